@@ -21,6 +21,11 @@ VDS_HOST_ADDRESS = os.environ["WEBVIZ_VDS_HOST_ADDRESS"]
 
 SURFACE_QUERY_URL = "http://surface-query:5001"
 
+# Optional local directory where decoded realization surfaces are spilled to disk, in addition to the memory cache
+SURFACE_CACHE_SPILL_DIR = os.getenv("WEBVIZ_SURFACE_CACHE_SPILL_DIR")
+# Byte budget for the spilled surfaces, the least recently used surfaces are deleted when it is exceeded
+SURFACE_CACHE_SPILL_MAX_BYTES = int(os.getenv("WEBVIZ_SURFACE_CACHE_SPILL_MAX_BYTES", str(10 * 1024 * 1024 * 1024)))
+
 RESOURCE_SCOPES_DICT = {
     "sumo": [f"api://{sumo_app_reg[SUMO_ENV]['RESOURCE_ID']}/access_as_user"],
     "smda": [SMDA_RESOURCE_SCOPE],
@@ -1,6 +1,8 @@
 import datetime
 import logging
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
@@ -30,6 +32,7 @@ from primary.routers.surface.router import router as surface_router
 from primary.routers.timeseries.router import router as timeseries_router
 from primary.routers.well.router import router as well_router
 from primary.routers.well_completions.router import router as well_completions_router
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY
 from primary.utils.azure_monitor_setup import setup_azure_monitor_telemetry
 from primary.utils.exception_handlers import configure_service_level_exception_handlers
 from primary.utils.exception_handlers import override_default_fastapi_exception_handlers
@@ -56,10 +59,19 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Long-lived http clients for the outbound service calls, so that connections are reused across requests
+    HTTP_CLIENT_REGISTRY.start()
+    yield
+    await HTTP_CLIENT_REGISTRY.aclose_async()
+
+
 app = FastAPI(
     generate_unique_id_function=custom_generate_unique_id,
     root_path="/api",
     default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 if os.environ.get("APPLICATIONINSIGHTS_CONNECTION_STRING"):
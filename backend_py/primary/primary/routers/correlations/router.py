@@ -1,65 +1,125 @@
+import asyncio
 import logging
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter
+import numpy as np
+from fastapi import APIRouter, Body, Depends, Query, Response
+from webviz_pkg.core_utils.b64 import b64_encode_float_array_as_float32
+
+from primary.auth.auth_helper import AuthHelper
+from primary.services.parameter_correlations import (
+    CorrelationMethod,
+    correlate_parameters_with_response,
+    correlate_parameters_with_responses,
+    pivot_vector_table_to_realization_matrix,
+)
+from primary.services.sumo_access.inplace_volumetrics_access import (
+    InplaceVolumetricsAccess,
+    InplaceVolumetricsCategoricalMetaData,
+)
+from primary.services.sumo_access.parameter_access import ParameterAccess
+from primary.services.sumo_access.summary_access import Frequency, SummaryAccess
+from primary.services.utils.authenticated_user import AuthenticatedUser
+from primary.utils.response_perf_metrics import ResponsePerfMetrics
+
+from ..timeseries import schemas as timeseries_schemas
+from . import schemas
 
 LOGGER = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-# @router.get("/correlate_parameters_with_timeseries/")
-# def correlate_parameters_with_timeseries(
-#     # fmt:off
-#     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
-#     case_uuid: str = Query(description="Sumo case uuid"),
-#     ensemble_name: str = Query(description="Ensemble name"),
-#     vector_name: str = Query(description="Name of the vector"),
-#     timestep: datetime.datetime = Query(description= "Timestep"),
-#     # realizations: Optional[Sequence[int]] = Query(None, description="Optional list of realizations to include. If not specified, all realizations will be returned."),
-#     # parameter_names: Optional[List[str]] = Query(None, description="Optional subset of parameters to correlate. Default are all parameters.")
-#     # fmt:on
-# ) -> EnsembleCorrelations:
-#     """Get parameter correlations for a timeseries at a given timestep"""
-
-#     summary_access = SummaryAccess(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-#     parameter_access = ParameterAccess(
-#         authenticated_user.get_sumo_access_token(),
-#         case_uuid=case_uuid,
-#         iteration_name=ensemble_name,
-#     )
-
-#     ensemble_response = summary_access.get_vector_values_at_timestep(
-#         vector_name=vector_name, timestep=timestep, realizations=None
-#     )
-#     parameters = parameter_access.get_parameters_and_sensitivities()
-
-#     return correlate_parameters_with_response(parameters.parameters, ensemble_response)
-
-
-# @router.get("/correlate_parameters_with_inplace_volumes/")
-# def correlate_parameters_with_inplace_volumes(
-#     # fmt:off
-#     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
-#     case_uuid: str = Query(description="Sumo case uuid"),
-#     ensemble_name: str = Query(description="Ensemble name"),
-#     table_name: str = Query(description="Table name"),
-#     response_name:str = Query(description="Response name"),
-#     # categorical_filter:Optional[List[InplaceVolumetricsCategoricalMetaData]] = None,
-#     # realizations: Optional[Sequence[int]] = Query(None, description="Optional list of realizations to include. If not specified, all realizations will be returned."),
-#     # parameter_names: Optional[List[str]] = Query(None, description="Optional subset of parameters to correlate. Default are all parameters.")
-#     # fmt:on
-# ) -> EnsembleCorrelations:
-#     """Get parameter correlations for an inplace volumetrics response"""
-
-#     inplace_access = InplaceVolumetricsAccess(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-#     parameter_access = ParameterAccess(
-#         authenticated_user.get_sumo_access_token(),
-#         case_uuid=case_uuid,
-#         iteration_name=ensemble_name,
-#     )
-#     ensemble_response = inplace_access.get_response(
-#         table_name, response_name, categorical_filters=None, realizations=None
-#     )
-#     parameters = parameter_access.get_parameters_and_sensitivities()
-
-#     return correlate_parameters_with_response(parameters.parameters, ensemble_response)
+@router.get("/parameter_correlations_with_vector_b64/")
+async def get_parameter_correlations_with_vector_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    vector_name: Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[timeseries_schemas.Frequency, Query(description="Resampling frequency")],
+    method: Annotated[schemas.CorrelationMethod, Query(description="Correlation method")],
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> schemas.ParameterCorrelationsWithVectorB64:
+    """
+    Get the correlations between all numerical, non-constant parameters and a vector at each of its timestamps
+    """
+    perf_metrics = ResponsePerfMetrics(response)
+
+    summary_access, parameter_access = await asyncio.gather(
+        SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name),
+        ParameterAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name),
+    )
+    perf_metrics.record_lap("get-access")
+
+    parameter_store, (vector_table, _vector_metadata) = await asyncio.gather(
+        parameter_access.get_parameter_store_async(),
+        summary_access.get_vector_table_async(
+            vector_name, Frequency.from_string_value(resampling_frequency.value), realizations
+        ),
+    )
+    perf_metrics.record_lap("get-parameters-and-table")
+
+    response_reals, timestamps_utc_ms, response_values = pivot_vector_table_to_realization_matrix(
+        vector_table, vector_name
+    )
+    correlation_matrix = correlate_parameters_with_responses(
+        parameter_store, response_reals, response_values, CorrelationMethod(method.value)
+    )
+    perf_metrics.record_lap("calc-correlations")
+
+    ret_data = schemas.ParameterCorrelationsWithVectorB64(
+        parameter_names=correlation_matrix.parameter_names,
+        timestamps_utc_ms=timestamps_utc_ms.tolist(),
+        correlations_b64arr=b64_encode_float_array_as_float32(np.ravel(correlation_matrix.correlations)),
+    )
+    perf_metrics.record_lap("encode-data")
+
+    LOGGER.info(
+        f"Computed {correlation_matrix.correlations.shape} parameter correlations with vector in: "
+        f"{perf_metrics.to_string()}"
+    )
+
+    return ret_data
+
+
+@router.post("/parameter_correlations_with_inplace_volumes/")
+async def post_parameter_correlations_with_inplace_volumes(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    table_name: Annotated[str, Query(description="Table name")],
+    response_name: Annotated[str, Query(description="Response name")],
+    method: Annotated[schemas.CorrelationMethod, Query(description="Correlation method")],
+    categorical_filter: Annotated[Optional[List[InplaceVolumetricsCategoricalMetaData]], Body(description="Optional categorical filters")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> schemas.ParameterCorrelations:
+    """Get the correlations between all numerical, non-constant parameters and an inplace volumetrics response"""
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access_token = authenticated_user.get_sumo_access_token()
+    inplace_access, parameter_access = await asyncio.gather(
+        InplaceVolumetricsAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+        ParameterAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+    )
+    perf_metrics.record_lap("get-access")
+
+    parameter_store, ensemble_response = await asyncio.gather(
+        parameter_access.get_parameter_store_async(),
+        inplace_access.get_response_async(table_name, response_name, categorical_filter, realizations),
+    )
+    perf_metrics.record_lap("get-parameters-and-response")
+
+    correlations = correlate_parameters_with_response(
+        parameter_store, ensemble_response, CorrelationMethod(method.value)
+    )
+    perf_metrics.record_lap("calc-correlations")
+
+    LOGGER.info(f"Computed parameter correlations with inplace volumes in: {perf_metrics.to_string()}")
+
+    return schemas.ParameterCorrelations(names=correlations.names, values=correlations.values)
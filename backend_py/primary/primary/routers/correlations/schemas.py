@@ -0,0 +1,32 @@
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel
+from webviz_pkg.core_utils.b64 import B64FloatArray
+
+
+class CorrelationMethod(str, Enum):
+    PEARSON = "PEARSON"
+    SPEARMAN = "SPEARMAN"
+
+
+class ParameterCorrelations(BaseModel):
+    """
+    Correlations between parameters and a single response, sorted on ascending absolute correlation.
+    Parameters where the correlation is undefined are left out.
+    """
+
+    names: List[str]
+    values: List[float]
+
+
+class ParameterCorrelationsWithVectorB64(BaseModel):
+    """
+    Correlations between parameters and a vector at each of its timestamps.
+    The correlations are a row-major float32 matrix with one row per parameter and one column per timestamp,
+    where NaN means that the correlation is undefined.
+    """
+
+    parameter_names: List[str]
+    timestamps_utc_ms: List[int]
+    correlations_b64arr: B64FloatArray
@@ -14,6 +14,7 @@ from primary.services.user_session_manager.user_session_manager import _USER_SES
 from primary.services.user_session_manager._radix_helpers import RadixResourceRequests, RadixJobApi
 from primary.services.user_session_manager._user_session_directory import UserSessionDirectory
 from primary.services.user_grid3d_service.user_grid3d_service import UserGrid3dService, IJKIndexFilter
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY
 
 LOGGER = logging.getLogger(__name__)
 
@@ -230,3 +231,10 @@ async def ri_isect(
     await grid_service.get_polyline_intersection_async(ensemble_name, realization, grid_name, property_name, xy_arr)
 
     return "OK"
+
+
+@router.get("/http_client_pool_stats")
+async def http_client_pool_stats() -> str:
+    stats_str = HTTP_CLIENT_REGISTRY.stats_string()
+    LOGGER.debug(f"http_client_pool_stats():\n{stats_str}")
+    return stats_str
@@ -29,7 +29,7 @@ async def get_table_names_and_descriptions(
     access = await InplaceVolumetricsAccess.from_case_uuid(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
     )
-    table_names = access.get_table_names_and_metadata()
+    table_names = await access.get_table_names_and_metadata_async()
     return table_names
 
 
@@ -49,7 +49,7 @@ async def get_realizations_response(
     access = await InplaceVolumetricsAccess.from_case_uuid(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
     )
-    response = access.get_response(table_name, response_name, categorical_filter, realizations)
+    response = await access.get_response_async(table_name, response_name, categorical_filter, realizations)
     return response
 
 
@@ -1,9 +1,18 @@
+import asyncio
 import logging
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from webviz_pkg.core_utils.perf_timer import PerfTimer
 
 from primary.auth.auth_helper import AuthHelper
+from primary.services.observation_misfit import (
+    ObservationMisfits,
+    compute_summary_observation_misfits,
+    get_summary_observation_timestamps_utc_ms,
+)
 from primary.services.sumo_access.observation_access import ObservationAccess
+from primary.services.sumo_access.summary_access import PointInTimeLookup, SummaryAccess
 from primary.services.utils.authenticated_user import AuthenticatedUser
 
 from . import schemas
@@ -27,3 +36,64 @@ async def get_observations(
     )
     observations = await access.get_observations()
     return observations
+
+
+@router.get("/summary_observation_misfits/")
+async def get_summary_observation_misfits(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    case_uuid: str = Query(description="Sumo case uuid"),
+    ensemble_name: str = Query(description="Ensemble name"),
+    vector_names: Optional[List[str]] = Query(None, description="Optional list of observed vectors to include. If not specified, all observed vectors are included"),
+    realizations: Optional[List[int]] = Query(None, description="Optional list of realizations to include. If not specified, all realizations are included"),
+    # fmt:on
+) -> schemas.ObservationMisfitData:
+    """Get misfits between the summary vector observations and the simulated values of all realizations"""
+    perf_timer = PerfTimer()
+    access_token = authenticated_user.get_sumo_access_token()
+    observation_access, summary_access = await asyncio.gather(
+        ObservationAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+        SummaryAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+    )
+    observations = await observation_access.get_observations()
+    vector_observations = [
+        obs for obs in observations.summary if vector_names is None or obs.vector_name in vector_names
+    ]
+    et_observations_ms = perf_timer.lap_ms()
+
+    values_and_metadata = await asyncio.gather(
+        *[
+            summary_access.get_vector_values_at_timestamps_async(
+                obs.vector_name,
+                get_summary_observation_timestamps_utc_ms(obs).tolist(),
+                PointInTimeLookup.INTERPOLATE,
+                realizations,
+            )
+            for obs in vector_observations
+        ]
+    )
+    et_values_ms = perf_timer.lap_ms()
+
+    misfits = compute_summary_observation_misfits(
+        vector_observations,
+        {obs.vector_name: values for obs, (values, _metadata) in zip(vector_observations, values_and_metadata)},
+    )
+    et_misfits_ms = perf_timer.lap_ms()
+
+    LOGGER.info(
+        f"Got summary observation misfits in: {perf_timer.elapsed_ms()}ms "
+        f"(observations={et_observations_ms}ms, values={et_values_ms}ms, misfits={et_misfits_ms}ms) "
+        f"({len(misfits.observation_labels)} observations, {len(misfits.realizations)} realizations)"
+    )
+
+    return _to_api_observation_misfit_data(misfits)
+
+
+def _to_api_observation_misfit_data(misfits: ObservationMisfits) -> schemas.ObservationMisfitData:
+    return schemas.ObservationMisfitData(
+        realizations=misfits.realizations.tolist(),
+        realization_misfits=misfits.get_realization_misfits().tolist(),
+        realization_observation_counts=misfits.get_realization_observation_counts().tolist(),
+        observation_labels=misfits.observation_labels,
+        observation_misfits=misfits.get_observation_misfits().tolist(),
+    )
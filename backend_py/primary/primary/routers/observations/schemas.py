@@ -74,3 +74,18 @@ class Observations(BaseModel):
 
     summary: List[SummaryVectorObservations] = []
     rft: List[RftObservations] = []
+
+
+class ObservationMisfitData(BaseModel):
+    """
+    Misfits between observations and the simulated values of an ensemble.
+    The realization misfits are the sum of squared normalized residuals, (simulated - observed) / error, over the
+    observations the realization has values for, and the observation misfits are the mean of the squared normalized
+    residuals over the realizations. Observation misfits without any simulated values are null.
+    """
+
+    realizations: List[int]
+    realization_misfits: List[Optional[float]]
+    realization_observation_counts: List[int]
+    observation_labels: List[str]
+    observation_misfits: List[Optional[float]]
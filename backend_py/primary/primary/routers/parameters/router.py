@@ -1,10 +1,19 @@
+import asyncio
 import logging
 from typing import List, Optional, Literal
 
-from fastapi import APIRouter, Depends, Query
+import numpy as np
+
+from fastapi import APIRouter, Body, Depends, Query
 
 from primary.auth.auth_helper import AuthHelper
+from primary.services.sensitivity_tornado import SensitivityTornado, compute_sensitivity_tornado
+from primary.services.sumo_access.inplace_volumetrics_access import (
+    InplaceVolumetricsAccess,
+    InplaceVolumetricsCategoricalMetaData,
+)
 from primary.services.sumo_access.parameter_access import ParameterAccess
+from primary.services.sumo_access.summary_access import PointInTimeLookup, SummaryAccess
 from primary.services.sumo_access.parameter_types import EnsembleParameter, EnsembleSensitivity
 from primary.services.utils.authenticated_user import AuthenticatedUser
 
@@ -27,7 +36,10 @@ async def get_parameter_names_and_description(
 ) -> List[schemas.EnsembleParameterDescription]:
     """Retrieve parameter names and description for an ensemble"""
     access = await ParameterAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-    parameters = (await access.get_parameters_and_sensitivities()).parameters
+    parameter_store = await access.get_parameter_store_async()
+
+    # Only the precomputed column infos are needed, so none of the parameter values are materialized
+    parameters = parameter_store.get_parameter_column_infos()
     if exclude_all_values_constant:
         parameters = [p for p in parameters if not p.is_constant]
     if sort_order == "alphabetically":
@@ -37,7 +49,7 @@ async def get_parameter_names_and_description(
     return [
         schemas.EnsembleParameterDescription(
             name=parameter.name,
-            descriptive_name=parameter.descriptive_name,
+            descriptive_name=parameter.name,
             group_name=parameter.group_name,
             is_numerical=parameter.is_numerical,
         )
@@ -55,11 +67,7 @@ async def get_parameter(
     """Get a parameter in a given Sumo ensemble"""
 
     access = await ParameterAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-    parameters = (await access.get_parameters_and_sensitivities()).parameters
-    for parameter in parameters:
-        if parameter.name == parameter_name:
-            return parameter
-    return None
+    return await access.get_parameter(parameter_name)
 
 
 @router.get("/parameters/")
@@ -82,8 +90,8 @@ async def is_sensitivity_run(
     """Check if a given Sumo ensemble is a sensitivity run"""
 
     access = await ParameterAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
-    parameters = await access.get_parameters_and_sensitivities()
-    return parameters.sensitivities is not None
+    parameter_store = await access.get_parameter_store_async()
+    return parameter_store.is_sensitivity_run()
 
 
 @router.get("/sensitivities/")
@@ -96,5 +104,95 @@ async def get_sensitivities(
 
     access = await ParameterAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
 
-    sensitivities = (await access.get_parameters_and_sensitivities()).sensitivities
+    sensitivities = await access.get_sensitivities_async()
     return sensitivities if sensitivities else []
+
+
+@router.get("/sensitivity_tornado_for_vector/")
+async def get_sensitivity_tornado_for_vector(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    case_uuid: str = Query(description="Sumo case uuid"),
+    ensemble_name: str = Query(description="Ensemble name"),
+    vector_name: str = Query(description="Name of the vector"),
+    timestamps_utc_ms: List[int] = Query(description="Timestamps in ms UTC, each timestamp is one response"),
+    reference_sensitivity_name: Optional[str] = Query(None, description="Reference sensitivity. If not specified, rms_seed or the first sensitivity is used"),
+    # fmt:on
+) -> schemas.SensitivityTornadoData:
+    """Get tornado data for a vector at each of the timestamps, where the vector values are interpolated"""
+
+    access_token = authenticated_user.get_sumo_access_token()
+    summary_access, parameter_access = await asyncio.gather(
+        SummaryAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+        ParameterAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+    )
+    parameter_store, (values_at_timestamps, _vector_metadata) = await asyncio.gather(
+        parameter_access.get_parameter_store_async(),
+        summary_access.get_vector_values_at_timestamps_async(
+            vector_name, timestamps_utc_ms, PointInTimeLookup.INTERPOLATE
+        ),
+    )
+
+    tornado = compute_sensitivity_tornado(
+        parameter_store,
+        values_at_timestamps.realizations,
+        values_at_timestamps.values.T,
+        reference_sensitivity_name,
+    )
+    return _to_api_sensitivity_tornado_data(tornado)
+
+
+@router.post("/sensitivity_tornado_for_inplace_volumes/")
+async def post_sensitivity_tornado_for_inplace_volumes(
+    # fmt:off
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    case_uuid: str = Query(description="Sumo case uuid"),
+    ensemble_name: str = Query(description="Ensemble name"),
+    table_name: str = Query(description="Table name"),
+    response_names: List[str] = Query(description="Names of the responses"),
+    reference_sensitivity_name: Optional[str] = Query(None, description="Reference sensitivity. If not specified, rms_seed or the first sensitivity is used"),
+    categorical_filter: Optional[List[InplaceVolumetricsCategoricalMetaData]] = Body(None, description="Optional categorical filters"),
+    # fmt:on
+) -> schemas.SensitivityTornadoData:
+    """Get tornado data for each of the inplace volumetrics responses"""
+
+    access_token = authenticated_user.get_sumo_access_token()
+    inplace_access, parameter_access = await asyncio.gather(
+        InplaceVolumetricsAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+        ParameterAccess.from_case_uuid(access_token, case_uuid, ensemble_name),
+    )
+    parameter_store, *ensemble_responses = await asyncio.gather(
+        parameter_access.get_parameter_store_async(),
+        *[inplace_access.get_response_async(table_name, name, categorical_filter) for name in response_names],
+    )
+
+    # Align the responses on the realizations, so that all the responses are processed in one pass
+    response_reals = np.unique(np.concatenate([np.asarray(resp.realizations) for resp in ensemble_responses]))
+    response_values = np.full((len(response_reals), len(ensemble_responses)), np.nan)
+    for resp_idx, resp in enumerate(ensemble_responses):
+        response_values[np.searchsorted(response_reals, resp.realizations), resp_idx] = resp.values
+
+    tornado = compute_sensitivity_tornado(parameter_store, response_reals, response_values, reference_sensitivity_name)
+    return _to_api_sensitivity_tornado_data(tornado)
+
+
+def _to_api_sensitivity_tornado_data(tornado: SensitivityTornado) -> schemas.SensitivityTornadoData:
+    return schemas.SensitivityTornadoData(
+        reference_sensitivity_name=tornado.reference_sensitivity_name,
+        reference_values=tornado.reference_values.tolist(),
+        sensitivities=[
+            schemas.SensitivityTornadoValues(
+                sensitivity_name=sens.sensitivity_name,
+                sensitivity_type=sens.sensitivity_type,
+                low_values=sens.low_values.tolist(),
+                high_values=sens.high_values.tolist(),
+                mean_values=sens.mean_values.tolist(),
+                low_deltas=sens.low_deltas.tolist(),
+                high_deltas=sens.high_deltas.tolist(),
+                mean_deltas=sens.mean_deltas.tolist(),
+                low_case_names=sens.low_case_names,
+                high_case_names=sens.high_case_names,
+            )
+            for sens in tornado.sensitivities
+        ],
+    )
@@ -1,10 +1,37 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
+from primary.services.sumo_access.parameter_types import SensitivityType
+
 
 class EnsembleParameterDescription(BaseModel):
     name: str
     group_name: Optional[str] = None
     descriptive_name: Optional[str] = None
     is_numerical: bool
+
+
+class SensitivityTornadoValues(BaseModel):
+    sensitivity_name: str
+    sensitivity_type: SensitivityType
+    low_values: List[Optional[float]]
+    high_values: List[Optional[float]]
+    mean_values: List[Optional[float]]
+    low_deltas: List[Optional[float]]
+    high_deltas: List[Optional[float]]
+    mean_deltas: List[Optional[float]]
+    low_case_names: List[Optional[str]]
+    high_case_names: List[Optional[str]]
+
+
+class SensitivityTornadoData(BaseModel):
+    """
+    Tornado data with one entry per response in all the value lists, in the same order as the requested responses.
+    The reference values are the mean of the reference sensitivity, and the deltas are the values minus the
+    reference values. Null means that there is no value.
+    """
+
+    reference_sensitivity_name: str
+    reference_values: List[Optional[float]]
+    sensitivities: List[SensitivityTornadoValues]
@@ -8,7 +8,6 @@ from primary.auth.auth_helper import AuthHelper
 from primary.services.smda_access.mocked_drogon_smda_access import _mocked_stratigraphy_access
 from primary.services.smda_access.stratigraphy_access import StratigraphyAccess
 from primary.services.smda_access.stratigraphy_utils import sort_stratigraphic_names_by_hierarchy
-from primary.services.sumo_access._helpers import SumoCase
 from primary.services.sumo_access.polygons_access import PolygonsAccess
 from primary.services.utils.authenticated_user import AuthenticatedUser
 
@@ -31,8 +30,7 @@ async def get_polygons_directory(
     access = await PolygonsAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
     polygons_dir = await access.get_polygons_directory_async()
 
-    case_inspector = await SumoCase.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid)
-    strat_column_identifier = await case_inspector.get_stratigraphic_column_identifier()
+    strat_column_identifier = await access.get_stratigraphic_column_identifier()
     strat_access: Union[StratigraphyAccess, _mocked_stratigraphy_access.StratigraphyAccess]
 
     if strat_column_identifier == "DROGON_HAS_NO_STRATCOLUMN":
@@ -12,7 +12,6 @@ from primary.services.utils.statistic_function import StatisticFunction
 from primary.services.utils.authenticated_user import AuthenticatedUser
 from primary.auth.auth_helper import AuthHelper
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
-from primary.services.sumo_access._helpers import SumoCase
 from primary.services.surface_query_service.surface_query_service import batch_sample_surface_in_points_async
 from primary.services.surface_query_service.surface_query_service import RealizationSampleResult
 
@@ -39,8 +38,7 @@ async def get_surface_directory(
     )
     sumo_surf_dir = await surface_access.get_surface_directory_async()
 
-    case_inspector = await SumoCase.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid)
-    strat_column_identifier = await case_inspector.get_stratigraphic_column_identifier()
+    strat_column_identifier = await surface_access.get_stratigraphic_column_identifier()
     strat_access: Union[StratigraphyAccess, _mocked_stratigraphy_access.StratigraphyAccess]
 
     if strat_column_identifier == "DROGON_HAS_NO_STRATCOLUMN":
@@ -108,7 +106,7 @@ async def get_statistical_surface_data(
         attribute=attribute,
         time_or_interval_str=time_or_interval,
     )
-    perf_metrics.record_lap("sumo-calc")
+    perf_metrics.record_lap("calc-stat")
 
     if not xtgeo_surf:
         raise HTTPException(status_code=404, detail="Could not find or compute surface")
@@ -121,6 +119,50 @@ async def get_statistical_surface_data(
     return surf_data_response
 
 
+@router.get("/statistical_surfaces_data/")
+async def get_statistical_surfaces_data(
+    response: Response,
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+    case_uuid: str = Query(description="Sumo case uuid"),
+    ensemble_name: str = Query(description="Ensemble name"),
+    statistic_functions: List[schemas.SurfaceStatisticFunction] = Query(description="Statistics to calculate"),
+    name: str = Query(description="Surface name"),
+    attribute: str = Query(description="Surface attribute"),
+    time_or_interval: Optional[str] = Query(None, description="Time point or time interval string"),
+) -> List[schemas.StatisticalSurfaceData]:
+    """
+    Calculate multiple statistical surfaces in one pass over the realization surfaces
+    """
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access = await SurfaceAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+
+    service_stat_funcs_to_compute = [StatisticFunction(stat_func.value) for stat_func in statistic_functions]
+    xtgeo_surfs = await access.get_statistical_surfaces_data_async(
+        statistic_functions=service_stat_funcs_to_compute,
+        name=name,
+        attribute=attribute,
+        time_or_interval_str=time_or_interval,
+    )
+    perf_metrics.record_lap("calc-stats")
+
+    if not xtgeo_surfs:
+        raise HTTPException(status_code=404, detail="Could not find or compute surfaces")
+
+    ret_arr = [
+        schemas.StatisticalSurfaceData(
+            statistic_function=schemas.SurfaceStatisticFunction(stat_func.value),
+            surface_data=converters.to_api_surface_data(xtgeo_surf),
+        )
+        for stat_func, xtgeo_surf in xtgeo_surfs.items()
+    ]
+    perf_metrics.record_lap("convert")
+
+    LOGGER.info(f"Calculated {len(ret_arr)} statistical surfaces in: {perf_metrics.to_string()}")
+
+    return ret_arr
+
+
 # pylint: disable=too-many-arguments
 @router.get("/property_surface_resampled_to_static_surface/")
 async def get_property_surface_resampled_to_static_surface(
@@ -70,6 +70,11 @@ class SurfaceData(BaseModel):
     values_b64arr: B64FloatArray
 
 
+class StatisticalSurfaceData(BaseModel):
+    statistic_function: SurfaceStatisticFunction
+    surface_data: SurfaceData
+
+
 class SurfaceIntersectionData(BaseModel):
     """
     Definition of a surface intersection made from a set of (x, y) coordinates.
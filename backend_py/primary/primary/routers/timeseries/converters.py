@@ -1,7 +1,12 @@
 from typing import List, Optional, Sequence
 
+import numpy as np
+import pyarrow as pa
+from webviz_pkg.core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_float_array_as_float64
+from webviz_pkg.core_utils.b64 import b64_encode_int_array_as_int32
+
 from primary.services.summary_vector_statistics import VectorStatistics
-from primary.services.sumo_access.summary_access import VectorMetadata
+from primary.services.sumo_access.summary_access import VectorMetadata, VectorValuesAtTimestamps
 from primary.services.utils.statistic_function import StatisticFunction
 from . import schemas
 
@@ -48,3 +53,180 @@ def to_api_vector_statistic_data(
     )
 
     return ret_data
+
+
+def to_api_vector_statistic_sensitivity_data(
+    vector_statistics: VectorStatistics, vector_metadata: VectorMetadata, sensitivity_name: str, sensitivity_case: str
+) -> schemas.VectorStatisticSensitivityData:
+    """
+    Create API VectorStatisticSensitivityData from service layer VectorStatistics for a single sensitivity case
+    """
+    statistic_data = to_api_vector_statistic_data(vector_statistics, vector_metadata)
+
+    ret_data = schemas.VectorStatisticSensitivityData(
+        sensitivity_name=sensitivity_name,
+        sensitivity_case=sensitivity_case,
+        realizations=statistic_data.realizations,
+        timestamps_utc_ms=statistic_data.timestamps_utc_ms,
+        value_objects=statistic_data.value_objects,
+        unit=statistic_data.unit,
+        is_rate=statistic_data.is_rate,
+    )
+
+    return ret_data
+
+
+def to_api_realizations_vectors_data(
+    vectors_table: pa.Table, vector_names: Sequence[str], vector_metadata_list: Sequence[VectorMetadata]
+) -> schemas.RealizationsVectorsData:
+    """
+    Create API RealizationsVectorsData from a service layer table with DATE, REAL and one column per vector
+    """
+    vector_columns: List[schemas.VectorColumnData] = []
+    for vector_name, vector_metadata in zip(vector_names, vector_metadata_list):
+        vector_columns.append(
+            schemas.VectorColumnData(
+                vector_name=vector_name,
+                values=vectors_table[vector_name].to_numpy().tolist(),
+                unit=vector_metadata.unit,
+                is_rate=vector_metadata.is_rate,
+            )
+        )
+
+    ret_data = schemas.RealizationsVectorsData(
+        realizations=vectors_table["REAL"].to_numpy().tolist(),
+        timestamps_utc_ms=vectors_table["DATE"].to_numpy().astype(int).tolist(),
+        vectors=vector_columns,
+    )
+
+    return ret_data
+
+
+def to_api_statistical_vectors_data(
+    vector_statistics_list: Sequence[VectorStatistics],
+    vector_names: Sequence[str],
+    vector_metadata_list: Sequence[VectorMetadata],
+) -> schemas.StatisticalVectorsData:
+    """
+    Create API StatisticalVectorsData from service layer VectorStatistics, one for each of the vectors.
+    All the statistics must have been computed from the same table, so that they share realizations and timestamps
+    """
+    vector_columns: List[schemas.VectorStatisticColumnData] = []
+    for vector_statistics, vector_name, vector_metadata in zip(
+        vector_statistics_list, vector_names, vector_metadata_list
+    ):
+        statistic_data = to_api_vector_statistic_data(vector_statistics, vector_metadata)
+        vector_columns.append(
+            schemas.VectorStatisticColumnData(
+                vector_name=vector_name,
+                value_objects=statistic_data.value_objects,
+                unit=statistic_data.unit,
+                is_rate=statistic_data.is_rate,
+            )
+        )
+
+    ret_data = schemas.StatisticalVectorsData(
+        realizations=vector_statistics_list[0].realizations,
+        timestamps_utc_ms=vector_statistics_list[0].timestamps_utc_ms,
+        vectors=vector_columns,
+    )
+
+    return ret_data
+
+
+def to_api_vector_realization_data_list(
+    vector_table: pa.Table, vector_name: str, unit: str, is_rate: bool
+) -> List[schemas.VectorRealizationData]:
+    """
+    Create list of API VectorRealizationData, one per realization, from a service layer table with DATE, REAL and
+    vector columns. The table must be segmented on REAL
+    """
+    real_arr_np = vector_table["REAL"].to_numpy()
+    is_segment_start = np.ones(len(real_arr_np), dtype=bool)
+    is_segment_start[1:] = real_arr_np[1:] != real_arr_np[:-1]
+    real_row_offsets = np.append(np.flatnonzero(is_segment_start), len(real_arr_np))
+
+    timestamps_list = vector_table["DATE"].to_numpy().view(np.int64).tolist()
+    values_list = vector_table[vector_name].to_numpy().tolist()
+
+    ret_arr: List[schemas.VectorRealizationData] = []
+    for start, stop in zip(real_row_offsets[:-1], real_row_offsets[1:]):
+        ret_arr.append(
+            schemas.VectorRealizationData(
+                realization=int(real_arr_np[start]),
+                timestamps_utc_ms=timestamps_list[start:stop],
+                values=values_list[start:stop],
+                unit=unit,
+                is_rate=is_rate,
+            )
+        )
+
+    return ret_arr
+
+
+def to_api_vector_realizations_data_b64(
+    vector_table: pa.Table, vector_name: str, vector_metadata: VectorMetadata
+) -> schemas.VectorRealizationsDataB64:
+    """
+    Create API VectorRealizationsDataB64 from a service layer table with DATE, REAL and vector columns.
+    The table must be segmented on REAL, and the columns are encoded directly without creating Python objects
+    per element
+    """
+    real_arr_np = vector_table["REAL"].to_numpy()
+    is_segment_start = np.ones(len(real_arr_np), dtype=bool)
+    is_segment_start[1:] = real_arr_np[1:] != real_arr_np[:-1]
+    segment_start_idx = np.flatnonzero(is_segment_start)
+    real_row_offsets = np.append(segment_start_idx, len(real_arr_np))
+
+    ret_data = schemas.VectorRealizationsDataB64(
+        realizations=real_arr_np[segment_start_idx].tolist(),
+        real_row_offsets_b64arr=b64_encode_int_array_as_int32(real_row_offsets),
+        timestamps_utc_ms_b64arr=b64_encode_float_array_as_float64(vector_table["DATE"].to_numpy().view(np.int64)),
+        values_b64arr=b64_encode_float_array_as_float32(vector_table[vector_name].to_numpy()),
+        unit=vector_metadata.unit,
+        is_rate=vector_metadata.is_rate,
+    )
+
+    return ret_data
+
+
+def to_api_vector_realizations_at_timestamps_data(
+    values_at_timestamps: VectorValuesAtTimestamps, vector_metadata: VectorMetadata
+) -> schemas.VectorRealizationsAtTimestampsData:
+    """
+    Create API VectorRealizationsAtTimestampsData from service layer values, NaN values are serialized as null
+    """
+    return schemas.VectorRealizationsAtTimestampsData(
+        realizations=values_at_timestamps.realizations.tolist(),
+        timestamps_utc_ms=values_at_timestamps.timestamps_utc_ms.tolist(),
+        values_per_timestamp=values_at_timestamps.values.tolist(),
+        unit=vector_metadata.unit,
+        is_rate=vector_metadata.is_rate,
+    )
+
+
+def to_api_vector_statistic_data_b64(
+    statistics_table: pa.Table, realizations: List[int], vector_metadata: VectorMetadata
+) -> schemas.VectorStatisticDataB64:
+    """
+    Create API VectorStatisticDataB64 from a service layer statistics table with DATE and one column per statistic
+    """
+    value_objects: List[schemas.StatisticValueObjectB64] = []
+    for api_func_enum in schemas.StatisticFunction:
+        if api_func_enum.value in statistics_table.column_names:
+            value_objects.append(
+                schemas.StatisticValueObjectB64(
+                    statistic_function=api_func_enum,
+                    values_b64arr=b64_encode_float_array_as_float32(statistics_table[api_func_enum.value].to_numpy()),
+                )
+            )
+
+    ret_data = schemas.VectorStatisticDataB64(
+        realizations=realizations,
+        timestamps_utc_ms_b64arr=b64_encode_float_array_as_float64(statistics_table["DATE"].to_numpy().view(np.int64)),
+        value_objects=value_objects,
+        unit=vector_metadata.unit,
+        is_rate=vector_metadata.is_rate,
+    )
+
+    return ret_data
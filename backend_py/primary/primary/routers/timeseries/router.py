@@ -1,16 +1,27 @@
+import asyncio
 import logging
 from typing import Annotated
 
-import pyarrow as pa
-import pyarrow.compute as pc
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from primary.auth.auth_helper import AuthHelper
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
-from primary.services.summary_vector_statistics import compute_vector_statistics
+from primary.services.summary_vector_statistics import (
+    VectorStatistics,
+    compute_vector_statistics,
+    compute_vector_statistics_for_realization_groups,
+    compute_vector_statistics_table,
+)
+from primary.services.summary_delta_vectors import (
+    compute_delta_statistics_table,
+    compute_delta_vector_table,
+    compute_vector_table_relative_to_timestamp,
+)
+from primary.services.summary_vector_expression import parse_vector_expression
 from primary.services.sumo_access.generic_types import EnsembleScalarResponse
+from primary.services.sumo_access._vector_decimation import decimate_vector_table_min_max
 from primary.services.sumo_access.parameter_access import ParameterAccess
-from primary.services.sumo_access.summary_access import Frequency, SummaryAccess
+from primary.services.sumo_access.summary_access import Frequency, PointInTimeLookup, SummaryAccess
 from primary.services.utils.authenticated_user import AuthenticatedUser
 
 from . import converters, schemas
@@ -39,6 +50,31 @@ async def get_vector_list(
     return ret_arr
 
 
+@router.get("/vector_search/")
+async def get_vector_search(
+    # fmt:off
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    pattern: Annotated[str | None, Query(description="Case sensitive wildcard pattern for the vector names, e.g. 'WOPR:*', 'F*PT' or '*:OP_1'. If not specified, all vectors match.")] = None,
+    offset: Annotated[int, Query(ge=0, description="Number of matching vectors to skip")] = 0,
+    limit: Annotated[int | None, Query(ge=1, description="Max number of matching vectors to return")] = None,
+    # fmt:on
+) -> schemas.VectorSearchResult:
+    """Get one page of the vectors in a given Sumo ensemble matching the pattern, excluding any historical vectors"""
+
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    search_result = await access.search_vectors_async(pattern, offset, limit)
+
+    return schemas.VectorSearchResult(
+        vectors=[
+            schemas.VectorDescription(name=vi.name, descriptive_name=vi.name, has_historical=vi.has_historical)
+            for vi in search_result.vectors
+        ],
+        total_count=search_result.total_count,
+    )
+
+
 @router.get("/realizations_vector_data/")
 async def get_realizations_vector_data(
     # fmt:off
@@ -49,7 +85,8 @@ async def get_realizations_vector_data(
     vector_name:  Annotated[str, Query(description="Name of the vector")],
     resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
     realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be returned.")] = None,
-    # relative_to_timestamp: Annotated[datetime.datetime | None, Query(description="Calculate relative to timestamp")] = None,
+    relative_to_timestamp_utc_ms: Annotated[int | None, Query(description="Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.")] = None,
+    max_points_per_realization: Annotated[int | None, Query(ge=4, description="Optional max number of points per realization. Realizations with more points are decimated using a min/max envelope that preserves the extremes, typically set to about twice the plot width in pixels.")] = None,
     # fmt:on
 ) -> list[schemas.VectorRealizationData]:
     """Get vector data per realization"""
@@ -58,37 +95,126 @@ async def get_realizations_vector_data(
     access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
 
     sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
-    sumo_vec_arr = await access.get_vector_async(
+    vector_table, vector_metadata = await access.get_vector_table_async(
         vector_name=vector_name,
         resampling_frequency=sumo_freq,
         realizations=realizations,
     )
     perf_metrics.record_lap("get-vector")
 
-    ret_arr: list[schemas.VectorRealizationData] = []
-    for vec in sumo_vec_arr:
-        ret_arr.append(
-            schemas.VectorRealizationData(
-                realization=vec.realization,
-                timestamps_utc_ms=vec.timestamps_utc_ms,
-                values=vec.values,
-                unit=vec.metadata.unit,
-                is_rate=vec.metadata.is_rate,
-            )
+    if relative_to_timestamp_utc_ms is not None:
+        vector_table = compute_vector_table_relative_to_timestamp(
+            vector_table, vector_name, relative_to_timestamp_utc_ms
         )
+        perf_metrics.record_lap("calc-relative")
+
+    # Decimate after making the values relative, since the decimation could remove the row at the timestamp
+    if max_points_per_realization is not None:
+        vector_table = decimate_vector_table_min_max(vector_table, vector_name, max_points_per_realization)
+        perf_metrics.record_lap("decimate")
+
+    ret_arr = converters.to_api_vector_realization_data_list(
+        vector_table, vector_name, unit=vector_metadata.unit, is_rate=vector_metadata.is_rate
+    )
+    perf_metrics.record_lap("convert-data")
 
     LOGGER.info(f"Loaded realization summary data in: {perf_metrics.to_string()}")
 
     return ret_arr
 
 
+@router.get("/realizations_vector_data_b64/")
+async def get_realizations_vector_data_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_name:  Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be returned.")] = None,
+    relative_to_timestamp_utc_ms: Annotated[int | None, Query(description="Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.")] = None,
+    max_points_per_realization: Annotated[int | None, Query(ge=4, description="Optional max number of points per realization. Realizations with more points are decimated using a min/max envelope that preserves the extremes, typically set to about twice the plot width in pixels.")] = None,
+    # fmt:on
+) -> schemas.VectorRealizationsDataB64:
+    """
+    Get vector data per realization, same as realizations_vector_data, but returned as base64 encoded typed arrays
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+
+    sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    vector_table, vector_metadata = await access.get_vector_table_async(
+        vector_name=vector_name,
+        resampling_frequency=sumo_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-table")
+
+    if relative_to_timestamp_utc_ms is not None:
+        vector_table = compute_vector_table_relative_to_timestamp(
+            vector_table, vector_name, relative_to_timestamp_utc_ms
+        )
+        perf_metrics.record_lap("calc-relative")
+
+    # Decimate after making the values relative, since the decimation could remove the row at the timestamp
+    if max_points_per_realization is not None:
+        vector_table = decimate_vector_table_min_max(vector_table, vector_name, max_points_per_realization)
+        perf_metrics.record_lap("decimate")
+
+    ret_data = converters.to_api_vector_realizations_data_b64(vector_table, vector_name, vector_metadata)
+    perf_metrics.record_lap("encode-data")
+
+    LOGGER.info(f"Loaded realization summary data as b64 in: {perf_metrics.to_string()}")
+
+    return ret_data
+
+
+@router.get("/realizations_vectors_data/")
+async def get_realizations_vectors_data(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_names: Annotated[list[str], Query(description="Names of the vectors")],
+    resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be returned.")] = None,
+    # fmt:on
+) -> schemas.RealizationsVectorsData:
+    """Get vector data per realization for multiple vectors in one columnar response"""
+
+    perf_metrics = ResponsePerfMetrics(response)
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-access")
+
+    unique_vector_names = list(dict.fromkeys(vector_names))
+    sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    vectors_table, vector_metadata_list = await access.get_vectors_table_async(
+        vector_names=unique_vector_names,
+        resampling_frequency=sumo_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-vectors")
+
+    ret_data = converters.to_api_realizations_vectors_data(vectors_table, unique_vector_names, vector_metadata_list)
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(
+        f"Loaded realization summary data for {len(unique_vector_names)} vectors in: {perf_metrics.to_string()}"
+    )
+
+    return ret_data
+
+
 @router.get("/timestamps_list/")
 async def get_timestamps_list(
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
     case_uuid: Annotated[str, Query(description="Sumo case uuid")],
     ensemble_name: Annotated[str, Query(description="Ensemble name")],
     resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency")] = None,
-    # realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include")] = None,
 ) -> list[int]:
     """Get the intersection of available timestamps.
         Note that when resampling_frequency is None, the pure intersection of the
@@ -99,7 +225,7 @@ async def get_timestamps_list(
     """
     access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
     sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
-    return await access.get_timestamps_async(resampling_frequency=sumo_freq)
+    return await access.get_timestamps_async(resampling_frequency=sumo_freq, realizations=realizations)
 
 
 @router.get("/historical_vector_data/")
@@ -141,7 +267,7 @@ async def get_statistical_vector_data(
     resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
     statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
     realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
-    # relative_to_timestamp: Annotated[datetime.datetime | None, Query(description="Calculate relative to timestamp")] = None,
+    relative_to_timestamp_utc_ms: Annotated[int | None, Query(description="Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.")] = None,
     # fmt:on
 ) -> schemas.VectorStatisticData:
     """Get statistical vector data for an ensemble"""
@@ -160,6 +286,12 @@ async def get_statistical_vector_data(
     )
     perf_metrics.record_lap("get-table")
 
+    if relative_to_timestamp_utc_ms is not None:
+        vector_table = compute_vector_table_relative_to_timestamp(
+            vector_table, vector_name, relative_to_timestamp_utc_ms
+        )
+        perf_metrics.record_lap("calc-relative")
+
     statistics = compute_vector_statistics(vector_table, vector_name, service_stat_funcs_to_compute)
     if not statistics:
         raise HTTPException(status_code=404, detail="Could not compute statistics")
@@ -172,58 +304,291 @@ async def get_statistical_vector_data(
     return ret_data
 
 
+@router.get("/statistical_vector_data_b64/")
+async def get_statistical_vector_data_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_name: Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
+    statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
+    relative_to_timestamp_utc_ms: Annotated[int | None, Query(description="Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.")] = None,
+    # fmt:on
+) -> schemas.VectorStatisticDataB64:
+    """
+    Get statistical vector data for an ensemble, same as statistical_vector_data, but with the timestamps and
+    values returned as base64 encoded typed arrays
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+
+    service_freq = Frequency.from_string_value(resampling_frequency.value)
+    service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
+
+    vector_table, vector_metadata = await access.get_vector_table_async(
+        vector_name=vector_name,
+        resampling_frequency=service_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-table")
+
+    if relative_to_timestamp_utc_ms is not None:
+        vector_table = compute_vector_table_relative_to_timestamp(
+            vector_table, vector_name, relative_to_timestamp_utc_ms
+        )
+        perf_metrics.record_lap("calc-relative")
+
+    statistics_table = compute_vector_statistics_table(vector_table, vector_name, service_stat_funcs_to_compute)
+    if not statistics_table:
+        raise HTTPException(status_code=404, detail="Could not compute statistics")
+    perf_metrics.record_lap("calc-stat")
+
+    unique_realizations: list[int] = vector_table["REAL"].unique().to_pylist()
+    ret_data = converters.to_api_vector_statistic_data_b64(statistics_table, unique_realizations, vector_metadata)
+    perf_metrics.record_lap("encode-data")
+
+    LOGGER.info(f"Loaded and computed statistical summary data as b64 in: {perf_metrics.to_string()}")
+
+    return ret_data
+
+
+@router.get("/statistical_vectors_data/")
+async def get_statistical_vectors_data(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_names: Annotated[list[str], Query(description="Names of the vectors")],
+    resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
+    statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> schemas.StatisticalVectorsData:
+    """Get statistical vector data for an ensemble for multiple vectors in one response"""
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-access")
+
+    unique_vector_names = list(dict.fromkeys(vector_names))
+    service_freq = Frequency.from_string_value(resampling_frequency.value)
+    service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
+
+    vectors_table, vector_metadata_list = await access.get_vectors_table_async(
+        vector_names=unique_vector_names,
+        resampling_frequency=service_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-vectors")
+
+    statistics_list: list[VectorStatistics] = []
+    for vector_name in unique_vector_names:
+        statistics = compute_vector_statistics(vectors_table, vector_name, service_stat_funcs_to_compute)
+        if not statistics:
+            raise HTTPException(status_code=404, detail=f"Could not compute statistics for {vector_name}")
+        statistics_list.append(statistics)
+    perf_metrics.record_lap("calc-stat")
+
+    ret_data = converters.to_api_statistical_vectors_data(statistics_list, unique_vector_names, vector_metadata_list)
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(
+        f"Loaded and computed statistical summary data for {len(unique_vector_names)} vectors in: "
+        f"{perf_metrics.to_string()}"
+    )
+
+    return ret_data
+
+
 @router.get("/statistical_vector_data_per_sensitivity/")
 async def get_statistical_vector_data_per_sensitivity(
     # fmt:off
+    response: Response,
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
     case_uuid: Annotated[str, Query(description="Sumo case uuid")],
     ensemble_name:  Annotated[str, Query(description="Ensemble name")],
     vector_name: Annotated[str, Query(description="Name of the vector")],
     resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
     statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
-    # relative_to_timestamp: Annotated[datetime.datetime | None, Query(description="Calculate relative to timestamp")] = None,
+    relative_to_timestamp_utc_ms: Annotated[int | None, Query(description="Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.")] = None,
     # fmt:on
 ) -> list[schemas.VectorStatisticSensitivityData]:
     """Get statistical vector data for an ensemble per sensitivity"""
 
+    perf_metrics = ResponsePerfMetrics(response)
+
     summmary_access = await SummaryAccess.from_case_uuid(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
     )
     parameter_access = await ParameterAccess.from_case_uuid(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
     )
-    sensitivities = (await parameter_access.get_parameters_and_sensitivities()).sensitivities
+    perf_metrics.record_lap("get-access")
 
     service_freq = Frequency.from_string_value(resampling_frequency.value)
-    service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
-    vector_table, vector_metadata = await summmary_access.get_vector_table_async(
-        vector_name=vector_name, resampling_frequency=service_freq, realizations=None
+
+    # Load the parameters and the vector table concurrently
+    sensitivities, (vector_table, vector_metadata) = await asyncio.gather(
+        parameter_access.get_sensitivities_async(),
+        summmary_access.get_vector_table_async(
+            vector_name=vector_name, resampling_frequency=service_freq, realizations=None
+        ),
     )
+    perf_metrics.record_lap("get-sensitivities-and-table")
+
+    if relative_to_timestamp_utc_ms is not None:
+        vector_table = compute_vector_table_relative_to_timestamp(
+            vector_table, vector_name, relative_to_timestamp_utc_ms
+        )
+        perf_metrics.record_lap("calc-relative")
+
     ret_data: list[schemas.VectorStatisticSensitivityData] = []
     if not sensitivities:
         return ret_data
-    for sensitivity in sensitivities:
-        for case in sensitivity.cases:
-            mask = pc.is_in(vector_table["REAL"], value_set=pa.array(case.realizations))
-            table = vector_table.filter(mask)
 
-            statistics = compute_vector_statistics(table, vector_name, service_stat_funcs_to_compute)
-            if not statistics:
-                raise HTTPException(status_code=404, detail="Could not compute statistics")
+    sensitivity_and_case_list = [(sensitivity, case) for sensitivity in sensitivities for case in sensitivity.cases]
+    statistics_per_case = compute_vector_statistics_for_realization_groups(
+        vector_table,
+        vector_name,
+        converters.to_service_statistic_functions(statistic_functions),
+        realization_groups=[case.realizations for _sensitivity, case in sensitivity_and_case_list],
+    )
+    perf_metrics.record_lap("calc-stat")
 
-            statistic_data: schemas.VectorStatisticData = converters.to_api_vector_statistic_data(
-                statistics, vector_metadata
-            )
-            sensitivity_statistic_data = schemas.VectorStatisticSensitivityData(
-                sensitivity_name=sensitivity.name,
-                sensitivity_case=case.name,
-                realizations=statistic_data.realizations,
-                timestamps_utc_ms=statistic_data.timestamps_utc_ms,
-                value_objects=statistic_data.value_objects,
-                unit=statistic_data.unit,
-                is_rate=statistic_data.is_rate,
+    for (sensitivity, case), statistics in zip(sensitivity_and_case_list, statistics_per_case):
+        if not statistics:
+            raise HTTPException(status_code=404, detail="Could not compute statistics")
+
+        ret_data.append(
+            converters.to_api_vector_statistic_sensitivity_data(
+                statistics, vector_metadata, sensitivity.name, case.name
             )
-            ret_data.append(sensitivity_statistic_data)
+        )
+
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(f"Loaded and computed statistical summary data per sensitivity in: {perf_metrics.to_string()}")
+
+    return ret_data
+
+
+@router.get("/delta_ensemble_realizations_vector_data_b64/")
+async def get_delta_ensemble_realizations_vector_data_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    comparison_case_uuid: Annotated[str, Query(description="Sumo case uuid for comparison ensemble")],
+    comparison_ensemble_name: Annotated[str, Query(description="Comparison ensemble name")],
+    reference_case_uuid: Annotated[str, Query(description="Sumo case uuid for reference ensemble")],
+    reference_ensemble_name: Annotated[str, Query(description="Reference ensemble name")],
+    vector_name: Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations found in both ensembles will be returned.")] = None,
+    # fmt:on
+) -> schemas.VectorRealizationsDataB64:
+    """
+    Get the realization matched delta of a vector between two ensembles, comparison minus reference, for the
+    realizations and resampled dates found in both ensembles
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access_token = authenticated_user.get_sumo_access_token()
+    comparison_access, reference_access = await asyncio.gather(
+        SummaryAccess.from_case_uuid(access_token, comparison_case_uuid, comparison_ensemble_name),
+        SummaryAccess.from_case_uuid(access_token, reference_case_uuid, reference_ensemble_name),
+    )
+    perf_metrics.record_lap("get-access")
+
+    service_freq = Frequency.from_string_value(resampling_frequency.value)
+    (comparison_table, vector_metadata), (reference_table, _) = await asyncio.gather(
+        comparison_access.get_vector_table_async(vector_name, service_freq, realizations),
+        reference_access.get_vector_table_async(vector_name, service_freq, realizations),
+    )
+    perf_metrics.record_lap("get-tables")
+
+    delta_table = compute_delta_vector_table(comparison_table, reference_table, vector_name)
+    perf_metrics.record_lap("calc-delta")
+
+    ret_data = converters.to_api_vector_realizations_data_b64(delta_table, vector_name, vector_metadata)
+    perf_metrics.record_lap("encode-data")
+
+    LOGGER.info(f"Loaded and computed delta ensemble realization data as b64 in: {perf_metrics.to_string()}")
+
+    return ret_data
+
+
+@router.get("/delta_ensemble_statistical_vector_data_b64/")
+async def get_delta_ensemble_statistical_vector_data_b64(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    comparison_case_uuid: Annotated[str, Query(description="Sumo case uuid for comparison ensemble")],
+    comparison_ensemble_name: Annotated[str, Query(description="Comparison ensemble name")],
+    reference_case_uuid: Annotated[str, Query(description="Sumo case uuid for reference ensemble")],
+    reference_ensemble_name: Annotated[str, Query(description="Reference ensemble name")],
+    vector_name: Annotated[str, Query(description="Name of the vector")],
+    resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
+    delta_method: Annotated[schemas.DeltaEnsembleMethod, Query(description="How the ensembles are matched when computing the delta")],
+    statistic_functions: Annotated[list[schemas.StatisticFunction] | None, Query(description="Optional list of statistics to calculate. If not specified, all statistics will be calculated.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be included.")] = None,
+    # fmt:on
+) -> schemas.VectorStatisticDataB64:
+    """
+    Get statistics of the delta of a vector between two ensembles, comparison minus reference.
+    REALIZATION_MATCHED computes the statistics of the realization matched delta, while STATISTICS_MATCHED
+    computes the statistics of each ensemble and subtracts them, e.g. P10 minus P10.
+    """
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    access_token = authenticated_user.get_sumo_access_token()
+    comparison_access, reference_access = await asyncio.gather(
+        SummaryAccess.from_case_uuid(access_token, comparison_case_uuid, comparison_ensemble_name),
+        SummaryAccess.from_case_uuid(access_token, reference_case_uuid, reference_ensemble_name),
+    )
+    perf_metrics.record_lap("get-access")
+
+    service_freq = Frequency.from_string_value(resampling_frequency.value)
+    service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
+    (comparison_table, vector_metadata), (reference_table, _) = await asyncio.gather(
+        comparison_access.get_vector_table_async(vector_name, service_freq, realizations),
+        reference_access.get_vector_table_async(vector_name, service_freq, realizations),
+    )
+    perf_metrics.record_lap("get-tables")
+
+    if delta_method == schemas.DeltaEnsembleMethod.REALIZATION_MATCHED:
+        delta_table = compute_delta_vector_table(comparison_table, reference_table, vector_name)
+        statistics_table = compute_vector_statistics_table(delta_table, vector_name, service_stat_funcs_to_compute)
+        unique_realizations: list[int] = delta_table["REAL"].unique().to_pylist()
+    else:
+        comparison_stats_table = compute_vector_statistics_table(
+            comparison_table, vector_name, service_stat_funcs_to_compute
+        )
+        reference_stats_table = compute_vector_statistics_table(
+            reference_table, vector_name, service_stat_funcs_to_compute
+        )
+        statistics_table = None
+        if comparison_stats_table and reference_stats_table:
+            statistics_table = compute_delta_statistics_table(comparison_stats_table, reference_stats_table)
+        unique_realizations = comparison_table["REAL"].unique().to_pylist()
+
+    if not statistics_table:
+        raise HTTPException(status_code=404, detail="Could not compute statistics")
+    perf_metrics.record_lap("calc-delta-stat")
+
+    ret_data = converters.to_api_vector_statistic_data_b64(statistics_table, unique_realizations, vector_metadata)
+    perf_metrics.record_lap("encode-data")
+
+    LOGGER.info(f"Loaded and computed delta ensemble statistical data as b64 in: {perf_metrics.to_string()}")
+
     return ret_data
 
 
@@ -247,16 +612,77 @@ async def get_realization_vector_at_timestamp(
     return ensemble_response
 
 
-# @router.get("/realizations_calculated_vector_data/")
-# def get_realizations_calculated_vector_data(
-#     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
-#     case_uuid: Annotated[str, Query(description="Sumo case uuid")],
-#     ensemble_name: Annotated[str, Query(description="Ensemble name")],
-#     expression: Annotated[schemas.VectorExpressionInfo, Depends()],
-#     resampling_frequency: Annotated[schemas.Frequency, Query(description="Resampling frequency")],
-#     relative_to_timestamp: Annotated[datetime.datetime | None, Query(description="Calculate relative to timestamp")] = None,
-# ) -> str:
-#     """Get calculated vector data per realization"""
-#     print(expression)
-#     print(type(expression))
-#     return "hei"
+@router.get("/realization_vector_at_timestamps/")
+async def get_realization_vector_at_timestamps(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name:  Annotated[str, Query(description="Ensemble name")],
+    vector_name: Annotated[str, Query(description="Name of the vector")],
+    timestamps_utc_ms: Annotated[list[int], Query(description="Timestamps in ms UTC to query the vector at")],
+    interpolate: Annotated[bool, Query(description="Interpolate between the realization's dates instead of only returning values at exact dates. Rate vectors are back-filled.")] = False,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be returned.")] = None,
+    # fmt:on
+) -> schemas.VectorRealizationsAtTimestampsData:
+    """Get the values of a vector at multiple timestamps for all realizations, using the raw (non-resampled) data"""
+    perf_metrics = ResponsePerfMetrics(response)
+
+    summary_access = await SummaryAccess.from_case_uuid(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+    )
+    perf_metrics.record_lap("get-access")
+
+    lookup = PointInTimeLookup.INTERPOLATE if interpolate else PointInTimeLookup.EXACT
+    values_at_timestamps, vector_metadata = await summary_access.get_vector_values_at_timestamps_async(
+        vector_name=vector_name, timestamps_utc_ms=timestamps_utc_ms, lookup=lookup, realizations=realizations
+    )
+    perf_metrics.record_lap("get-values")
+
+    ret_data = converters.to_api_vector_realizations_at_timestamps_data(values_at_timestamps, vector_metadata)
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(f"Loaded vector values at {len(timestamps_utc_ms)} timestamps in: {perf_metrics.to_string()}")
+
+    return ret_data
+
+
+@router.get("/realizations_calculated_vector_data/")
+async def get_realizations_calculated_vector_data(
+    # fmt:off
+    response: Response,
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    expression: Annotated[str, Query(description="Mathematical expression, e.g. 'x + y' or 'x / (y + 1)'")],
+    variable_names: Annotated[list[str], Query(description="Variable names used in the expression")],
+    vector_names: Annotated[list[str], Query(description="Vector name for each of the variable names")],
+    resampling_frequency: Annotated[schemas.Frequency | None, Query(description="Resampling frequency. If not specified, raw data without resampling wil be returned.")] = None,
+    realizations: Annotated[list[int] | None, Query(description="Optional list of realizations to include. If not specified, all realizations will be returned.")] = None,
+    # fmt:on
+) -> list[schemas.VectorRealizationData]:
+    """Get calculated vector data per realization"""
+
+    perf_metrics = ResponsePerfMetrics(response)
+
+    vector_expression = parse_vector_expression(expression, variable_names, vector_names)
+    perf_metrics.record_lap("parse-expression")
+
+    access = await SummaryAccess.from_case_uuid(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+
+    sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
+    vector_table, vector_metadata_list = await access.get_calculated_vector_table_async(
+        vector_expression=vector_expression,
+        resampling_frequency=sumo_freq,
+        realizations=realizations,
+    )
+    perf_metrics.record_lap("get-calculated-vector")
+
+    # The calculated vector is presented as a rate if all the vectors it is calculated from are rates
+    is_rate = all(vector_metadata.is_rate for vector_metadata in vector_metadata_list)
+    ret_arr = converters.to_api_vector_realization_data_list(vector_table, "VALUE", unit="", is_rate=is_rate)
+    perf_metrics.record_lap("convert-data")
+
+    LOGGER.info(f"Loaded calculated realization summary data in: {perf_metrics.to_string()}")
+
+    return ret_arr
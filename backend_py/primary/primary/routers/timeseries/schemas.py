@@ -1,8 +1,9 @@
 import datetime
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
+from webviz_pkg.core_utils.b64 import B64FloatArray, B64IntArray
 
 
 class Frequency(str, Enum):
@@ -22,12 +23,24 @@ class StatisticFunction(str, Enum):
     P50 = "P50"
 
 
+class DeltaEnsembleMethod(str, Enum):
+    REALIZATION_MATCHED = "REALIZATION_MATCHED"
+    STATISTICS_MATCHED = "STATISTICS_MATCHED"
+
+
 class VectorDescription(BaseModel):
     name: str
     descriptive_name: str
     has_historical: bool
 
 
+class VectorSearchResult(BaseModel):
+    """One page of the vectors matching a search, total_count is the number of matches across all pages"""
+
+    vectors: List[VectorDescription]
+    total_count: int
+
+
 class VectorHistoricalData(BaseModel):
     timestamps_utc_ms: List[int]
     values: List[float]
@@ -66,6 +79,90 @@ class VectorStatisticSensitivityData(BaseModel):
     sensitivity_case: str
 
 
+class VectorColumnData(BaseModel):
+    vector_name: str
+    values: List[Optional[float]]
+    unit: str
+    is_rate: bool
+
+
+class RealizationsVectorsData(BaseModel):
+    """
+    Columnar data for multiple vectors. The realizations and timestamps lists, along with the values list of each
+    vector, all have one entry per row. The rows are sorted on realization and then on timestamp. A value is null
+    where the vector has no value for the row, which happens when the vectors have different dates.
+    """
+
+    realizations: List[int]
+    timestamps_utc_ms: List[int]
+    vectors: List[VectorColumnData]
+
+
+class VectorStatisticColumnData(BaseModel):
+    vector_name: str
+    value_objects: List[StatisticValueObject]
+    unit: str
+    is_rate: bool
+
+
+class StatisticalVectorsData(BaseModel):
+    """
+    Statistics for multiple vectors, computed over the same realizations and sampled at the same timestamps.
+    """
+
+    realizations: List[int]
+    timestamps_utc_ms: List[int]
+    vectors: List[VectorStatisticColumnData]
+
+
+class VectorRealizationsDataB64(BaseModel):
+    """
+    Data for all realizations of a single vector as base64 encoded typed arrays.
+    The rows of all the realizations are concatenated, and the rows of realizations[i] are found in the index
+    range [real_row_offsets[i], real_row_offsets[i+1]) of the timestamps and values arrays.
+    Timestamps are encoded as float64, which is exact for timestamps in ms.
+    """
+
+    realizations: List[int]
+    real_row_offsets_b64arr: B64IntArray
+    timestamps_utc_ms_b64arr: B64FloatArray
+    values_b64arr: B64FloatArray
+    unit: str
+    is_rate: bool
+
+
+class VectorRealizationsAtTimestampsData(BaseModel):
+    """
+    Values of a vector for multiple realizations at a set of timestamps.
+    The values list has one entry per timestamp, each holding one value per realization, where null means that
+    the realization has no value at the timestamp.
+    """
+
+    realizations: List[int]
+    timestamps_utc_ms: List[int]
+    values_per_timestamp: List[List[Optional[float]]]
+    unit: str
+    is_rate: bool
+
+
+class StatisticValueObjectB64(BaseModel):
+    statistic_function: StatisticFunction
+    values_b64arr: B64FloatArray
+
+
+class VectorStatisticDataB64(BaseModel):
+    """
+    Statistical vector data with the timestamps and values as base64 encoded typed arrays.
+    Timestamps are encoded as float64, which is exact for timestamps in ms.
+    """
+
+    realizations: List[int]
+    timestamps_utc_ms_b64arr: B64FloatArray
+    value_objects: List[StatisticValueObjectB64]
+    unit: str
+    is_rate: bool
+
+
 class VectorExpressionInfo(BaseModel):
     """
     `Description`:
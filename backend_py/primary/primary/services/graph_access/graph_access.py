@@ -5,6 +5,8 @@ from urllib.parse import urljoin
 # Using the same http client as sumo
 import httpx
 
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
+
 
 class GraphApiAccess:
     def __init__(self, access_token: str):
@@ -15,7 +17,7 @@ class GraphApiAccess:
         return {"Authorization": f"Bearer {self._access_token}"}
 
     async def _request(self, url: str) -> httpx.Response:
-        async with httpx.AsyncClient() as client:
+        async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.GRAPH) as client:
             response = await client.get(
                 url,
                 headers=self._make_headers(),
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from primary.services.sumo_access.observation_types import SummaryVectorObservations
+from primary.services.sumo_access.summary_access import VectorValuesAtTimestamps
+
+from .service_exceptions import Service, InvalidDataError
+
+
+@dataclass(frozen=True)
+class ObservationMisfits:
+    """
+    Normalized residuals, (simulated - observed) / error, with shape (num_observations, num_realizations).
+    NaN means that the realization has no simulated value for the observation.
+    """
+
+    realizations: np.ndarray
+    observation_labels: List[str]
+    normalized_residuals: np.ndarray
+
+    def get_realization_misfits(self) -> np.ndarray:
+        """Sum of the squared normalized residuals per realization, over the observations it has values for"""
+        return np.nansum(np.square(self.normalized_residuals), axis=0)
+
+    def get_realization_observation_counts(self) -> np.ndarray:
+        """Number of observations with a simulated value per realization"""
+        return np.count_nonzero(~np.isnan(self.normalized_residuals), axis=0)
+
+    def get_observation_misfits(self) -> np.ndarray:
+        """Mean of the squared normalized residuals per observation, over the realizations with values"""
+        squared_residuals = np.square(self.normalized_residuals)
+        has_value = ~np.isnan(squared_residuals)
+        counts = np.count_nonzero(has_value, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(counts > 0, np.nansum(squared_residuals, axis=1) / counts, np.nan)
+
+
+def get_summary_observation_timestamps_utc_ms(vector_observations: SummaryVectorObservations) -> np.ndarray:
+    """Get the observation dates of the vector as timestamps in ms UTC"""
+    dates = [obs.date for obs in vector_observations.observations]
+    return np.array(dates, dtype="datetime64[ms]").view(np.int64)
+
+
+def compute_summary_observation_misfits(
+    observations: Sequence[SummaryVectorObservations],
+    simulated_values_per_vector: Dict[str, VectorValuesAtTimestamps],
+) -> ObservationMisfits:
+    """
+    Compute normalized residuals for summary vector observations.
+
+    For each observed vector, the simulated values must be looked up at the observation dates, in the same order
+    as the observations, e.g. by using the DATE index of the vector table. The realizations of all vectors are
+    aligned, and realizations that lack a vector get NaN for its observations.
+    """
+    realizations_per_vector = [values.realizations for values in simulated_values_per_vector.values()]
+    all_reals = np.unique(np.concatenate(realizations_per_vector)) if realizations_per_vector else np.empty(0, int)
+
+    labels: List[str] = []
+    residual_blocks: List[np.ndarray] = []
+    for vector_observations in observations:
+        vector_name = vector_observations.vector_name
+        simulated_values = simulated_values_per_vector[vector_name].values
+        obs_values = np.array([obs.value for obs in vector_observations.observations], dtype=np.float64)
+        obs_errors = np.array([obs.error for obs in vector_observations.observations], dtype=np.float64)
+        if simulated_values.shape[0] != len(obs_values):
+            raise InvalidDataError(f"Simulated values do not match the observations of {vector_name}", Service.GENERAL)
+
+        block = np.full((len(obs_values), len(all_reals)), np.nan)
+        col_idx = np.searchsorted(all_reals, simulated_values_per_vector[vector_name].realizations)
+        block[:, col_idx] = _normalized_residuals(simulated_values, obs_values, obs_errors)
+
+        residual_blocks.append(block)
+        labels.extend(obs.label for obs in vector_observations.observations)
+
+    normalized_residuals = np.vstack(residual_blocks) if residual_blocks else np.empty((0, len(all_reals)))
+    return ObservationMisfits(
+        realizations=all_reals, observation_labels=labels, normalized_residuals=normalized_residuals
+    )
+
+
+def _normalized_residuals(simulated_values: np.ndarray, obs_values: np.ndarray, obs_errors: np.ndarray) -> np.ndarray:
+    """Normalized residuals for simulated values with shape (num_observations, num_realizations)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        residuals = (simulated_values - obs_values.reshape(-1, 1)) / obs_errors.reshape(-1, 1)
+    residuals[~np.isfinite(residuals)] = np.nan
+    return residuals
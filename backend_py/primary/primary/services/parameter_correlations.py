@@ -1,62 +1,156 @@
-from typing import List
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Tuple
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
 
-from primary.services.sumo_access.parameter_access import EnsembleParameter
+from primary.services.sumo_access.parameter_access import EnsembleParameterStore
 from primary.services.sumo_access.generic_types import EnsembleScalarResponse, EnsembleCorrelations
 
 
+class CorrelationMethod(str, Enum):
+    PEARSON = "PEARSON"
+    SPEARMAN = "SPEARMAN"
+
+
+@dataclass(frozen=True)
+class ParameterCorrelationMatrix:
+    """
+    Correlations between parameters and responses, with shape (num_parameters, num_responses).
+    Correlations that are undefined, e.g. because a response has the same value in all realizations, are NaN.
+    """
+
+    parameter_names: List[str]
+    correlations: np.ndarray
+
+
+def correlate_parameters_with_responses(
+    parameter_store: EnsembleParameterStore,
+    response_realizations: np.ndarray,
+    response_values: np.ndarray,
+    method: CorrelationMethod,
+) -> ParameterCorrelationMatrix:
+    """
+    Correlate all numerical, non-constant parameters with multiple responses in one pass.
+
+    `response_values` has shape (num_realizations, num_responses), with rows ordered as `response_realizations`.
+    NaN marks a realization that has no value for a response, and each correlation only uses the realizations
+    that have a value. The realizations are aligned once, and the responses sharing the same set of realizations
+    with values, e.g. all timesteps of a vector where every realization has data, are correlated as one matrix
+    product.
+    """
+    parameter_names, parameter_matrix = parameter_store.get_numerical_parameter_matrix()
+
+    _shared_reals, param_row_idx, response_row_idx = np.intersect1d(
+        parameter_store.get_realizations(), response_realizations, assume_unique=True, return_indices=True
+    )
+    parameter_matrix = parameter_matrix[param_row_idx]
+    response_matrix = np.asarray(response_values, dtype=np.float64)[response_row_idx]
+
+    correlations = np.full((len(parameter_names), response_matrix.shape[1]), np.nan)
+    if correlations.size == 0:
+        return ParameterCorrelationMatrix(parameter_names=parameter_names, correlations=correlations)
+
+    # Group the responses on which realizations have values, so that each group is correlated using exactly
+    # the realizations with values. Typically there are only a few such groups.
+    has_value = ~np.isnan(response_matrix)
+    unique_patterns, pattern_idx_per_response = np.unique(has_value.T, axis=0, return_inverse=True)
+    pattern_idx_per_response = pattern_idx_per_response.reshape(-1)
+    for pattern_idx, row_mask in enumerate(unique_patterns):
+        response_mask = pattern_idx_per_response == pattern_idx
+        param_values = parameter_matrix[row_mask]
+        resp_values = response_matrix[np.ix_(row_mask, response_mask)]
+        if method == CorrelationMethod.SPEARMAN:
+            param_values = rank_columns(param_values)
+            resp_values = rank_columns(resp_values)
+        correlations[:, response_mask] = pearson_correlation_matrix(param_values, resp_values)
+
+    return ParameterCorrelationMatrix(parameter_names=parameter_names, correlations=correlations)
+
+
 def correlate_parameters_with_response(
-    ensemble_parameters: List[EnsembleParameter], response: EnsembleScalarResponse
+    parameter_store: EnsembleParameterStore,
+    response: EnsembleScalarResponse,
+    method: CorrelationMethod = CorrelationMethod.PEARSON,
 ) -> EnsembleCorrelations:
-    """Correlates ensemble parameters values with an ensemble response"""
-    parameter_dframe = _numerical_parameters_to_pandas_table(ensemble_parameters)
-    response_dframe = _ensemble_scalar_response_to_pandas_table(response)
-
-    # Merge dframes on real for consistency
-    dframe = pd.merge(parameter_dframe, response_dframe, on="realization")
-    dframe.set_index("realization", inplace=True)
-
-    # Separate response out as a series and correlate
-    response_series = dframe["response"]
-    dframe = dframe.drop(columns=["response"])
-    corr_series = dframe.corrwith(response_series)
-
-    # Sort correlations in descending order
-    sorted_corr_series = corr_series.reindex(corr_series.abs().sort_values().index)
-
-    return EnsembleCorrelations(names=sorted_corr_series.index.to_list(), values=sorted_corr_series.to_list())
-
-
-def _numerical_parameters_to_pandas_table(
-    ensemble_parameters: List[EnsembleParameter],
-) -> pd.DataFrame:
-    """Convert a list of ensemble parameters to a pandas dataframe"""
-    data = []
-    for parameter in ensemble_parameters:
-        # Skip non-numerical parameters
-        if not parameter.is_numerical:
-            continue
-        # Skip parameters where all values are equal
-        if all(value == parameter.values[0] for value in parameter.values[1:]):
-            continue
-        for real, value in zip(parameter.realizations, parameter.values):
-            data.append({"name": parameter.name, "realization": real, "value": value})
-
-    # Convert the list of dictionaries to a pandas DataFrame
-    df = pd.DataFrame(data)
-
-    # Pivot name column to individual columns per parameter
-    pivot_df = df.pivot(index="realization", columns="name", values="value").reset_index()
-    return pivot_df
-
-
-def _ensemble_scalar_response_to_pandas_table(
-    ensemble_response: EnsembleScalarResponse,
-) -> pd.DataFrame:
-    """Convert a ensemble scalar response to a pandas dataframe"""
-    data = []
-    for real, value in zip(ensemble_response.realizations, ensemble_response.values):
-        data.append({"realization": real, "response": value})
-    df = pd.DataFrame(data)
-    return df
+    """
+    Correlates the ensemble parameters with an ensemble scalar response.
+    Parameters with undefined correlation are left out, and the rest are sorted on ascending absolute correlation.
+    """
+    response_values = np.array(response.values, dtype=np.float64).reshape(-1, 1)
+    correlation_matrix = correlate_parameters_with_responses(
+        parameter_store, np.array(response.realizations), response_values, method
+    )
+
+    correlations = correlation_matrix.correlations[:, 0]
+    valid_idx = np.flatnonzero(~np.isnan(correlations))
+    sorted_idx = valid_idx[np.argsort(np.abs(correlations[valid_idx]), kind="stable")]
+
+    return EnsembleCorrelations(
+        names=[correlation_matrix.parameter_names[idx] for idx in sorted_idx],
+        values=correlations[sorted_idx].tolist(),
+    )
+
+
+def pivot_vector_table_to_realization_matrix(
+    vector_table: pa.Table, vector_name: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pivot a table with DATE, REAL and vector columns to a matrix with one row per realization and one column per
+    unique timestamp, with NaN where a realization has no value.
+    Returns the unique realizations, the unique timestamps in ms UTC and the float64 value matrix.
+    """
+    real_arr_np = vector_table["REAL"].to_numpy()
+    dates_as_int = vector_table["DATE"].to_numpy().view(np.int64)
+
+    unique_reals, row_idx = np.unique(real_arr_np, return_inverse=True)
+    unique_timestamps, col_idx = np.unique(dates_as_int, return_inverse=True)
+
+    value_matrix = np.full((len(unique_reals), len(unique_timestamps)), np.nan)
+    value_matrix[row_idx, col_idx] = vector_table[vector_name].to_numpy()
+
+    return unique_reals, unique_timestamps, value_matrix
+
+
+def pearson_correlation_matrix(x_values: np.ndarray, y_values: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between each column of x_values, shape (n, p), and each column of y_values, shape (n, q).
+    Returns array with shape (p, q), with NaN for columns without variation.
+    """
+    x_centered = x_values - x_values.mean(axis=0) if len(x_values) > 0 else x_values
+    y_centered = y_values - y_values.mean(axis=0) if len(y_values) > 0 else y_values
+    x_norm = np.linalg.norm(x_centered, axis=0)
+    y_norm = np.linalg.norm(y_centered, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlations = (x_centered.T @ y_centered) / np.outer(x_norm, y_norm)
+
+    correlations[~np.isfinite(correlations)] = np.nan
+    return np.clip(correlations, -1.0, 1.0)
+
+
+def rank_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Rank the values in each column of a 2D array, starting at 1, where tied values get the average of their ranks
+    """
+    num_rows = values.shape[0]
+    if num_rows == 0:
+        return values.astype(np.float64)
+
+    order = np.argsort(values, axis=0, kind="stable")
+    sorted_values = np.take_along_axis(values, order, axis=0)
+
+    # Each run of equal sorted values is a group of ties, find the first and last position of each run
+    positions = np.broadcast_to(np.arange(num_rows).reshape(-1, 1), values.shape)
+    is_run_start = np.ones(values.shape, dtype=bool)
+    is_run_start[1:] = sorted_values[1:] != sorted_values[:-1]
+    is_run_end = np.ones(values.shape, dtype=bool)
+    is_run_end[:-1] = is_run_start[1:]
+
+    run_first_pos = np.maximum.accumulate(np.where(is_run_start, positions, 0), axis=0)
+    run_last_pos = np.flip(np.minimum.accumulate(np.flip(np.where(is_run_end, positions, num_rows), 0), axis=0), 0)
+
+    ranks = np.empty(values.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, (run_first_pos + run_last_pos) / 2.0 + 1.0, axis=0)
+    return ranks
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from primary.services.sumo_access.parameter_access import EnsembleParameterStore
+from primary.services.sumo_access.parameter_types import SensitivityType
+
+from .service_exceptions import Service, InvalidParameterError
+
+# Sensitivity used as reference when none is specified, if it exists in the ensemble
+DEFAULT_REFERENCE_SENSITIVITY_NAME = "rms_seed"
+
+# Percentiles used as low and high for Monte Carlo sensitivities
+_MONTECARLO_LOW_PERCENTILE = 10
+_MONTECARLO_HIGH_PERCENTILE = 90
+
+
+@dataclass(frozen=True)
+class SensitivityTornadoValues:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Low, high and mean of one sensitivity for each of the responses, both as values and as deltas against the
+    reference values.
+    For scenario sensitivities low and high are the lowest and highest case mean. If there is only one case, the
+    reference value is used on the other side and the case name there is None. For Monte Carlo sensitivities low
+    and high are the P10 and P90 of the sensitivity's realizations.
+    """
+
+    sensitivity_name: str
+    sensitivity_type: SensitivityType
+    low_values: np.ndarray
+    high_values: np.ndarray
+    mean_values: np.ndarray
+    low_deltas: np.ndarray
+    high_deltas: np.ndarray
+    mean_deltas: np.ndarray
+    low_case_names: List[Optional[str]]
+    high_case_names: List[Optional[str]]
+
+
+@dataclass(frozen=True)
+class SensitivityTornado:
+    """
+    Tornado data for a set of responses, where the reference values are the mean of the reference sensitivity.
+    All arrays have one entry per response, with NaN where there are no values.
+    """
+
+    reference_sensitivity_name: str
+    reference_values: np.ndarray
+    sensitivities: List[SensitivityTornadoValues]
+
+
+def compute_sensitivity_tornado(
+    parameter_store: EnsembleParameterStore,
+    response_realizations: np.ndarray,
+    response_values: np.ndarray,
+    reference_sensitivity_name: Optional[str],
+) -> SensitivityTornado:
+    # pylint: disable=too-many-locals
+    """
+    Compute tornado data for all sensitivities and all responses in one pass.
+
+    `response_values` has shape (num_realizations, num_responses), with rows ordered as `response_realizations`,
+    and NaN where a realization has no value. If no reference sensitivity is given, the default reference
+    sensitivity is used if it exists, otherwise the first sensitivity.
+    """
+    case_index = parameter_store.get_sensitivity_case_index()
+    if case_index is None:
+        raise InvalidParameterError("Ensemble is not a sensitivity run", Service.GENERAL)
+
+    sens_names = [sensitivity.name for sensitivity in case_index.sensitivities]
+    if reference_sensitivity_name is None:
+        reference_sensitivity_name = (
+            DEFAULT_REFERENCE_SENSITIVITY_NAME if DEFAULT_REFERENCE_SENSITIVITY_NAME in sens_names else sens_names[0]
+        )
+    if reference_sensitivity_name not in sens_names:
+        raise InvalidParameterError(
+            f"Reference sensitivity {reference_sensitivity_name} not found, {sens_names=}", Service.GENERAL
+        )
+
+    _shared_reals, param_row_idx, response_row_idx = np.intersect1d(
+        parameter_store.get_realizations(), response_realizations, assume_unique=True, return_indices=True
+    )
+    row_case_idx = case_index.row_case_idx[param_row_idx]
+    values = np.asarray(response_values, dtype=np.float64)[response_row_idx]
+
+    # Sum and count the values per case for all responses as one matrix product
+    num_cases = len(case_index.case_names)
+    has_case = row_case_idx >= 0
+    case_membership = np.zeros((num_cases, len(row_case_idx)))
+    case_membership[row_case_idx[has_case], np.flatnonzero(has_case)] = 1.0
+    has_value = ~np.isnan(values)
+    case_sums = case_membership @ np.where(has_value, values, 0.0)
+    case_counts = case_membership @ has_value
+
+    sens_sums = np.zeros((len(sens_names), values.shape[1]))
+    sens_counts = np.zeros((len(sens_names), values.shape[1]))
+    np.add.at(sens_sums, case_index.case_sens_idx, case_sums)
+    np.add.at(sens_counts, case_index.case_sens_idx, case_counts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        case_means = case_sums / case_counts
+        sens_means = sens_sums / sens_counts
+
+    reference_values = sens_means[sens_names.index(reference_sensitivity_name)]
+
+    sensitivities: List[SensitivityTornadoValues] = []
+    for sens_idx, sensitivity in enumerate(case_index.sensitivities):
+        sens_case_idx = np.flatnonzero(case_index.case_sens_idx == sens_idx)
+        if sensitivity.type == SensitivityType.MONTECARLO:
+            sens_values = values[np.isin(row_case_idx, sens_case_idx)]
+            low_values, high_values = _compute_low_and_high_percentiles(sens_values)
+            case_name = case_index.case_names[sens_case_idx[0]]
+            low_case_names: List[Optional[str]] = [case_name] * len(low_values)
+            high_case_names: List[Optional[str]] = [case_name] * len(high_values)
+        else:
+            sens_case_names: List[Optional[str]] = [case_index.case_names[idx] for idx in sens_case_idx]
+            if len(sens_case_idx) == 1:
+                # Use the reference on the side of the tornado the single case is not on
+                sens_case_means = np.vstack((case_means[sens_case_idx[0]], reference_values))
+                sens_case_names.append(None)
+            else:
+                sens_case_means = case_means[sens_case_idx]
+            low_values, low_case_names = _select_case_values(sens_case_means, sens_case_names, select_max=False)
+            high_values, high_case_names = _select_case_values(sens_case_means, sens_case_names, select_max=True)
+
+        sensitivities.append(
+            SensitivityTornadoValues(
+                sensitivity_name=sensitivity.name,
+                sensitivity_type=sensitivity.type,
+                low_values=low_values,
+                high_values=high_values,
+                mean_values=sens_means[sens_idx],
+                low_deltas=low_values - reference_values,
+                high_deltas=high_values - reference_values,
+                mean_deltas=sens_means[sens_idx] - reference_values,
+                low_case_names=low_case_names,
+                high_case_names=high_case_names,
+            )
+        )
+
+    return SensitivityTornado(
+        reference_sensitivity_name=reference_sensitivity_name,
+        reference_values=reference_values,
+        sensitivities=sensitivities,
+    )
+
+
+def _compute_low_and_high_percentiles(sens_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    num_responses = sens_values.shape[1]
+    is_all_nan = np.all(np.isnan(sens_values), axis=0)
+    low_values = np.full(num_responses, np.nan)
+    high_values = np.full(num_responses, np.nan)
+    if not np.all(is_all_nan):
+        percentiles = np.nanpercentile(
+            sens_values[:, ~is_all_nan], [_MONTECARLO_LOW_PERCENTILE, _MONTECARLO_HIGH_PERCENTILE], axis=0
+        )
+        low_values[~is_all_nan] = percentiles[0]
+        high_values[~is_all_nan] = percentiles[1]
+    return low_values, high_values
+
+
+def _select_case_values(
+    case_means: np.ndarray, case_names: List[Optional[str]], select_max: bool
+) -> Tuple[np.ndarray, List[Optional[str]]]:
+    """
+    Select the lowest, or highest, case mean per response along with the case name, ignoring NaN.
+    Responses where all cases are NaN get NaN and no case name.
+    """
+    is_all_nan = np.all(np.isnan(case_means), axis=0)
+    if select_max:
+        selected_idx = np.argmax(np.where(np.isnan(case_means), -np.inf, case_means), axis=0)
+    else:
+        selected_idx = np.argmin(np.where(np.isnan(case_means), np.inf, case_means), axis=0)
+    selected_values = np.take_along_axis(case_means, selected_idx.reshape(1, -1), axis=0)[0]
+    selected_values[is_all_nan] = np.nan
+    selected_names = [None if is_nan else case_names[idx] for idx, is_nan in zip(selected_idx, is_all_nan)]
+    return selected_values, selected_names
@@ -1,10 +1,10 @@
 from typing import List
 
-import httpx
 from dotenv import load_dotenv
 from webviz_pkg.core_utils.perf_timer import PerfTimer
 
 from primary import config
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
 
 load_dotenv()
 
@@ -25,15 +25,15 @@ async def get(access_token: str, endpoint: str, params: dict) -> List[dict]:
     }
     timer = PerfTimer()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(urlstring, params=params, headers=headers, timeout=60)
+    async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.SMDA) as client:
+        response = await client.get(urlstring, params=params, headers=headers)
         results = []
         if response.status_code == 200:
             results = response.json()["data"]["results"]
             next_request = response.json()["data"]["next"]
             while next_request is not None:
                 params["_next"] = next_request
-                response = await client.get(urlstring, params=params, headers=headers, timeout=60)
+                response = await client.get(urlstring, params=params, headers=headers)
                 result = response.json()["data"]["results"]
                 if result:
                     results.extend(response.json()["data"]["results"])
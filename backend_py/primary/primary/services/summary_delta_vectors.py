@@ -0,0 +1,96 @@
+import numpy as np
+import pyarrow as pa
+
+from .service_exceptions import Service, InvalidParameterError
+from .sumo_access.summary_access import PointInTimeLookup, build_segmented_date_index
+
+
+def compute_vector_table_relative_to_timestamp(
+    summary_vector_table: pa.Table, vector_name: str, timestamp_utc_ms: int
+) -> pa.Table:
+    """
+    Subtract each realization's value at the timestamp from all of the realization's values.
+    The table must contain DATE, REAL and vector columns and be sorted on REAL and then DATE.
+    Realizations that do not have a value at exactly the timestamp are removed from the returned table.
+    """
+    date_index = build_segmented_date_index(summary_vector_table)
+    values_np = summary_vector_table.column(vector_name).to_numpy()
+
+    ref_values = date_index.lookup_values_at_timestamps(
+        values_np, np.array([timestamp_utc_ms]), PointInTimeLookup.EXACT, is_rate=False
+    )[0]
+
+    seg_counts = np.diff(date_index.real_row_offsets)
+    row_ref_values = np.repeat(ref_values, seg_counts)
+    has_ref_value = ~np.isnan(row_ref_values)
+
+    relative_values = (values_np - row_ref_values).astype(np.float32)
+    vector_idx = summary_vector_table.schema.get_field_index(vector_name)
+    relative_table = summary_vector_table.set_column(
+        vector_idx, summary_vector_table.schema.field(vector_name), pa.array(relative_values)
+    )
+
+    if np.all(has_ref_value):
+        return relative_table
+    return relative_table.filter(pa.array(has_ref_value))
+
+
+def compute_delta_vector_table(
+    comparison_vector_table: pa.Table, reference_vector_table: pa.Table, vector_name: str
+) -> pa.Table:
+    """
+    Realization matched delta, comparison minus reference, for the realizations and dates found in both tables.
+    Both tables must contain DATE, REAL and vector columns, and the returned table is sorted on REAL and then DATE.
+    """
+    # Fast path for the common case where the tables are resampled, and have the same realizations
+    has_same_rows = comparison_vector_table["REAL"].equals(reference_vector_table["REAL"])
+    has_same_rows = has_same_rows and comparison_vector_table["DATE"].equals(reference_vector_table["DATE"])
+    if has_same_rows:
+        delta_np = comparison_vector_table[vector_name].to_numpy() - reference_vector_table[vector_name].to_numpy()
+        return comparison_vector_table.select(["DATE", "REAL"]).append_column(
+            comparison_vector_table.schema.field(vector_name), pa.array(delta_np.astype(np.float32))
+        )
+
+    joined_table = comparison_vector_table.select(["DATE", "REAL", vector_name]).join(
+        reference_vector_table.select(["DATE", "REAL", vector_name]).rename_columns(["DATE", "REAL", "_REF"]),
+        keys=["REAL", "DATE"],
+        join_type="inner",
+    )
+    joined_table = joined_table.sort_by([("REAL", "ascending"), ("DATE", "ascending")])
+
+    delta_np = joined_table[vector_name].to_numpy() - joined_table["_REF"].to_numpy()
+    return joined_table.select(["DATE", "REAL"]).append_column(
+        comparison_vector_table.schema.field(vector_name), pa.array(delta_np.astype(np.float32))
+    )
+
+
+def compute_delta_statistics_table(
+    comparison_statistics_table: pa.Table, reference_statistics_table: pa.Table
+) -> pa.Table:
+    """
+    Statistics matched delta, where each statistic of the reference is subtracted from the same statistic of the
+    comparison, e.g. P10 minus P10. Both tables must contain a DATE column and the same statistic columns, as
+    returned by compute_vector_statistics_table(), and the returned table contains the dates found in both.
+    """
+    stat_column_names = [name for name in comparison_statistics_table.column_names if name != "DATE"]
+    if sorted(stat_column_names) != sorted(name for name in reference_statistics_table.column_names if name != "DATE"):
+        raise InvalidParameterError("Statistics tables must contain the same statistics", Service.GENERAL)
+
+    comparison_dates_np = comparison_statistics_table["DATE"].to_numpy().view(np.int64)
+    reference_dates_np = reference_statistics_table["DATE"].to_numpy().view(np.int64)
+
+    # The dates of statistics tables are unique and sorted
+    _shared_dates, comparison_idx, reference_idx = np.intersect1d(
+        comparison_dates_np, reference_dates_np, assume_unique=True, return_indices=True
+    )
+
+    delta_table = comparison_statistics_table.select(["DATE"]).take(pa.array(comparison_idx))
+    for name in stat_column_names:
+        comparison_values = comparison_statistics_table[name].to_numpy()[comparison_idx]
+        reference_values = reference_statistics_table[name].to_numpy()[reference_idx]
+        delta_table = delta_table.append_column(
+            comparison_statistics_table.schema.field(name),
+            pa.array((comparison_values - reference_values).astype(np.float32)),
+        )
+
+    return delta_table
@@ -0,0 +1,280 @@
+import ast
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from .service_exceptions import Service, InvalidParameterError
+
+# Max length of an expression string, guards against pathological input to the parser
+_MAX_EXPRESSION_LENGTH = 1000
+
+_BINARY_OPERATORS: Dict[type, Tuple[str, Callable[..., np.ndarray]]] = {
+    ast.Add: ("+", np.add),
+    ast.Sub: ("-", np.subtract),
+    ast.Mult: ("*", np.multiply),
+    ast.Div: ("/", np.divide),
+    ast.Pow: ("**", np.power),
+}
+
+_UNARY_OPERATORS: Dict[type, Tuple[str, Callable[..., np.ndarray]]] = {
+    ast.USub: ("-", np.negative),
+    ast.UAdd: ("+", np.positive),
+}
+
+_BINARY_OPERATORS_BY_SYMBOL = dict(_BINARY_OPERATORS.values())
+_UNARY_OPERATORS_BY_SYMBOL = dict(_UNARY_OPERATORS.values())
+
+_FUNCTIONS: Dict[str, Tuple[int, Callable[..., np.ndarray]]] = {
+    "abs": (1, np.abs),
+    "sqrt": (1, np.sqrt),
+    "exp": (1, np.exp),
+    "log": (1, np.log),
+    "log10": (1, np.log10),
+    "min": (2, np.minimum),
+    "max": (2, np.maximum),
+}
+
+
+@dataclass(frozen=True)
+class _VectorNode:
+    vector_name: str
+
+    def canonical(self) -> str:
+        return f"[{self.vector_name}]"
+
+
+@dataclass(frozen=True)
+class _ConstantNode:
+    value: float
+
+    def canonical(self) -> str:
+        return repr(self.value)
+
+
+@dataclass(frozen=True)
+class _UnaryNode:
+    op_symbol: str
+    operand: "ExpressionNode"
+
+    def canonical(self) -> str:
+        return f"({self.op_symbol}{self.operand.canonical()})"
+
+
+@dataclass(frozen=True)
+class _BinaryNode:
+    op_symbol: str
+    left: "ExpressionNode"
+    right: "ExpressionNode"
+
+    def canonical(self) -> str:
+        return f"({self.left.canonical()}{self.op_symbol}{self.right.canonical()})"
+
+
+@dataclass(frozen=True)
+class _FunctionNode:
+    func_name: str
+    args: Tuple["ExpressionNode", ...]
+
+    def canonical(self) -> str:
+        return f"{self.func_name}({','.join(arg.canonical() for arg in self.args)})"
+
+
+ExpressionNode = Union[_VectorNode, _ConstantNode, _UnaryNode, _BinaryNode, _FunctionNode]
+
+
+@dataclass(frozen=True)
+class VectorExpression:
+    """
+    Parsed expression for a calculated vector, where the variables have been replaced by the vector names.
+
+    The canonical string of the expression, and of each of its subexpressions, only depends on the structure and
+    the vector names, so it can be used as a cache key across requests that use different variable names.
+    """
+
+    root: ExpressionNode
+    vector_names: Tuple[str, ...]
+
+    def canonical(self) -> str:
+        return self.root.canonical()
+
+    def get_cacheable_subexpressions(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+        Get the canonical string and the referenced vector names of each subexpression that is worth caching,
+        i.e. the ones that depend on vectors and are not simply a vector. Includes the expression itself.
+        """
+        ret_list: List[Tuple[str, Tuple[str, ...]]] = []
+        _collect_cacheable_subexpressions(self.root, ret_list)
+        return list(dict.fromkeys(ret_list))
+
+
+def parse_vector_expression(
+    expression: str, variable_names: Sequence[str], vector_names: Sequence[str]
+) -> VectorExpression:
+    """
+    Parse an expression like `x + y` or `x / (y + 1)`, where the variable names are mapped to vector names.
+    Supported are the operators + - * / **, numeric constants and the functions abs, sqrt, exp, log, log10, min and
+    max. The expression must reference at least one vector. Parsed expressions are cached.
+    """
+    if len(variable_names) != len(vector_names):
+        raise InvalidParameterError(
+            f"Number of variable names and vector names must match: {variable_names=}, {vector_names=}",
+            Service.GENERAL,
+        )
+    if len(set(variable_names)) != len(variable_names):
+        raise InvalidParameterError(f"Variable names must be unique: {variable_names=}", Service.GENERAL)
+
+    return _parse_vector_expression_cached(expression, tuple(variable_names), tuple(vector_names))
+
+
+def evaluate_vector_expression(
+    vector_expression: VectorExpression,
+    vector_values: Mapping[str, np.ndarray],
+    subexpression_values: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """
+    Evaluate the expression over whole columns.
+    All arrays in `vector_values` must be aligned, i.e. have the same length and refer to the same rows.
+
+    `subexpression_values` holds already computed subexpressions, keyed on their canonical string, and these are
+    used instead of evaluating the subexpressions again. The computed subexpressions are added to it, which also
+    makes subexpressions that occur multiple times in the expression be evaluated only once.
+    Division by zero and invalid operations give inf or NaN without raising.
+    """
+    vector_values_f64 = {name: np.asarray(values, dtype=np.float64) for name, values in vector_values.items()}
+    num_rows = len(next(iter(vector_values_f64.values()))) if vector_values_f64 else 0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        result = _evaluate_node(vector_expression.root, vector_values_f64, subexpression_values)
+
+    if isinstance(result, float):
+        return np.full(num_rows, result, dtype=np.float64)
+    return result
+
+
+@lru_cache(maxsize=256)
+def _parse_vector_expression_cached(
+    expression: str, variable_names: Tuple[str, ...], vector_names: Tuple[str, ...]
+) -> VectorExpression:
+    if len(expression) > _MAX_EXPRESSION_LENGTH:
+        raise InvalidParameterError(f"Expression is longer than {_MAX_EXPRESSION_LENGTH} characters", Service.GENERAL)
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise InvalidParameterError(f"Invalid expression {expression=}: {exc.msg}", Service.GENERAL) from exc
+
+    vector_name_by_variable = dict(zip(variable_names, vector_names))
+    root = _convert_ast_node(tree.body, vector_name_by_variable)
+
+    referenced_vector_names: List[str] = []
+    _collect_vector_names(root, referenced_vector_names)
+    if not referenced_vector_names:
+        raise InvalidParameterError(f"Expression must reference at least one vector: {expression=}", Service.GENERAL)
+
+    return VectorExpression(root=root, vector_names=tuple(dict.fromkeys(referenced_vector_names)))
+
+
+def _convert_ast_node(node: ast.AST, vector_name_by_variable: Mapping[str, str]) -> ExpressionNode:
+    # pylint: disable=too-many-return-statements
+    if isinstance(node, ast.Name):
+        vector_name = vector_name_by_variable.get(node.id)
+        if vector_name is None:
+            raise InvalidParameterError(f"Unknown variable in expression: {node.id}", Service.GENERAL)
+        return _VectorNode(vector_name)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return _ConstantNode(float(node.value))
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        op_symbol = _BINARY_OPERATORS[type(node.op)][0]
+        left = _convert_ast_node(node.left, vector_name_by_variable)
+        right = _convert_ast_node(node.right, vector_name_by_variable)
+        return _BinaryNode(op_symbol, left, right)
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        op_symbol = _UNARY_OPERATORS[type(node.op)][0]
+        return _UnaryNode(op_symbol, _convert_ast_node(node.operand, vector_name_by_variable))
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS:
+        func_name = node.func.id
+        arg_count = _FUNCTIONS[func_name][0]
+        if node.keywords or len(node.args) != arg_count:
+            raise InvalidParameterError(
+                f"Function {func_name} in expression takes exactly {arg_count} argument(s)", Service.GENERAL
+            )
+        args = tuple(_convert_ast_node(arg, vector_name_by_variable) for arg in node.args)
+        return _FunctionNode(func_name, args)
+
+    raise InvalidParameterError(f"Unsupported element in expression: {ast.unparse(node)}", Service.GENERAL)
+
+
+def _collect_vector_names(node: ExpressionNode, vector_names: List[str]) -> None:
+    if isinstance(node, _VectorNode):
+        vector_names.append(node.vector_name)
+    elif isinstance(node, _UnaryNode):
+        _collect_vector_names(node.operand, vector_names)
+    elif isinstance(node, _BinaryNode):
+        _collect_vector_names(node.left, vector_names)
+        _collect_vector_names(node.right, vector_names)
+    elif isinstance(node, _FunctionNode):
+        for arg in node.args:
+            _collect_vector_names(arg, vector_names)
+
+
+def _collect_cacheable_subexpressions(node: ExpressionNode, ret_list: List[Tuple[str, Tuple[str, ...]]]) -> None:
+    if isinstance(node, (_VectorNode, _ConstantNode)):
+        return
+
+    child_nodes: Sequence[ExpressionNode]
+    if isinstance(node, _UnaryNode):
+        child_nodes = [node.operand]
+    elif isinstance(node, _BinaryNode):
+        child_nodes = [node.left, node.right]
+    else:
+        child_nodes = node.args
+
+    for child_node in child_nodes:
+        _collect_cacheable_subexpressions(child_node, ret_list)
+
+    vector_names: List[str] = []
+    _collect_vector_names(node, vector_names)
+    if vector_names:
+        ret_list.append((node.canonical(), tuple(sorted(set(vector_names)))))
+
+
+def _evaluate_node(
+    node: ExpressionNode,
+    vector_values: Mapping[str, np.ndarray],
+    subexpression_values: Dict[str, np.ndarray],
+) -> Union[np.ndarray, float]:
+    if isinstance(node, _VectorNode):
+        return vector_values[node.vector_name]
+    if isinstance(node, _ConstantNode):
+        return node.value
+
+    canonical = node.canonical()
+    cached_values = subexpression_values.get(canonical)
+    if cached_values is not None:
+        return cached_values
+
+    result: Union[np.ndarray, float]
+    if isinstance(node, _UnaryNode):
+        unary_func = _UNARY_OPERATORS_BY_SYMBOL[node.op_symbol]
+        result = unary_func(_evaluate_node(node.operand, vector_values, subexpression_values))
+    elif isinstance(node, _BinaryNode):
+        binary_func = _BINARY_OPERATORS_BY_SYMBOL[node.op_symbol]
+        left = _evaluate_node(node.left, vector_values, subexpression_values)
+        right = _evaluate_node(node.right, vector_values, subexpression_values)
+        result = binary_func(left, right)
+    else:
+        func = _FUNCTIONS[node.func_name][1]
+        result = func(*[_evaluate_node(arg, vector_values, subexpression_values) for arg in node.args])
+
+    # Constant subexpressions are cheap and are not stored
+    if np.ndim(result) == 0:
+        return float(result)
+
+    result_arr = np.asarray(result, dtype=np.float64)
+    subexpression_values[canonical] = result_arr
+    return result_arr
@@ -1,14 +1,10 @@
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 from pydantic import BaseModel
 
-from .utils.arrow_helpers import (
-    create_float_downcasting_schema,
-    set_date_column_type_to_timestamp_ms,
-)
 from .utils.statistic_function import StatisticFunction
 from .service_exceptions import Service, InvalidParameterError
 
@@ -26,10 +22,39 @@ def compute_vector_statistics_table(
 ) -> Optional[pa.Table]:
     """
     Compute statistics for specified summary vector in the pyarrow table.
-    If statistics is None, all available statistics are computed.
+    If statistics is None, all available statistics except STD are computed.
     Returns a pyarrow.Table with a DATE column and then one column for each statistic.
+
+    The values are arranged into a dense 2-D matrix with one row per unique date, and all statistics are computed
+    row-wise in a single vectorized pass. NaN values, and missing values for a date, are ignored.
     """
 
+    unique_stat_funcs = _get_unique_statistic_functions(statistic_functions)
+
+    if summary_vector_table.num_rows == 0:
+        return None
+
+    unique_dates_np, values_matrix = _build_date_by_sample_matrix(summary_vector_table, vector_name)
+    stat_values_dict = compute_statistics_for_matrix_rows(values_matrix, unique_stat_funcs)
+
+    field_list = [pa.field("DATE", pa.timestamp("ms"))]
+    array_list = [pa.array(unique_dates_np, type=pa.timestamp("ms"))]
+    for stat_func in unique_stat_funcs:
+        field_list.append(pa.field(stat_func.value, pa.float32()))
+        array_list.append(pa.array(stat_values_dict[stat_func].astype(np.float32)))
+
+    statistics_table = pa.table(array_list, schema=pa.schema(field_list))
+
+    return statistics_table
+
+
+def _get_unique_statistic_functions(
+    statistic_functions: Optional[Sequence[StatisticFunction]],
+) -> List[StatisticFunction]:
+    """
+    Get the statistic functions to compute, using the defaults if None is specified.
+    Duplicates are removed while preserving the requested order, which determines the order of the output columns
+    """
     if statistic_functions is None:
         statistic_functions = [
             StatisticFunction.MIN,
@@ -40,49 +65,128 @@ def compute_vector_statistics_table(
             StatisticFunction.P50,
         ]
 
-    # Invert p10 and p90 due to oil industry convention.
-    def p10_func(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=90)
-
-    def p90_func(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=10)
-
-    def p50_func(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=50)
-
-    agg_dict = {}
-    for stat_func in statistic_functions:
-        if stat_func == StatisticFunction.MIN:
-            agg_dict["MIN"] = pd.NamedAgg(column=vector_name, aggfunc=np.nanmin)
-        elif stat_func == StatisticFunction.MAX:
-            agg_dict["MAX"] = pd.NamedAgg(column=vector_name, aggfunc=np.nanmax)
-        elif stat_func == StatisticFunction.MEAN:
-            agg_dict["MEAN"] = pd.NamedAgg(column=vector_name, aggfunc=np.nanmean)
-        elif stat_func == StatisticFunction.P10:
-            agg_dict["P10"] = pd.NamedAgg(column=vector_name, aggfunc=p10_func)
-        elif stat_func == StatisticFunction.P90:
-            agg_dict["P90"] = pd.NamedAgg(column=vector_name, aggfunc=p90_func)
-        elif stat_func == StatisticFunction.P50:
-            agg_dict["P50"] = pd.NamedAgg(column=vector_name, aggfunc=p50_func)
-
-    if not agg_dict:
+    unique_stat_funcs = list(dict.fromkeys(statistic_functions))
+    if not unique_stat_funcs:
         raise InvalidParameterError("At least one statistic must be requested", Service.GENERAL)
 
-    if summary_vector_table.num_rows == 0:
+    return unique_stat_funcs
+
+
+def _build_date_by_sample_matrix(summary_vector_table: pa.Table, vector_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Arrange the vector values into a dense float32 matrix with one row per unique date, sorted on date.
+    Each row holds all the values for that date (typically one per realization) and is padded with NaN when
+    dates have differing number of values.
+    Returns the unique dates as int64 milliseconds along with the matrix.
+    """
+    dates_np = summary_vector_table.column("DATE").cast(pa.timestamp("ms")).to_numpy().view(np.int64)
+    values_np = summary_vector_table.column(vector_name).to_numpy().astype(np.float32, copy=False)
+
+    # Fast path for the common case of resampled tables, where all realizations share the same sorted dates
+    shared_dates_np = _find_shared_sorted_dates_of_segments(dates_np)
+    if shared_dates_np is not None:
+        values_matrix = np.ascontiguousarray(values_np.reshape(-1, len(shared_dates_np)).T)
+        return shared_dates_np, values_matrix
+
+    # Position of each value within its date row, obtained by sorting the values on date.
+    # The order of the values within a row is of no consequence for the statistics, so no need for a stable sort
+    sorted_order = np.argsort(dates_np)
+    sorted_dates_np = dates_np[sorted_order]
+    is_first_of_date = np.empty(len(sorted_dates_np), dtype=bool)
+    is_first_of_date[0] = True
+    np.not_equal(sorted_dates_np[1:], sorted_dates_np[:-1], out=is_first_of_date[1:])
+
+    unique_dates_np = sorted_dates_np[is_first_of_date]
+    num_dates = len(unique_dates_np)
+
+    sorted_date_idx = np.cumsum(is_first_of_date) - 1
+    count_per_date = np.bincount(sorted_date_idx, minlength=num_dates)
+    row_start_idx = np.cumsum(count_per_date) - count_per_date
+    pos_in_row = np.arange(len(sorted_date_idx)) - row_start_idx[sorted_date_idx]
+
+    values_matrix = np.full((num_dates, int(count_per_date.max())), np.nan, dtype=np.float32)
+    values_matrix[sorted_date_idx, pos_in_row] = values_np[sorted_order]
+
+    return unique_dates_np, values_matrix
+
+
+def _find_shared_sorted_dates_of_segments(dates_np: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Check if the dates consist of consecutive segments that all contain the same strictly increasing dates.
+    If so, the dates of a single segment are returned, otherwise None.
+    """
+    non_increasing_idx = np.flatnonzero(dates_np[1:] <= dates_np[:-1])
+    segment_length = non_increasing_idx[0] + 1 if len(non_increasing_idx) > 0 else len(dates_np)
+    if len(dates_np) % segment_length != 0:
         return None
 
-    df = summary_vector_table.select(["DATE", vector_name]).to_pandas(timestamp_as_object=True)
+    segments_np = dates_np.reshape(-1, segment_length)
+    if not np.array_equal(segments_np, np.broadcast_to(segments_np[0], segments_np.shape)):
+        return None
 
-    grouped: pd.core.groupby.DataFrameGroupBy = df.groupby("DATE", as_index=False, sort=True)
-    statistics_df: pd.DataFrame = grouped.agg(**agg_dict)
+    return segments_np[0].copy()
 
-    default_schema = pa.Schema.from_pandas(statistics_df, preserve_index=False)
-    schema_to_use = set_date_column_type_to_timestamp_ms(default_schema)
-    schema_to_use = create_float_downcasting_schema(schema_to_use)
 
-    statistics_table = pa.Table.from_pandas(statistics_df, schema=schema_to_use, preserve_index=False)
+def compute_statistics_for_matrix_rows(
+    values_matrix: np.ndarray, statistic_functions: Sequence[StatisticFunction]
+) -> Dict[StatisticFunction, np.ndarray]:
+    """
+    Compute the requested statistics along each row of the matrix, ignoring NaN values.
+    Rows without any valid values will result in NaN for all statistics.
+    Note that STD is the population standard deviation, consistent with the statistical surfaces.
+    """
+    ret_dict: Dict[StatisticFunction, np.ndarray] = {}
 
-    return statistics_table
+    valid_mask = ~np.isnan(values_matrix)
+    valid_count = np.count_nonzero(valid_mask, axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if StatisticFunction.MEAN in statistic_functions or StatisticFunction.STD in statistic_functions:
+            values_or_zero = np.where(valid_mask, values_matrix, 0).astype(np.float64)
+            mean = values_or_zero.sum(axis=1) / valid_count
+            ret_dict[StatisticFunction.MEAN] = mean
+            if StatisticFunction.STD in statistic_functions:
+                sq_dev = np.where(valid_mask, values_or_zero - mean[:, np.newaxis], 0) ** 2
+                ret_dict[StatisticFunction.STD] = np.sqrt(sq_dev.sum(axis=1) / valid_count)
+
+    # fmin/fmax ignore NaN and return NaN for rows where all values are NaN
+    if StatisticFunction.MIN in statistic_functions:
+        ret_dict[StatisticFunction.MIN] = np.fmin.reduce(values_matrix, axis=1)
+    if StatisticFunction.MAX in statistic_functions:
+        ret_dict[StatisticFunction.MAX] = np.fmax.reduce(values_matrix, axis=1)
+
+    # Invert p10 and p90 due to oil industry convention.
+    percentile_dict = {StatisticFunction.P10: 90, StatisticFunction.P90: 10, StatisticFunction.P50: 50}
+    requested_percentiles = [stat_func for stat_func in percentile_dict if stat_func in statistic_functions]
+    if requested_percentiles:
+        # NaN values are sorted to the end of each row, leaving the valid values first
+        sorted_matrix = np.sort(values_matrix, axis=1)
+        for stat_func in requested_percentiles:
+            ret_dict[stat_func] = _percentile_of_sorted_rows(sorted_matrix, valid_count, percentile_dict[stat_func])
+
+    return ret_dict
+
+
+def _percentile_of_sorted_rows(sorted_matrix: np.ndarray, valid_count: np.ndarray, percentile: float) -> np.ndarray:
+    """
+    Percentile of the first valid_count values in each sorted row, using the same linear interpolation as
+    np.nanpercentile(). Rows without any valid values give NaN.
+    """
+    virtual_idx = (percentile / 100) * (np.maximum(valid_count, 1) - 1)
+    lower_idx = np.floor(virtual_idx).astype(np.int64)
+    upper_idx = np.minimum(lower_idx + 1, np.maximum(valid_count, 1) - 1)
+    fraction = virtual_idx - lower_idx
+
+    row_idx = np.arange(sorted_matrix.shape[0])
+    lower_vals = sorted_matrix[row_idx, lower_idx].astype(np.float64)
+    upper_vals = sorted_matrix[row_idx, upper_idx].astype(np.float64)
+
+    # Same formulation as numpy's internal lerp, which is more accurate when the fraction is close to 1
+    diff = upper_vals - lower_vals
+    result = np.where(fraction >= 0.5, upper_vals - diff * (1 - fraction), lower_vals + diff * fraction)
+    result[valid_count == 0] = np.nan
+
+    return result
 
 
 def compute_vector_statistics(
@@ -111,3 +215,85 @@ def compute_vector_statistics(
     )
 
     return ret_data
+
+
+def compute_vector_statistics_for_realization_groups(
+    summary_vector_table: pa.Table,
+    vector_name: str,
+    statistic_functions: Optional[Sequence[StatisticFunction]],
+    realization_groups: Sequence[Sequence[int]],
+) -> List[Optional[VectorStatistics]]:
+    """
+    Compute statistics for specified summary vector for each of the groups of realizations, typically the
+    cases of the sensitivities in an ensemble. The table must contain a REAL column.
+
+    The table is arranged into a DATE by REAL matrix once, and the statistics for each group are then computed on
+    the matrix columns of the group's realizations. This avoids filtering the whole table once per group.
+
+    Returns a list with one entry per group, the entry is None if none of the group's realizations are present
+    in the table. Just as for a table that only contains the group's realizations, the returned timestamps for a
+    group are the dates where at least one of the group's realizations has data.
+    """
+    unique_stat_funcs = _get_unique_statistic_functions(statistic_functions)
+
+    if summary_vector_table.num_rows == 0:
+        return [None] * len(realization_groups)
+
+    unique_dates_np, unique_reals_np, values_matrix, has_value_matrix = _build_date_by_real_matrix(
+        summary_vector_table, vector_name
+    )
+
+    ret_list: List[Optional[VectorStatistics]] = []
+    for group_reals in realization_groups:
+        real_col_idx = np.flatnonzero(np.isin(unique_reals_np, group_reals))
+        if len(real_col_idx) == 0:
+            ret_list.append(None)
+            continue
+
+        date_row_mask = np.any(has_value_matrix[:, real_col_idx], axis=1)
+        group_values_matrix = values_matrix[np.ix_(date_row_mask, real_col_idx)]
+        stat_values_dict = compute_statistics_for_matrix_rows(group_values_matrix, unique_stat_funcs)
+
+        ret_list.append(
+            VectorStatistics(
+                realizations=unique_reals_np[real_col_idx].tolist(),
+                timestamps_utc_ms=unique_dates_np[date_row_mask].tolist(),
+                values_dict={
+                    stat_func: stat_values_dict[stat_func].astype(np.float32).tolist()
+                    for stat_func in unique_stat_funcs
+                },
+            )
+        )
+
+    return ret_list
+
+
+def _build_date_by_real_matrix(
+    summary_vector_table: pa.Table, vector_name: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Arrange the vector values into a dense float32 matrix with one row per unique date and one column per unique
+    realization, both sorted in ascending order. Uses hashing to find the row and column of each value, so the
+    table does not need to be sorted.
+    Returns the unique dates as int64 milliseconds, the unique realizations, the value matrix (NaN where there is
+    no value) and a boolean matrix that tells which (date, realization) combinations were present in the table.
+    """
+    dates_arr = summary_vector_table.column("DATE").cast(pa.timestamp("ms")).cast(pa.int64())
+    reals_arr = summary_vector_table.column("REAL").cast(pa.int64())
+    values_np = summary_vector_table.column(vector_name).to_numpy().astype(np.float32, copy=False)
+
+    unique_dates_arr = pc.unique(dates_arr)
+    unique_dates_arr = unique_dates_arr.take(pc.sort_indices(unique_dates_arr))
+    unique_reals_arr = pc.unique(reals_arr)
+    unique_reals_arr = unique_reals_arr.take(pc.sort_indices(unique_reals_arr))
+
+    date_idx_np = pc.index_in(dates_arr, value_set=unique_dates_arr).to_numpy()
+    real_idx_np = pc.index_in(reals_arr, value_set=unique_reals_arr).to_numpy()
+
+    matrix_shape = (len(unique_dates_arr), len(unique_reals_arr))
+    values_matrix = np.full(matrix_shape, np.nan, dtype=np.float32)
+    values_matrix[date_idx_np, real_idx_np] = values_np
+    has_value_matrix = np.zeros(matrix_shape, dtype=bool)
+    has_value_matrix[date_idx_np, real_idx_np] = True
+
+    return unique_dates_arr.to_numpy(), unique_reals_arr.to_numpy(), values_matrix, has_value_matrix
@@ -0,0 +1,605 @@
+import asyncio
+import io
+import logging
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import pyarrow as pa
+import pyarrow.feather as pf
+import pyarrow.parquet as pq
+from fmu.sumo.explorer.objects import Table
+from webviz_pkg.core_utils.perf_timer import PerfTimer
+
+from primary.services.service_exceptions import InvalidDataError, NoDataError, Service
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
+from primary.services.utils.memory_lru_cache import MemoryLruCache
+
+from ._summary_table_cache import SINGLE_REAL_COLUMN_CACHE, SingleRealColumnKey
+from .sumo_blob_access import get_sas_token_and_blob_store_base_uri_for_case_async
+
+LOGGER = logging.getLogger(__name__)
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_IPC_MAGIC = b"ARROW1"
+
+# Sumo formats for which we probe the blob for range reads, the actual format is determined from the magic bytes
+# at the end of the blob, since the format in the metadata has been seen to not match the data
+_RANGE_READ_SUMO_FORMATS = {"arrow", "parquet"}
+
+# Flatbuffer message header type of a record batch in the arrow IPC format
+_ARROW_IPC_RECORD_BATCH_HEADER_TYPE = 3
+
+# Number of bytes to read from the end of the blob in the first request, normally enough to cover the entire
+# parquet or arrow IPC footer. If the footer is larger, the remainder is fetched in a second request.
+# Must be at least 64KB, which is what the parquet reader reads speculatively when looking for the footer.
+_INITIAL_TAIL_READ_BYTES = 256 * 1024
+
+# Column chunk ranges that are closer than this are fetched in one request
+_RANGE_COALESCE_GAP_BYTES = 64 * 1024
+
+_MAX_CONCURRENT_RANGE_REQUESTS = 8
+
+
+class _RangeNotFetchedError(OSError):
+    pass
+
+
+class _SparseRangeFile:
+    """
+    Read-only, seekable file object for a remote blob where only some byte ranges have been fetched.
+    Reading outside of the fetched ranges raises an error instead of silently returning wrong data.
+    """
+
+    def __init__(self, size: int, ranges: Dict[int, bytes]) -> None:
+        self._size = size
+        self._ranges = sorted(ranges.items())
+        self._pos = 0
+        self.closed = False
+
+    def add_ranges(self, ranges: Dict[int, bytes]) -> None:
+        self._ranges = sorted([*self._ranges, *ranges.items()])
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._pos
+
+    def size(self) -> int:
+        return self._size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self._size + offset
+        return self._pos
+
+    def read(self, nbytes: int = -1) -> bytes:
+        end = self._size if nbytes is None or nbytes < 0 else min(self._pos + nbytes, self._size)
+        if end <= self._pos:
+            return b""
+
+        for range_start, range_bytes in self._ranges:
+            if range_start <= self._pos and end <= range_start + len(range_bytes):
+                data = range_bytes[self._pos - range_start : end - range_start]
+                self._pos = end
+                return data
+
+        raise _RangeNotFetchedError(f"Byte range {self._pos}-{end} has not been fetched")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@dataclass(frozen=True)
+class _ParquetBlobLayout:
+    """
+    The parsed footer of a parquet blob, which is all we need to locate the byte ranges of each column.
+    We keep the raw bytes of the entire tail that we read, since the parquet reader speculatively reads
+    the last 64KB of the file when looking for the footer.
+    """
+
+    blob_size: int
+    tail_start: int
+    tail_bytes: bytes
+    metadata: pq.FileMetaData
+    arrow_schema: pa.Schema
+
+
+@dataclass(frozen=True)
+class _ArrowIpcBlobLayout:
+    """
+    The footer of an arrow IPC file blob along with the metadata of each of its record batches, which is all we
+    need to locate the byte ranges of each column. The fetched bytes are keyed on their start position in the blob.
+    """
+
+    blob_size: int
+    metadata_ranges: Dict[int, bytes]
+    arrow_schema: pa.Schema
+    first_buffer_idx_per_field: List[int]
+    buffer_count_per_field: List[int]
+    batch_buffer_ranges: List[List[Tuple[int, int]]]
+
+
+@dataclass(frozen=True)
+class _BlobProbeResult:
+    """Result of probing a blob, both layouts are None if the blob can not be read using range requests"""
+
+    parquet_layout: Optional[_ParquetBlobLayout] = None
+    arrow_ipc_layout: Optional[_ArrowIpcBlobLayout] = None
+
+
+def _probe_result_nbytes(probe_result: _BlobProbeResult) -> int:
+    if probe_result.parquet_layout:
+        return len(probe_result.parquet_layout.tail_bytes)
+    if probe_result.arrow_ipc_layout:
+        return sum(len(range_bytes) for range_bytes in probe_result.arrow_ipc_layout.metadata_ranges.values())
+    return 1
+
+
+# Sumo objects are immutable, so the probe result (and footer) of a blob can be reused for as long as we keep it
+_BLOB_PROBE_CACHE: MemoryLruCache[str, _BlobProbeResult] = MemoryLruCache(
+    max_bytes=64 * 1024 * 1024, size_of_value=_probe_result_nbytes
+)
+
+
+async def load_columns_from_sumo_arrow_table_async(
+    access_token: str, case_uuid: str, sumo_table: Table, column_names: Sequence[str]
+) -> pa.Table:
+    """
+    Load only the specified columns from a Sumo table in arrow format.
+
+    For parquet and arrow IPC blobs, the footer is read first and then only the byte ranges of the requested
+    columns are read directly from the blob store. If range reads are not possible, the entire blob is downloaded
+    and only the requested columns are decoded.
+
+    Decoded columns are cached per (Sumo object uuid, column name).
+    The blob must contain a DATE column of type timestamp[ms] and no REAL column.
+    """
+    timer = PerfTimer()
+
+    cached_tables: Dict[str, pa.Table] = {}
+    for column_name in column_names:
+        cached_table = SINGLE_REAL_COLUMN_CACHE.get(SingleRealColumnKey(sumo_table.uuid, column_name))
+        if cached_table is not None:
+            cached_tables[column_name] = cached_table
+
+    columns_to_load = [name for name in dict.fromkeys(column_names) if name not in cached_tables]
+    load_method = "cache"
+    if columns_to_load:
+        loaded_table, load_method = await _load_columns_from_blob_async(
+            access_token, case_uuid, sumo_table, columns_to_load, is_aggregated_table=False
+        )
+        for column_name in columns_to_load:
+            single_column_table = loaded_table.select([column_name])
+            SINGLE_REAL_COLUMN_CACHE.put(SingleRealColumnKey(sumo_table.uuid, column_name), single_column_table)
+            cached_tables[column_name] = single_column_table
+
+    fields = [cached_tables[name].schema.field(name) for name in column_names]
+    columns = [cached_tables[name].column(name) for name in column_names]
+    table = pa.table(columns, schema=pa.schema(fields))
+
+    LOGGER.debug(
+        f"Loaded {len(column_names)} columns ({len(columns_to_load)} not cached) from Sumo table in: "
+        f"{timer.elapsed_ms()}ms ({load_method=}, {table.shape=}) "
+        f"[cache: {SINGLE_REAL_COLUMN_CACHE.stats().to_string()}]"
+    )
+
+    return table
+
+
+async def load_columns_from_sumo_aggregated_arrow_table_async(
+    access_token: str, case_uuid: str, sumo_table: Table, column_names: Sequence[str]
+) -> pa.Table:
+    """
+    Load only the specified columns from a Sumo table in arrow format that contains data for multiple realizations,
+    i.e. a table that has a REAL column in addition to the DATE column.
+    Loading is done in the same way as for `load_columns_from_sumo_arrow_table_async()`, but the columns are not
+    cached, it is up to the caller to cache whatever is derived from them.
+    """
+    timer = PerfTimer()
+
+    table, load_method = await _load_columns_from_blob_async(
+        access_token, case_uuid, sumo_table, list(dict.fromkeys(column_names)), is_aggregated_table=True
+    )
+
+    LOGGER.debug(
+        f"Loaded {len(column_names)} columns from aggregated Sumo table in: {timer.elapsed_ms()}ms "
+        f"({load_method=}, {table.shape=})"
+    )
+
+    return table
+
+
+async def _load_columns_from_blob_async(
+    access_token: str, case_uuid: str, sumo_table: Table, column_names: List[str], is_aggregated_table: bool
+) -> tuple[pa.Table, str]:
+    """Load the columns using range requests if possible, otherwise by downloading the entire blob"""
+    sas_token, blob_store_base_uri = await get_sas_token_and_blob_store_base_uri_for_case_async(access_token, case_uuid)
+    blob_url = f"{blob_store_base_uri}/{sumo_table.uuid}?{sas_token}"
+
+    async def _probe_blob() -> _BlobProbeResult:
+        return await _probe_blob_async(blob_url)
+
+    try:
+        probe_result = _BlobProbeResult()
+        if sumo_table.format in _RANGE_READ_SUMO_FORMATS:
+            probe_result = await _BLOB_PROBE_CACHE.get_or_load_async(sumo_table.uuid, _probe_blob)
+
+        if probe_result.parquet_layout is not None:
+            parquet_layout = probe_result.parquet_layout
+            _verify_schema_and_columns(parquet_layout.arrow_schema, column_names, is_aggregated_table)
+            table = await _read_parquet_columns_using_range_requests_async(blob_url, parquet_layout, column_names)
+            return table, "parquet_range_read"
+        if probe_result.arrow_ipc_layout is not None:
+            arrow_ipc_layout = probe_result.arrow_ipc_layout
+            _verify_schema_and_columns(arrow_ipc_layout.arrow_schema, column_names, is_aggregated_table)
+            table = await _read_arrow_ipc_columns_using_range_requests_async(blob_url, arrow_ipc_layout, column_names)
+            return table, "arrow_ipc_range_read"
+    except (httpx.HTTPError, _RangeNotFetchedError, pa.ArrowException, struct.error) as exc:
+        # An unparseable footer or metadata is left to the full download, which reports a corrupt blob properly
+        LOGGER.warning(f"Range read of blob failed, falling back to full download ({sumo_table.uuid=}): {exc!r}")
+
+    full_blob: io.BytesIO = await sumo_table.blob_async
+    return _read_columns_from_full_blob(full_blob, column_names, is_aggregated_table), "full_download"
+
+
+async def _probe_blob_async(blob_url: str) -> _BlobProbeResult:
+    """
+    Read the tail of the blob using range requests, and then the footer of the format found from the magic bytes.
+    Returns an empty result if the blob is neither parquet nor arrow IPC, if the arrow IPC blob uses features
+    that we can not locate columns for, or if the blob store does not honor range requests.
+    """
+    async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.SUMO_BLOB_STORE) as client:
+        head_response = await client.head(blob_url)
+        head_response.raise_for_status()
+        blob_size = int(head_response.headers.get("Content-Length", 0))
+        if blob_size < 12 or head_response.headers.get("Accept-Ranges") == "none":
+            return _BlobProbeResult()
+
+        tail_start = max(0, blob_size - _INITIAL_TAIL_READ_BYTES)
+        tail_bytes = await _get_byte_range_async(client, blob_url, tail_start, blob_size)
+        if tail_bytes is None:
+            return _BlobProbeResult()
+
+        if tail_bytes[-len(_PARQUET_MAGIC) :] == _PARQUET_MAGIC:
+            footer_length = int.from_bytes(tail_bytes[-8:-4], "little")
+            footer_start = blob_size - 8 - footer_length
+        elif tail_bytes[-len(_ARROW_IPC_MAGIC) :] == _ARROW_IPC_MAGIC:
+            footer_length = int.from_bytes(tail_bytes[-10:-6], "little")
+            footer_start = blob_size - 10 - footer_length
+        else:
+            return _BlobProbeResult()
+
+        if footer_start < tail_start:
+            head_of_footer = await _get_byte_range_async(client, blob_url, footer_start, tail_start)
+            if head_of_footer is None:
+                return _BlobProbeResult()
+            tail_bytes = head_of_footer + tail_bytes
+            tail_start = footer_start
+
+        if tail_bytes[-len(_PARQUET_MAGIC) :] == _PARQUET_MAGIC:
+            return _BlobProbeResult(parquet_layout=_create_parquet_layout(blob_size, tail_start, tail_bytes))
+
+        footer_bytes = tail_bytes[footer_start - tail_start : -10]
+        return _BlobProbeResult(
+            arrow_ipc_layout=await _load_arrow_ipc_layout_async(
+                client, blob_url, blob_size, {tail_start: tail_bytes}, footer_bytes
+            )
+        )
+
+
+def _create_parquet_layout(blob_size: int, tail_start: int, tail_bytes: bytes) -> _ParquetBlobLayout:
+    metadata = pq.read_metadata(_SparseRangeFile(blob_size, {tail_start: tail_bytes}))
+
+    return _ParquetBlobLayout(
+        blob_size=blob_size,
+        tail_start=tail_start,
+        tail_bytes=tail_bytes,
+        metadata=metadata,
+        arrow_schema=metadata.schema.to_arrow_schema(),
+    )
+
+
+async def _load_arrow_ipc_layout_async(
+    client: httpx.AsyncClient, blob_url: str, blob_size: int, tail_ranges: Dict[int, bytes], footer_bytes: bytes
+) -> Optional[_ArrowIpcBlobLayout]:
+    """Read the metadata of all the record batches listed in the footer and create the layout from it"""
+    has_dictionaries, record_batch_blocks = parse_arrow_ipc_footer_blocks(footer_bytes)
+    if has_dictionaries:
+        return None
+
+    metadata_ranges = dict(tail_ranges)
+    metadata_byte_ranges = coalesce_byte_ranges(
+        [(offset, offset + metadata_length) for offset, metadata_length, _body_length in record_batch_blocks]
+    )
+    for start, end in metadata_byte_ranges:
+        range_bytes = await _get_byte_range_async(client, blob_url, start, end)
+        if range_bytes is None:
+            return None
+        metadata_ranges[start] = range_bytes
+
+    return create_arrow_ipc_layout(blob_size, metadata_ranges, record_batch_blocks)
+
+
+def create_arrow_ipc_layout(
+    blob_size: int, metadata_ranges: Dict[int, bytes], record_batch_blocks: Sequence[Tuple[int, int, int]]
+) -> Optional[_ArrowIpcBlobLayout]:
+    """
+    Find the byte ranges of the buffers of all record batches, the metadata ranges must cover the footer and the
+    metadata of each record batch. Returns None if there are columns with types where the number of buffers per
+    column is not fixed.
+    """
+    metadata_file = _SparseRangeFile(blob_size, metadata_ranges)
+    arrow_schema = pa.ipc.open_file(metadata_file).schema
+
+    buffer_count_per_field: List[int] = []
+    for field in arrow_schema:
+        buffer_count = _arrow_ipc_buffer_count_of_type(field.type)
+        if buffer_count is None:
+            return None
+        buffer_count_per_field.append(buffer_count)
+
+    batch_buffer_ranges: List[List[Tuple[int, int]]] = []
+    for offset, metadata_length, _body_length in record_batch_blocks:
+        metadata_file.seek(offset)
+        buffers = parse_arrow_ipc_record_batch_buffers(metadata_file.read(metadata_length))
+        if buffers is None or len(buffers) != sum(buffer_count_per_field):
+            return None
+        body_start = offset + metadata_length
+        batch_buffer_ranges.append([(body_start + start, body_start + start + length) for start, length in buffers])
+
+    return _ArrowIpcBlobLayout(
+        blob_size=blob_size,
+        metadata_ranges=metadata_ranges,
+        arrow_schema=arrow_schema,
+        first_buffer_idx_per_field=[sum(buffer_count_per_field[:idx]) for idx in range(len(buffer_count_per_field))],
+        buffer_count_per_field=buffer_count_per_field,
+        batch_buffer_ranges=batch_buffer_ranges,
+    )
+
+
+def _arrow_ipc_buffer_count_of_type(arrow_type: pa.DataType) -> Optional[int]:
+    """Number of IPC buffers for a column of the type, None for the types we do not locate buffers for"""
+    variable_width_type_checks = [
+        pa.types.is_string,
+        pa.types.is_large_string,
+        pa.types.is_binary,
+        pa.types.is_large_binary,
+    ]
+    fixed_width_type_checks = [
+        pa.types.is_boolean,
+        pa.types.is_integer,
+        pa.types.is_floating,
+        pa.types.is_temporal,
+        pa.types.is_decimal,
+        pa.types.is_fixed_size_binary,
+    ]
+    if any(type_check(arrow_type) for type_check in variable_width_type_checks):
+        return 3
+    if any(type_check(arrow_type) for type_check in fixed_width_type_checks):
+        return 2
+    return None
+
+
+async def _get_byte_range_async(client: httpx.AsyncClient, blob_url: str, start: int, end: int) -> Optional[bytes]:
+    """Get bytes in the half-open range [start, end), returns None if the server does not honor the range request"""
+    response = await client.get(blob_url, headers={"Range": f"bytes={start}-{end - 1}"})
+    response.raise_for_status()
+    if response.status_code != 206:
+        return None
+
+    return response.content
+
+
+def find_parquet_column_byte_ranges(metadata: pq.FileMetaData, column_names: Sequence[str]) -> List[tuple[int, int]]:
+    """
+    Find the byte ranges, as half-open [start, end) pairs, of the column chunks for the specified columns
+    in all row groups. Ranges that are close together are coalesced.
+    """
+    column_name_set = set(column_names)
+    ranges: List[tuple[int, int]] = []
+    for row_group_idx in range(metadata.num_row_groups):
+        row_group = metadata.row_group(row_group_idx)
+        for column_idx in range(row_group.num_columns):
+            column_chunk = row_group.column(column_idx)
+            if column_chunk.path_in_schema not in column_name_set:
+                continue
+
+            start = column_chunk.data_page_offset
+            if column_chunk.has_dictionary_page and 0 < column_chunk.dictionary_page_offset < start:
+                start = column_chunk.dictionary_page_offset
+            ranges.append((start, start + column_chunk.total_compressed_size))
+
+    return coalesce_byte_ranges(ranges)
+
+
+def coalesce_byte_ranges(ranges: Sequence[tuple[int, int]]) -> List[tuple[int, int]]:
+    """Sort the half-open byte ranges and merge the ranges that overlap or are close together"""
+    coalesced_ranges: List[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if coalesced_ranges and start - coalesced_ranges[-1][1] <= _RANGE_COALESCE_GAP_BYTES:
+            coalesced_ranges[-1] = (coalesced_ranges[-1][0], max(end, coalesced_ranges[-1][1]))
+        else:
+            coalesced_ranges.append((start, end))
+
+    return coalesced_ranges
+
+
+async def _read_parquet_columns_using_range_requests_async(
+    blob_url: str, layout: _ParquetBlobLayout, column_names: Sequence[str]
+) -> pa.Table:
+    byte_ranges = find_parquet_column_byte_ranges(layout.metadata, column_names)
+    fetched_ranges = await _get_byte_ranges_async(blob_url, byte_ranges)
+
+    sparse_file = _SparseRangeFile(layout.blob_size, {layout.tail_start: layout.tail_bytes})
+    sparse_file.add_ranges(fetched_ranges)
+
+    return pq.ParquetFile(sparse_file, metadata=layout.metadata).read(columns=list(column_names))
+
+
+def find_arrow_ipc_column_byte_ranges(
+    layout: _ArrowIpcBlobLayout, column_names: Sequence[str]
+) -> List[tuple[int, int]]:
+    """
+    Find the byte ranges, as half-open [start, end) pairs, of the buffers of the specified columns in all
+    record batches. Ranges that are close together are coalesced.
+    """
+    ranges: List[tuple[int, int]] = []
+    for column_name in column_names:
+        field_idx = layout.arrow_schema.get_field_index(column_name)
+        first_buffer_idx = layout.first_buffer_idx_per_field[field_idx]
+        last_buffer_idx = first_buffer_idx + layout.buffer_count_per_field[field_idx]
+        for buffer_ranges in layout.batch_buffer_ranges:
+            ranges.extend((start, end) for start, end in buffer_ranges[first_buffer_idx:last_buffer_idx] if end > start)
+
+    return coalesce_byte_ranges(ranges)
+
+
+async def _read_arrow_ipc_columns_using_range_requests_async(
+    blob_url: str, layout: _ArrowIpcBlobLayout, column_names: Sequence[str]
+) -> pa.Table:
+    byte_ranges = find_arrow_ipc_column_byte_ranges(layout, column_names)
+    fetched_ranges = await _get_byte_ranges_async(blob_url, byte_ranges)
+
+    sparse_file = _SparseRangeFile(layout.blob_size, layout.metadata_ranges)
+    sparse_file.add_ranges(fetched_ranges)
+
+    return read_arrow_ipc_columns(sparse_file, column_names)
+
+
+def read_arrow_ipc_columns(ipc_file: _SparseRangeFile, column_names: Sequence[str]) -> pa.Table:
+    """Read the columns from an arrow IPC file, where only the buffers of the included fields are read"""
+    schema = pa.ipc.open_file(ipc_file).schema
+    field_indices = sorted({schema.get_field_index(name) for name in column_names})
+    options = pa.ipc.IpcReadOptions(included_fields=field_indices)
+
+    # Unlike the parquet reader, the IPC reader wraps exceptions raised by the file in an OSError
+    try:
+        table = pa.ipc.open_file(ipc_file, options=options).read_all()
+    except OSError as exc:
+        raise _RangeNotFetchedError(str(exc)) from exc
+
+    return table.select(list(column_names))
+
+
+async def _get_byte_ranges_async(blob_url: str, byte_ranges: Sequence[tuple[int, int]]) -> Dict[int, bytes]:
+    """Get the half-open byte ranges concurrently, returns the bytes keyed on the start of each range"""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_RANGE_REQUESTS)
+
+    async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.SUMO_BLOB_STORE) as client:
+
+        async def _get_range(start: int, end: int) -> tuple[int, bytes]:
+            async with semaphore:
+                range_bytes = await _get_byte_range_async(client, blob_url, start, end)
+            if range_bytes is None:
+                raise _RangeNotFetchedError(f"Range request for bytes {start}-{end} was not honored")
+            return start, range_bytes
+
+        fetched_ranges = await asyncio.gather(*[_get_range(start, end) for start, end in byte_ranges])
+
+    return dict(fetched_ranges)
+
+
+def parse_arrow_ipc_footer_blocks(footer_bytes: bytes) -> Tuple[bool, List[Tuple[int, int, int]]]:
+    """
+    Parse the flatbuffer footer of an arrow IPC file.
+    Returns whether the file has dictionary batches, and (offset, metadata length, body length) of each record batch.
+    """
+    footer_pos = _fb_u32(footer_bytes, 0)
+    dictionary_blocks = _fb_vector_of_structs(footer_bytes, footer_pos, 2, "<qi4xq")
+    record_batch_blocks = _fb_vector_of_structs(footer_bytes, footer_pos, 3, "<qi4xq")
+    return len(dictionary_blocks) > 0, record_batch_blocks
+
+
+def parse_arrow_ipc_record_batch_buffers(message_bytes: bytes) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse the encapsulated flatbuffer message of a record batch in an arrow IPC file.
+    Returns (offset, length) of each buffer relative to the start of the body, or None if it is not a plain record
+    batch message.
+    """
+    # Messages are prefixed by a continuation marker and the metadata length, older files only have the length
+    fb_start = 8 if message_bytes[:4] == b"\xff\xff\xff\xff" else 4
+    message = message_bytes[fb_start:]
+    message_pos = _fb_u32(message, 0)
+
+    header_type_pos = _fb_field_pos(message, message_pos, 1)
+    header_pos = _fb_field_pos(message, message_pos, 2)
+    if header_type_pos is None or header_pos is None or message[header_type_pos] != _ARROW_IPC_RECORD_BATCH_HEADER_TYPE:
+        return None
+
+    # Batches with variadic buffers, i.e. string and binary views, do not have a fixed buffer count per column
+    record_batch_pos = header_pos + _fb_u32(message, header_pos)
+    if _fb_field_pos(message, record_batch_pos, 4) is not None:
+        return None
+
+    return _fb_vector_of_structs(message, record_batch_pos, 2, "<qq")
+
+
+def _fb_u32(buf: bytes, pos: int) -> int:
+    return int.from_bytes(buf[pos : pos + 4], "little")
+
+
+def _fb_field_pos(buf: bytes, table_pos: int, field_idx: int) -> Optional[int]:
+    """Position of a field in a flatbuffer table, or None if the field is not present"""
+    vtable_pos = table_pos - int.from_bytes(buf[table_pos : table_pos + 4], "little", signed=True)
+    vtable_length = int.from_bytes(buf[vtable_pos : vtable_pos + 2], "little")
+    slot_pos = 4 + 2 * field_idx
+    if slot_pos >= vtable_length:
+        return None
+    field_offset = int.from_bytes(buf[vtable_pos + slot_pos : vtable_pos + slot_pos + 2], "little")
+    return table_pos + field_offset if field_offset else None
+
+
+def _fb_vector_of_structs(buf: bytes, table_pos: int, field_idx: int, struct_format: str) -> List[Any]:
+    """Unpack a flatbuffer table field that is a vector of structs, an absent field gives an empty list"""
+    field_pos = _fb_field_pos(buf, table_pos, field_idx)
+    if field_pos is None:
+        return []
+    vector_pos = field_pos + _fb_u32(buf, field_pos)
+    vector_length = _fb_u32(buf, vector_pos)
+    struct_size = struct.calcsize(struct_format)
+    return [struct.unpack_from(struct_format, buf, vector_pos + 4 + idx * struct_size) for idx in range(vector_length)]
+
+
+def _read_columns_from_full_blob(blob: io.BytesIO, column_names: Sequence[str], is_aggregated_table: bool) -> pa.Table:
+    """Decode only the specified columns from a blob in either feather or parquet format"""
+    blob_buffer = pa.py_buffer(blob.getbuffer())
+    try:
+        schema = pa.ipc.open_file(blob_buffer).schema
+        _verify_schema_and_columns(schema, column_names, is_aggregated_table)
+        return pf.read_table(pa.BufferReader(blob_buffer), columns=list(column_names), memory_map=False)
+    except pa.ArrowInvalid:
+        pass
+
+    parquet_file = pq.ParquetFile(pa.BufferReader(blob_buffer))
+    _verify_schema_and_columns(parquet_file.schema_arrow, column_names, is_aggregated_table)
+    return parquet_file.read(columns=list(column_names))
+
+
+def _verify_schema_and_columns(schema: pa.Schema, column_names: Sequence[str], is_aggregated_table: bool) -> None:
+    if "DATE" not in schema.names:
+        raise InvalidDataError("Table does not contain a DATE column", Service.SUMO)
+    date_field: pa.Field = schema.field("DATE")
+    if date_field.type != pa.timestamp("ms"):
+        raise InvalidDataError(f"Unexpected type for DATE column {date_field.type=}", Service.SUMO)
+    if is_aggregated_table:
+        if "REAL" not in schema.names:
+            raise InvalidDataError("Aggregated table does not contain a REAL column", Service.SUMO)
+    elif "REAL" in schema.names:
+        raise InvalidDataError("Table contains an unexpected REAL column", Service.SUMO)
+
+    missing_column_names = [name for name in column_names if name not in schema.names]
+    if missing_column_names:
+        raise NoDataError(f"Columns not found in table: {missing_column_names}", Service.SUMO)
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+from primary.services.utils.arrow_helpers import sort_table_on_real_then_date
+
+from ._resampling import generate_normalized_sample_dates
+from .summary_types import Frequency
+
+
+@dataclass(frozen=True)
+class RealizationDateRanges:
+    """The first and last raw date, in ms UTC, of each realization"""
+
+    realizations: np.ndarray
+    min_dates_utc_ms: np.ndarray
+    max_dates_utc_ms: np.ndarray
+
+
+@dataclass(frozen=True)
+class EnsembleTimestampIndex:
+    """
+    The raw dates of every realization in an ensemble. All summary vectors of a realization share the same dates,
+    so the index can be built from the DATE and REAL columns of any one of the ensemble's summary tables.
+
+    The dates of unique_reals[i] are found, sorted and without duplicates, in the range
+    [real_row_offsets[i], real_row_offsets[i+1]) of dates_utc_ms.
+    """
+
+    unique_reals: np.ndarray
+    real_row_offsets: np.ndarray
+    dates_utc_ms: np.ndarray
+
+    def nbytes(self) -> int:
+        return self.unique_reals.nbytes + self.real_row_offsets.nbytes + self.dates_utc_ms.nbytes
+
+    def get_realization_date_ranges(self, realizations: Optional[Sequence[int]] = None) -> RealizationDateRanges:
+        real_mask = self._make_real_mask(realizations)
+        seg_first = self.real_row_offsets[:-1][real_mask]
+        seg_last = self.real_row_offsets[1:][real_mask] - 1
+        return RealizationDateRanges(
+            realizations=self.unique_reals[real_mask],
+            min_dates_utc_ms=self.dates_utc_ms[seg_first],
+            max_dates_utc_ms=self.dates_utc_ms[seg_last],
+        )
+
+    def get_raw_timestamps_intersection(self, realizations: Optional[Sequence[int]] = None) -> np.ndarray:
+        """The raw dates that are present in all the realizations"""
+        real_mask = self._make_real_mask(realizations)
+        num_selected_reals = int(np.count_nonzero(real_mask))
+        if num_selected_reals == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Since no realization has duplicate dates, a date is shared by all when it occurs once per realization
+        row_mask = np.repeat(real_mask, np.diff(self.real_row_offsets))
+        unique_dates, counts = np.unique(self.dates_utc_ms[row_mask], return_counts=True)
+        return unique_dates[counts == num_selected_reals]
+
+    def get_raw_timestamps_union(self, realizations: Optional[Sequence[int]] = None) -> np.ndarray:
+        """The raw dates that are present in at least one of the realizations"""
+        row_mask = np.repeat(self._make_real_mask(realizations), np.diff(self.real_row_offsets))
+        return np.unique(self.dates_utc_ms[row_mask])
+
+    def get_resampled_timestamps(
+        self, resampling_frequency: Frequency, realizations: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        The resampled dates covering the entire date range of all the realizations, which are the same dates that
+        are found in the union of the realizations after resampling
+        """
+        date_ranges = self.get_realization_date_ranges(realizations)
+        if len(date_ranges.realizations) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        sample_dates = generate_normalized_sample_dates(
+            np.datetime64(int(date_ranges.min_dates_utc_ms.min()), "ms"),
+            np.datetime64(int(date_ranges.max_dates_utc_ms.max()), "ms"),
+            resampling_frequency,
+        )
+        return sample_dates.view(np.int64)
+
+    def get_timestamps(
+        self, resampling_frequency: Optional[Frequency], realizations: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Without resampling, the intersection of the raw dates of the realizations.
+        With resampling, the resampled dates covering the entire date range of the realizations.
+        """
+        if resampling_frequency is None:
+            return self.get_raw_timestamps_intersection(realizations)
+
+        return self.get_resampled_timestamps(resampling_frequency, realizations)
+
+    def _make_real_mask(self, realizations: Optional[Sequence[int]]) -> np.ndarray:
+        if realizations is None:
+            return np.ones(len(self.unique_reals), dtype=bool)
+
+        return np.isin(self.unique_reals, np.asarray(realizations))
+
+
+def build_ensemble_timestamp_index(table: pa.Table) -> EnsembleTimestampIndex:
+    """
+    Build timestamp index from a table with REAL and DATE columns, which does not need to be sorted
+    """
+    table = sort_table_on_real_then_date(table.select(["REAL", "DATE"]))
+    real_arr_np = table.column("REAL").to_numpy()
+    dates_as_int = table.column("DATE").to_numpy().view(np.int64)
+
+    # Drop any repeated dates within a realization
+    is_new_row = np.ones(len(real_arr_np), dtype=bool)
+    is_new_row[1:] = (real_arr_np[1:] != real_arr_np[:-1]) | (dates_as_int[1:] != dates_as_int[:-1])
+    real_arr_np = real_arr_np[is_new_row]
+    dates_as_int = dates_as_int[is_new_row]
+
+    is_seg_start = np.ones(len(real_arr_np), dtype=bool)
+    is_seg_start[1:] = real_arr_np[1:] != real_arr_np[:-1]
+    seg_start_idx = np.flatnonzero(is_seg_start).astype(np.int64)
+
+    return EnsembleTimestampIndex(
+        unique_reals=real_arr_np[seg_start_idx],
+        real_row_offsets=np.append(seg_start_idx, len(real_arr_np)),
+        dates_utc_ms=np.ascontiguousarray(dates_as_int),
+    )
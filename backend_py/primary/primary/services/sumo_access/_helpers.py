@@ -1,22 +1,58 @@
-from typing import List, Sequence, Tuple
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
 
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects import CaseCollection, Case
-from fmu.sumo.explorer.explorer import Pit
+from webviz_pkg.core_utils.perf_timer import PerfTimer
 
 from primary import config
 from primary.services.service_exceptions import Service, NoDataError, MultipleDataMatchesError
+from primary.services.utils.ttl_cache import TtlCache
 from .queries.case import get_stratigraphic_column_identifier, get_field_identifiers
 
+LOGGER = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# Resolved case contexts are cached per access token, and thereby per user, for a limited time
+_CASE_CONTEXT_CACHE_TTL_S = 5 * 60
+_CASE_CONTEXT_CACHE_MAX_ENTRIES = 1000
+
 
 def create_sumo_client_instance(access_token: str) -> SumoClient:
     sumo_client = SumoClient(env=config.SUMO_ENV, token=access_token, interactive=False)
     return sumo_client
 
 
-async def _init_helper(access_token: str, case_uuid: str) -> Tuple[SumoClient, Case]:
+@dataclass
+class _CaseContext:
+    """
+    The resolved Sumo case along with the client used to access it, and case metadata that is loaded on demand.
+    Shared between all requests from the same user for the same case while it is in the cache.
+    """
+
+    access_token: str
+    sumo_client: SumoClient
+    case: Case
+    stratigraphic_column_identifier: Optional[str] = None
+    field_identifiers: Optional[List[str]] = None
+    realizations_per_iteration: Dict[str, List[int]] = field(default_factory=dict)
+
+
+_CASE_CONTEXT_CACHE: TtlCache[tuple[str, str], _CaseContext] = TtlCache(
+    max_entries=_CASE_CONTEXT_CACHE_MAX_ENTRIES, ttl_s=_CASE_CONTEXT_CACHE_TTL_S
+)
+
+
+async def _resolve_case_context(access_token: str, case_uuid: str) -> _CaseContext:
+    timer = PerfTimer()
+
     sumo_client: SumoClient = create_sumo_client_instance(access_token)
-    case_collection = CaseCollection(sumo_client, pit=Pit(sumo_client, keep_alive="1m")).filter(uuid=case_uuid)
+
+    # Note that we do not use a point in time (Pit) here, since the case object outlives the request and
+    # would otherwise end up referencing an expired Pit in its queries
+    case_collection = CaseCollection(sumo_client).filter(uuid=case_uuid)
 
     matching_case_count = await case_collection.length_async()
     if matching_case_count == 0:
@@ -24,21 +60,36 @@ async def _init_helper(access_token: str, case_uuid: str) -> Tuple[SumoClient, C
     if matching_case_count > 1:
         raise MultipleDataMatchesError(f"Multiple sumo cases found for {case_uuid=}", Service.SUMO)
 
-    case = case_collection[0]
+    case = await case_collection.getitem_async(0)
+
+    LOGGER.debug(f"Resolved Sumo case in: {timer.elapsed_ms()}ms ({case_uuid=})")
+
+    return _CaseContext(access_token=access_token, sumo_client=sumo_client, case=case)
+
+
+async def _get_case_context(access_token: str, case_uuid: str) -> _CaseContext:
+    """
+    Get context for the case, resolving it through Sumo only if it is not already cached for this access token.
+    Concurrent requests for the same uncached case will share a single lookup.
+    """
+
+    async def _resolve() -> _CaseContext:
+        return await _resolve_case_context(access_token, case_uuid)
 
-    return sumo_client, case
+    return await _CASE_CONTEXT_CACHE.get_or_load_async((access_token, case_uuid), _resolve)
 
 
 class SumoCase:
-    def __init__(self, sumo_client: SumoClient, case: Case, case_uuid: str):
-        self._sumo_client = sumo_client
-        self._case = case
+    def __init__(self, case_context: _CaseContext, case_uuid: str):
+        self._case_context = case_context
+        self._sumo_client = case_context.sumo_client
+        self._case = case_context.case
         self._case_uuid = case_uuid
 
     @classmethod
     async def from_case_uuid(cls, access_token: str, case_uuid: str):  # type: ignore # wait on Python 3.11
-        sumo_client, case = await _init_helper(access_token, case_uuid)
-        return SumoCase(sumo_client=sumo_client, case=case, case_uuid=case_uuid)
+        case_context = await _get_case_context(access_token, case_uuid)
+        return SumoCase(case_context=case_context, case_uuid=case_uuid)
 
     def get_case_name(self) -> str:
         """Get name of the case"""
@@ -46,24 +97,39 @@ class SumoCase:
 
     async def get_stratigraphic_column_identifier(self) -> str:
         """Retrieve the stratigraphic column identifier for a case"""
-        return await get_stratigraphic_column_identifier(self._sumo_client, self._case_uuid)
+        if self._case_context.stratigraphic_column_identifier is None:
+            self._case_context.stratigraphic_column_identifier = await get_stratigraphic_column_identifier(
+                self._sumo_client, self._case_uuid
+            )
+        return self._case_context.stratigraphic_column_identifier
 
     async def get_field_identifiers(self) -> List[str]:
         """Retrieve the field identifiers for a case"""
-        return await get_field_identifiers(self._sumo_client, self._case_uuid)
+        if self._case_context.field_identifiers is None:
+            self._case_context.field_identifiers = await get_field_identifiers(self._sumo_client, self._case_uuid)
+        return list(self._case_context.field_identifiers)
 
 
 class SumoEnsemble(SumoCase):
-    def __init__(self, sumo_client: SumoClient, case: Case, case_uuid: str, iteration_name: str):
-        super().__init__(sumo_client=sumo_client, case=case, case_uuid=case_uuid)
+    def __init__(self, case_context: _CaseContext, case_uuid: str, iteration_name: str):
+        super().__init__(case_context=case_context, case_uuid=case_uuid)
         self._iteration_name: str = iteration_name
 
     @classmethod
     async def from_case_uuid(cls, access_token: str, case_uuid: str, iteration_name: str):  # type: ignore # wait on Python 3.11  # pylint: disable=arguments-differ
-        sumo_client, case = await _init_helper(access_token, case_uuid)
-        return cls(sumo_client=sumo_client, case=case, case_uuid=case_uuid, iteration_name=iteration_name)
+        case_context = await _get_case_context(access_token, case_uuid)
+        return cls(case_context=case_context, case_uuid=case_uuid, iteration_name=iteration_name)
 
     def get_realizations(self) -> Sequence[int]:
         """Get list of realizations for this iteration"""
-        realizations = self._case.get_realizations(self._iteration_name)
-        return sorted([int(real) for real in realizations])
+        realizations = self._case_context.realizations_per_iteration.get(self._iteration_name)
+        if realizations is None:
+            realizations = sorted([int(real) for real in self._case.get_realizations(self._iteration_name)])
+            self._case_context.realizations_per_iteration[self._iteration_name] = realizations
+        return list(realizations)
+
+    async def _get_or_load_per_ensemble_async(
+        self, cache: TtlCache[tuple[str, str], V], load_func: Callable[[], Awaitable[V]]
+    ) -> V:
+        """Get the value cached for this ensemble, loading it using `load_func` if it is not cached"""
+        return await cache.get_or_load_async((self._case_uuid, self._iteration_name), load_func)
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pyarrow as pa
+
+from primary.services.utils.memory_lru_cache import MemoryLruCache
+
+
+# Byte budget for the process wide cache of inplace volumetrics tables
+_VOLUMETRICS_TABLE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class VolumetricsTableKey:
+    """
+    Key for an inplace volumetrics table containing all realizations.
+    The table is either a single aggregated Sumo table object for one column, or a table that we have aggregated
+    ourselves from the per realization Sumo table objects, in which case column_name is None.
+    Since Sumo objects are immutable, including the object uuids means that we will never return stale data.
+    """
+
+    case_uuid: str
+    iteration_name: str
+    table_name: str
+    column_name: Optional[str]
+    sumo_object_uuids: tuple[str, ...]
+
+
+def _arrow_table_nbytes(table: pa.Table) -> int:
+    return table.nbytes
+
+
+VOLUMETRICS_TABLE_CACHE: MemoryLruCache[VolumetricsTableKey, pa.Table] = MemoryLruCache(
+    max_bytes=_VOLUMETRICS_TABLE_CACHE_MAX_BYTES, size_of_value=_arrow_table_nbytes
+)
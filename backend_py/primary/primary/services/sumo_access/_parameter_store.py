@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .parameter_types import EnsembleParameter, EnsembleSensitivity, EnsembleSensitivityCase, SensitivityType
+
+
+@dataclass(frozen=True)
+class ParameterColumnInfo:
+    """Description of a single parameter column in the parameter table, without the values"""
+
+    column_name: str
+    name: str
+    group_name: Optional[str]
+    is_logarithmic: bool
+    is_numerical: bool
+    is_constant: bool
+
+
+@dataclass(frozen=True)
+class SensitivityCaseIndex:
+    """
+    Index from the rows of the parameter table to the sensitivity cases, flattened over all sensitivities.
+    Case i is case_names[i] in sensitivities[case_sens_idx[i]], and row r of the parameter table belongs to case
+    row_case_idx[r], which is -1 for rows that are not part of any case.
+    """
+
+    sensitivities: List[EnsembleSensitivity]
+    case_names: List[str]
+    case_sens_idx: np.ndarray
+    row_case_idx: np.ndarray
+
+
+class EnsembleParameterStore:
+    """
+    Columnar store of the parameters of an ensemble, holding the parameter table as loaded from Sumo.
+
+    The per-parameter flags and the sensitivities are computed once when the store is built, so questions like
+    which parameters are non-constant or whether the ensemble is a sensitivity run are answered without touching
+    the values. Python lists of values are only created for the parameters that are actually requested.
+    """
+
+    def __init__(self, parameter_table: pa.Table) -> None:
+        self._table = parameter_table
+        self._realizations_np: np.ndarray = parameter_table["REAL"].to_numpy()
+        self._column_infos: List[ParameterColumnInfo] = [
+            _make_parameter_column_info(parameter_table, column_name)
+            for column_name in parameter_table.column_names
+            if column_name != "REAL"
+        ]
+
+        # If multiple groups have a parameter with the same name, lookup by name gives the first one
+        self._column_info_by_name: Dict[str, ParameterColumnInfo] = {}
+        for info in self._column_infos:
+            self._column_info_by_name.setdefault(info.name, info)
+
+        self._numerical_parameter_matrix: Optional[Tuple[List[str], np.ndarray]] = None
+
+        self._sensitivities: Optional[List[EnsembleSensitivity]] = None
+        self._sensitivity_case_index: Optional[SensitivityCaseIndex] = None
+        sens_name_info = self._column_info_by_name.get("SENSNAME")
+        sens_case_info = self._column_info_by_name.get("SENSCASE")
+        if sens_name_info is not None and sens_case_info is not None:
+            self._sensitivities = _create_ensemble_sensitivities(
+                parameter_table, sens_name_info.column_name, sens_case_info.column_name
+            )
+        if self._sensitivities is not None:
+            self._sensitivity_case_index = _create_sensitivity_case_index(self._sensitivities, self._realizations_np)
+
+    def nbytes(self) -> int:
+        return self._table.nbytes
+
+    def get_realizations(self) -> np.ndarray:
+        return self._realizations_np
+
+    def get_parameter_column_infos(self) -> List[ParameterColumnInfo]:
+        return list(self._column_infos)
+
+    def get_parameter_column_info(self, parameter_name: str) -> Optional[ParameterColumnInfo]:
+        return self._column_info_by_name.get(parameter_name)
+
+    def get_parameter_values_np(self, parameter_name: str) -> Optional[np.ndarray]:
+        """Get the values of the parameter, ordered the same as get_realizations(), or None if not found"""
+        info = self._column_info_by_name.get(parameter_name)
+        if info is None:
+            return None
+        return self._table[info.column_name].to_numpy()
+
+    def get_numerical_parameter_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the names and values of all numerical, non-constant parameters as a float64 matrix with one row per
+        realization, ordered the same as get_realizations(), and one column per parameter.
+        The matrix is built on first use and must not be modified.
+        """
+        if self._numerical_parameter_matrix is None:
+            infos = [info for info in self._column_infos if info.is_numerical and not info.is_constant]
+            matrix = np.empty((len(self._realizations_np), len(infos)), dtype=np.float64)
+            for col_idx, info in enumerate(infos):
+                matrix[:, col_idx] = self._table[info.column_name].to_numpy()
+            matrix.flags.writeable = False
+            self._numerical_parameter_matrix = ([info.name for info in infos], matrix)
+
+        return self._numerical_parameter_matrix
+
+    def get_parameter(self, parameter_name: str) -> Optional[EnsembleParameter]:
+        info = self._column_info_by_name.get(parameter_name)
+        if info is None:
+            return None
+        return self._make_ensemble_parameter(info)
+
+    def get_parameters(self, parameter_names: Optional[Sequence[str]] = None) -> List[EnsembleParameter]:
+        """Get the parameters with the specified names, or all parameters if no names are given"""
+        if parameter_names is None:
+            return [self._make_ensemble_parameter(info) for info in self._column_infos]
+
+        infos = [self._column_info_by_name.get(name) for name in parameter_names]
+        return [self._make_ensemble_parameter(info) for info in infos if info is not None]
+
+    def get_sensitivities(self) -> Optional[List[EnsembleSensitivity]]:
+        return self._sensitivities
+
+    def is_sensitivity_run(self) -> bool:
+        return self._sensitivities is not None
+
+    def get_sensitivity_case_index(self) -> Optional[SensitivityCaseIndex]:
+        """Get the index from realizations to sensitivity cases, or None if the ensemble is not a sensitivity run"""
+        return self._sensitivity_case_index
+
+    def _make_ensemble_parameter(self, info: ParameterColumnInfo) -> EnsembleParameter:
+        return EnsembleParameter(
+            name=info.name,
+            is_logarithmic=info.is_logarithmic,
+            is_numerical=info.is_numerical,
+            is_constant=info.is_constant,
+            group_name=info.group_name,
+            descriptive_name=info.name,
+            values=self._table[info.column_name].to_numpy().tolist(),
+            realizations=self._realizations_np.tolist(),
+        )
+
+
+def _make_parameter_column_info(parameter_table: pa.Table, column_name: str) -> ParameterColumnInfo:
+    parameter_name_components = column_name.split(":")
+    if len(parameter_name_components) > 2:
+        raise ValueError(f"Parameter {column_name} has too many componenents. Expected <groupname>:<parametername>")
+    if len(parameter_name_components) == 1:
+        parameter_name = column_name
+        group_name = None
+    else:
+        group_name = parameter_name_components[0]
+        parameter_name = parameter_name_components[1]
+
+    column_type = parameter_table.schema.field(column_name).type
+    return ParameterColumnInfo(
+        column_name=column_name,
+        name=parameter_name,
+        group_name=group_name,
+        is_logarithmic=column_name.startswith("LOG10_"),
+        is_numerical=not (pa.types.is_string(column_type) or pa.types.is_large_string(column_type)),
+        is_constant=pc.count_distinct(parameter_table[column_name], mode="all").as_py() == 1,
+    )
+
+
+def _create_ensemble_sensitivities(
+    parameter_table: pa.Table, sens_name_column: str, sens_case_column: str
+) -> Optional[List[EnsembleSensitivity]]:
+    """Extract sensitivities from the SENSNAME and SENSCASE parameters, sorted on sensitivity and case name"""
+    # One row per (sensitivity, case) combination, with the distinct realizations of the combination
+    sens_table = parameter_table.select([sens_name_column, sens_case_column, "REAL"]).rename_columns(
+        ["name", "case", "REAL"]
+    )
+    sens_table = sens_table.filter(pc.and_(pc.is_valid(sens_table["name"]), pc.is_valid(sens_table["case"])))
+    grouped_table = sens_table.group_by(["name", "case"]).aggregate([("REAL", "distinct")])
+    grouped_table = grouped_table.sort_by([("name", "ascending"), ("case", "ascending")])
+
+    cases_by_sens_name: Dict[str, List[EnsembleSensitivityCase]] = {}
+    for sens_name, case_name, reals in zip(
+        grouped_table["name"].to_pylist(), grouped_table["case"].to_pylist(), grouped_table["REAL_distinct"].to_pylist()
+    ):
+        case = EnsembleSensitivityCase(name=case_name, realizations=sorted(reals))
+        cases_by_sens_name.setdefault(sens_name, []).append(case)
+
+    sensitivities = [
+        EnsembleSensitivity(
+            name=sens_name,
+            type=find_sensitivity_type([case.name for case in cases]),
+            cases=cases,
+        )
+        for sens_name, cases in cases_by_sens_name.items()
+    ]
+    return sensitivities if sensitivities else None
+
+
+def _create_sensitivity_case_index(
+    sensitivities: List[EnsembleSensitivity], realizations_np: np.ndarray
+) -> SensitivityCaseIndex:
+    case_names: List[str] = []
+    case_sens_idx: List[int] = []
+    row_case_idx = np.full(len(realizations_np), -1, dtype=np.int64)
+    for sens_idx, sensitivity in enumerate(sensitivities):
+        for case in sensitivity.cases:
+            row_case_idx[np.isin(realizations_np, case.realizations)] = len(case_names)
+            case_names.append(case.name)
+            case_sens_idx.append(sens_idx)
+
+    return SensitivityCaseIndex(
+        sensitivities=sensitivities,
+        case_names=case_names,
+        case_sens_idx=np.array(case_sens_idx, dtype=np.int64),
+        row_case_idx=row_case_idx,
+    )
+
+
+def find_sensitivity_type(sens_case_names: List[str]) -> SensitivityType:
+    """Find the sensitivity type based on the sensitivity case names"""
+    if len(sens_case_names) == 1 and sens_case_names[0] == "p10_p90":
+        return SensitivityType.MONTECARLO
+    return SensitivityType.SCENARIO
@@ -0,0 +1,15 @@
+from primary.services.utils.ttl_cache import TtlCache
+
+from ._parameter_store import EnsembleParameterStore
+
+
+# The parameter store is cached per ensemble rather than per Sumo object, so that it can be served without
+# any Sumo round-trips. The time-to-live bounds how long it takes before re-uploaded data is picked up.
+_PARAMETER_STORE_CACHE_TTL_S = 60 * 60
+_PARAMETER_STORE_CACHE_MAX_ENTRIES = 100
+
+
+# Holds parameter stores keyed on (case_uuid, iteration_name)
+PARAMETER_STORE_CACHE: TtlCache[tuple[str, str], EnsembleParameterStore] = TtlCache(
+    max_entries=_PARAMETER_STORE_CACHE_MAX_ENTRIES, ttl_s=_PARAMETER_STORE_CACHE_TTL_S
+)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -89,7 +89,81 @@ def interpolate_backfill(x: np.ndarray, xp: np.ndarray, yp: np.ndarray, yleft: f
     return ret_arr
 
 
+def _find_interp_indices(x_keys: np.ndarray, xp_keys: np.ndarray) -> np.ndarray:
+    """
+    Find, for each of the x_keys, the index of the last element in xp_keys that is less than or equal to the key.
+    This is the same index that np.interp() uses internally, and will be -1 for keys that are less than xp_keys[0].
+    """
+    return np.searchsorted(xp_keys, x_keys, side="right") - 1
+
+
+def _interp_using_indices(
+    x: np.ndarray, xp: np.ndarray, fp: np.ndarray, j: np.ndarray, seg_first: np.ndarray, seg_last: np.ndarray
+) -> np.ndarray:
+    # pylint: disable=invalid-name
+    """
+    Vectorized linear interpolation that reproduces the exact floating point operations done by np.interp()
+    using the default left and right values.
+
+    The xp and fp arrays may contain multiple concatenated segments. For each x, `j` is the index into xp as
+    returned by _find_interp_indices() and `seg_first`/`seg_last` are the indices of the first and last elements
+    of the segment that the x value belongs to. The fp array may be 2D, in which case each column is interpolated.
+    """
+    x = x.astype(np.float64)
+    xp = xp.astype(np.float64)
+    fp = fp.astype(np.float64)
+
+    is_left_of_segment = j < seg_first
+    j = np.clip(j, seg_first, seg_last)
+    j_next = np.minimum(j + 1, seg_last)
+
+    is_interior = ~is_left_of_segment & (j < seg_last) & (xp[j] != x)
+
+    x_j = xp[j]
+    x_j_next = xp[j_next]
+    y_j = fp[j]
+    y_j_next = fp[j_next]
+    if fp.ndim == 2:
+        x = x[:, np.newaxis]
+        x_j = x_j[:, np.newaxis]
+        x_j_next = x_j_next[:, np.newaxis]
+        is_interior = is_interior[:, np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (y_j_next - y_j) / (x_j_next - x_j)
+        res = slope * (x - x_j) + y_j
+
+        # Just as np.interp(), if we get nan in one direction, try the other
+        res_is_nan = np.isnan(res)
+        if np.any(res_is_nan & is_interior):
+            res_other = slope * (x - x_j_next) + y_j_next
+            res_other = np.where(np.isnan(res_other) & (y_j == y_j_next), y_j, res_other)
+            res = np.where(res_is_nan, res_other, res)
+
+    return np.where(is_interior, res, y_j)
+
+
+def _backfill_using_indices(
+    x: np.ndarray, xp: np.ndarray, fp: np.ndarray, seg_first: np.ndarray, seg_last: np.ndarray, k: np.ndarray
+) -> np.ndarray:
+    # pylint: disable=invalid-name
+    """
+    Vectorized version of interpolate_backfill() with yleft and yright set to 0.
+    For each x, `k` is the leftmost insertion index of x into xp, and `seg_first`/`seg_last` are the indices
+    of the first and last elements of the segment that the x value belongs to.
+    """
+    outside = (x < xp[seg_first]) | (k > seg_last)
+    k = np.clip(k, seg_first, seg_last)
+
+    y = fp[k].astype(np.float64)
+    if y.ndim == 2:
+        outside = outside[:, np.newaxis]
+
+    return np.where(outside, 0.0, y)
+
+
 def resample_single_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
+    # pylint: disable=too-many-locals
     """Resample table that contains only a single realization.
     The table must contain a DATE column and it must be sorted on DATE
     """
@@ -99,57 +173,155 @@ def resample_single_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
     raw_dates_np = table.column("DATE").to_numpy()
     raw_dates_np_as_uint = raw_dates_np.astype(np.uint64)
 
-    min_raw_date = np.min(raw_dates_np)
-    max_raw_date = np.max(raw_dates_np)
-
-    sample_dates_np = generate_normalized_sample_dates(min_raw_date, max_raw_date, freq=freq)
+    sample_dates_np = generate_normalized_sample_dates(np.min(raw_dates_np), np.max(raw_dates_np), freq=freq)
     sample_dates_np_as_uint = sample_dates_np.astype(np.uint64)
 
-    column_arrays = []
+    # Interpolation indices and weights are the same for all the columns, so we find them once and
+    # then interpolate all rate columns and all non-rate columns in one go as 2D arrays
+    seg_first = np.zeros(len(sample_dates_np), dtype=np.int64)
+    seg_last = np.full(len(sample_dates_np), len(raw_dates_np) - 1, dtype=np.int64)
+
+    value_colnames = [colname for colname in schema.names if colname not in ["DATE", "REAL"]]
+    rate_colnames = [colname for colname in value_colnames if is_rate_from_field_meta(table.field(colname))]
+    non_rate_colnames = [colname for colname in value_colnames if colname not in rate_colnames]
+
+    resampled_columns_dict: Dict[str, np.ndarray] = {}
+
+    if non_rate_colnames:
+        interp_indices = _find_interp_indices(sample_dates_np_as_uint, raw_dates_np_as_uint)
+        raw_values_2d = _columns_to_2d_numpy_arr(table, non_rate_colnames)
+        resampled_2d = _interp_using_indices(
+            sample_dates_np_as_uint, raw_dates_np_as_uint, raw_values_2d, interp_indices, seg_first, seg_last
+        )
+        for col_idx, colname in enumerate(non_rate_colnames):
+            resampled_columns_dict[colname] = resampled_2d[:, col_idx]
+
+    if rate_colnames:
+        backfill_indices = np.searchsorted(raw_dates_np_as_uint, sample_dates_np_as_uint, side="left")
+        raw_values_2d = _columns_to_2d_numpy_arr(table, rate_colnames)
+        resampled_2d = _backfill_using_indices(
+            sample_dates_np_as_uint, raw_dates_np_as_uint, raw_values_2d, seg_first, seg_last, backfill_indices
+        )
+        for col_idx, colname in enumerate(rate_colnames):
+            resampled_columns_dict[colname] = resampled_2d[:, col_idx]
 
+    column_arrays = []
     for colname in schema.names:
         if colname == "DATE":
             column_arrays.append(sample_dates_np)
         elif colname == "REAL":
             column_arrays.append(np.full(len(sample_dates_np), table.column("REAL")[0].as_py()))
         else:
-            raw_numpy_arr = table.column(colname).to_numpy()
-            if is_rate_from_field_meta(table.field(colname)):
-                i = interpolate_backfill(sample_dates_np_as_uint, raw_dates_np_as_uint, raw_numpy_arr, 0, 0)
-            else:
-                i = np.interp(sample_dates_np_as_uint, raw_dates_np_as_uint, raw_numpy_arr)
-
-            column_arrays.append(i)
+            column_arrays.append(resampled_columns_dict[colname])
 
     ret_table = pa.table(column_arrays, schema=schema)
 
     return ret_table
 
 
+def _columns_to_2d_numpy_arr(table: pa.Table, column_names: List[str]) -> np.ndarray:
+    return np.column_stack([table.column(colname).to_numpy() for colname in column_names])
+
+
 @dataclass
-class RealInterpolationInfo:
-    raw_dates_np: np.ndarray
-    raw_dates_np_as_uint: np.ndarray
-    sample_dates_np: np.ndarray
-    sample_dates_np_as_uint: np.ndarray
-
-
-def _extract_real_interpolation_info(
-    table: pa.Table, start_row_idx: int, row_count: int, freq: Frequency
-) -> RealInterpolationInfo:
-    real_dates = table["DATE"].slice(start_row_idx, row_count).to_numpy()
-
-    min_raw_date = np.min(real_dates)
-    max_raw_date = np.max(real_dates)
-    sample_dates = generate_normalized_sample_dates(min_raw_date, max_raw_date, freq)
-
-    return RealInterpolationInfo(
-        raw_dates_np=real_dates,
-        raw_dates_np_as_uint=real_dates.astype(np.uint64),
-        sample_dates_np=sample_dates,
-        sample_dates_np_as_uint=sample_dates.astype(np.uint64),
+class SegmentedSampleGrid:
+    """
+    Sample dates for a table that is segmented on REAL, where all realizations share one normalized date grid.
+    Each realization uses a contiguous slice of the shared grid that covers its own raw date range, which is exactly
+    the same set of dates that generate_normalized_sample_dates() would give for that realization alone.
+    """
+
+    unique_reals: np.ndarray
+    shared_sample_dates_np: np.ndarray
+    # Per realization: start index into the shared grid and number of sample dates
+    grid_start_idx: np.ndarray
+    grid_count: np.ndarray
+    # Per realization: first row index and row count in the raw table
+    raw_start_idx: np.ndarray
+    raw_count: np.ndarray
+
+
+def find_real_segments(real_arr_np: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the unique realizations in ascending order together with the start row index and row count
+    of each realization's segment, i.e. the same as np.unique() with return_index and return_counts.
+    Avoids the sort done by np.unique() when the table is already sorted on REAL.
+    """
+    if len(real_arr_np) > 0 and np.all(real_arr_np[1:] >= real_arr_np[:-1]):
+        first_occurrence_idx = np.concatenate(([0], np.flatnonzero(real_arr_np[1:] != real_arr_np[:-1]) + 1))
+        real_counts = np.diff(np.append(first_occurrence_idx, len(real_arr_np)))
+        return real_arr_np[first_occurrence_idx], first_occurrence_idx, real_counts
+
+    return np.unique(real_arr_np, return_index=True, return_counts=True)
+
+
+def _build_segmented_sample_grid(
+    real_arr_np: np.ndarray, raw_dates_np: np.ndarray, freq: Frequency
+) -> SegmentedSampleGrid:
+    unique_reals, first_occurrence_idx, real_counts = find_real_segments(real_arr_np)
+
+    # Since each segment is sorted on DATE, the first and last row in each segment holds the min and max date
+    per_real_min_dates = raw_dates_np[first_occurrence_idx]
+    per_real_max_dates = raw_dates_np[first_occurrence_idx + real_counts - 1]
+
+    shared_sample_dates_np = generate_normalized_sample_dates(
+        np.min(per_real_min_dates), np.max(per_real_max_dates), freq
     )
 
+    # The grid is normalized, so for each realization the resampled range starts at the last grid date at or
+    # before the realization's first date and stops at the first grid date at or after its last date
+    grid_start_idx = np.searchsorted(shared_sample_dates_np, per_real_min_dates, side="right") - 1
+    grid_stop_idx = np.searchsorted(shared_sample_dates_np, per_real_max_dates, side="left")
+
+    return SegmentedSampleGrid(
+        unique_reals=unique_reals,
+        shared_sample_dates_np=shared_sample_dates_np,
+        grid_start_idx=grid_start_idx,
+        grid_count=grid_stop_idx - grid_start_idx + 1,
+        raw_start_idx=first_occurrence_idx,
+        raw_count=real_counts,
+    )
+
+
+def _ranges_to_indices(start_idx: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """
+    Concatenation of np.arange(start, start + count) for all the start/count pairs, without any Python loop.
+    All counts must be greater than zero.
+    """
+    # Make an array of steps that is 1 everywhere except at the start of each range, where it jumps
+    # to the next range's start index, and then accumulate the steps.
+    steps = np.ones(int(np.sum(count)), dtype=np.int64)
+    range_first_pos = np.cumsum(count) - count
+    steps[range_first_pos[1:]] = start_idx[1:] - (start_idx[:-1] + count[:-1] - 1)
+    steps[0] = start_idx[0]
+    return np.cumsum(steps)
+
+
+# np.interp() works on float64, so to get results identical to interpolating each realization separately all
+# the offset keys we make must be exactly representable as float64
+_MAX_EXACT_FLOAT64_INT = 2**53
+
+
+def _max_realizations_per_batch(date_stride: int) -> int:
+    """
+    Number of realizations that can be interpolated in one batch while keeping the offset keys below the limit
+    where they can be exactly represented as float64. For normal ensembles all realizations fit in one batch.
+    """
+    return max(1, (_MAX_EXACT_FLOAT64_INT - 1) // date_stride - 1)
+
+
+def _find_leftmost_insertion_indices(sorted_x: np.ndarray, sorted_xp: np.ndarray) -> np.ndarray:
+    """
+    Equivalent to np.searchsorted(sorted_xp, sorted_x, side="left"), but requires that both arrays are sorted.
+    When there are many more sample points than raw points, it is cheaper to locate each raw point among
+    the sample points and then accumulate the counts.
+    """
+    if len(sorted_x) <= len(sorted_xp):
+        return np.searchsorted(sorted_xp, sorted_x, side="left")
+
+    raw_pos_in_x = np.searchsorted(sorted_x, sorted_xp, side="right")
+    return np.cumsum(np.bincount(raw_pos_in_x, minlength=len(sorted_x) + 1))[: len(sorted_x)]
+
 
 def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
     """
@@ -157,66 +329,179 @@ def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.
     The table must contain both a REAL and a DATE column.
     The table must be segmented on REAL (so that all rows from a single realization are contiguous) and within each REAL
     segment, it must be sorted on DATE.
-    The segmentation is needed since interpolations must be done per realization and we use slicing on rows for speed.
+    The segmentation is needed since interpolations must be done per realization. All realizations are interpolated
+    in one pass by offsetting the dates of each REAL segment so that the segments occupy non-overlapping ranges.
     """
     # pylint: disable=too-many-locals
 
+    if table.num_rows == 0:
+        return table
+
     real_arr_np = table.column("REAL").to_numpy()
-    unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
+    raw_dates_np = table.column("DATE").to_numpy()
 
-    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
+    grid = _build_segmented_sample_grid(real_arr_np, raw_dates_np, freq)
+    num_reals = len(grid.unique_reals)
 
-    real_interpolation_info_dict: Dict[int, RealInterpolationInfo] = {}
+    # Make sure the raw rows are laid out in the same (ascending) REAL order as the output.
+    # Tables that come sorted on REAL are used as is.
+    raw_row_idx: np.ndarray | None = None
+    if np.any(np.diff(grid.raw_start_idx) < 0):
+        raw_row_idx = _ranges_to_indices(grid.raw_start_idx, grid.raw_count)
+        raw_dates_np = raw_dates_np[raw_row_idx]
+
+    # Index of the first and last raw row of each realization
+    raw_seg_first = np.cumsum(grid.raw_count) - grid.raw_count
+    raw_seg_last = raw_seg_first + grid.raw_count - 1
+
+    # Output sample dates for all realizations concatenated, along with index of the first and last sample of each real
+    sample_dates_np = grid.shared_sample_dates_np[_ranges_to_indices(grid.grid_start_idx, grid.grid_count)]
+    sample_seg_first = np.cumsum(grid.grid_count) - grid.grid_count
+    sample_seg_last = sample_seg_first + grid.grid_count - 1
+
+    # Only the first and last sample of each realization can lie outside the realization's raw date range
+    raw_dates_as_int = raw_dates_np.view(np.int64)
+    sample_dates_as_int = sample_dates_np.view(np.int64)
+    first_sample_is_left = sample_dates_as_int[sample_seg_first] < raw_dates_as_int[raw_seg_first]
+    last_sample_is_right = sample_dates_as_int[sample_seg_last] > raw_dates_as_int[raw_seg_last]
+
+    # Make offset keys, where each realization occupies its own range of width date_stride
+    date_base = int(min(raw_dates_as_int.min(), sample_dates_as_int.min()))
+    date_stride = int(max(raw_dates_as_int.max(), sample_dates_as_int.max())) - date_base + 1
+    reals_per_batch = _max_realizations_per_batch(date_stride)
+    real_key_offsets = (np.arange(num_reals, dtype=np.int64) % reals_per_batch) * date_stride - date_base
+    raw_keys = raw_dates_as_int + np.repeat(real_key_offsets, grid.raw_count)
+    sample_keys = sample_dates_as_int + np.repeat(real_key_offsets, grid.grid_count)
+
+    output_columns_dict: Dict[str, pa.Array] = {}
+
+    backfill_indices: np.ndarray | None = None
 
     for colname in table.schema.names:
         if colname in ["DATE", "REAL"]:
             continue
 
-        is_rate = is_rate_from_field_meta(table.field(colname))
-        raw_whole_numpy_arr = table.column(colname).to_numpy()
+        raw_numpy_arr = table.column(colname).to_numpy()
+        if raw_row_idx is not None:
+            raw_numpy_arr = raw_numpy_arr[raw_row_idx]
 
-        vec_arr_list = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
+        if is_rate_from_field_meta(table.field(colname)):
+            if backfill_indices is None:
+                backfill_indices = _find_leftmost_insertion_indices(sample_keys, raw_keys)
+            inter = _backfill_segments(raw_numpy_arr, backfill_indices)
+            inter[sample_seg_first[first_sample_is_left]] = 0
+            inter[sample_seg_last[last_sample_is_right]] = 0
+        else:
+            inter = np.empty(len(sample_keys), dtype=np.float64)
+            for first_real in range(0, num_reals, reals_per_batch):
+                end_real = min(first_real + reals_per_batch, num_reals)
+                raw_slice = slice(raw_seg_first[first_real], raw_seg_last[end_real - 1] + 1)
+                sample_slice = slice(sample_seg_first[first_real], sample_seg_last[end_real - 1] + 1)
+                inter[sample_slice] = np.interp(
+                    sample_keys[sample_slice].astype(np.float64),
+                    raw_keys[raw_slice].astype(np.float64),
+                    raw_numpy_arr[raw_slice],
+                )
+            # Samples outside the raw range of a realization get the realization's first or last value
+            inter[sample_seg_first[first_sample_is_left]] = raw_numpy_arr[raw_seg_first[first_sample_is_left]]
+            inter[sample_seg_last[last_sample_is_right]] = raw_numpy_arr[raw_seg_last[last_sample_is_right]]
 
-            rii = real_interpolation_info_dict.get(real)
-            if not rii:
-                rii = _extract_real_interpolation_info(table, start_row_idx, row_count, freq)
-                real_interpolation_info_dict[real] = rii
+        output_columns_dict[colname] = pa.array(inter)
 
-            raw_numpy_arr = raw_whole_numpy_arr[start_row_idx : start_row_idx + row_count]
+    output_columns_dict["DATE"] = pa.array(sample_dates_np)
+    output_columns_dict["REAL"] = pa.array(np.repeat(grid.unique_reals, grid.grid_count))
 
-            if is_rate:
-                inter = interpolate_backfill(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                    0,
-                    0,
-                )
-            else:
-                inter = np.interp(rii.sample_dates_np_as_uint, rii.raw_dates_np_as_uint, raw_numpy_arr)
+    ret_table = pa.table(output_columns_dict, schema=table.schema)
 
-            arr_length = len(rii.sample_dates_np_as_uint)
-            if arr_length != len(inter):
-                raise RuntimeError("Unequal length between date and value arrays")
+    return ret_table
 
-            vec_arr_list.append(inter)
 
-        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+def _backfill_segments(raw_numpy_arr: np.ndarray, backfill_indices: np.ndarray) -> np.ndarray:
+    padded_y = np.concatenate((raw_numpy_arr, np.array([0])))
+    return padded_y[backfill_indices]
 
-    date_arr_list = []
-    real_arr_list = []
-    for real in unique_reals:
-        rii = real_interpolation_info_dict[real]
-        arr_length = len(rii.sample_dates_np)
-        date_arr_list.append(rii.sample_dates_np)
-        real_arr_list.append(np.full(arr_length, real))
 
-    output_columns_dict["DATE"] = pa.chunked_array(date_arr_list)
-    output_columns_dict["REAL"] = pa.chunked_array(real_arr_list)
+# For each frequency, the next finer frequency whose normalized sample dates include all of its sample dates
+_NESTED_FINER_FREQUENCY: Dict[Frequency, Frequency] = {
+    Frequency.WEEKLY: Frequency.DAILY,
+    Frequency.MONTHLY: Frequency.DAILY,
+    Frequency.QUARTERLY: Frequency.MONTHLY,
+    Frequency.YEARLY: Frequency.QUARTERLY,
+}
 
-    ret_table = pa.table(output_columns_dict, schema=table.schema)
 
-    return ret_table
+def get_nested_finer_frequencies(freq: Frequency) -> List[Frequency]:
+    """
+    Get the finer frequencies that a table resampled to `freq` can be derived from using
+    downsample_resampled_segmented_multi_real_table(), ordered from the closest (and cheapest) to the finest.
+    """
+    finer_freqs: List[Frequency] = []
+    finer_freq = _NESTED_FINER_FREQUENCY.get(freq)
+    while finer_freq is not None:
+        finer_freqs.append(finer_freq)
+        finer_freq = _NESTED_FINER_FREQUENCY.get(finer_freq)
+
+    return finer_freqs
+
+
+def downsample_resampled_segmented_multi_real_table(finer_table: pa.Table, coarser_freq: Frequency) -> pa.Table:
+    """
+    Derive a table resampled to `coarser_freq` from a table that has already been resampled, using
+    resample_segmented_multi_real_table(), to one of the finer frequencies given by get_nested_finer_frequencies().
+
+    Since every coarser sample date is also a sample date in the finer table, the values inside each realization's
+    date range are picked directly from the finer table. The coarser grid may extend beyond the finer grid at the
+    ends, where rate vectors get 0 and non-rate vectors get the realization's first or last value, just as when
+    resampling from the raw data. The result is identical to resampling the raw table to `coarser_freq`.
+    """
+    # pylint: disable=too-many-locals
+
+    if finer_table.num_rows == 0:
+        return finer_table
+
+    real_arr_np = finer_table.column("REAL").to_numpy()
+    finer_dates_np = finer_table.column("DATE").to_numpy()
+
+    # The grid is built from the min and max dates of the finer table, but since the grids are nested this gives
+    # the same grid as building it from the raw min and max dates
+    grid = _build_segmented_sample_grid(real_arr_np, finer_dates_np, coarser_freq)
+    if np.any(np.diff(grid.raw_start_idx) < 0):
+        raise ValueError("The finer table must be sorted on REAL")
+
+    sample_dates_np = grid.shared_sample_dates_np[_ranges_to_indices(grid.grid_start_idx, grid.grid_count)]
+    sample_real_idx = np.repeat(np.arange(len(grid.unique_reals)), grid.grid_count)
+    finer_seg_first = grid.raw_start_idx[sample_real_idx]
+    finer_seg_last = finer_seg_first + grid.raw_count[sample_real_idx] - 1
+
+    # Locate each sample within its realization's segment using offset keys, no float conversion is involved here
+    finer_dates_as_int = finer_dates_np.view(np.int64)
+    sample_dates_as_int = sample_dates_np.view(np.int64)
+    date_base = int(min(finer_dates_as_int.min(), sample_dates_as_int.min()))
+    date_stride = int(max(finer_dates_as_int.max(), sample_dates_as_int.max())) - date_base + 1
+    real_key_offsets = np.arange(len(grid.unique_reals), dtype=np.int64) * date_stride - date_base
+    finer_keys = finer_dates_as_int + np.repeat(real_key_offsets, grid.raw_count)
+    sample_keys = sample_dates_as_int + real_key_offsets[sample_real_idx]
+
+    finer_row_idx = np.clip(np.searchsorted(finer_keys, sample_keys, side="left"), finer_seg_first, finer_seg_last)
+    is_inside = (sample_dates_as_int >= finer_dates_as_int[finer_seg_first]) & (
+        sample_dates_as_int <= finer_dates_as_int[finer_seg_last]
+    )
+    if not np.array_equal(finer_dates_as_int[finer_row_idx[is_inside]], sample_dates_as_int[is_inside]):
+        raise ValueError(f"The sample dates of the finer table do not include all the {coarser_freq.value} dates")
+
+    output_columns_dict: Dict[str, pa.Array] = {}
+    for colname in finer_table.schema.names:
+        if colname in ["DATE", "REAL"]:
+            continue
+
+        finer_numpy_arr = finer_table.column(colname).to_numpy()
+        values = finer_numpy_arr[finer_row_idx]
+        if is_rate_from_field_meta(finer_table.field(colname)):
+            values = np.where(is_inside, values, 0)
+
+        output_columns_dict[colname] = pa.array(values)
+
+    output_columns_dict["DATE"] = pa.array(sample_dates_np)
+    output_columns_dict["REAL"] = pa.array(grid.unique_reals[sample_real_idx])
+
+    return pa.table(output_columns_dict, schema=finer_table.schema)
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+import pyarrow as pa
+
+
+class PointInTimeLookup(str, Enum):
+    """
+    How to look up values at timestamps that do not exactly match one of the realization's dates.
+    EXACT: Only exact matches give a value.
+    INTERPOLATE: Non-rate vectors are linearly interpolated. Rate vectors are back-filled, i.e. they get the value of
+    the next date, since a rate value applies to the interval leading up to the date it is reported at.
+    In both cases timestamps outside a realization's date range give no value.
+    """
+
+    EXACT = "EXACT"
+    INTERPOLATE = "INTERPOLATE"
+
+
+@dataclass(frozen=True)
+class SegmentedDateIndex:
+    """
+    Index over the DATE column of a table that is sorted on REAL and then DATE, which allows values at any number
+    of timestamps to be looked up for all realizations using binary search.
+
+    The rows of unique_reals[i] are found in the range [real_row_offsets[i], real_row_offsets[i+1]) of the table.
+    The search keys are the dates offset per realization, so that all realizations are searched in one operation.
+    """
+
+    unique_reals: np.ndarray
+    real_row_offsets: np.ndarray
+    date_keys: np.ndarray
+    date_base: int
+    date_stride: int
+
+    def nbytes(self) -> int:
+        return self.unique_reals.nbytes + self.real_row_offsets.nbytes + self.date_keys.nbytes
+
+    def lookup_values_at_timestamps(
+        self, values_np: np.ndarray, timestamps_utc_ms: np.ndarray, lookup: PointInTimeLookup, is_rate: bool
+    ) -> np.ndarray:
+        # pylint: disable=too-many-locals
+        """
+        Look up the values for all realizations at the specified timestamps.
+        `values_np` must be the vector column of the indexed table.
+        Returns float64 array of shape (num_timestamps, num_realizations), with NaN where there is no value.
+        """
+        num_reals = len(self.unique_reals)
+        timestamps_as_int = np.asarray(timestamps_utc_ms, dtype=np.int64)
+        result = np.full((len(timestamps_as_int), num_reals), np.nan, dtype=np.float64)
+        if num_reals == 0 or len(timestamps_as_int) == 0:
+            return result
+
+        seg_first = self.real_row_offsets[:-1]
+        seg_last = self.real_row_offsets[1:] - 1
+
+        # Timestamps outside the range of all the indexed dates can never give a value, and must not be used
+        # to make search keys since they could then end up in the neighbouring realization's key range
+        is_in_key_range = (timestamps_as_int >= self.date_base) & (
+            timestamps_as_int < self.date_base + self.date_stride
+        )
+
+        # Search keys laid out as [timestamp, realization]
+        real_key_offsets = np.arange(num_reals, dtype=np.int64) * self.date_stride - self.date_base
+        search_keys = timestamps_as_int[:, np.newaxis] + real_key_offsets[np.newaxis, :]
+
+        # Leftmost insertion index, clipped to the realization's segment
+        row_idx = np.searchsorted(self.date_keys, search_keys, side="left")
+        clipped_row_idx = np.clip(row_idx, seg_first, seg_last)
+        is_exact = (self.date_keys[clipped_row_idx] == search_keys) & is_in_key_range[:, np.newaxis]
+
+        values_f64 = values_np.astype(np.float64, copy=False)
+        result[is_exact] = values_f64[clipped_row_idx[is_exact]]
+        if lookup == PointInTimeLookup.EXACT:
+            return result
+
+        # Inside the realization's date range, but between two dates
+        is_between = (
+            ~is_exact
+            & is_in_key_range[:, np.newaxis]
+            & (row_idx > seg_first[np.newaxis, :])
+            & (row_idx <= seg_last[np.newaxis, :])
+        )
+        next_idx = row_idx[is_between]
+        if is_rate:
+            result[is_between] = values_f64[next_idx]
+        else:
+            prev_idx = next_idx - 1
+            prev_keys = self.date_keys[prev_idx]
+            weight = (search_keys[is_between] - prev_keys) / (self.date_keys[next_idx] - prev_keys)
+            result[is_between] = values_f64[prev_idx] + weight * (values_f64[next_idx] - values_f64[prev_idx])
+
+        return result
+
+
+def build_segmented_date_index(table: pa.Table) -> SegmentedDateIndex:
+    """
+    Build DATE index for a table with REAL and DATE columns that is sorted on REAL and then DATE
+    """
+    real_arr_np = table.column("REAL").to_numpy()
+    dates_as_int = table.column("DATE").to_numpy().view(np.int64)
+
+    if len(real_arr_np) == 0:
+        return SegmentedDateIndex(
+            unique_reals=np.empty(0, dtype=np.int64),
+            real_row_offsets=np.zeros(1, dtype=np.int64),
+            date_keys=np.empty(0, dtype=np.int64),
+            date_base=0,
+            date_stride=1,
+        )
+
+    if np.any(real_arr_np[1:] < real_arr_np[:-1]):
+        raise ValueError("Table must be sorted on REAL")
+
+    seg_start_idx = np.concatenate(([0], np.flatnonzero(real_arr_np[1:] != real_arr_np[:-1]) + 1)).astype(np.int64)
+    real_row_offsets = np.append(seg_start_idx, len(real_arr_np))
+    seg_counts = np.diff(real_row_offsets)
+
+    date_base = int(dates_as_int.min())
+    date_stride = int(dates_as_int.max()) - date_base + 1
+    real_key_offsets = np.arange(len(seg_start_idx), dtype=np.int64) * date_stride - date_base
+
+    return SegmentedDateIndex(
+        unique_reals=real_arr_np[seg_start_idx],
+        real_row_offsets=real_row_offsets,
+        date_keys=dates_as_int + np.repeat(real_key_offsets, seg_counts),
+        date_base=date_base,
+        date_stride=date_stride,
+    )
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pyarrow as pa
+
+from primary.services.utils.memory_lru_cache import MemoryLruCache
+from primary.services.utils.ttl_cache import TtlCache
+
+from ._ensemble_timestamp_index import EnsembleTimestampIndex
+from ._summary_date_index import SegmentedDateIndex
+from ._vector_directory import VectorDirectory
+from .summary_types import Frequency, VectorMetadata
+
+
+# Byte budget for the process wide cache of per-vector summary tables
+_ALL_REAL_TABLE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Byte budget for the process wide cache of DATE indices of the per-vector summary tables
+_ALL_REAL_DATE_INDEX_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Byte budget for the process wide cache of evaluated calculated vector expressions and their subexpressions
+_CALCULATED_VECTOR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Byte budget for the process wide cache of columns from the per-realization summary tables
+_SINGLE_REAL_COLUMN_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# The timestamp index is cached per ensemble rather than per Sumo object, so that it can be served without
+# any Sumo round-trips. The time-to-live bounds how long it takes before re-uploaded data is picked up.
+_ENSEMBLE_TIMESTAMP_INDEX_CACHE_TTL_S = 60 * 60
+_ENSEMBLE_TIMESTAMP_INDEX_CACHE_MAX_ENTRIES = 200
+
+# Vector directories are cached per ensemble in the same way as the timestamp index
+_VECTOR_DIRECTORY_CACHE_TTL_S = 60 * 60
+_VECTOR_DIRECTORY_CACHE_MAX_ENTRIES = 100
+
+# Historical vectors are small, single realization tables, and the same curve is requested for every plot of a vector
+_HISTORICAL_VECTOR_CACHE_TTL_S = 60 * 60
+_HISTORICAL_VECTOR_CACHE_MAX_ENTRIES = 1000
+
+
+@dataclass(frozen=True)
+class AllRealTableKey:
+    """
+    Key for a summary table containing all realizations for a single vector.
+    Note that since Sumo objects are immutable, including the object uuid means that we will never
+    return stale data if a table is re-uploaded to Sumo.
+    The raw table has resampling_frequency None, while resampled versions of it are stored alongside it using
+    the same key with the frequency set.
+    """
+
+    case_uuid: str
+    iteration_name: str
+    vector_name: str
+    sumo_object_uuid: str
+    resampling_frequency: Optional[Frequency] = None
+
+
+@dataclass(frozen=True)
+class CalculatedVectorKey:
+    """
+    Key for an evaluated calculated vector expression, or subexpression, given by its canonical string.
+    The keys of the (possibly resampled) tables that it was computed from are included, so the entry is only
+    used for the same source data.
+    """
+
+    canonical_expression: str
+    input_table_keys: Tuple[AllRealTableKey, ...]
+
+
+@dataclass(frozen=True)
+class SingleRealColumnKey:
+    """
+    Key for a single column (DATE or a vector) of a per-realization summary table.
+    The per-realization tables contain all vectors, so this lets us load and cache only the columns we need.
+    """
+
+    sumo_object_uuid: str
+    column_name: str
+
+
+@dataclass(frozen=True)
+class HistoricalVectorKey:
+    """
+    Key for a historical vector in an ensemble.
+    Since the key does not identify a Sumo object, the entries are only kept for a limited time.
+    """
+
+    case_uuid: str
+    iteration_name: str
+    hist_vector_name: str
+    resampling_frequency: Optional[Frequency]
+
+
+def _arrow_table_nbytes(table: pa.Table) -> int:
+    return table.nbytes
+
+
+def _date_index_nbytes(date_index: SegmentedDateIndex) -> int:
+    return date_index.nbytes()
+
+
+# Holds validated raw tables that have been sorted on REAL and then DATE, along with their resampled versions
+ALL_REAL_TABLE_CACHE: MemoryLruCache[AllRealTableKey, pa.Table] = MemoryLruCache(
+    max_bytes=_ALL_REAL_TABLE_CACHE_MAX_BYTES, size_of_value=_arrow_table_nbytes
+)
+
+# Holds DATE indices of the raw tables in ALL_REAL_TABLE_CACHE, keyed on the same key as the raw table
+ALL_REAL_DATE_INDEX_CACHE: MemoryLruCache[AllRealTableKey, SegmentedDateIndex] = MemoryLruCache(
+    max_bytes=_ALL_REAL_DATE_INDEX_CACHE_MAX_BYTES, size_of_value=_date_index_nbytes
+)
+
+# Holds tables with DATE, REAL and a float64 VALUE column for evaluated calculated vector (sub)expressions
+CALCULATED_VECTOR_CACHE: MemoryLruCache[CalculatedVectorKey, pa.Table] = MemoryLruCache(
+    max_bytes=_CALCULATED_VECTOR_CACHE_MAX_BYTES, size_of_value=_arrow_table_nbytes
+)
+
+# Holds single column tables, including the field metadata, decoded from the per-realization summary tables
+SINGLE_REAL_COLUMN_CACHE: MemoryLruCache[SingleRealColumnKey, pa.Table] = MemoryLruCache(
+    max_bytes=_SINGLE_REAL_COLUMN_CACHE_MAX_BYTES, size_of_value=_arrow_table_nbytes
+)
+
+# Holds timestamp indices keyed on (case_uuid, iteration_name)
+ENSEMBLE_TIMESTAMP_INDEX_CACHE: TtlCache[tuple[str, str], EnsembleTimestampIndex] = TtlCache(
+    max_entries=_ENSEMBLE_TIMESTAMP_INDEX_CACHE_MAX_ENTRIES, ttl_s=_ENSEMBLE_TIMESTAMP_INDEX_CACHE_TTL_S
+)
+
+# Holds tables with DATE and the historical vector column for the first realization, along with the vector metadata
+HISTORICAL_VECTOR_CACHE: TtlCache[HistoricalVectorKey, Tuple[pa.Table, VectorMetadata]] = TtlCache(
+    max_entries=_HISTORICAL_VECTOR_CACHE_MAX_ENTRIES, ttl_s=_HISTORICAL_VECTOR_CACHE_TTL_S
+)
+
+# Holds vector directories keyed on (case_uuid, iteration_name)
+VECTOR_DIRECTORY_CACHE: TtlCache[tuple[str, str], VectorDirectory] = TtlCache(
+    max_entries=_VECTOR_DIRECTORY_CACHE_MAX_ENTRIES, ttl_s=_VECTOR_DIRECTORY_CACHE_TTL_S
+)
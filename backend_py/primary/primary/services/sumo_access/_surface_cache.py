@@ -0,0 +1,239 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+import xtgeo
+
+from primary import config
+from primary.services.utils.memory_lru_cache import CacheStats, MemoryLruCache
+
+LOGGER = logging.getLogger(__name__)
+
+
+# Byte budget for the process wide memory cache of decoded realization surfaces
+_DECODED_SURFACE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Sumo object ids are uuids, anything else is never used as a file name in the spill directory
+_VALID_SPILL_KEY_PATTERN = re.compile(r"^[0-9a-fA-F-]+$")
+
+
+@dataclass(frozen=True)
+class SurfaceGeometry:
+    # pylint: disable=too-many-instance-attributes
+    ncol: int
+    nrow: int
+    xori: float
+    yori: float
+    xinc: float
+    yinc: float
+    yflip: int
+    rotation: float
+
+
+@dataclass(frozen=True)
+class DecodedSurface:
+    """
+    Decoded surface, with the values as a read-only float32 array of shape (ncol, nrow) where undefined nodes are NaN
+    """
+
+    geometry: SurfaceGeometry
+    values: np.ndarray
+
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def to_xtgeo_surface(self) -> xtgeo.RegularSurface:
+        """Create a new xtgeo surface, which the caller is free to modify"""
+        return xtgeo.RegularSurface(
+            **asdict(self.geometry),
+            values=np.ma.masked_invalid(self.values.astype(np.float64)),
+        )
+
+
+def decode_surface(xtgeo_surf: xtgeo.RegularSurface) -> DecodedSurface:
+    values = np.ma.filled(xtgeo_surf.values.astype(np.float32), fill_value=np.nan)
+    values.flags.writeable = False
+    return DecodedSurface(
+        geometry=SurfaceGeometry(
+            ncol=int(xtgeo_surf.ncol),
+            nrow=int(xtgeo_surf.nrow),
+            xori=float(xtgeo_surf.xori),
+            yori=float(xtgeo_surf.yori),
+            xinc=float(xtgeo_surf.xinc),
+            yinc=float(xtgeo_surf.yinc),
+            yflip=int(xtgeo_surf.yflip),
+            rotation=float(xtgeo_surf.rotation),
+        ),
+        values=values,
+    )
+
+
+def decode_surface_blob(byte_stream: BytesIO) -> DecodedSurface:
+    return decode_surface(xtgeo.surface_from_file(byte_stream))
+
+
+class DecodedSurfaceCache:
+    """
+    Two-tier cache of decoded surfaces keyed by the Sumo object id.
+
+    Since Sumo objects are immutable, an entry never becomes stale. The first tier is an in-memory LRU cache with a
+    byte budget. The optional second tier spills the values to a local directory as .npy files along with a small
+    json file holding the geometry, and the values are memory mapped when read back. The spilled files also have a
+    byte budget, and when it is exceeded the least recently used surfaces, by the modification time of their json
+    file, are deleted. Loads are single-flight, so concurrent requests for the same surface share one download and
+    decode.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: Optional[str], spill_max_bytes: int) -> None:
+        self._memory_cache: MemoryLruCache[str, DecodedSurface] = MemoryLruCache(
+            max_bytes=max_bytes, size_of_value=DecodedSurface.nbytes
+        )
+        self._spill_dir = spill_dir
+        self._spill_max_bytes = spill_max_bytes
+        self._spill_lock = threading.Lock()
+        self._spill_byte_count = 0
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._spill_byte_count = sum(entry_size for _mtime, _stem, entry_size in self._list_spilled_entries())
+
+    async def get_or_load_async(
+        self, sumo_object_uuid: str, download_blob_func: Callable[[], Awaitable[BytesIO]]
+    ) -> DecodedSurface:
+        """Get the decoded surface, downloading and decoding it using `download_blob_func` if it is not cached"""
+
+        async def load_async() -> DecodedSurface:
+            decoded_surf = await asyncio.to_thread(self._read_spilled, sumo_object_uuid)
+            if decoded_surf is not None:
+                return decoded_surf
+
+            byte_stream = await download_blob_func()
+            decoded_surf = await asyncio.to_thread(decode_surface_blob, byte_stream)
+            await asyncio.to_thread(self._write_spilled, sumo_object_uuid, decoded_surf)
+            return decoded_surf
+
+        return await self._memory_cache.get_or_load_async(sumo_object_uuid, load_async)
+
+    def stats(self) -> CacheStats:
+        return self._memory_cache.stats()
+
+    def _spill_path_stem(self, sumo_object_uuid: str) -> Optional[str]:
+        if self._spill_dir is None or not _VALID_SPILL_KEY_PATTERN.match(sumo_object_uuid):
+            return None
+        return os.path.join(self._spill_dir, sumo_object_uuid)
+
+    def _read_spilled(self, sumo_object_uuid: str) -> Optional[DecodedSurface]:
+        path_stem = self._spill_path_stem(sumo_object_uuid)
+        if path_stem is None or not os.path.exists(f"{path_stem}.json"):
+            return None
+
+        try:
+            with open(f"{path_stem}.json", "r", encoding="utf-8") as file:
+                geometry = SurfaceGeometry(**json.load(file))
+            values = np.load(f"{path_stem}.npy", mmap_mode="r")
+        except (OSError, ValueError, TypeError) as exc:
+            LOGGER.warning(f"Could not read spilled surface {sumo_object_uuid}: {exc}")
+            return None
+
+        if values.shape != (geometry.ncol, geometry.nrow) or values.dtype != np.float32:
+            LOGGER.warning(f"Spilled surface {sumo_object_uuid} does not match its geometry, ignoring it")
+            return None
+
+        # Touch the geometry file, so that the surface counts as recently used when pruning
+        try:
+            os.utime(f"{path_stem}.json")
+        except OSError:
+            pass
+
+        return DecodedSurface(geometry=geometry, values=values)
+
+    def _write_spilled(self, sumo_object_uuid: str, decoded_surf: DecodedSurface) -> None:
+        path_stem = self._spill_path_stem(sumo_object_uuid)
+        if path_stem is None:
+            return
+
+        npy_stream = BytesIO()
+        np.save(npy_stream, decoded_surf.values)
+        geometry_bytes = json.dumps(asdict(decoded_surf.geometry)).encode("utf-8")
+        entry_size = npy_stream.getbuffer().nbytes + len(geometry_bytes)
+        if entry_size > self._spill_max_bytes:
+            return
+
+        # The geometry is written last since its presence marks the entry as complete
+        try:
+            _write_file_atomically(f"{path_stem}.npy", npy_stream.getvalue())
+            _write_file_atomically(f"{path_stem}.json", geometry_bytes)
+        except OSError as exc:
+            LOGGER.warning(f"Could not spill surface {sumo_object_uuid} to disk: {exc}")
+            return
+
+        with self._spill_lock:
+            self._spill_byte_count += entry_size
+            if self._spill_byte_count > self._spill_max_bytes:
+                self._prune_spilled()
+
+    def _prune_spilled(self) -> None:
+        """
+        Delete the least recently used spilled surfaces until the spilled files are within the byte budget.
+        The directory is listed anew, since other processes may share it.
+        """
+        entries = sorted(self._list_spilled_entries())
+        spill_byte_count = sum(entry_size for _mtime, _stem, entry_size in entries)
+        pruned_count = 0
+        for _mtime, path_stem, entry_size in entries:
+            if spill_byte_count <= self._spill_max_bytes:
+                break
+            # The geometry is deleted first, so that readers never see an entry without values
+            for path in [f"{path_stem}.json", f"{path_stem}.npy"]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as exc:
+                    LOGGER.warning(f"Could not delete spilled surface file {path}: {exc}")
+            spill_byte_count -= entry_size
+            pruned_count += 1
+
+        self._spill_byte_count = spill_byte_count
+        LOGGER.debug(f"Pruned {pruned_count} spilled surfaces, {spill_byte_count / (1024 * 1024):.1f}MB remaining")
+
+    def _list_spilled_entries(self) -> List[Tuple[float, str, int]]:
+        """List the (modification time, path stem, byte size) of the complete spilled surfaces"""
+        if self._spill_dir is None:
+            return []
+
+        entries: List[Tuple[float, str, int]] = []
+        for file_name in os.listdir(self._spill_dir):
+            if not file_name.endswith(".json"):
+                continue
+            path_stem = os.path.join(self._spill_dir, file_name[: -len(".json")])
+            try:
+                json_stat = os.stat(f"{path_stem}.json")
+                npy_size = os.stat(f"{path_stem}.npy").st_size
+            except OSError:
+                continue
+            entries.append((json_stat.st_mtime, path_stem, json_stat.st_size + npy_size))
+
+        return entries
+
+
+def _write_file_atomically(path: str, data: bytes) -> None:
+    """Write to a temporary file and rename it, so that readers never see a partially written file"""
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".tmp", delete=False) as tmp_file:
+        tmp_file.write(data)
+    os.replace(tmp_file.name, path)
+
+
+# Holds decoded realization surfaces keyed on the Sumo object uuid
+DECODED_SURFACE_CACHE = DecodedSurfaceCache(
+    max_bytes=_DECODED_SURFACE_CACHE_MAX_BYTES,
+    spill_dir=config.SURFACE_CACHE_SPILL_DIR,
+    spill_max_bytes=config.SURFACE_CACHE_SPILL_MAX_BYTES,
+)
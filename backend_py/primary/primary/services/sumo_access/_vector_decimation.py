@@ -0,0 +1,93 @@
+from typing import Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from ._resampling import find_real_segments
+
+# The first and last row of each realization are always kept, and each bucket in between contributes two rows
+MIN_POINTS_PER_REALIZATION = 4
+
+
+def decimate_vector_table_min_max(table: pa.Table, vector_name: str, max_points_per_realization: int) -> pa.Table:
+    """
+    Reduce the number of rows per realization to at most `max_points_per_realization` using a min/max envelope.
+
+    The table must contain DATE, REAL and vector columns and be sorted on REAL and then DATE.
+    For each realization with more rows than the limit, the first and last row are kept, and the rows in between
+    are split into equally sized buckets where the rows holding the min and the max value of each bucket are kept.
+    This preserves the extremes of the curve, so a plot of the decimated data looks the same as a plot of the raw
+    data as long as there are at least as many buckets as there are pixels along the time axis.
+    Realizations with fewer rows than the limit are returned unchanged.
+    """
+    if max_points_per_realization < MIN_POINTS_PER_REALIZATION:
+        raise ValueError(f"max_points_per_realization must be at least {MIN_POINTS_PER_REALIZATION}")
+
+    real_arr_np = table.column("REAL").to_numpy()
+    _unique_reals, seg_start_idx, seg_counts = find_real_segments(real_arr_np)
+    is_decimated_seg = seg_counts > max_points_per_realization
+    if not np.any(is_decimated_seg):
+        return table
+
+    row_seg_idx = np.repeat(np.arange(len(seg_start_idx), dtype=np.int64), seg_counts)
+    num_buckets = (max_points_per_realization - 2) // 2
+    interior_idx, bucket_start = _bucket_interior_rows_of_decimated_segments(
+        row_seg_idx, seg_start_idx, seg_counts, is_decimated_seg, num_buckets
+    )
+    bucket_counts = np.diff(np.append(bucket_start, len(interior_idx)))
+
+    interior_values = table.column(vector_name).to_numpy()[interior_idx]
+    with np.errstate(invalid="ignore"):
+        bucket_min = np.fmin.reduceat(interior_values, bucket_start)
+        bucket_max = np.fmax.reduceat(interior_values, bucket_start)
+
+    keep_idx = np.concatenate(
+        (
+            np.flatnonzero(~is_decimated_seg[row_seg_idx]),
+            seg_start_idx[is_decimated_seg],
+            seg_start_idx[is_decimated_seg] + seg_counts[is_decimated_seg] - 1,
+            interior_idx[_find_first_matching_pos(interior_values, bucket_min, bucket_start, bucket_counts)],
+            interior_idx[_find_first_matching_pos(interior_values, bucket_max, bucket_start, bucket_counts)],
+        )
+    )
+
+    # np.unique() sorts the row indices, so the returned table is still sorted on REAL and then DATE
+    return table.take(pa.array(np.unique(keep_idx)))
+
+
+def _bucket_interior_rows_of_decimated_segments(
+    row_seg_idx: np.ndarray,
+    seg_start_idx: np.ndarray,
+    seg_counts: np.ndarray,
+    is_decimated_seg: np.ndarray,
+    num_buckets: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split the rows between the first and last row of each decimated segment into `num_buckets` buckets.
+    Returns the row indices of these interior rows, and the start position of each bucket within them.
+    Since the rows are sorted on REAL each bucket is a contiguous range of the interior rows.
+    """
+    row_pos_in_seg = np.arange(len(row_seg_idx), dtype=np.int64) - seg_start_idx[row_seg_idx]
+    row_seg_count = seg_counts[row_seg_idx]
+
+    is_interior_row = is_decimated_seg[row_seg_idx] & (row_pos_in_seg >= 1) & (row_pos_in_seg <= row_seg_count - 2)
+    interior_idx = np.flatnonzero(is_interior_row)
+    interior_bucket = (row_pos_in_seg[interior_idx] - 1) * num_buckets // (row_seg_count[interior_idx] - 2)
+
+    bucket_keys = row_seg_idx[interior_idx] * num_buckets + interior_bucket
+    bucket_start = np.concatenate(([0], np.flatnonzero(bucket_keys[1:] != bucket_keys[:-1]) + 1))
+    return interior_idx, bucket_start
+
+
+def _find_first_matching_pos(
+    values: np.ndarray, bucket_values: np.ndarray, bucket_start: np.ndarray, bucket_counts: np.ndarray
+) -> np.ndarray:
+    """
+    Position of the first value in each bucket that equals the bucket's value.
+    Buckets with only NaN values, which have no match, give the position of the bucket's first value.
+    """
+    num_values = len(values)
+    is_match = values == np.repeat(bucket_values, bucket_counts)
+    candidate_pos = np.where(is_match, np.arange(num_values), num_values)
+    first_pos = np.minimum.reduceat(candidate_pos, bucket_start)
+    return np.where(first_pos == num_values, bucket_start, first_pos)
@@ -0,0 +1,129 @@
+import bisect
+import fnmatch
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from .summary_types import VectorInfo
+
+_WILDCARD_CHARS = "*?["
+
+
+@dataclass(frozen=True)
+class VectorSearchResult:
+    """One page of the vectors matching a search, total_count is the number of matches across all pages"""
+
+    vectors: List[VectorInfo]
+    total_count: int
+
+
+class VectorDirectory:
+    """
+    Directory of the (non-historical) summary vectors in an ensemble, along with whether each vector has a
+    matching historical vector.
+
+    The names are kept sorted, so that patterns with a literal prefix, e.g. `WOPR:*` or `F*PT`, only need to
+    be matched against the range of names sharing that prefix. Patterns that start with a wildcard and have
+    a literal qualifier, e.g. `*:OP_1` to get all vectors for a well or `*:5` for a region, are looked up
+    in an index on the parts of the names after each colon, so that names with more than one colon, e.g. the
+    local grid vector `LWOPR:LGR1:OP_1`, are found as well.
+    """
+
+    def __init__(self, column_names: Sequence[str]) -> None:
+        hist_vector_names = set()
+        vector_names: List[str] = []
+        for column_name in column_names:
+            if column_name in ["DATE", "REAL"]:
+                continue
+            if is_historical_vector_name(column_name):
+                hist_vector_names.add(column_name)
+            else:
+                vector_names.append(column_name)
+
+        self._sorted_names: List[str] = sorted(set(vector_names))
+        self._has_historical: List[bool] = [
+            construct_historical_vector_name(name) in hist_vector_names for name in self._sorted_names
+        ]
+
+        self._indices_by_qualifier: Dict[str, List[int]] = {}
+        for idx, name in enumerate(self._sorted_names):
+            name_parts = name.split(":")
+            for part_idx in range(1, len(name_parts)):
+                self._indices_by_qualifier.setdefault(":".join(name_parts[part_idx:]), []).append(idx)
+
+    def vector_count(self) -> int:
+        return len(self._sorted_names)
+
+    def get_all_vectors(self) -> List[VectorInfo]:
+        return [self._make_vector_info(idx) for idx in range(len(self._sorted_names))]
+
+    def search(self, pattern: Optional[str], offset: int = 0, limit: Optional[int] = None) -> VectorSearchResult:
+        """
+        Get the vectors whose names match the shell-style wildcard pattern, in sorted order.
+        The pattern is case sensitive, and None matches all vectors.
+        Use `offset` and `limit` to get one page of the matches.
+        """
+        matching_indices = self._find_matching_indices(pattern)
+        stop = len(matching_indices) if limit is None else offset + limit
+        page_indices = matching_indices[offset:stop]
+        return VectorSearchResult(
+            vectors=[self._make_vector_info(idx) for idx in page_indices],
+            total_count=len(matching_indices),
+        )
+
+    def _find_matching_indices(self, pattern: Optional[str]) -> Sequence[int]:
+        if pattern is None or pattern == "*":
+            return range(len(self._sorted_names))
+
+        regex = re.compile(fnmatch.translate(pattern))
+
+        literal_prefix = _get_literal_prefix(pattern)
+        if not literal_prefix:
+            candidate_indices = self._find_candidate_indices_using_qualifier(pattern)
+            if candidate_indices is not None:
+                return [idx for idx in candidate_indices if regex.match(self._sorted_names[idx])]
+
+        # Since the names are sorted, all names that start with the prefix are found in one contiguous range
+        start = bisect.bisect_left(self._sorted_names, literal_prefix)
+        stop = bisect.bisect_left(self._sorted_names, literal_prefix + chr(sys.maxunicode))
+        return [idx for idx in range(start, stop) if regex.match(self._sorted_names[idx])]
+
+    def _find_candidate_indices_using_qualifier(self, pattern: str) -> Optional[List[int]]:
+        """
+        Get candidates for patterns on the form `<pattern>:<literal qualifier>`, e.g. `*:OP_1`, where the qualifier
+        is the part after the last colon. A "]" in the qualifier means that the colon is inside a bracket expression.
+        """
+        _keyword_pattern, sep, qualifier = pattern.rpartition(":")
+        if not sep or not qualifier or any(char in qualifier for char in _WILDCARD_CHARS + "]"):
+            return None
+
+        return self._indices_by_qualifier.get(qualifier, [])
+
+    def _make_vector_info(self, idx: int) -> VectorInfo:
+        return VectorInfo(name=self._sorted_names[idx], has_historical=self._has_historical[idx])
+
+
+def _get_literal_prefix(pattern: str) -> str:
+    for pos, char in enumerate(pattern):
+        if char in _WILDCARD_CHARS:
+            return pattern[:pos]
+    return pattern
+
+
+def is_historical_vector_name(vector_name: str) -> bool:
+    parts = vector_name.split(":", 1)
+    if parts[0].endswith("H") and parts[0].startswith(("F", "G", "W")):
+        return True
+
+    return False
+
+
+def construct_historical_vector_name(non_historical_vector_name: str) -> Optional[str]:
+    parts = non_historical_vector_name.split(":", 1)
+    parts[0] += "H"
+    hist_vec = ":".join(parts)
+    if is_historical_vector_name(hist_vec):
+        return hist_vec
+
+    return None
@@ -0,0 +1,138 @@
+from typing import Dict, List
+
+import numpy as np
+import pyarrow as pa
+from webviz_pkg.core_utils.perf_timer import PerfTimer
+
+from .._field_metadata import is_rate_from_field_meta
+from .._resampling import generate_normalized_sample_dates, interpolate_backfill, resample_segmented_multi_real_table
+from ..summary_types import Frequency
+
+
+def _reference_resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
+    """
+    The previous per realization implementation of resample_segmented_multi_real_table(), kept here as
+    the reference for both the timing and for verifying that the vectorized version gives identical results.
+    """
+    real_arr_np = table.column("REAL").to_numpy()
+    unique_reals, first_occurrence_idx, real_counts = np.unique(real_arr_np, return_index=True, return_counts=True)
+    whole_dates_np = table.column("DATE").to_numpy()
+
+    per_real_raw_dates: List[np.ndarray] = []
+    per_real_sample_dates: List[np.ndarray] = []
+    for i in range(len(unique_reals)):
+        raw_dates = whole_dates_np[first_occurrence_idx[i] : first_occurrence_idx[i] + real_counts[i]]
+        per_real_raw_dates.append(raw_dates)
+        per_real_sample_dates.append(generate_normalized_sample_dates(np.min(raw_dates), np.max(raw_dates), freq))
+
+    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
+    for colname in table.schema.names:
+        if colname in ["DATE", "REAL"]:
+            continue
+
+        is_rate = is_rate_from_field_meta(table.field(colname))
+        raw_whole_numpy_arr = table.column(colname).to_numpy()
+
+        vec_arr_list = []
+        for i in range(len(unique_reals)):
+            raw_x = per_real_raw_dates[i].astype(np.uint64)
+            sample_x = per_real_sample_dates[i].astype(np.uint64)
+            raw_y = raw_whole_numpy_arr[first_occurrence_idx[i] : first_occurrence_idx[i] + real_counts[i]]
+            if is_rate:
+                vec_arr_list.append(interpolate_backfill(sample_x, raw_x, raw_y, 0, 0))
+            else:
+                vec_arr_list.append(np.interp(sample_x, raw_x, raw_y))
+
+        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+
+    output_columns_dict["DATE"] = pa.chunked_array(per_real_sample_dates)
+    output_columns_dict["REAL"] = pa.chunked_array(
+        [np.full(len(dates), real) for real, dates in zip(unique_reals, per_real_sample_dates)]
+    )
+
+    return pa.table(output_columns_dict, schema=table.schema)
+
+
+def _make_synthetic_table(num_reals: int, num_dates_per_real: int) -> pa.Table:
+    """
+    Make a table that resembles a typical summary table with irregular, roughly weekly, report steps and
+    realizations that run for slightly different lengths of time
+    """
+    rng = np.random.default_rng(seed=42)
+
+    date_arr_list = []
+    real_arr_list = []
+    for real in range(num_reals):
+        step_count = num_dates_per_real - int(rng.integers(0, num_dates_per_real // 10))
+        steps_ms = rng.integers(1, 14, size=step_count).astype(np.int64) * 24 * 3600 * 1000
+        start_date = np.datetime64("2018-01-01", "ms")
+        date_arr_list.append(start_date + np.cumsum(steps_ms).astype("timedelta64[ms]"))
+        real_arr_list.append(np.full(step_count, real, dtype=np.int16))
+
+    dates = np.concatenate(date_arr_list)
+    reals = np.concatenate(real_arr_list)
+    total_vals = np.abs(rng.normal(size=len(dates))).astype(np.float32).cumsum()
+    rate_vals = np.abs(rng.normal(size=len(dates))).astype(np.float32)
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("FOPT", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("FOPR", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+    return pa.table({"DATE": dates, "REAL": reals, "FOPT": total_vals, "FOPR": rate_vals}, schema=schema)
+
+
+def _are_tables_bitwise_equal(table_a: pa.Table, table_b: pa.Table) -> bool:
+    if table_a.schema != table_b.schema or table_a.num_rows != table_b.num_rows:
+        return False
+    for colname in table_a.column_names:
+        arr_a = table_a.column(colname).to_numpy()
+        arr_b = table_b.column(colname).to_numpy()
+        if arr_a.dtype.kind == "f":
+            arr_a = arr_a.view(np.uint32 if arr_a.itemsize == 4 else np.uint64)
+            arr_b = arr_b.view(np.uint32 if arr_b.itemsize == 4 else np.uint64)
+        if not np.array_equal(arr_a, arr_b):
+            return False
+
+    return True
+
+
+def main() -> None:
+    print("\n\n")
+    print("## Running dev_resampling_benchmark")
+    print("## =================================================")
+
+    num_dates_per_real = 1500
+    for num_reals in [100, 500, 1000]:
+        table = _make_synthetic_table(num_reals, num_dates_per_real)
+        print(f"\n{num_reals=} {table.shape=}")
+
+        for freq in [Frequency.DAILY, Frequency.WEEKLY, Frequency.MONTHLY, Frequency.YEARLY]:
+            # Use the best of a few runs to reduce noise
+            ref_ms_list = []
+            new_ms_list = []
+            for _ in range(3):
+                timer = PerfTimer()
+                ref_table = _reference_resample_segmented_multi_real_table(table, freq)
+                ref_ms_list.append(timer.lap_ms())
+                new_table = resample_segmented_multi_real_table(table, freq)
+                new_ms_list.append(timer.lap_ms())
+            ref_ms = min(ref_ms_list)
+            new_ms = min(new_ms_list)
+
+            is_equal = _are_tables_bitwise_equal(ref_table, new_table)
+            speedup = ref_ms / max(new_ms, 1)
+            print(
+                f"  {freq.value:<9} per_real_loop={ref_ms:>6}ms  vectorized={new_ms:>5}ms  "
+                f"speedup={speedup:5.1f}x  bitwise_equal={is_equal}  {new_table.shape=}"
+            )
+
+
+# Running:
+#   python -m primary.services.sumo_access.dev.dev_resampling_benchmark
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
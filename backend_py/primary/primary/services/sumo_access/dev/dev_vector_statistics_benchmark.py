@@ -0,0 +1,143 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from webviz_pkg.core_utils.perf_timer import PerfTimer
+
+from primary.services.summary_vector_statistics import compute_vector_statistics_table
+from primary.services.utils.arrow_helpers import create_float_downcasting_schema, set_date_column_type_to_timestamp_ms
+from primary.services.utils.statistic_function import StatisticFunction
+
+
+def _reference_compute_vector_statistics_table(
+    summary_vector_table: pa.Table,
+    vector_name: str,
+    statistic_functions: Sequence[StatisticFunction],
+) -> Optional[pa.Table]:
+    """
+    The previous pandas groupby implementation of compute_vector_statistics_table(), kept here as
+    the reference for both the timing and for verifying the results of the NumPy implementation.
+    """
+
+    # Invert p10 and p90 due to oil industry convention.
+    def p10_func(x: List[float]) -> np.floating:
+        return np.nanpercentile(x, q=90)
+
+    def p90_func(x: List[float]) -> np.floating:
+        return np.nanpercentile(x, q=10)
+
+    def p50_func(x: List[float]) -> np.floating:
+        return np.nanpercentile(x, q=50)
+
+    agg_func_dict = {
+        StatisticFunction.MIN: np.nanmin,
+        StatisticFunction.MAX: np.nanmax,
+        StatisticFunction.MEAN: np.nanmean,
+        StatisticFunction.P10: p10_func,
+        StatisticFunction.P90: p90_func,
+        StatisticFunction.P50: p50_func,
+    }
+
+    agg_dict = {}
+    for stat_func in statistic_functions:
+        agg_dict[stat_func.value] = pd.NamedAgg(column=vector_name, aggfunc=agg_func_dict[stat_func])
+
+    df = summary_vector_table.select(["DATE", vector_name]).to_pandas(timestamp_as_object=True)
+
+    grouped: pd.core.groupby.DataFrameGroupBy = df.groupby("DATE", as_index=False, sort=True)
+    statistics_df: pd.DataFrame = grouped.agg(**agg_dict)
+
+    default_schema = pa.Schema.from_pandas(statistics_df, preserve_index=False)
+    schema_to_use = set_date_column_type_to_timestamp_ms(default_schema)
+    schema_to_use = create_float_downcasting_schema(schema_to_use)
+
+    return pa.Table.from_pandas(statistics_df, schema=schema_to_use, preserve_index=False)
+
+
+def _make_synthetic_table(num_reals: int, num_dates: int, nan_fraction: float, shuffle_rows: bool) -> pa.Table:
+    """
+    Make a resampled summary table with a shared date grid for all realizations and a fraction of NaN values.
+    Optionally shuffle the rows, which forces the statistics kernel off its fast path.
+    """
+    rng = np.random.default_rng(seed=42)
+
+    sample_dates = np.datetime64("2018-01-01", "ms") + np.arange(num_dates).astype("timedelta64[D]")
+    dates = np.tile(sample_dates, num_reals)
+    reals = np.repeat(np.arange(num_reals, dtype=np.int16), num_dates)
+    values = np.abs(rng.normal(loc=1000, scale=100, size=len(dates))).astype(np.float32)
+    values[rng.random(len(values)) < nan_fraction] = np.nan
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("FOPT", pa.float32()),
+        ]
+    )
+    table = pa.table({"DATE": dates, "REAL": reals, "FOPT": values}, schema=schema)
+    if shuffle_rows:
+        table = table.take(rng.permutation(table.num_rows))
+
+    return table
+
+
+def _max_relative_diff(table_a: pa.Table, table_b: pa.Table, column_name: str) -> float:
+    arr_a = table_a.column(column_name).to_numpy().astype(np.float64)
+    arr_b = table_b.column(column_name).to_numpy().astype(np.float64)
+    if not np.array_equal(np.isnan(arr_a), np.isnan(arr_b)):
+        return np.inf
+
+    valid_mask = ~np.isnan(arr_a)
+    if not np.any(valid_mask):
+        return 0.0
+    return float(np.max(np.abs(arr_a[valid_mask] - arr_b[valid_mask]) / np.maximum(np.abs(arr_b[valid_mask]), 1)))
+
+
+def main() -> None:
+    print("\n\n")
+    print("## Running dev_vector_statistics_benchmark")
+    print("## =================================================")
+
+    stat_funcs = [
+        StatisticFunction.MIN,
+        StatisticFunction.MAX,
+        StatisticFunction.MEAN,
+        StatisticFunction.P10,
+        StatisticFunction.P90,
+        StatisticFunction.P50,
+    ]
+
+    for num_reals, num_dates in [(100, 120), (100, 3650), (500, 3650), (1000, 600), (1000, 3650)]:
+        for nan_fraction, shuffle_rows in [(0.0, False), (0.01, False), (0.01, True)]:
+            table = _make_synthetic_table(num_reals, num_dates, nan_fraction, shuffle_rows)
+
+            # Use the best of a few runs to reduce noise
+            ref_ms_list = []
+            new_ms_list = []
+            for _ in range(3):
+                timer = PerfTimer()
+                ref_table = _reference_compute_vector_statistics_table(table, "FOPT", stat_funcs)
+                ref_ms_list.append(timer.lap_ms())
+                new_table = compute_vector_statistics_table(table, "FOPT", stat_funcs)
+                new_ms_list.append(timer.lap_ms())
+            ref_ms = min(ref_ms_list)
+            new_ms = min(new_ms_list)
+
+            assert ref_table is not None and new_table is not None
+            is_schema_equal = ref_table.schema == new_table.schema
+            is_dates_equal = ref_table["DATE"].equals(new_table["DATE"])
+            max_rel_diff = max(_max_relative_diff(new_table, ref_table, stat_func.value) for stat_func in stat_funcs)
+
+            speedup = ref_ms / max(new_ms, 1)
+            print(
+                f"  {num_reals=:<5} {num_dates=:<5} {nan_fraction=:<5} {shuffle_rows=:<1} pandas={ref_ms:>6}ms  numpy={new_ms:>4}ms  "
+                f"speedup={speedup:6.1f}x  {is_schema_equal=}  {is_dates_equal=}  {max_rel_diff=:.1e}"
+            )
+
+
+# Running:
+#   python -m primary.services.sumo_access.dev.dev_vector_statistics_benchmark
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,22 @@
+import asyncio
 import logging
 from enum import Enum
 from io import BytesIO
-from typing import List, Optional, Sequence, Union
-
-from concurrent.futures import ThreadPoolExecutor
-import pandas as pd
+from typing import Dict, List, Optional, Sequence, Union
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
-from fmu.sumo.explorer.objects import TableCollection
+from fmu.sumo.explorer.objects import Table, TableCollection
 from pydantic import ConfigDict, BaseModel
+from webviz_pkg.core_utils.perf_timer import PerfTimer
+
+from primary.services.service_exceptions import MultipleDataMatchesError, NoDataError, Service
 
 from ._helpers import SumoEnsemble
+from ._inplace_volumetrics_table_cache import VOLUMETRICS_TABLE_CACHE, VolumetricsTableKey
 from .generic_types import EnsembleScalarResponse
 
 # from fmu.sumo.explorer.objects.table import AggregatedTable
@@ -20,6 +24,9 @@ from .generic_types import EnsembleScalarResponse
 
 LOGGER = logging.getLogger(__name__)
 
+# Limit the number of concurrent downloads when aggregating from the per realization tables
+_MAX_CONCURRENT_REALIZATION_TABLE_DOWNLOADS = 16
+
 
 class PossibleInplaceVolumetricsCategoricalColumnNames(str, Enum):
     ZONE = "ZONE"
@@ -68,43 +75,55 @@ class InplaceVolumetricsTableMetaData(BaseModel):
 
 
 class InplaceVolumetricsAccess(SumoEnsemble):
-    async def get_table_names_and_metadata(self) -> List[InplaceVolumetricsTableMetaData]:
+    async def get_table_names_and_metadata_async(self) -> List[InplaceVolumetricsTableMetaData]:
         """Retrieve the available volumetric tables names and corresponding metadata for the case"""
         vol_table_collections: TableCollection = self._case.tables.filter(
             aggregation="collection", tagname="vol", iteration=self._iteration_name
         )
-        vol_tables_metadata = []
-        async for vol_table_name in vol_table_collections.names:
-            vol_table_collection: TableCollection = self._case.tables.filter(
-                aggregation="collection",
-                name=vol_table_name,
-                tagname="vol",
-                iteration=self._iteration_name,
-            )
-            numerical_column_names = [
-                col
-                for col in vol_table_collection.columns
-                if PossibleInplaceVolumetricsNumericalColumnNames.has_value(col)
-            ]
-            first_numerical_column_table = self.get_table(vol_table_name, numerical_column_names[0])
-            categorical_column_metadata = [
-                InplaceVolumetricsCategoricalMetaData(
-                    name=col,
-                    unique_values=pc.unique(first_numerical_column_table[col]).to_pylist(),
-                )
-                for col in vol_table_collection.columns
-                if PossibleInplaceVolumetricsCategoricalColumnNames.has_value(col)
-            ]
-            vol_table_metadata = InplaceVolumetricsTableMetaData(
-                name=vol_table_name,
-                categorical_column_metadata=categorical_column_metadata,
-                numerical_column_names=numerical_column_names,
+        vol_table_names: List[str] = await vol_table_collections.names_async
+
+        return await asyncio.gather(*[self._get_table_metadata_async(name) for name in vol_table_names])
+
+    async def _get_table_metadata_async(self, vol_table_name: str) -> InplaceVolumetricsTableMetaData:
+        vol_table_collection: TableCollection = self._case.tables.filter(
+            aggregation="collection",
+            name=vol_table_name,
+            tagname="vol",
+            iteration=self._iteration_name,
+        )
+        column_names: List[str] = await vol_table_collection.columns_async
+        numerical_column_names = [
+            col for col in column_names if PossibleInplaceVolumetricsNumericalColumnNames.has_value(col)
+        ]
+        categorical_column_names = [
+            col for col in column_names if PossibleInplaceVolumetricsCategoricalColumnNames.has_value(col)
+        ]
+
+        # The unique categorical values are the same for all numerical columns, so we use the (cached) table of the
+        # first numerical column. These are the tables that the subsequent response requests will use anyway.
+        first_numerical_column_table = await self.get_table_async(vol_table_name, numerical_column_names[0])
+        categorical_column_metadata = [
+            InplaceVolumetricsCategoricalMetaData(
+                name=col,
+                unique_values=pc.unique(first_numerical_column_table[col]).to_pylist(),
             )
+            for col in categorical_column_names
+            if col in first_numerical_column_table.column_names
+        ]
+
+        return InplaceVolumetricsTableMetaData(
+            name=vol_table_name,
+            categorical_column_metadata=categorical_column_metadata,
+            numerical_column_names=numerical_column_names,
+        )
 
-            vol_tables_metadata.append(vol_table_metadata)
-        return vol_tables_metadata
+    async def get_table_async(self, table_name: str, column_name: str) -> pa.Table:
+        """
+        Get table with the REAL and categorical columns in addition to the requested column, for all realizations.
+        Tables are cached per Sumo object, so repeated requests will not trigger new downloads.
+        """
+        timer = PerfTimer()
 
-    def get_table(self, table_name: str, column_name: str) -> pa.Table:
         vol_table_collection: TableCollection = self._case.tables.filter(
             aggregation="collection",
             name=table_name,
@@ -112,50 +131,85 @@ class InplaceVolumetricsAccess(SumoEnsemble):
             iteration=self._iteration_name,
             column=column_name,
         )
-        if not vol_table_collection:
-            print(f"No aggregated volumetric tables found {self._case_uuid}, {table_name}, {column_name}")
-            print("Aggregating manually from realization tables...")
-            full_table = self.temporary_aggregate_from_realization_tables(table_name)
-            return full_table.select([column_name, "REAL", "FACIES", "ZONE", "REGION"])
-
-        if len(vol_table_collection) > 1:
-            raise ValueError(f"None or multiple volumetric tables found {self._case_uuid}, {table_name}, {column_name}")
-        vol_table = vol_table_collection[0]
-        byte_stream: BytesIO = vol_table.blob
-        table: pa.Table = pq.read_table(byte_stream)
+        table_count = await vol_table_collection.length_async()
+        if table_count == 0:
+            LOGGER.debug(f"No aggregated volumetric tables found {self._case_uuid}, {table_name}, {column_name}")
+            LOGGER.debug("Aggregating from realization tables...")
+            full_table = await self.get_aggregated_table_from_realization_tables_async(table_name)
+            columns_to_select = [column_name, "REAL"] + [
+                col
+                for col in full_table.column_names
+                if PossibleInplaceVolumetricsCategoricalColumnNames.has_value(col)
+            ]
+            return full_table.select(columns_to_select)
+
+        if table_count > 1:
+            raise MultipleDataMatchesError(
+                f"Multiple volumetric tables found {self._case_uuid}, {table_name}, {column_name}", Service.SUMO
+            )
+
+        sumo_table: Table = await vol_table_collection.getitem_async(0)
+        cache_key = VolumetricsTableKey(
+            case_uuid=self._case_uuid,
+            iteration_name=self._iteration_name,
+            table_name=table_name,
+            column_name=column_name,
+            sumo_object_uuids=(sumo_table.uuid,),
+        )
+
+        async def _download_and_read() -> pa.Table:
+            byte_stream: BytesIO = await sumo_table.blob_async
+            return await asyncio.to_thread(pq.read_table, byte_stream)
+
+        table = await VOLUMETRICS_TABLE_CACHE.get_or_load_async(cache_key, _download_and_read)
+
+        LOGGER.debug(
+            f"Got volumetric table in: {timer.elapsed_ms()}ms ({table_name=}, {column_name=}, {table.shape=}) "
+            f"[cache: {VOLUMETRICS_TABLE_CACHE.stats().to_string()}]"
+        )
+
         return table
 
-    def temporary_aggregate_from_realization_tables(self, table_name: str) -> pa.Table:
-        """Temporary function to aggregate from realization tables when no aggregated table is available
-        Assume Sumo will handle this in the future"""
+    async def get_aggregated_table_from_realization_tables_async(self, table_name: str) -> pa.Table:
+        """
+        Temporary function to aggregate from realization tables when no aggregated table is available
+        Assume Sumo will handle this in the future
+        """
+        timer = PerfTimer()
+
         vol_table_collection: TableCollection = self._case.tables.filter(
             stage="realization",
             name=table_name,
             tagname="vol",
             iteration=self._iteration_name,
         )
-        if not vol_table_collection:
-            raise ValueError(f"No volumetric realization tables found {self._case_uuid}, {table_name}")
+        realization_sumo_tables: List[Table] = [sumo_table async for sumo_table in vol_table_collection]
+        if not realization_sumo_tables:
+            raise NoDataError(f"No volumetric realization tables found {self._case_uuid}, {table_name}", Service.SUMO)
+        et_locate_ms = timer.lap_ms()
 
-        ### Using ThreadPoolExecutor to parallelize the download of the tables
+        cache_key = VolumetricsTableKey(
+            case_uuid=self._case_uuid,
+            iteration_name=self._iteration_name,
+            table_name=table_name,
+            column_name=None,
+            sumo_object_uuids=tuple(sorted(sumo_table.uuid for sumo_table in realization_sumo_tables)),
+        )
 
-        def worker(idx: int) -> pd.DataFrame:
-            vol_table = vol_table_collection[idx]
-            print(f"Downloading table: {table_name} for realization {vol_table.realization}")
-            byte_stream: BytesIO = vol_table.blob
+        async def _download_and_aggregate() -> pa.Table:
+            return await _download_and_concat_realization_tables_async(realization_sumo_tables)
 
-            table: pd.DataFrame = pd.read_csv(byte_stream)
-            table["REAL"] = vol_table.realization
-            return table
+        table = await VOLUMETRICS_TABLE_CACHE.get_or_load_async(cache_key, _download_and_aggregate)
 
-        with ThreadPoolExecutor() as executor:
-            tables = list(executor.map(worker, list(range(len(vol_table_collection)))))
-            tables = pd.concat(tables)
-            tables = pa.Table.from_pandas(tables)
+        LOGGER.debug(
+            f"Got volumetric table aggregated from {len(realization_sumo_tables)} realization tables in: "
+            f"{timer.elapsed_ms()}ms (locate={et_locate_ms}ms, aggregate={timer.lap_ms()}ms) "
+            f"({table_name=}, {table.shape=}) [cache: {VOLUMETRICS_TABLE_CACHE.stats().to_string()}]"
+        )
 
-            return tables
+        return table
 
-    def get_response(
+    async def get_response_async(
         self,
         table_name: str,
         column_name: str,
@@ -163,7 +217,7 @@ class InplaceVolumetricsAccess(SumoEnsemble):
         realizations: Optional[Sequence[int]] = None,
     ) -> EnsembleScalarResponse:
         """Retrieve the volumetric response for the given table name and column name"""
-        table = self.get_table(table_name, column_name)
+        table = await self.get_table_async(table_name, column_name)
         if realizations is not None:
             mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
             table = table.filter(mask)
@@ -171,7 +225,6 @@ class InplaceVolumetricsAccess(SumoEnsemble):
             for category in categorical_filters:
                 mask = pc.is_in(table[category.name], value_set=pa.array(category.unique_values))
                 table = table.filter(mask)
-                print(table)
 
         summed_on_real_table = table.group_by("REAL").aggregate([(column_name, "sum")]).sort_by("REAL")
 
@@ -179,3 +232,62 @@ class InplaceVolumetricsAccess(SumoEnsemble):
             realizations=summed_on_real_table["REAL"].to_pylist(),
             values=summed_on_real_table[f"{column_name}_sum"].to_pylist(),
         )
+
+
+async def _download_and_concat_realization_tables_async(realization_sumo_tables: List[Table]) -> pa.Table:
+    """
+    Download the per realization CSV tables concurrently, parse them directly into Arrow and concatenate them
+    into one table with an added REAL column
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REALIZATION_TABLE_DOWNLOADS)
+
+    async def _download_and_parse(sumo_table: Table) -> pa.Table:
+        async with semaphore:
+            byte_stream: BytesIO = await sumo_table.blob_async
+
+        # Parse in a worker thread so that we don't block the event loop while the other downloads are in progress
+        table: pa.Table = await asyncio.to_thread(pa_csv.read_csv, byte_stream)
+        real_arr = pa.array(np.full(table.num_rows, sumo_table.realization, dtype=np.int64))
+        return table.append_column("REAL", real_arr)
+
+    table_list: List[pa.Table] = await asyncio.gather(*[_download_and_parse(t) for t in realization_sumo_tables])
+    return _concat_tables_with_unified_schema(table_list)
+
+
+def _concat_tables_with_unified_schema(table_list: List[pa.Table]) -> pa.Table:
+    """
+    Concatenate tables, which is zero-copy when all the tables have the same schema.
+    Since the column types are inferred per CSV file, a column may be parsed as integer in one realization and as
+    floating point in another. In that case the column is cast to float64 (or to string if it is not numeric in
+    all the tables) and missing columns are filled with nulls.
+    """
+    first_schema = table_list[0].schema
+    if all(table.schema.equals(first_schema) for table in table_list):
+        return pa.concat_tables(table_list)
+
+    types_per_column: Dict[str, List[pa.DataType]] = {}
+    for table in table_list:
+        for field in table.schema:
+            types_per_column.setdefault(field.name, []).append(field.type)
+
+    unified_fields: List[pa.Field] = []
+    for column_name, column_types in types_per_column.items():
+        if all(column_type == column_types[0] for column_type in column_types):
+            unified_fields.append(pa.field(column_name, column_types[0]))
+        elif all(pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_null(t) for t in column_types):
+            unified_fields.append(pa.field(column_name, pa.float64()))
+        else:
+            unified_fields.append(pa.field(column_name, pa.string()))
+    unified_schema = pa.schema(unified_fields)
+
+    unified_table_list: List[pa.Table] = []
+    for table in table_list:
+        columns = [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in unified_schema
+        ]
+        unified_table_list.append(pa.table(columns, schema=unified_schema))
+
+    return pa.concat_tables(unified_table_list)
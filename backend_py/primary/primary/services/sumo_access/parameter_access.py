@@ -2,18 +2,16 @@ import logging
 from io import BytesIO
 from typing import List, Optional
 
-import pandas as pd
-import pyarrow as pa
 import pyarrow.parquet as pq
 
 from webviz_pkg.core_utils.perf_timer import PerfTimer
 from ._helpers import SumoEnsemble
+from ._parameter_store import EnsembleParameterStore
+from ._parameter_store_cache import PARAMETER_STORE_CACHE
 from .parameter_types import (
     EnsembleParameter,
     EnsembleParameters,
     EnsembleSensitivity,
-    EnsembleSensitivityCase,
-    SensitivityType,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -22,6 +20,27 @@ LOGGER = logging.getLogger(__name__)
 class ParameterAccess(SumoEnsemble):
     async def get_parameters_and_sensitivities(self) -> EnsembleParameters:
         """Retrieve parameters for an ensemble"""
+        store = await self.get_parameter_store_async()
+        return EnsembleParameters(
+            parameters=store.get_parameters(),
+            sensitivities=store.get_sensitivities(),
+        )
+
+    async def get_parameter(self, parameter_name: str) -> Optional[EnsembleParameter]:
+        """Retrieve a single parameter for an ensemble, returns None if the parameter does not exist"""
+        store = await self.get_parameter_store_async()
+        return store.get_parameter(parameter_name)
+
+    async def get_sensitivities_async(self) -> Optional[List[EnsembleSensitivity]]:
+        """Retrieve the sensitivities for an ensemble, returns None if the ensemble is not a sensitivity run"""
+        store = await self.get_parameter_store_async()
+        return store.get_sensitivities()
+
+    async def get_parameter_store_async(self) -> EnsembleParameterStore:
+        """Get the columnar parameter store for the ensemble"""
+        return await self._get_or_load_per_ensemble_async(PARAMETER_STORE_CACHE, self._load_parameter_store)
+
+    async def _load_parameter_store(self) -> EnsembleParameterStore:
         timer = PerfTimer()
 
         table_collection = self._case.tables.filter(
@@ -30,113 +49,24 @@ class ParameterAccess(SumoEnsemble):
             name="parameters",
             tagname="all",
         )
-        if await table_collection.length_async() == 0:
+        table_count = await table_collection.length_async()
+        if table_count == 0:
             raise ValueError(f"No parameter tables found {self._case.name, self._iteration_name}")
-        if await table_collection.length_async() > 1:
+        if table_count > 1:
             raise ValueError(f"Multiple parameter tables found {self._case.name,self._iteration_name}")
 
-        table = await table_collection.getitem_async(0)
-        byte_stream: BytesIO = await table.blob_async
+        sumo_table = await table_collection.getitem_async(0)
+        byte_stream: BytesIO = await sumo_table.blob_async
         table = pq.read_table(byte_stream)
-
         et_download_arrow_table_ms = timer.lap_ms()
-        LOGGER.debug(f"Downloaded arrow table in {et_download_arrow_table_ms}ms")
-
-        ensemble_parameters = parameter_table_to_ensemble_parameters(table)
-        sensitivities = create_ensemble_sensitivities(ensemble_parameters)
-
-        return EnsembleParameters(
-            parameters=ensemble_parameters,
-            sensitivities=sensitivities,
-        )
-
-    async def get_parameter(self, parameter_name: str) -> EnsembleParameter:
-        """Retrieve a single parameter for an ensemble"""
-        parameters = await self.get_parameters_and_sensitivities()
-        return next(parameter for parameter in parameters.parameters if parameter.name == parameter_name)
-
-
-def create_ensemble_sensitivities(
-    sumo_ensemble_parameters: List[EnsembleParameter],
-) -> Optional[List[EnsembleSensitivity]]:
-    """Extract sensitivities from a list of SumoEnsembleParameter objects"""
-    sensitivities = []
-
-    sens_name_parameter = next(
-        (parameter for parameter in sumo_ensemble_parameters if parameter.name == "SENSNAME"),
-        None,
-    )
-    sens_case_parameter = next(
-        (parameter for parameter in sumo_ensemble_parameters if parameter.name == "SENSCASE"),
-        None,
-    )
-    if sens_case_parameter is None or sens_name_parameter is None:
-        return None
-    df = pd.DataFrame(
-        {
-            "name": sens_name_parameter.values,
-            "case": sens_case_parameter.values,
-            "REAL": sens_case_parameter.realizations,
-        }
-    )
-    for name, group in df.groupby("name"):
-        sensitivities.append(
-            EnsembleSensitivity(
-                name=name,
-                type=find_sensitivity_type(list(group["case"].unique())),
-                cases=create_ensemble_sensitivity_cases(group),
-            )
-        )
-    return sensitivities if sensitivities else None
-
-
-def find_sensitivity_type(sens_case_names: List[str]) -> SensitivityType:
-    """Find the sensitivity type based on the sensitivity case names"""
-    if len(sens_case_names) == 1 and sens_case_names[0] == "p10_p90":
-        return SensitivityType.MONTECARLO
-    return SensitivityType.SCENARIO
 
+        store = EnsembleParameterStore(table)
+        et_build_store_ms = timer.lap_ms()
 
-def create_ensemble_sensitivity_cases(
-    df: pd.DataFrame,
-) -> List[EnsembleSensitivityCase]:
-    """Create a list of EnsembleSensitivityCase objects from a dataframe"""
-    cases = []
-    for case_name, case_df in df.groupby("case"):
-        cases.append(
-            EnsembleSensitivityCase(
-                name=case_name,
-                realizations=case_df["REAL"].unique().tolist(),
-            )
+        LOGGER.debug(
+            f"Loaded parameter store in: {timer.elapsed_ms()}ms "
+            f"(download={et_download_arrow_table_ms}ms, build={et_build_store_ms}ms) "
+            f"({self._iteration_name=}, {table.shape=})"
         )
-    return cases
 
-
-def parameter_table_to_ensemble_parameters(parameter_table: pa.Table) -> List[EnsembleParameter]:
-    """Convert a parameter table to an EnsembleParameter"""
-    ensemble_parameters: List[EnsembleParameter] = []
-    for column_name in parameter_table.column_names:
-        if column_name == "REAL":
-            continue
-        parameter_name_components = column_name.split(":")
-        if len(parameter_name_components) > 2:
-            raise ValueError(f"Parameter {column_name} has too many componenents. Expected <groupname>:<parametername>")
-        if len(parameter_name_components) == 1:
-            parameter_name = column_name
-            group_name = None
-        else:
-            group_name = parameter_name_components[0]
-            parameter_name = parameter_name_components[1]
-        ensemble_parameters.append(
-            EnsembleParameter(
-                name=parameter_name,
-                is_logarithmic=column_name.startswith("LOG10_"),
-                is_numerical=parameter_table.schema.field(column_name).type != pa.string,
-                is_constant=len(set(parameter_table[column_name])) == 1,
-                group_name=group_name,
-                descriptive_name=parameter_name,
-                values=parameter_table[column_name].to_numpy().tolist(),
-                realizations=parameter_table["REAL"].to_numpy().tolist(),
-            )
-        )
-    return ensemble_parameters
+        return store
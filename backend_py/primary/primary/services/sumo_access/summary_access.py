@@ -1,6 +1,8 @@
+import asyncio
 import logging
+from dataclasses import dataclass, replace
 from io import BytesIO
-from typing import List, Optional, Sequence, Tuple, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -10,6 +12,7 @@ from webviz_pkg.core_utils.perf_timer import PerfTimer
 
 from primary.services.utils.arrow_helpers import sort_table_on_real_then_date, is_date_column_monotonically_increasing
 from primary.services.utils.arrow_helpers import find_first_non_increasing_date_pair
+from primary.services.summary_vector_expression import VectorExpression, evaluate_vector_expression
 from primary.services.service_exceptions import (
     Service,
     NoDataError,
@@ -19,65 +22,62 @@ from primary.services.service_exceptions import (
 )
 
 
+from ._arrow_column_loader import load_columns_from_sumo_aggregated_arrow_table_async
+from ._arrow_column_loader import load_columns_from_sumo_arrow_table_async
+from ._ensemble_timestamp_index import EnsembleTimestampIndex, build_ensemble_timestamp_index
 from ._field_metadata import create_vector_metadata_from_field_meta
 from ._helpers import SumoEnsemble
+from ._resampling import downsample_resampled_segmented_multi_real_table, get_nested_finer_frequencies
 from ._resampling import resample_segmented_multi_real_table, resample_single_real_table
+from ._summary_date_index import PointInTimeLookup, SegmentedDateIndex, build_segmented_date_index
+from ._summary_table_cache import ALL_REAL_DATE_INDEX_CACHE, ALL_REAL_TABLE_CACHE, AllRealTableKey
+from ._summary_table_cache import CALCULATED_VECTOR_CACHE, CalculatedVectorKey
+from ._summary_table_cache import ENSEMBLE_TIMESTAMP_INDEX_CACHE, VECTOR_DIRECTORY_CACHE
+from ._summary_table_cache import HISTORICAL_VECTOR_CACHE, HistoricalVectorKey
+from ._vector_directory import VectorDirectory, VectorSearchResult, construct_historical_vector_name
 from .generic_types import EnsembleScalarResponse
 from .summary_types import Frequency, VectorInfo, RealizationVector, HistoricalVector, VectorMetadata
 
 LOGGER = logging.getLogger(__name__)
 
+# Max number of per-vector tables to fetch from Sumo concurrently when getting data for multiple vectors
+_MAX_CONCURRENT_VECTOR_TABLE_LOADS = 8
 
-class SummaryAccess(SumoEnsemble):
-    async def get_available_vectors_async(self) -> List[VectorInfo]:
-        timer = PerfTimer()
-
-        # For now, only consider the collection-aggregated tables even if we will also be accessing and
-        # returning data for the per-realization summary tables.
-        smry_table_collection: TableCollection = self._case.tables.filter(
-            tagname="summary",
-            iteration=self._iteration_name,
-            aggregation="collection",
-            # stage="realization",
-        )
 
-        table_names = await smry_table_collection.names_async
-        et_get_table_names_ms = timer.lap_ms()
-        if len(table_names) == 0:
-            LOGGER.warning(f"No summary tables found in case={self._case_uuid}, iteration={self._iteration_name}")
-            return []
-        if len(table_names) > 1:
-            raise MultipleDataMatchesError(
-                f"Multiple summary tables found in case={self._case_uuid}, iteration={self._iteration_name}: {table_names=}",
-                Service.SUMO,
-            )
+@dataclass(frozen=True)
+class VectorValuesAtTimestamps:
+    """
+    Values of a vector at a set of timestamps for multiple realizations.
+    The values array has shape (num_timestamps, num_realizations), with NaN where a realization has no value.
+    """
 
-        column_names = await smry_table_collection.columns_async
-        et_get_column_names_ms = timer.lap_ms()
+    realizations: np.ndarray
+    timestamps_utc_ms: np.ndarray
+    values: np.ndarray
 
-        ret_info_arr: List[VectorInfo] = []
-        hist_vectors: Set[str] = set()
 
-        for vec_name in column_names:
-            if vec_name not in ["DATE", "REAL"]:
-                if _is_historical_vector_name(vec_name):
-                    hist_vectors.add(vec_name)
-                else:
-                    ret_info_arr.append(VectorInfo(name=vec_name, has_historical=False))
+class SummaryAccess(SumoEnsemble):
+    async def get_available_vectors_async(self) -> List[VectorInfo]:
+        """Get all vectors in the ensemble, excluding historical vectors, sorted by name"""
+        vector_directory = await self.get_vector_directory_async()
+        return vector_directory.get_all_vectors()
 
-        for info in ret_info_arr:
-            hist_vec_name = _construct_historical_vector_name(info.name)
-            if hist_vec_name in hist_vectors:
-                info.has_historical = True
+    async def search_vectors_async(
+        self, pattern: Optional[str], offset: int = 0, limit: Optional[int] = None
+    ) -> VectorSearchResult:
+        """
+        Get one page of the vectors, excluding historical vectors, whose names match the shell-style wildcard
+        pattern, e.g. `WOPR:*`, `F*PT` or `*:OP_1`
+        """
+        vector_directory = await self.get_vector_directory_async()
+        return vector_directory.search(pattern, offset, limit)
 
-        LOGGER.debug(
-            f"Got vector names from Sumo in: {timer.elapsed_ms()}ms "
-            f"(get_table_names={et_get_table_names_ms}ms, get_column_names={et_get_column_names_ms}ms) "
-            f"(total_column_count={len(column_names)})"
+    async def get_vector_directory_async(self) -> VectorDirectory:
+        """Get directory of the vectors in the ensemble"""
+        return await self._get_or_load_per_ensemble_async(
+            VECTOR_DIRECTORY_CACHE, lambda: _load_vector_directory(self._case, self._iteration_name)
         )
 
-        return ret_info_arr
-
     async def get_vector_table_async(
         self,
         vector_name: str,
@@ -94,9 +94,13 @@ class SummaryAccess(SumoEnsemble):
         """
         timer = PerfTimer()
 
-        table = await _load_all_real_arrow_table_from_sumo(self._case, self._iteration_name, vector_name)
+        table = await _load_all_real_arrow_table_from_sumo(
+            self._case, self._iteration_name, vector_name, resampling_frequency
+        )
         et_loading_ms = timer.lap_ms()
 
+        # The loaded table is resampled per realization, so filtering on realizations after the resampling
+        # gives the same result as filtering before it, and lets us use the cached resampled table.
         if realizations is not None:
             requested_reals_arr = pa.array(realizations)
             mask = pc.is_in(table["REAL"], value_set=requested_reals_arr)
@@ -108,35 +112,122 @@ class SummaryAccess(SumoEnsemble):
             # if reals_without_data:
             #     raise NoDataError(f"No data in some requested realizations, {reals_without_data=}", Service.SUMO)
 
-        # Our assumption is that the table is segmented on REAL and that within each segment,
-        # the DATE column is sorted. We may want to add some checks here to verify this assumption since the
-        # resampling algorithm below assumes this and will fail if it is not true.
-        # ...or just sort it unconditionally here
-        table = sort_table_on_real_then_date(table)
-
-        # The resampling algorithm below uses the field metadata to determine if the vector is a rate or not.
-        # For now, fail hard if metadata is not present. This test could be refined, but should suffice now.
         vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(vector_name))
         if not vector_metadata:
             raise InvalidDataError(f"Did not find valid metadata for vector {vector_name}", Service.SUMO)
 
-        # Do the actual resampling
-        timer.lap_ms()
-        if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
-        et_resampling_ms = timer.lap_ms()
-
         # Should we always combine the chunks?
         table = table.combine_chunks()
+        et_filtering_ms = timer.lap_ms()
 
         LOGGER.debug(
             f"Got summary vector data from Sumo in: {timer.elapsed_ms()}ms "
-            f"(loading={et_loading_ms}ms, resampling={et_resampling_ms}ms) "
+            f"(loading={et_loading_ms}ms, filtering={et_filtering_ms}ms) "
             f"({vector_name=} {resampling_frequency=} {table.shape=})"
         )
 
         return table, vector_metadata
 
+    async def get_vectors_table_async(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]],
+    ) -> Tuple[pa.Table, List[VectorMetadata]]:
+        """
+        Get pyarrow.Table containing values for multiple vectors and the specified realizations.
+        If realizations is None, data for all available realizations will be returned.
+        The returned table will always contain a 'DATE' and 'REAL' column followed by one float32 column per vector,
+        and it will be sorted on REAL and then DATE.
+        The per-vector tables are fetched (and resampled, using the cache) concurrently, and when all of them share
+        the same DATE and REAL columns they are combined directly, otherwise they are joined on REAL and DATE.
+        Rows where a vector has no data will contain NaN for that vector.
+        If `resampling_frequency` is None, the data will be returned with full/raw resolution.
+        """
+        if not vector_names:
+            raise InvalidParameterError("List of requested vector names is empty", Service.SUMO)
+
+        unique_vector_names = list(dict.fromkeys(vector_names))
+
+        timer = PerfTimer()
+
+        tables_and_keys = await _load_all_real_arrow_tables_and_keys_from_sumo(
+            self._case, self._iteration_name, unique_vector_names, resampling_frequency
+        )
+        table_list = [table for table, _key in tables_and_keys]
+        et_loading_ms = timer.lap_ms()
+
+        if realizations is not None:
+            requested_reals_arr = pa.array(realizations)
+            table_list = [table.filter(pc.is_in(table["REAL"], value_set=requested_reals_arr)) for table in table_list]
+
+        vector_metadata_list = _create_vector_metadata_list(table_list, unique_vector_names)
+
+        combined_table, has_shared_rows = _combine_vector_tables_on_real_and_date(table_list, unique_vector_names)
+        et_combining_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"Got summary data for {len(unique_vector_names)} vectors from Sumo in: {timer.elapsed_ms()}ms "
+            f"(loading={et_loading_ms}ms, combining={et_combining_ms}ms) "
+            f"({has_shared_rows=} {resampling_frequency=} {combined_table.shape=})"
+        )
+
+        return combined_table, vector_metadata_list
+
+    async def get_calculated_vector_table_async(
+        self,
+        vector_expression: VectorExpression,
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]],
+    ) -> Tuple[pa.Table, List[VectorMetadata]]:
+        """
+        Get pyarrow.Table with a calculated vector for the specified realizations, along with the metadata of the
+        vectors that are referenced in the expression.
+        The returned table will contain a 'DATE', a 'REAL' and a float32 'VALUE' column, sorted on REAL and then DATE.
+        The referenced vectors are loaded (and resampled, using the cache) concurrently, aligned on REAL and DATE,
+        and the expression is evaluated over whole columns for all realizations at once.
+        Evaluated subexpressions are cached, keyed on the tables they were computed from.
+        """
+        timer = PerfTimer()
+
+        vector_names = list(vector_expression.vector_names)
+        tables_and_keys = await _load_all_real_arrow_tables_and_keys_from_sumo(
+            self._case, self._iteration_name, vector_names, resampling_frequency
+        )
+        table_list = [table for table, _key in tables_and_keys]
+        table_key_by_vector = {name: key for name, (_table, key) in zip(vector_names, tables_and_keys)}
+        et_loading_ms = timer.lap_ms()
+
+        vector_metadata_list = _create_vector_metadata_list(table_list, vector_names)
+
+        combined_table, has_shared_rows = _combine_vector_tables_on_real_and_date(table_list, vector_names)
+        et_combining_ms = timer.lap_ms()
+
+        values_np, cached_count, subexpression_count = _evaluate_vector_expression_using_cache(
+            vector_expression, combined_table, table_key_by_vector
+        )
+        et_evaluating_ms = timer.lap_ms()
+
+        result_table = pa.table(
+            {
+                "DATE": combined_table["DATE"],
+                "REAL": combined_table["REAL"],
+                "VALUE": pa.array(values_np.astype(np.float32)),
+            }
+        )
+        if realizations is not None:
+            result_table = result_table.filter(pc.is_in(result_table["REAL"], value_set=pa.array(realizations)))
+
+        LOGGER.debug(
+            f"Got calculated vector from Sumo in: {timer.elapsed_ms()}ms "
+            f"(loading={et_loading_ms}ms, combining={et_combining_ms}ms, evaluating={et_evaluating_ms}ms) "
+            f"(expression={vector_expression.canonical()}, {has_shared_rows=}, "
+            f"cached_subexpressions={cached_count}/{subexpression_count}, "
+            f"{resampling_frequency=}, {result_table.shape=}) [cache: {CALCULATED_VECTOR_CACHE.stats().to_string()}]"
+        )
+
+        return result_table, vector_metadata_list
+
     async def get_vector_async(
         self,
         vector_name: str,
@@ -152,9 +243,7 @@ class SummaryAccess(SumoEnsemble):
         whole_value_np_arr = table.column(vector_name).to_numpy()
 
         ret_arr: List[RealizationVector] = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
+        for real, start_row_idx, row_count in zip(unique_reals, first_occurrence_idx, real_counts):
             date_np_arr = whole_date_np_arr[start_row_idx : start_row_idx + row_count]
             value_np_arr = whole_value_np_arr[start_row_idx : start_row_idx + row_count]
 
@@ -178,7 +267,8 @@ class SummaryAccess(SumoEnsemble):
         """
         Get pyarrow.Table containing values for the specified vectors and the single specified realization.
         This function will fetch per-realization summary data from Sumo, thereby downloading data only for the
-        specified realization, BUT it will download all the vector columns in the process.
+        specified realization. Only the requested vector columns are read from the table, and they are cached
+        so that later requests for other vectors in the same realization only need to load the new columns.
         The returned table will always contain a 'DATE' column in addition to the requested vectors.
         The 'DATE' column will be of type timestamp[ms].
         The vector columns will be of type float32.
@@ -189,14 +279,16 @@ class SummaryAccess(SumoEnsemble):
 
         timer = PerfTimer()
 
-        full_table: pa.Table = await _load_single_real_full_arrow_table_from_sumo(
-            self._case, self._iteration_name, realization
-        )
-        et_loading_ms = timer.lap_ms()
+        sumo_table: Table = await _locate_single_real_sumo_table(self._case, self._iteration_name, realization)
+        et_locate_ms = timer.lap_ms()
 
+        # Only the requested columns are downloaded and decoded, the per-realization table contains all vectors
         columns_to_get = ["DATE"]
         columns_to_get.extend(vector_names)
-        table = full_table.select(columns_to_get)
+        table = await load_columns_from_sumo_arrow_table_async(
+            self._case_context.access_token, self._case_uuid, sumo_table, columns_to_get
+        )
+        et_loading_ms = timer.lap_ms()
 
         # Verify that the column datatypes are as we expect
         schema = table.schema
@@ -230,8 +322,8 @@ class SummaryAccess(SumoEnsemble):
 
         LOGGER.debug(
             f"Got single realization summary data for {len(vector_names)} vectors from Sumo in: {timer.elapsed_ms()}ms "
-            f"(loading={et_loading_ms}ms, preparing={et_preparing_ms}ms, resampling={et_resampling_ms}ms) "
-            f"({realization=}, {resampling_frequency=}, {table.shape=})"
+            f"(locate={et_locate_ms}ms, loading={et_loading_ms}ms, preparing={et_preparing_ms}ms, "
+            f"resampling={et_resampling_ms}ms) ({realization=}, {resampling_frequency=}, {table.shape=})"
         )
 
         return table, vector_metadata_list
@@ -241,50 +333,83 @@ class SummaryAccess(SumoEnsemble):
         non_historical_vector_name: str,
         resampling_frequency: Optional[Frequency],
     ) -> Optional[HistoricalVector]:
+        """
+        Get the historical vector matching the non-historical vector, or None if the vector has no historical
+        counterpart. History vectors are identical across realizations, so only the data for the first realization
+        in the ensemble is read, and the result is cached per ensemble.
+        """
         timer = PerfTimer()
 
-        hist_vec_name = _construct_historical_vector_name(non_historical_vector_name)
+        hist_vec_name = construct_historical_vector_name(non_historical_vector_name)
         if not hist_vec_name:
             return None
 
-        table = await _load_all_real_arrow_table_from_sumo(self._case, self._iteration_name, hist_vec_name)
-        et_load_table_ms = timer.lap_ms()
+        async def _load_hist_vector() -> Tuple[pa.Table, VectorMetadata]:
+            return await self._load_historical_vector_table(hist_vec_name, resampling_frequency)
+
+        cache_key = HistoricalVectorKey(self._case_uuid, self._iteration_name, hist_vec_name, resampling_frequency)
+        table, vector_metadata = await HISTORICAL_VECTOR_CACHE.get_or_load_async(cache_key, _load_hist_vector)
+
+        date_np_arr = table.column("DATE").to_numpy()
+        value_np_arr = table.column(hist_vec_name).to_numpy()
+
+        LOGGER.debug(f"Got historical vector in: {timer.elapsed_ms()}ms ({resampling_frequency=} {table.shape=})")
+
+        return HistoricalVector(
+            timestamps_utc_ms=date_np_arr.astype(int).tolist(),
+            values=value_np_arr.tolist(),
+            metadata=vector_metadata,
+        )
+
+    async def _load_historical_vector_table(
+        self, hist_vec_name: str, resampling_frequency: Optional[Frequency]
+    ) -> Tuple[pa.Table, VectorMetadata]:
+        """
+        Load the DATE and historical vector columns for the first realization in the ensemble, resampled if
+        `resampling_frequency` is given. Only these two columns are read from the per-realization table.
+        Falls back to filtering the all-realization table if there is no per-realization table.
+        """
+        timer = PerfTimer()
 
-        # Use data from the first realization
-        realization_to_use = pc.min((table["REAL"]))
-        mask = pc.equal(table["REAL"], realization_to_use)
-        table = table.filter(mask)
+        timestamp_index = await self.get_timestamp_index_async()
+        if len(timestamp_index.unique_reals) == 0:
+            raise NoDataError(f"No realizations found when getting historical vector {hist_vec_name}", Service.SUMO)
+        realization_to_use = int(timestamp_index.unique_reals[0])
+        et_get_real_ms = timer.lap_ms()
 
-        # Resampling assumes table is segmented on REAL and that within each segment the DATE column is sorted.
-        # By now we only have one real, so just sort on DAT
-        table = table.sort_by([("DATE", "ascending")])
+        try:
+            sumo_table = await _locate_single_real_sumo_table(self._case, self._iteration_name, realization_to_use)
+            table = await load_columns_from_sumo_arrow_table_async(
+                self._case_context.access_token, self._case_uuid, sumo_table, ["DATE", hist_vec_name]
+            )
+        except NoDataError:
+            # The loaded table is already sorted on REAL and DATE, so there is no need to sort the filtered table
+            table = await _load_all_real_arrow_table_from_sumo(self._case, self._iteration_name, hist_vec_name)
+            table = table.filter(pc.equal(table["REAL"], realization_to_use)).select(["DATE", hist_vec_name])
+        et_load_table_ms = timer.lap_ms()
 
         # Need metadata both for resampling and return value
         vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(hist_vec_name))
         if not vector_metadata:
             raise InvalidDataError(f"Did not find valid metadata for vector {hist_vec_name}", Service.SUMO)
 
-        # Do the actual resampling
-        if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
-
-        date_np_arr = table.column("DATE").to_numpy()
-        value_np_arr = table.column(hist_vec_name).to_numpy()
+        if not is_date_column_monotonically_increasing(table):
+            error_pair = find_first_non_increasing_date_pair(table)
+            raise InvalidDataError(
+                f"DATE column must be monotonically increasing, first offending timestamps: {error_pair}", Service.SUMO
+            )
 
-        et_processing = timer.lap_ms()
+        if resampling_frequency is not None:
+            table = resample_single_real_table(table, resampling_frequency)
+        et_processing_ms = timer.lap_ms()
 
         LOGGER.debug(
-            f"Got historical vector in: {timer.elapsed_ms()}ms ("
-            f"load_table={et_load_table_ms}ms, "
-            f"processing={et_processing}ms, "
-            f"{resampling_frequency=} {table.shape=}"
+            f"Loaded historical vector in: {timer.elapsed_ms()}ms ("
+            f"get_real={et_get_real_ms}ms, load_table={et_load_table_ms}ms, processing={et_processing_ms}ms, "
+            f"{hist_vec_name=}, {realization_to_use=}, {resampling_frequency=} {table.shape=}"
         )
 
-        return HistoricalVector(
-            timestamps_utc_ms=date_np_arr.astype(int).tolist(),
-            values=value_np_arr.tolist(),
-            metadata=vector_metadata,
-        )
+        return table, vector_metadata
 
     async def get_vector_values_at_timestamp_async(
         self,
@@ -292,41 +417,305 @@ class SummaryAccess(SumoEnsemble):
         timestamp_utc_ms: int,
         realizations: Optional[Sequence[int]] = None,
     ) -> EnsembleScalarResponse:
-        table, _ = await self.get_vector_table_async(vector_name, resampling_frequency=None, realizations=realizations)
+        """
+        Get the raw values of the vector at the exact timestamp, for the realizations that have a value there
+        """
+        values_at_timestamps, _ = await self.get_vector_values_at_timestamps_async(
+            vector_name, [timestamp_utc_ms], PointInTimeLookup.EXACT, realizations
+        )
+        values = values_at_timestamps.values[0]
+        has_value = ~np.isnan(values)
 
+        return EnsembleScalarResponse(
+            realizations=values_at_timestamps.realizations[has_value].tolist(),
+            values=values[has_value].tolist(),
+        )
+
+    async def get_vector_values_at_timestamps_async(
+        self,
+        vector_name: str,
+        timestamps_utc_ms: Sequence[int],
+        lookup: PointInTimeLookup,
+        realizations: Optional[Sequence[int]] = None,
+    ) -> Tuple[VectorValuesAtTimestamps, VectorMetadata]:
+        """
+        Get values of the vector at each of the specified timestamps for all the realizations, using the raw data.
+        The lookup is done with binary search in a DATE index that is cached alongside the raw table.
+        Timestamps where a realization has no value, according to `lookup`, give NaN.
+        """
+        timer = PerfTimer()
+
+        table, date_index = await _load_all_real_arrow_table_and_date_index_from_sumo(
+            self._case, self._iteration_name, vector_name
+        )
+        et_loading_ms = timer.lap_ms()
+
+        vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(vector_name))
+        if not vector_metadata:
+            raise InvalidDataError(f"Did not find valid metadata for vector {vector_name}", Service.SUMO)
+
+        values_np = date_index.lookup_values_at_timestamps(
+            table.column(vector_name).to_numpy(), np.asarray(timestamps_utc_ms), lookup, vector_metadata.is_rate
+        )
+        realizations_np = date_index.unique_reals
         if realizations is not None:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        mask = pc.is_in(table["DATE"], value_set=pa.array([timestamp_utc_ms]))
-        table = table.filter(mask)
+            real_mask = np.isin(realizations_np, np.asarray(realizations))
+            realizations_np = realizations_np[real_mask]
+            values_np = values_np[:, real_mask]
+        et_lookup_ms = timer.lap_ms()
 
-        return EnsembleScalarResponse(
-            realizations=table["REAL"].to_pylist(),
-            values=table[vector_name].to_pylist(),
+        LOGGER.debug(
+            f"Got vector values at {len(timestamps_utc_ms)} timestamps in: {timer.elapsed_ms()}ms "
+            f"(loading={et_loading_ms}ms, lookup={et_lookup_ms}ms) ({vector_name=}, {lookup=}, {values_np.shape=})"
+        )
+
+        return (
+            VectorValuesAtTimestamps(
+                realizations=realizations_np,
+                timestamps_utc_ms=np.asarray(timestamps_utc_ms, dtype=np.int64),
+                values=values_np,
+            ),
+            vector_metadata,
         )
 
     async def get_timestamps_async(
         self,
         resampling_frequency: Optional[Frequency] = None,
+        realizations: Optional[Sequence[int]] = None,
     ) -> List[int]:
         """
-        Get list of available timestamps in ms UTC
+        Get list of available timestamps in ms UTC.
+        Without resampling, this is the intersection of the raw dates of the realizations. With resampling, the
+        dates cover the entire date range of all the realizations.
         """
-        table, _ = await self.get_vector_table_async(
-            (await self.get_available_vectors_async())[0].name,
-            resampling_frequency=resampling_frequency,
-            realizations=None,
+        timestamp_index = await self.get_timestamp_index_async()
+        return timestamp_index.get_timestamps(resampling_frequency, realizations).tolist()
+
+    async def get_timestamp_index_async(self) -> EnsembleTimestampIndex:
+        """Get index of the raw dates of all realizations in the ensemble"""
+        return await self._get_or_load_per_ensemble_async(
+            ENSEMBLE_TIMESTAMP_INDEX_CACHE,
+            lambda: _load_ensemble_timestamp_index(self._case, self._iteration_name, self._case_context.access_token),
+        )
+
+
+async def _load_vector_directory(case: Case, iteration_name: str) -> VectorDirectory:
+    timer = PerfTimer()
+
+    # For now, only consider the collection-aggregated tables even if we will also be accessing and
+    # returning data for the per-realization summary tables.
+    smry_table_collection: TableCollection = case.tables.filter(
+        tagname="summary",
+        iteration=iteration_name,
+        aggregation="collection",
+        # stage="realization",
+    )
+
+    table_names = await smry_table_collection.names_async
+    et_get_table_names_ms = timer.lap_ms()
+    if len(table_names) == 0:
+        LOGGER.warning(f"No summary tables found in case={case.uuid}, iteration={iteration_name}")
+        return VectorDirectory([])
+    if len(table_names) > 1:
+        raise MultipleDataMatchesError(
+            f"Multiple summary tables found in case={case.uuid}, iteration={iteration_name}: {table_names=}",
+            Service.SUMO,
         )
 
-        return pc.unique(table.column("DATE")).to_numpy().astype(int).tolist()
+    column_names = await smry_table_collection.columns_async
+    et_get_column_names_ms = timer.lap_ms()
 
+    vector_directory = VectorDirectory(column_names)
+    et_build_ms = timer.lap_ms()
 
-async def _load_all_real_arrow_table_from_sumo(case: Case, iteration_name: str, vector_name: str) -> pa.Table:
+    LOGGER.debug(
+        f"Built vector directory from Sumo in: {timer.elapsed_ms()}ms "
+        f"(get_table_names={et_get_table_names_ms}ms, get_column_names={et_get_column_names_ms}ms, "
+        f"build={et_build_ms}ms) (total_column_count={len(column_names)}, {vector_directory.vector_count()=})"
+    )
+
+    return vector_directory
+
+
+async def _load_ensemble_timestamp_index(case: Case, iteration_name: str, access_token: str) -> EnsembleTimestampIndex:
+    """
+    Build the timestamp index from the DATE and REAL columns of one of the ensemble's per-vector summary tables.
+    All vectors share the same dates, so any table will do and only the two columns are loaded from the blob.
+    """
     timer = PerfTimer()
 
-    sumo_table = await _locate_all_real_combined_sumo_table(case, iteration_name, column_name=vector_name)
+    table_collection: TableCollection = case.tables.filter(
+        tagname="summary",
+        stage="iteration",
+        aggregation="collection",
+        iteration=iteration_name,
+    )
+
+    # The first call fetches the first batch of hits, so getting the first item does not need another round-trip
+    if await table_collection.length_async() == 0:
+        raise NoDataError(f"No summary tables with collection aggregation found for {iteration_name=}", Service.SUMO)
+    sumo_table: Table = await table_collection.getitem_async(0)
+    et_locate_ms = timer.lap_ms()
+
+    table = await load_columns_from_sumo_aggregated_arrow_table_async(
+        access_token, case.uuid, sumo_table, ["DATE", "REAL"]
+    )
+    et_loading_ms = timer.lap_ms()
+
+    timestamp_index = build_ensemble_timestamp_index(table)
+    et_build_ms = timer.lap_ms()
+
+    LOGGER.debug(
+        f"Built ensemble timestamp index in: {timer.elapsed_ms()}ms "
+        f"(locate={et_locate_ms}ms, loading={et_loading_ms}ms, build={et_build_ms}ms) "
+        f"({iteration_name=}, {table.shape=}, num_reals={len(timestamp_index.unique_reals)})"
+    )
+
+    return timestamp_index
+
+
+async def _load_all_real_arrow_table_from_sumo(
+    case: Case, iteration_name: str, vector_name: str, resampling_frequency: Optional[Frequency] = None
+) -> pa.Table:
+    """
+    Same as `_load_all_real_arrow_table_and_key_from_sumo()`, but only returns the table
+    """
+    table, _cache_key = await _load_all_real_arrow_table_and_key_from_sumo(
+        case, iteration_name, vector_name, resampling_frequency
+    )
+    return table
+
+
+async def _load_all_real_arrow_table_and_key_from_sumo(
+    case: Case, iteration_name: str, vector_name: str, resampling_frequency: Optional[Frequency] = None
+) -> Tuple[pa.Table, AllRealTableKey]:
+    """
+    Get table with data for all realizations for the specified vector.
+    The returned table is validated and sorted on REAL and then DATE.
+    Tables are cached per Sumo object so repeated requests for the same vector will not trigger a new download.
+    If `resampling_frequency` is given, the resampled table is returned. Resampled tables are cached alongside
+    the raw table, so switching between frequencies that have already been requested is just a lookup.
+    """
+    timer = PerfTimer()
+
+    sumo_table, raw_cache_key = await _locate_all_real_sumo_table_and_make_cache_key(case, iteration_name, vector_name)
     et_locate_ms = timer.lap_ms()
 
+    async def _load_and_validate() -> pa.Table:
+        return await _download_and_validate_all_real_arrow_table(sumo_table, vector_name)
+
+    if resampling_frequency is None:
+        cache_key = raw_cache_key
+        table = await ALL_REAL_TABLE_CACHE.get_or_load_async(cache_key, _load_and_validate)
+    else:
+
+        async def _load_and_resample() -> pa.Table:
+            return await _resample_using_cached_tables_async(raw_cache_key, resampling_frequency, _load_and_validate)
+
+        cache_key = replace(raw_cache_key, resampling_frequency=resampling_frequency)
+        table = await ALL_REAL_TABLE_CACHE.get_or_load_async(cache_key, _load_and_resample)
+    et_get_table_ms = timer.lap_ms()
+
+    LOGGER.debug(
+        f"Got all realizations arrow table in: {timer.elapsed_ms()}ms "
+        f"(locate={et_locate_ms}ms, get_table={et_get_table_ms}ms) "
+        f"({vector_name=}, {resampling_frequency=}, {table.shape=}) "
+        f"[cache: {ALL_REAL_TABLE_CACHE.stats().to_string()}]"
+    )
+
+    return table, cache_key
+
+
+async def _load_all_real_arrow_tables_and_keys_from_sumo(
+    case: Case, iteration_name: str, vector_names: Sequence[str], resampling_frequency: Optional[Frequency]
+) -> List[Tuple[pa.Table, AllRealTableKey]]:
+    """Load the tables for multiple vectors concurrently, limiting the number of concurrent loads"""
+    load_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VECTOR_TABLE_LOADS)
+
+    async def _load_with_limit(vector_name: str) -> Tuple[pa.Table, AllRealTableKey]:
+        async with load_semaphore:
+            return await _load_all_real_arrow_table_and_key_from_sumo(
+                case, iteration_name, vector_name, resampling_frequency
+            )
+
+    return await asyncio.gather(*[_load_with_limit(name) for name in vector_names])
+
+
+async def _load_all_real_arrow_table_and_date_index_from_sumo(
+    case: Case, iteration_name: str, vector_name: str
+) -> Tuple[pa.Table, SegmentedDateIndex]:
+    """
+    Get the raw table with data for all realizations for the specified vector, along with an index over its
+    DATE column. The index is cached alongside the table.
+    """
+    sumo_table, raw_cache_key = await _locate_all_real_sumo_table_and_make_cache_key(case, iteration_name, vector_name)
+
+    async def _load_and_validate() -> pa.Table:
+        return await _download_and_validate_all_real_arrow_table(sumo_table, vector_name)
+
+    table = await ALL_REAL_TABLE_CACHE.get_or_load_async(raw_cache_key, _load_and_validate)
+
+    date_index = ALL_REAL_DATE_INDEX_CACHE.get(raw_cache_key)
+    if date_index is None:
+        date_index = build_segmented_date_index(table)
+        ALL_REAL_DATE_INDEX_CACHE.put(raw_cache_key, date_index)
+
+    return table, date_index
+
+
+async def _locate_all_real_sumo_table_and_make_cache_key(
+    case: Case, iteration_name: str, vector_name: str
+) -> Tuple[Table, AllRealTableKey]:
+    sumo_table = await _locate_all_real_combined_sumo_table(case, iteration_name, column_name=vector_name)
+    cache_key = AllRealTableKey(
+        case_uuid=case.uuid,
+        iteration_name=iteration_name,
+        vector_name=vector_name,
+        sumo_object_uuid=sumo_table.uuid,
+    )
+    return sumo_table, cache_key
+
+
+async def _resample_using_cached_tables_async(
+    raw_cache_key: AllRealTableKey,
+    resampling_frequency: Frequency,
+    load_raw_table: Callable[[], Awaitable[pa.Table]],
+) -> pa.Table:
+    """
+    Make the resampled table, preferably by picking values from an already cached table with a finer frequency
+    whose sample dates include all the requested sample dates. This is only done if the finer table has fewer rows
+    than the raw table, since picking values from e.g. a large DAILY table is slower than resampling the raw data.
+    """
+    timer = PerfTimer()
+
+    # Peek, so that looking for tables to derive from does not count as cache misses
+    raw_table = ALL_REAL_TABLE_CACHE.peek(raw_cache_key)
+    for finer_freq in get_nested_finer_frequencies(resampling_frequency):
+        finer_table = ALL_REAL_TABLE_CACHE.peek(replace(raw_cache_key, resampling_frequency=finer_freq))
+        if finer_table is not None and (raw_table is None or finer_table.num_rows < raw_table.num_rows):
+            table = downsample_resampled_segmented_multi_real_table(finer_table, resampling_frequency)
+            LOGGER.debug(
+                f"Derived {resampling_frequency.value} table from cached {finer_freq.value} table in: "
+                f"{timer.elapsed_ms()}ms ({raw_cache_key.vector_name=}, {table.shape=})"
+            )
+            return table
+
+    if raw_table is None:
+        raw_table = await ALL_REAL_TABLE_CACHE.get_or_load_async(raw_cache_key, load_raw_table)
+    et_load_raw_ms = timer.lap_ms()
+
+    table = resample_segmented_multi_real_table(raw_table, resampling_frequency).combine_chunks()
+    LOGGER.debug(
+        f"Resampled raw table to {resampling_frequency.value} in: {timer.elapsed_ms()}ms "
+        f"(load_raw={et_load_raw_ms}ms, resample={timer.lap_ms()}ms) ({raw_cache_key.vector_name=}, {table.shape=})"
+    )
+
+    return table
+
+
+async def _download_and_validate_all_real_arrow_table(sumo_table: Table, vector_name: str) -> pa.Table:
+    timer = PerfTimer()
+
     # print(f"{sumo_table.format=}")
     # print(f"{sumo_table.name=}")
     # print(f"{sumo_table.tagname=}")
@@ -359,74 +748,123 @@ async def _load_all_real_arrow_table_from_sumo(case: Case, iteration_name: str,
             f"Unexpected type for {vector_name} column {schema.field(vector_name).type=}", Service.SUMO
         )
 
+    # Our consumers assume that the table is segmented on REAL and that within each segment the DATE column
+    # is sorted, so sort it once here before it goes into the cache
+    table = sort_table_on_real_then_date(table)
+    table = table.combine_chunks()
+    et_sort_ms = timer.lap_ms()
+
     # The call above has already downloaded and cached the raw blob, just use this to get the data size
     blob_size_mb = _try_to_determine_blob_size_mb(sumo_table.blob)
 
     LOGGER.debug(
         f"Loaded all realizations arrow table from Sumo in: {timer.elapsed_ms()}ms "
-        f"(locate={et_locate_ms}ms, download_and_read={et_download_and_read_ms}ms) "
+        f"(download_and_read={et_download_and_read_ms}ms, sort={et_sort_ms}ms) "
         f"({vector_name=}, {table.shape=}, {blob_size_mb=:.2f})"
     )
 
     return table
 
 
-async def _load_single_real_full_arrow_table_from_sumo(case: Case, iteration_name: str, realization: int) -> pa.Table:
-    timer = PerfTimer()
-
-    sumo_table: Table = await _locate_single_real_sumo_table(case, iteration_name, realization)
-    et_locate_ms = timer.lap_ms()
-
-    # print(f"{sumo_table.format=}")
-    # print(f"{sumo_table.name=}")
-    # print(f"{sumo_table.tagname=}")
-    # print(f"{sumo_table.context=}")
-    # print(f"{sumo_table.stage=}")
-    # print(f"{sumo_table.aggregation=}")
-
-    # Note that this will download and load the entire table into memory regardless
-    # of which columns in the table we will actually use.
-    table: pa.Table = await sumo_table.to_arrow_async()
-    et_download_and_read_ms = timer.lap_ms()
-
-    # Verify that we got the expected DATE column and no REAL column
-    if not "DATE" in table.column_names:
-        raise InvalidDataError("Table does not contain a DATE column", Service.SUMO)
-    date_field: pa.Field = table.field("DATE")
-    if date_field.type != pa.timestamp("ms"):
-        raise InvalidDataError(f"Unexpected type for DATE column {date_field.type=}", Service.SUMO)
+def _create_vector_metadata_list(table_list: Sequence[pa.Table], vector_names: Sequence[str]) -> List[VectorMetadata]:
+    vector_metadata_list: List[VectorMetadata] = []
+    for vector_name, table in zip(vector_names, table_list):
+        vector_metadata = create_vector_metadata_from_field_meta(table.schema.field(vector_name))
+        if not vector_metadata:
+            raise InvalidDataError(f"Did not find valid metadata for vector {vector_name}", Service.SUMO)
+        vector_metadata_list.append(vector_metadata)
+
+    return vector_metadata_list
+
+
+def _combine_vector_tables_on_real_and_date(
+    table_list: Sequence[pa.Table], vector_names: Sequence[str]
+) -> Tuple[pa.Table, bool]:
+    """
+    Combine single vector tables into one table with DATE, REAL and all the vectors.
+    When all the tables share the same DATE and REAL columns, the vector columns are combined directly,
+    otherwise they are joined on REAL and DATE. Also returns whether the tables shared the same rows.
+    """
+    # Vectors that share the same raw DATE and REAL columns also share them after resampling
+    first_table = table_list[0]
+    has_shared_rows = all(
+        table["DATE"].equals(first_table["DATE"]) and table["REAL"].equals(first_table["REAL"])
+        for table in table_list[1:]
+    )
 
-    if "REAL" in table.column_names:
-        raise InvalidDataError("Table contains an unexpected REAL column", Service.SUMO)
+    if has_shared_rows:
+        combined_table = first_table
+        for vector_name, table in zip(vector_names[1:], table_list[1:]):
+            combined_table = combined_table.append_column(table.field(vector_name), table[vector_name])
+    else:
+        combined_table = _outer_join_vector_tables_on_real_and_date(table_list, vector_names)
+
+    return combined_table.combine_chunks(), has_shared_rows
+
+
+def _evaluate_vector_expression_using_cache(
+    vector_expression: VectorExpression, combined_table: pa.Table, table_key_by_vector: Dict[str, AllRealTableKey]
+) -> Tuple[np.ndarray, int, int]:
+    """
+    Evaluate the expression over the table with all its vectors, using and populating the cache of evaluated
+    subexpressions. Also returns the number of subexpressions found in the cache and the total number.
+    """
+    subexpression_keys = {
+        canonical: CalculatedVectorKey(canonical, tuple(table_key_by_vector[name] for name in sub_vector_names))
+        for canonical, sub_vector_names in vector_expression.get_cacheable_subexpressions()
+    }
+
+    # Cached subexpressions can only be used if they were computed for the same rows
+    subexpression_values: Dict[str, np.ndarray] = {}
+    for canonical, cache_key in subexpression_keys.items():
+        cached_table = CALCULATED_VECTOR_CACHE.get(cache_key)
+        if cached_table is not None and _has_same_real_and_date_columns(cached_table, combined_table):
+            subexpression_values[canonical] = cached_table["VALUE"].to_numpy()
+    cached_canonicals = set(subexpression_values)
+
+    values_np = evaluate_vector_expression(
+        vector_expression,
+        {name: combined_table[name].to_numpy() for name in vector_expression.vector_names},
+        subexpression_values,
+    )
 
-    # The call above has already downloaded and cached the raw blob, just use this to get the data size
-    blob_size_mb = _try_to_determine_blob_size_mb(sumo_table.blob)
+    for canonical, cache_key in subexpression_keys.items():
+        if canonical not in cached_canonicals and canonical in subexpression_values:
+            values_table = pa.table(
+                {
+                    "DATE": combined_table["DATE"],
+                    "REAL": combined_table["REAL"],
+                    "VALUE": pa.array(subexpression_values[canonical]),
+                }
+            )
+            CALCULATED_VECTOR_CACHE.put(cache_key, values_table)
 
-    LOGGER.debug(
-        f"Loaded single realization arrow table from Sumo in: {timer.elapsed_ms()}ms "
-        f"(locate={et_locate_ms}ms, download_and_read={et_download_and_read_ms}ms) "
-        f"({realization=}, {table.shape=}, {blob_size_mb=:.2f})"
-    )
+    return values_np, len(cached_canonicals), len(subexpression_keys)
 
-    return table
 
+def _has_same_real_and_date_columns(table_a: pa.Table, table_b: pa.Table) -> bool:
+    return table_a["REAL"].equals(table_b["REAL"]) and table_a["DATE"].equals(table_b["DATE"])
 
-def _is_historical_vector_name(vector_name: str) -> bool:
-    parts = vector_name.split(":", 1)
-    if parts[0].endswith("H") and parts[0].startswith(("F", "G", "W")):
-        return True
 
-    return False
+def _outer_join_vector_tables_on_real_and_date(table_list: Sequence[pa.Table], vector_names: Sequence[str]) -> pa.Table:
+    """
+    Combine single vector tables that do not share the same DATE and REAL columns into one table with all the
+    vectors. Missing values are filled with NaN and the result is sorted on REAL and then DATE.
+    """
+    combined_table = table_list[0]
+    for table in table_list[1:]:
+        combined_table = combined_table.join(table, keys=["DATE", "REAL"], join_type="full outer")
 
+    combined_table = sort_table_on_real_then_date(combined_table)
 
-def _construct_historical_vector_name(non_historical_vector_name: str) -> Optional[str]:
-    parts = non_historical_vector_name.split(":", 1)
-    parts[0] += "H"
-    hist_vec = ":".join(parts)
-    if _is_historical_vector_name(hist_vec):
-        return hist_vec
+    # Restore the column order and the vector field metadata, which is lost in the join
+    column_list: List[pa.ChunkedArray] = [combined_table["DATE"], combined_table["REAL"]]
+    field_list: List[pa.Field] = [pa.field("DATE", pa.timestamp("ms")), pa.field("REAL", pa.int16())]
+    for vector_name, table in zip(vector_names, table_list):
+        column_list.append(pc.fill_null(combined_table[vector_name], np.nan))
+        field_list.append(table.field(vector_name))
 
-    return None
+    return pa.table(column_list, schema=pa.schema(field_list))
 
 
 async def _locate_all_real_combined_sumo_table(case: Case, iteration_name: str, column_name: str) -> Table:
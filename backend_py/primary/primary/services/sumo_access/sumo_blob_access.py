@@ -1,12 +1,44 @@
-import requests
+import datetime
+import logging
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qs
+
+from webviz_pkg.core_utils.perf_timer import PerfTimer
 
 from primary import config
 from primary.services.service_exceptions import AuthorizationError, Service
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
+from primary.services.utils.ttl_cache import TtlCache
+
+LOGGER = logging.getLogger(__name__)
 
 SUMO_BASE_URI = f"https://main-sumo-{config.SUMO_ENV}.radix.equinor.com/api/v1"
 
+# Cached tokens are refreshed this long before they actually expire, so that callers never get a token
+# that is about to expire while they are still using it
+_SAS_TOKEN_REFRESH_MARGIN_S = 5 * 60
+
+# Time-to-live used if we are not able to determine the expiry time from the SAS token itself
+_SAS_TOKEN_FALLBACK_TTL_S = 10 * 60
+
+
+@dataclass(frozen=True)
+class _SasTokenEntry:
+    sas_token: str
+    blob_store_base_uri: str
+    expires_at_utc: Optional[datetime.datetime]
+
+
+# Keyed on (sumo_access_token, case_uuid) so that a token is never shared between users
+_SAS_TOKEN_CACHE: TtlCache[tuple[str, str], _SasTokenEntry] = TtlCache(
+    max_entries=1000, ttl_s=_SAS_TOKEN_FALLBACK_TTL_S
+)
 
-def get_sas_token_and_blob_store_base_uri_for_case(sumo_access_token: str, case_uuid: str) -> tuple[str, str]:
+
+async def get_sas_token_and_blob_store_base_uri_for_case_async(
+    sumo_access_token: str, case_uuid: str
+) -> tuple[str, str]:
     """
     Get a SAS token and a base URI that allows reading of all children of case_uuid
     The returned base uri looks something like this:
@@ -14,16 +46,65 @@ def get_sas_token_and_blob_store_base_uri_for_case(sumo_access_token: str, case_
 
     To actually fetch data for a blob belonging to this case, you need to form a SAS URI:
         {blob_store_base_uri}/{my_blob_id}?{sas_token}
+
+    The tokens are cached per user and case until shortly before they expire. Concurrent requests for the
+    same user and case share a single request to Sumo.
     """
+    entry = await _SAS_TOKEN_CACHE.get_or_load_async(
+        key=(sumo_access_token, case_uuid),
+        load_func=lambda: _fetch_sas_token_entry_async(sumo_access_token, case_uuid),
+        ttl_of_value=_cache_ttl_for_entry,
+    )
+
+    return entry.sas_token, entry.blob_store_base_uri
+
+
+async def _fetch_sas_token_entry_async(sumo_access_token: str, case_uuid: str) -> _SasTokenEntry:
+    timer = PerfTimer()
 
     req_url = f"{SUMO_BASE_URI}/objects('{case_uuid}')/authtoken"
     req_headers = {"Authorization": f"Bearer {sumo_access_token}"}
-    res = requests.get(url=req_url, headers=req_headers, timeout=60)
+    async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.SUMO) as client:
+        res = await client.get(url=req_url, headers=req_headers)
+
     if res.status_code != 200:
         raise AuthorizationError(f"Failed to get SAS token for case {case_uuid}", Service.GENERAL)
 
     body = res.json()
     sas_token = body["auth"]
     blob_store_base_uri = body["baseuri"].removesuffix("/")
+    expires_at_utc = _get_sas_token_expiry_utc(sas_token)
+
+    LOGGER.debug(f"Got SAS token for case {case_uuid} in {timer.elapsed_ms()}ms, expires at: {expires_at_utc}")
+
+    return _SasTokenEntry(sas_token=sas_token, blob_store_base_uri=blob_store_base_uri, expires_at_utc=expires_at_utc)
+
+
+def _get_sas_token_expiry_utc(sas_token: str) -> Optional[datetime.datetime]:
+    """
+    Get the expiry time from the signed expiry (se) field of a SAS token, e.g. `...&se=2024-01-01T12:00:00Z&...`
+    Returns None if the token does not contain a valid expiry time.
+    """
+    expiry_str_list = parse_qs(sas_token.lstrip("?")).get("se")
+    if not expiry_str_list:
+        return None
+
+    try:
+        expires_at = datetime.datetime.fromisoformat(expiry_str_list[0].replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+
+    return expires_at
+
+
+def _cache_ttl_for_entry(entry: _SasTokenEntry) -> Optional[float]:
+    if entry.expires_at_utc is None:
+        return None
+
+    remaining_s = (entry.expires_at_utc - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
 
-    return sas_token, blob_store_base_uri
+    # A zero or negative TTL means that the entry will not be cached
+    return remaining_s - _SAS_TOKEN_REFRESH_MARGIN_S
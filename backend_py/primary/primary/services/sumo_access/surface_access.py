@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from io import BytesIO
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import xtgeo
 import numpy as np
@@ -9,15 +10,21 @@ from fmu.sumo.explorer import TimeFilter, TimeType
 from fmu.sumo.explorer.objects import SurfaceCollection, Surface
 
 from webviz_pkg.core_utils.perf_timer import PerfTimer
+from primary.services.service_exceptions import Service, InvalidDataError
+from primary.services.surface_statistics import StreamingSurfaceStatistics
 from primary.services.utils.statistic_function import StatisticFunction
 
 from ._helpers import SumoEnsemble
+from ._surface_cache import DECODED_SURFACE_CACHE, DecodedSurface, SurfaceGeometry
 from .surface_types import SurfaceMeta, XtgeoSurfaceIntersectionResult, XtgeoSurfaceIntersectionPolyline
 from .generic_types import SumoContent
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound for the number of realization surfaces that are downloaded and decoded at the same time
+_MAX_CONCURRENT_SURFACE_LOADS = 16
+
 
 class SurfaceAccess(SumoEnsemble):
     async def get_surface_directory_async(self) -> List[SurfaceMeta]:
@@ -108,27 +115,8 @@ class SurfaceAccess(SumoEnsemble):
         timer = PerfTimer()
         addr_str = self._make_addr_str(real_num, name, attribute, time_or_interval_str)
 
-        if time_or_interval_str is None:
-            time_filter = TimeFilter(TimeType.NONE)
-
-        else:
-            timestamp_arr = time_or_interval_str.split("/", 1)
-            if len(timestamp_arr) == 0 or len(timestamp_arr) > 2:
-                raise ValueError("time_or_interval_str must contain a single timestamp or interval")
-            if len(timestamp_arr) == 1:
-                time_filter = TimeFilter(
-                    TimeType.TIMESTAMP,
-                    start=timestamp_arr[0],
-                    end=timestamp_arr[0],
-                    exact=True,
-                )
-            else:
-                time_filter = TimeFilter(
-                    TimeType.INTERVAL,
-                    start=timestamp_arr[0],
-                    end=timestamp_arr[1],
-                    exact=True,
-                )
+        time_filter = _make_time_filter(time_or_interval_str)
+
         # Remove this once Sumo enforces tagname (tagname-unset)
         # https://github.com/equinor/webviz/issues/433
         tagname = attribute if attribute != "Unknown" else ""
@@ -151,20 +139,19 @@ class SurfaceAccess(SumoEnsemble):
         sumo_surf: Surface = await surface_collection.getitem_async(0)
         et_locate_ms = timer.lap_ms()
 
-        byte_stream: BytesIO = await sumo_surf.blob_async
-        et_download_ms = timer.lap_ms()
+        decoded_surf = await _load_decoded_surface_async(sumo_surf)
+        et_load_ms = timer.lap_ms()
 
-        xtgeo_surf = xtgeo.surface_from_file(byte_stream)
-        et_xtgeo_read_ms = timer.lap_ms()
+        xtgeo_surf = decoded_surf.to_xtgeo_surface()
+        et_to_xtgeo_ms = timer.lap_ms()
 
-        size_mb = byte_stream.getbuffer().nbytes / (1024 * 1024)
         LOGGER.debug(
             f"Got realization surface from Sumo in: {timer.elapsed_ms()}ms ("
             f"locate={et_locate_ms}ms, "
-            f"download={et_download_ms}ms, "
-            f"xtgeo_read={et_xtgeo_read_ms}ms) "
-            f"[{xtgeo_surf.ncol}x{xtgeo_surf.nrow}, {size_mb:.2f}MB] "
-            f"({addr_str})"
+            f"load={et_load_ms}ms, "
+            f"to_xtgeo={et_to_xtgeo_ms}ms) "
+            f"[{xtgeo_surf.ncol}x{xtgeo_surf.nrow}, {decoded_surf.nbytes() / (1024 * 1024):.2f}MB] "
+            f"({addr_str}) [cache: {DECODED_SURFACE_CACHE.stats().to_string()}]"
         )
 
         return xtgeo_surf
@@ -179,70 +166,152 @@ class SurfaceAccess(SumoEnsemble):
         """
         Compute statistic and return surface data
         """
+        stat_surfaces = await self.get_statistical_surfaces_data_async(
+            [statistic_function], name, attribute, time_or_interval_str
+        )
+        return stat_surfaces[statistic_function] if stat_surfaces is not None else None
+
+    async def get_statistical_surfaces_data_async(
+        self,
+        statistic_functions: Sequence[StatisticFunction],
+        name: str,
+        attribute: str,
+        time_or_interval_str: Optional[str] = None,
+    ) -> Optional[Dict[StatisticFunction, xtgeo.RegularSurface]]:
+        """
+        Compute multiple statistics in one pass over the realization surfaces and return the surface for each.
+
+        The realization surfaces are loaded concurrently through the decoded surface cache, and are added to the
+        statistics as they arrive, so the statistics are computed locally instead of by one Sumo aggregation per
+        statistic. All realization surfaces must have the same geometry.
+
+        Percentiles need the values of all the realizations in memory. If that would exceed the limit of the
+        local statistics, the percentiles are instead computed by Sumo aggregation.
+        """
         timer = PerfTimer()
         addr_str = self._make_addr_str(-1, name, attribute, time_or_interval_str)
 
-        if time_or_interval_str is None:
-            time_filter = TimeFilter(TimeType.NONE)
-
-        else:
-            timestamp_arr = time_or_interval_str.split("/", 1)
-            if len(timestamp_arr) == 0 or len(timestamp_arr) > 2:
-                raise ValueError("time_or_interval_str must contain a single timestamp or interval")
-            if len(timestamp_arr) == 1:
-                time_filter = TimeFilter(
-                    TimeType.TIMESTAMP,
-                    start=timestamp_arr[0],
-                    end=timestamp_arr[0],
-                    exact=True,
-                )
-            else:
-                time_filter = TimeFilter(
-                    TimeType.INTERVAL,
-                    start=timestamp_arr[0],
-                    end=timestamp_arr[1],
-                    exact=True,
-                )
-
         surface_collection = self._case.surfaces.filter(
             iteration=self._iteration_name,
             aggregation=False,
             name=name,
             tagname=attribute,
-            time=time_filter,
+            time=_make_time_filter(time_or_interval_str),
         )
-
-        surf_count = await surface_collection.length_async()
-        if surf_count == 0:
+        sumo_surfs: List[Surface] = [sumo_surf async for sumo_surf in surface_collection]
+        if not sumo_surfs:
             LOGGER.warning(f"No statistical surfaces found in Sumo for {addr_str}")
             return None
         et_locate_ms = timer.lap_ms()
 
-        realizations = await surface_collection.realizations_async
-        et_collect_reals_ms = timer.lap_ms()
+        surface_statistics = StreamingSurfaceStatistics(statistic_functions, realization_count=len(sumo_surfs))
+        geometry = await _load_and_accumulate_surfaces_async(sumo_surfs, surface_statistics)
+        et_load_and_accumulate_ms = timer.lap_ms()
 
-        xtgeo_surf = await _compute_statistical_surface_async(statistic_function, surface_collection)
+        stat_surfaces = {
+            stat_func: DecodedSurface(geometry=geometry, values=stat_values).to_xtgeo_surface()
+            for stat_func, stat_values in surface_statistics.compute_statistics().items()
+        }
         et_calc_stat_ms = timer.lap_ms()
 
-        if not xtgeo_surf:
-            LOGGER.warning(f"Could not calculate statistical surface using Sumo for {addr_str}")
-            return None
+        aggregation_funcs = surface_statistics.get_skipped_statistic_functions()
+        if aggregation_funcs:
+            LOGGER.info(
+                f"Surfaces too large for local percentiles, using Sumo aggregation for "
+                f"{[stat_func.value for stat_func in aggregation_funcs]} ({addr_str})"
+            )
+            aggregated_surfs = await asyncio.gather(
+                *[_compute_statistical_surface_async(stat_func, surface_collection) for stat_func in aggregation_funcs]
+            )
+            stat_surfaces.update(zip(aggregation_funcs, aggregated_surfs))
+        et_aggregate_ms = timer.lap_ms()
 
         LOGGER.debug(
-            f"Calculated statistical surface using Sumo in: {timer.elapsed_ms()}ms ("
+            f"Calculated statistical surfaces in: {timer.elapsed_ms()}ms ("
             f"locate={et_locate_ms}ms, "
-            f"collect_reals={et_collect_reals_ms}ms, "
-            f"calc_stat={et_calc_stat_ms}ms) "
-            f"({addr_str} {len(realizations)=} )"
+            f"load_and_accumulate={et_load_and_accumulate_ms}ms, "
+            f"calc_stat={et_calc_stat_ms}ms, "
+            f"sumo_aggregation={et_aggregate_ms}ms) "
+            f"({addr_str} {len(sumo_surfs)=} {[stat_func.value for stat_func in stat_surfaces]}) "
+            f"[cache: {DECODED_SURFACE_CACHE.stats().to_string()}]"
         )
 
-        return xtgeo_surf
+        return stat_surfaces
 
     def _make_addr_str(self, real_num: int, name: str, attribute: str, date_str: Optional[str]) -> str:
         addr_str = f"R:{real_num}__N:{name}__A:{attribute}__D:{date_str}__I:{self._iteration_name}__C:{self._case_uuid}"
         return addr_str
 
 
+def _make_time_filter(time_or_interval_str: Optional[str]) -> TimeFilter:
+    if time_or_interval_str is None:
+        return TimeFilter(TimeType.NONE)
+
+    timestamp_arr = time_or_interval_str.split("/", 1)
+    if len(timestamp_arr) == 0 or len(timestamp_arr) > 2:
+        raise ValueError("time_or_interval_str must contain a single timestamp or interval")
+    if len(timestamp_arr) == 1:
+        return TimeFilter(
+            TimeType.TIMESTAMP,
+            start=timestamp_arr[0],
+            end=timestamp_arr[0],
+            exact=True,
+        )
+    return TimeFilter(
+        TimeType.INTERVAL,
+        start=timestamp_arr[0],
+        end=timestamp_arr[1],
+        exact=True,
+    )
+
+
+async def _load_decoded_surface_async(sumo_surf: Surface) -> DecodedSurface:
+    async def download_blob_async() -> BytesIO:
+        return await sumo_surf.blob_async
+
+    # The decoded surface is cached on the Sumo object id, so a repeat request skips the download and decode
+    return await DECODED_SURFACE_CACHE.get_or_load_async(sumo_surf.uuid, download_blob_async)
+
+
+async def _load_and_accumulate_surfaces_async(
+    sumo_surfs: List[Surface], surface_statistics: StreamingSurfaceStatistics
+) -> SurfaceGeometry:
+    """
+    Load the surfaces with bounded concurrency and add each to the statistics as soon as it is loaded.
+    Returns the geometry shared by all the surfaces. If a load fails, or the statistics need no more values,
+    the remaining loads are cancelled.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SURFACE_LOADS)
+
+    async def load_bounded_async(sumo_surf: Surface) -> DecodedSurface:
+        async with semaphore:
+            return await _load_decoded_surface_async(sumo_surf)
+
+    load_tasks = [asyncio.create_task(load_bounded_async(sumo_surf)) for sumo_surf in sumo_surfs]
+    geometry: Optional[SurfaceGeometry] = None
+    try:
+        for load_task in asyncio.as_completed(load_tasks):
+            decoded_surf = await load_task
+            if geometry is None:
+                geometry = decoded_surf.geometry
+            elif decoded_surf.geometry != geometry:
+                raise InvalidDataError("Realization surfaces have different geometries", Service.SUMO)
+            surface_statistics.add_realization_values(decoded_surf.values)
+            if not surface_statistics.has_statistics_to_compute():
+                # All the requested statistics are left to Sumo aggregation, so the remaining loads are not needed
+                break
+    finally:
+        # On errors, the remaining loads are cancelled. Loads shared with other requests through the decoded
+        # surface cache are shielded, and will continue for the other requests.
+        for load_task in load_tasks:
+            load_task.cancel()
+        await asyncio.gather(*load_tasks, return_exceptions=True)
+
+    if geometry is None:
+        raise InvalidDataError("No realization surfaces to compute statistics from", Service.SUMO)
+    return geometry
+
+
 async def _compute_statistical_surface_async(
     statistic: StatisticFunction, surface_coll: SurfaceCollection
 ) -> xtgeo.RegularSurface:
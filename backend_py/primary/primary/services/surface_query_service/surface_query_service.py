@@ -9,7 +9,8 @@ from pydantic import BaseModel
 from sumo.wrapper import SumoClient
 
 from primary import config
-from primary.services.sumo_access.sumo_blob_access import get_sas_token_and_blob_store_base_uri_for_case
+from primary.services.sumo_access.sumo_blob_access import get_sas_token_and_blob_store_base_uri_for_case_async
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
 
 LOGGER = logging.getLogger(__name__)
 
@@ -60,7 +61,9 @@ async def batch_sample_surface_in_points_async(
         realizations=realizations,
     )
 
-    sas_token, blob_store_base_uri = get_sas_token_and_blob_store_base_uri_for_case(sumo_access_token, case_uuid)
+    sas_token, blob_store_base_uri = await get_sas_token_and_blob_store_base_uri_for_case_async(
+        sumo_access_token, case_uuid
+    )
 
     request_body = _PointSamplingRequestBody(
         sasToken=sas_token,
@@ -70,7 +73,7 @@ async def batch_sample_surface_in_points_async(
         yCoords=y_coords,
     )
 
-    async with httpx.AsyncClient(timeout=300) as client:
+    async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.SURFACE_QUERY) as client:
         LOGGER.info(f"Running async go point sampling for surface: {surface_name}")
         response: httpx.Response = await client.post(url=SERVICE_ENDPOINT, json=request_body.model_dump())
 
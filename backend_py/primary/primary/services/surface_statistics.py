@@ -0,0 +1,169 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .summary_vector_statistics import compute_statistics_for_matrix_rows
+from .utils.statistic_function import StatisticFunction
+from .service_exceptions import Service, InvalidDataError, InvalidParameterError
+
+# Upper bound for the (realizations x nodes) float32 stack holding the values that percentiles are computed from
+_PERCENTILE_STACK_MAX_BYTES = 1024 * 1024 * 1024
+
+# Upper bound for the temporary (nodes x realizations) matrix used when computing percentiles for a chunk of nodes
+_PERCENTILE_CHUNK_MAX_BYTES = 256 * 1024 * 1024
+
+_PERCENTILE_STATISTICS = [StatisticFunction.P10, StatisticFunction.P90, StatisticFunction.P50]
+
+
+class StreamingSurfaceStatistics:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Accumulates statistics over realization surfaces, one surface at a time, so that all requested statistics
+    come out of a single pass over the realizations.
+
+    MIN, MAX, MEAN and STD are accumulated in streaming form, using Welford's algorithm for MEAN and STD, and need
+    no more memory than a few arrays the size of one surface. Percentiles need all the values of each node, so the
+    values of each surface are copied into a float32 stack that is preallocated for `realization_count` surfaces.
+    The stack needs 4 bytes per node and realization, e.g. 800MB for 200 realizations of a 1000 x 1000 surface.
+    If it would exceed `percentile_stack_max_bytes`, the percentiles are skipped, and must be computed elsewhere by
+    the caller, see `get_skipped_statistic_functions()`. The percentiles are computed in chunks of nodes, so that the
+    temporary matrix of values stays within `percentile_chunk_max_bytes`.
+
+    NaN values, i.e. undefined nodes, are ignored. Nodes without any values give NaN for all statistics.
+    STD is the population standard deviation, and P10/P90 follow the oil industry convention, consistent with the
+    summary vector statistics.
+    """
+
+    def __init__(
+        self,
+        statistic_functions: Sequence[StatisticFunction],
+        realization_count: int,
+        percentile_stack_max_bytes: int = _PERCENTILE_STACK_MAX_BYTES,
+        percentile_chunk_max_bytes: int = _PERCENTILE_CHUNK_MAX_BYTES,
+    ) -> None:
+        self._statistic_functions = list(dict.fromkeys(statistic_functions))
+        if not self._statistic_functions:
+            raise InvalidParameterError("At least one statistic must be requested", Service.GENERAL)
+
+        self._max_realization_count = realization_count
+        self._percentile_stack_max_bytes = percentile_stack_max_bytes
+        self._percentile_chunk_max_bytes = percentile_chunk_max_bytes
+        self._values_shape: Optional[Tuple[int, ...]] = None
+        self._realization_count = 0
+
+        self._count: Optional[np.ndarray] = None
+        self._mean: Optional[np.ndarray] = None
+        self._m2: Optional[np.ndarray] = None
+        self._min: Optional[np.ndarray] = None
+        self._max: Optional[np.ndarray] = None
+        self._percentile_stack: Optional[np.ndarray] = None
+        self._skipped_statistic_functions: List[StatisticFunction] = []
+
+    def get_realization_count(self) -> int:
+        return self._realization_count
+
+    def get_skipped_statistic_functions(self) -> List[StatisticFunction]:
+        """Get the requested statistics that are not computed, because the percentile stack would exceed its limit"""
+        return list(self._skipped_statistic_functions)
+
+    def has_statistics_to_compute(self) -> bool:
+        """Whether any of the requested statistics are computed, i.e. whether more realization values are needed"""
+        return len(self._skipped_statistic_functions) < len(self._statistic_functions)
+
+    def add_realization_values(self, values: np.ndarray) -> None:
+        """Add the values of one realization surface, all surfaces must have the same shape"""
+        if self._realization_count >= self._max_realization_count:
+            raise InvalidDataError(
+                f"More than the expected {self._max_realization_count} realization surfaces were added",
+                Service.GENERAL,
+            )
+        if self._values_shape is None:
+            self._initialize_accumulators(values.shape)
+        elif values.shape != self._values_shape:
+            raise InvalidDataError(
+                f"Surface shape {values.shape} differs from the first surface shape {self._values_shape}",
+                Service.GENERAL,
+            )
+
+        if self._percentile_stack is not None:
+            self._percentile_stack[self._realization_count] = values.ravel()
+        self._realization_count += 1
+
+        if self._count is not None and self._mean is not None and self._m2 is not None:
+            flat_values = values.ravel().astype(np.float64)
+            is_valid = ~np.isnan(flat_values)
+            self._count += is_valid
+            delta = np.where(is_valid, flat_values - self._mean, 0.0)
+            self._mean += np.divide(delta, self._count, out=np.zeros_like(delta), where=is_valid)
+            self._m2 += np.where(is_valid, delta * (flat_values - self._mean), 0.0)
+
+        # fmin/fmax ignore NaN, so NaN in the initial arrays is replaced by the first valid value
+        if self._min is not None:
+            np.fmin(self._min, values.ravel(), out=self._min)
+        if self._max is not None:
+            np.fmax(self._max, values.ravel(), out=self._max)
+
+    def compute_statistics(self) -> Dict[StatisticFunction, np.ndarray]:
+        """Get the requested statistics as float32 arrays with the same shape as the realization surfaces"""
+        if self._values_shape is None:
+            raise InvalidDataError("No realization surfaces have been added", Service.GENERAL)
+
+        flat_stats: Dict[StatisticFunction, np.ndarray] = {}
+        if self._count is not None and self._mean is not None and self._m2 is not None:
+            has_values = self._count > 0
+            flat_stats[StatisticFunction.MEAN] = np.where(has_values, self._mean, np.nan)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                flat_stats[StatisticFunction.STD] = np.where(has_values, np.sqrt(self._m2 / self._count), np.nan)
+        if self._min is not None:
+            flat_stats[StatisticFunction.MIN] = self._min
+        if self._max is not None:
+            flat_stats[StatisticFunction.MAX] = self._max
+        flat_stats.update(self._compute_percentiles())
+
+        return {
+            stat_func: flat_stats[stat_func].astype(np.float32).reshape(self._values_shape)
+            for stat_func in self._statistic_functions
+            if stat_func not in self._skipped_statistic_functions
+        }
+
+    def _initialize_accumulators(self, values_shape: Tuple[int, ...]) -> None:
+        self._values_shape = values_shape
+        num_nodes = int(np.prod(values_shape))
+        if StatisticFunction.MEAN in self._statistic_functions or StatisticFunction.STD in self._statistic_functions:
+            self._count = np.zeros(num_nodes, dtype=np.int64)
+            self._mean = np.zeros(num_nodes, dtype=np.float64)
+            self._m2 = np.zeros(num_nodes, dtype=np.float64)
+        if StatisticFunction.MIN in self._statistic_functions:
+            self._min = np.full(num_nodes, np.nan, dtype=np.float32)
+        if StatisticFunction.MAX in self._statistic_functions:
+            self._max = np.full(num_nodes, np.nan, dtype=np.float32)
+        percentile_funcs = [stat_func for stat_func in self._statistic_functions if stat_func in _PERCENTILE_STATISTICS]
+        if percentile_funcs:
+            stack_bytes = self._max_realization_count * num_nodes * np.dtype(np.float32).itemsize
+            if stack_bytes > self._percentile_stack_max_bytes:
+                self._skipped_statistic_functions = percentile_funcs
+            else:
+                self._percentile_stack = np.empty((self._max_realization_count, num_nodes), dtype=np.float32)
+
+    def _compute_percentiles(self) -> Dict[StatisticFunction, np.ndarray]:
+        percentile_funcs = [stat_func for stat_func in self._statistic_functions if stat_func in _PERCENTILE_STATISTICS]
+        if not percentile_funcs or self._percentile_stack is None:
+            return {}
+
+        values_stack = self._percentile_stack[: self._realization_count]
+        num_reals, num_nodes = values_stack.shape
+
+        # Each chunk is transposed into a float32 matrix and then sorted, which makes a copy of the same size
+        bytes_per_node = 2 * num_reals * np.dtype(np.float32).itemsize
+        nodes_per_chunk = max(1, self._percentile_chunk_max_bytes // max(bytes_per_node, 1))
+
+        percentiles = {stat_func: np.empty(num_nodes, dtype=np.float64) for stat_func in percentile_funcs}
+        for chunk_start in range(0, num_nodes, nodes_per_chunk):
+            chunk_end = min(chunk_start + nodes_per_chunk, num_nodes)
+            chunk_matrix = np.ascontiguousarray(values_stack[:, chunk_start:chunk_end].T)
+
+            chunk_stats = compute_statistics_for_matrix_rows(chunk_matrix, percentile_funcs)
+            for stat_func in percentile_funcs:
+                percentiles[stat_func][chunk_start:chunk_end] = chunk_stats[stat_func]
+
+        return percentiles
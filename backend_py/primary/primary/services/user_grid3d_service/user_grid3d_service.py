@@ -19,8 +19,9 @@ from primary.services.service_exceptions import Service
 from primary.services.service_exceptions import ServiceRequestError, ServiceTimeoutError, ServiceUnavailableError
 from primary.services.sumo_access.queries.grid3d import get_grid_geometry_and_property_blob_ids_async
 from primary.services.sumo_access.queries.grid3d import get_grid_geometry_blob_id_async
-from primary.services.sumo_access.sumo_blob_access import get_sas_token_and_blob_store_base_uri_for_case
+from primary.services.sumo_access.sumo_blob_access import get_sas_token_and_blob_store_base_uri_for_case_async
 from primary.services.user_session_manager.user_session_manager import UserComponent, UserSessionManager
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
 
 LOGGER = logging.getLogger(__name__)
 
@@ -112,7 +113,9 @@ class UserGrid3dService:
         sumo_client = SumoClient(env=config.SUMO_ENV, token=sumo_access_token, interactive=False)
         perf_metrics.record_lap("sumo-client")
 
-        sas_token, blob_store_base_uri = get_sas_token_and_blob_store_base_uri_for_case(sumo_access_token, case_uuid)
+        sas_token, blob_store_base_uri = await get_sas_token_and_blob_store_base_uri_for_case_async(
+            sumo_access_token, case_uuid
+        )
         perf_metrics.record_lap("sas-token")
 
         service_object = UserGrid3dService(
@@ -361,10 +364,10 @@ class UserGrid3dService:
         if method == "POST" and post_body_pydantic_model is not None:
             post_content = post_body_pydantic_model.model_dump_json()
 
-        async with httpx.AsyncClient(timeout=self._call_timeout) as client:
+        async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.USER_GRID3D) as client:
             try:
                 response: httpx.Response = await client.request(
-                    method=method, url=url, params=query_params, content=post_content
+                    method=method, url=url, params=query_params, content=post_content, timeout=self._call_timeout
                 )
                 response.raise_for_status()
 
@@ -0,0 +1,226 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HttpClientId(str, Enum):
+    """Identifies the outbound services that get their own pooled http client"""
+
+    VDS = "VDS"
+    SUMO = "SUMO"
+    SUMO_BLOB_STORE = "SUMO_BLOB_STORE"
+    SMDA = "SMDA"
+    GRAPH = "GRAPH"
+    SURFACE_QUERY = "SURFACE_QUERY"
+    USER_GRID3D = "USER_GRID3D"
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry_s: float
+    timeout_s: float
+    connect_timeout_s: float
+
+
+_CLIENT_CONFIGS: Dict[HttpClientId, HttpClientConfig] = {
+    HttpClientId.VDS: HttpClientConfig(
+        max_connections=50,
+        max_keepalive_connections=20,
+        keepalive_expiry_s=60,
+        timeout_s=60,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.SUMO: HttpClientConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry_s=60,
+        timeout_s=60,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.SUMO_BLOB_STORE: HttpClientConfig(
+        max_connections=50,
+        max_keepalive_connections=20,
+        keepalive_expiry_s=60,
+        timeout_s=60,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.SMDA: HttpClientConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry_s=60,
+        timeout_s=60,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.GRAPH: HttpClientConfig(
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry_s=60,
+        timeout_s=30,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.SURFACE_QUERY: HttpClientConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry_s=30,
+        timeout_s=300,
+        connect_timeout_s=10,
+    ),
+    HttpClientId.USER_GRID3D: HttpClientConfig(
+        max_connections=50,
+        max_keepalive_connections=20,
+        keepalive_expiry_s=30,
+        timeout_s=60,
+        connect_timeout_s=10,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PoolUsageStats:
+    request_count: int
+    error_count: int
+    pool_timeout_count: int
+    in_flight: int
+    peak_in_flight: int
+    max_connections: int
+    total_request_time_s: float
+
+    def to_string(self) -> str:
+        """Compact representation suitable for logging"""
+        avg_ms = 1000 * self.total_request_time_s / self.request_count if self.request_count > 0 else 0
+        return (
+            f"requests={self.request_count}, errors={self.error_count}, pool_timeouts={self.pool_timeout_count}, "
+            f"in_flight={self.in_flight}, peak_in_flight={self.peak_in_flight}/{self.max_connections}, "
+            f"avg_time={avg_ms:.0f}ms"
+        )
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    # pylint: disable=too-many-instance-attributes
+    """
+    Wraps the pooled transport and tracks how many requests are in flight, which is what determines how
+    many connections the pool needs. A request counts as in flight until the response headers have been received.
+    """
+
+    def __init__(self, wrapped_transport: httpx.AsyncBaseTransport, max_connections: int) -> None:
+        self._wrapped_transport = wrapped_transport
+        self._max_connections = max_connections
+        self._request_count = 0
+        self._error_count = 0
+        self._pool_timeout_count = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._total_request_time_s = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._request_count += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        start_s = time.perf_counter()
+        try:
+            return await self._wrapped_transport.handle_async_request(request)
+        except httpx.PoolTimeout:
+            self._pool_timeout_count += 1
+            self._error_count += 1
+            raise
+        except Exception:
+            self._error_count += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self._total_request_time_s += time.perf_counter() - start_s
+
+    async def aclose(self) -> None:
+        await self._wrapped_transport.aclose()
+
+    def stats(self) -> PoolUsageStats:
+        return PoolUsageStats(
+            request_count=self._request_count,
+            error_count=self._error_count,
+            pool_timeout_count=self._pool_timeout_count,
+            in_flight=self._in_flight,
+            peak_in_flight=self._peak_in_flight,
+            max_connections=self._max_connections,
+            total_request_time_s=self._total_request_time_s,
+        )
+
+
+def _create_client(client_config: HttpClientConfig) -> tuple[httpx.AsyncClient, _MeteredTransport]:
+    limits = httpx.Limits(
+        max_connections=client_config.max_connections,
+        max_keepalive_connections=client_config.max_keepalive_connections,
+        keepalive_expiry=client_config.keepalive_expiry_s,
+    )
+    inner_transport = httpx.AsyncHTTPTransport(limits=limits)
+    metered_transport = _MeteredTransport(inner_transport, client_config.max_connections)
+    timeout = httpx.Timeout(client_config.timeout_s, connect=client_config.connect_timeout_s)
+    return httpx.AsyncClient(transport=metered_transport, timeout=timeout), metered_transport
+
+
+class HttpClientRegistry:
+    """
+    Application scoped registry of long-lived http clients, one per outbound service, so that connections
+    (and their TCP/TLS handshakes) are reused across requests.
+
+    The registry is started and closed in the lifespan of the FastAPI app. Outside of the app, e.g. in dev scripts,
+    `client_context()` falls back to a short-lived client with the same configuration.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[HttpClientId, httpx.AsyncClient] = {}
+        self._transports: Dict[HttpClientId, _MeteredTransport] = {}
+
+    def is_started(self) -> bool:
+        return len(self._clients) > 0
+
+    def start(self) -> None:
+        if self.is_started():
+            return
+
+        LOGGER.info("Starting http client registry")
+        for client_id, client_config in _CLIENT_CONFIGS.items():
+            client, transport = _create_client(client_config)
+            self._clients[client_id] = client
+            self._transports[client_id] = transport
+
+    async def aclose_async(self) -> None:
+        LOGGER.info(f"Closing http client registry, pool usage:\n{self.stats_string()}")
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._transports.clear()
+        for client in clients:
+            await client.aclose()
+
+    @asynccontextmanager
+    async def client_context(self, client_id: HttpClientId) -> AsyncIterator[httpx.AsyncClient]:
+        """Yields the pooled client for the service, or a short-lived client if the registry has not been started"""
+        client = self._clients.get(client_id)
+        if client is not None:
+            yield client
+            return
+
+        temp_client, _transport = _create_client(_CLIENT_CONFIGS[client_id])
+        async with temp_client:
+            yield temp_client
+
+    def stats(self, client_id: HttpClientId) -> Optional[PoolUsageStats]:
+        transport = self._transports.get(client_id)
+        return transport.stats() if transport else None
+
+    def stats_string(self) -> str:
+        lines = [
+            f"  {client_id.value}: {transport.stats().to_string()}" for client_id, transport in self._transports.items()
+        ]
+        return "\n".join(lines)
+
+
+HTTP_CLIENT_REGISTRY = HttpClientRegistry()
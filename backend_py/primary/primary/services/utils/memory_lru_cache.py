@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from .single_flight import SingleFlight
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entry_count: int
+    byte_count: int
+    max_bytes: int
+
+    def to_string(self) -> str:
+        """Compact representation suitable for debug logging"""
+        return (
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"entries={self.entry_count}, size={self.byte_count / (1024 * 1024):.1f}/{self.max_bytes / (1024 * 1024):.0f}MB"
+        )
+
+
+class MemoryLruCache(Generic[K, V]):
+    # pylint: disable=too-many-instance-attributes
+    """
+    In-process LRU cache that is bounded by the total byte size of its entries rather than by the entry count.
+
+    The byte size of each entry is determined by the `size_of_value` function passed to the constructor.
+    Entries that are larger than the entire byte budget are never stored.
+
+    Use `get_or_load_async()` to get single-flight semantics, where concurrent requests for the same key
+    will share one load operation instead of triggering multiple loads.
+    """
+
+    def __init__(self, max_bytes: int, size_of_value: Callable[[V], int]) -> None:
+        self._max_bytes = max_bytes
+        self._size_of_value = size_of_value
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._byte_count = 0
+        self._single_flight: SingleFlight[K, V] = SingleFlight()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Get value for key, returns None if the key is not in the cache"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[0]
+
+    def peek(self, key: K) -> Optional[V]:
+        """Get value for key without counting a hit or miss and without marking the entry as recently used"""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: K, value: V) -> None:
+        """Insert value into the cache, evicting least recently used entries as needed"""
+        value_size = self._size_of_value(value)
+        self._remove_entry(key)
+        if value_size > self._max_bytes:
+            return
+
+        self._entries[key] = (value, value_size)
+        self._byte_count += value_size
+
+        while self._byte_count > self._max_bytes:
+            _evicted_key, (_evicted_value, evicted_size) = self._entries.popitem(last=False)
+            self._byte_count -= evicted_size
+            self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._remove_entry(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._byte_count = 0
+
+    async def get_or_load_async(self, key: K, load_func: Callable[[], Awaitable[V]]) -> V:
+        """
+        Get value for key, loading it using `load_func` if it is not present in the cache.
+        If a load for the same key is already in progress, we wait for it to finish instead of starting a new one.
+        Exceptions raised by `load_func` are propagated to all waiters and nothing is stored in the cache.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        return await self._single_flight.run_async(key, lambda: self._load_and_put(key, load_func))
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entry_count=len(self._entries),
+            byte_count=self._byte_count,
+            max_bytes=self._max_bytes,
+        )
+
+    async def _load_and_put(self, key: K, load_func: Callable[[], Awaitable[V]]) -> V:
+        value = await load_func()
+        self.put(key, value)
+        return value
+
+    def _remove_entry(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._byte_count -= entry[1]
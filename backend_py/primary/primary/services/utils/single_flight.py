@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any, Callable, Coroutine, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Deduplicates concurrent loads, so that concurrent calls for the same key share one load operation.
+    Exceptions raised by the load are propagated to all waiters.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[K, asyncio.Task[V]] = {}
+
+    async def run_async(self, key: K, load_func: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Run `load_func`, or wait for the load already in progress for the same key"""
+        load_task = self._in_flight.get(key)
+        if load_task is None:
+            load_task = asyncio.create_task(load_func())
+            self._in_flight[key] = load_task
+            load_task.add_done_callback(lambda _task: self._in_flight.pop(key, None))
+
+        # Shield the shared task so that a cancelled request does not cancel the load for the other waiters
+        return await asyncio.shield(load_task)
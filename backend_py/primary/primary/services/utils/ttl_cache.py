@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from .single_flight import SingleFlight
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TtlCache(Generic[K, V]):
+    """
+    In-process cache where entries expire after a time-to-live, bounded by the number of entries.
+    When the cache is full, the least recently used entry is evicted.
+
+    The default time-to-live is given in the constructor, but can be overridden per entry when putting values
+    into the cache, e.g. for values that carry their own expiry time.
+
+    Use `get_or_load_async()` to get single-flight semantics, where concurrent requests for the same key
+    will share one load operation instead of triggering multiple loads.
+    """
+
+    def __init__(self, max_entries: int, ttl_s: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._single_flight: SingleFlight[K, V] = SingleFlight()
+
+    def get(self, key: K) -> Optional[V]:
+        """Get value for key, returns None if the key is not in the cache or if the entry has expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V, ttl_s: Optional[float] = None) -> None:
+        """Insert value into the cache, optionally with a time-to-live that differs from the cache's default"""
+        effective_ttl_s = ttl_s if ttl_s is not None else self._ttl_s
+        if effective_ttl_s <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (value, time.monotonic() + effective_ttl_s)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load_async(
+        self,
+        key: K,
+        load_func: Callable[[], Awaitable[V]],
+        ttl_of_value: Optional[Callable[[V], Optional[float]]] = None,
+    ) -> V:
+        """
+        Get value for key, loading it using `load_func` if it is not present or has expired, with the same
+        single-flight semantics as MemoryLruCache.get_or_load_async().
+
+        The optional `ttl_of_value` function can be used to give the loaded value its own time-to-live,
+        returning None from it means that the cache's default time-to-live is used.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        return await self._single_flight.run_async(key, lambda: self._load_and_put(key, load_func, ttl_of_value))
+
+    async def _load_and_put(
+        self,
+        key: K,
+        load_func: Callable[[], Awaitable[V]],
+        ttl_of_value: Optional[Callable[[V], Optional[float]]],
+    ) -> V:
+        value = await load_func()
+        self.put(key, value, ttl_of_value(value) if ttl_of_value else None)
+        return value
@@ -8,6 +8,7 @@ from requests_toolbelt.multipart.decoder import MultipartDecoder, BodyPart
 import httpx
 
 from primary import config
+from primary.services.utils.httpx_client_registry import HTTP_CLIENT_REGISTRY, HttpClientId
 
 from .response_types import VdsMetadata, VdsFenceMetadata
 from .request_types import (
@@ -56,12 +57,11 @@ class VdsAccess:
     async def _query_async(endpoint: str, request: VdsRequestedResource) -> httpx.Response:
         """Query the service"""
 
-        async with httpx.AsyncClient() as client:
+        async with HTTP_CLIENT_REGISTRY.client_context(HttpClientId.VDS) as client:
             response = await client.post(
                 f"{config.VDS_HOST_ADDRESS}/{endpoint}",
                 headers={"Content-Type": "application/json"},
                 content=json.dumps(request.request_parameters()),
-                timeout=60,
             )
 
         if response.is_error:
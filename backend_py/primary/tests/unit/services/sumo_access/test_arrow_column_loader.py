@@ -0,0 +1,154 @@
+import asyncio
+import io
+import struct
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as pf
+import pyarrow.parquet as pq
+import pytest
+
+from primary.services.sumo_access import _arrow_column_loader
+
+from primary.services.sumo_access._arrow_column_loader import _RangeNotFetchedError, _SparseRangeFile
+from primary.services.sumo_access._arrow_column_loader import _read_columns_from_full_blob
+from primary.services.sumo_access._arrow_column_loader import find_parquet_column_byte_ranges
+from primary.services.sumo_access._arrow_column_loader import create_arrow_ipc_layout, parse_arrow_ipc_footer_blocks
+from primary.services.sumo_access._arrow_column_loader import find_arrow_ipc_column_byte_ranges, read_arrow_ipc_columns
+
+
+def _make_single_real_table(num_vectors: int, num_dates: int) -> pa.Table:
+    dates = np.datetime64("2020-01-01", "ms") + np.arange(num_dates).astype("timedelta64[D]")
+    fields = [pa.field("DATE", pa.timestamp("ms"))]
+    columns = [pa.array(dates, type=pa.timestamp("ms"))]
+    for i in range(num_vectors):
+        fields.append(pa.field(f"WOPR:W{i}", pa.float32(), metadata={b"is_rate": b"True"}))
+        columns.append(pa.array(np.arange(num_dates, dtype=np.float32) + i))
+    return pa.table(columns, schema=pa.schema(fields))
+
+
+def _write_parquet(table: pa.Table) -> bytes:
+    buf = io.BytesIO()
+    pq.write_table(table, buf, row_group_size=100)
+    return buf.getvalue()
+
+
+def test_read_parquet_columns_from_fetched_ranges_only() -> None:
+    table = _make_single_real_table(num_vectors=500, num_dates=1000)
+    blob_bytes = _write_parquet(table)
+
+    # The tail must cover the footer and the last 64KB, which the parquet reader reads when looking for the footer
+    footer_length = int.from_bytes(blob_bytes[-8:-4], "little")
+    tail_start = min(len(blob_bytes) - 8 - footer_length, len(blob_bytes) - 64 * 1024)
+    sparse_file = _SparseRangeFile(len(blob_bytes), {tail_start: blob_bytes[tail_start:]})
+    metadata = pq.read_metadata(sparse_file)
+
+    column_names = ["DATE", "WOPR:W7"]
+    byte_ranges = find_parquet_column_byte_ranges(metadata, column_names)
+    fetched_bytes = sum(end - start for start, end in byte_ranges)
+    assert fetched_bytes < len(blob_bytes) / 50
+
+    sparse_file.add_ranges({start: blob_bytes[start:end] for start, end in byte_ranges})
+    result = pq.ParquetFile(sparse_file, metadata=metadata).read(columns=column_names)
+    assert result.equals(table.select(column_names))
+    assert result.schema.field("WOPR:W7").metadata == {b"is_rate": b"True"}
+
+    # Columns whose ranges have not been fetched must not be readable
+    with pytest.raises(_RangeNotFetchedError):
+        pq.ParquetFile(sparse_file, metadata=metadata).read(columns=["WOPR:W8"])
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+def test_read_arrow_ipc_columns_from_fetched_ranges_only(compression: str) -> None:
+    table = _make_single_real_table(num_vectors=500, num_dates=1000)
+    feather_buf = io.BytesIO()
+    pf.write_feather(table, feather_buf, compression=compression, chunksize=300)
+    blob_bytes = feather_buf.getvalue()
+
+    # Only the footer and the metadata of each record batch are needed to locate the columns
+    footer_length = int.from_bytes(blob_bytes[-10:-6], "little")
+    footer_start = len(blob_bytes) - 10 - footer_length
+    has_dictionaries, record_batch_blocks = parse_arrow_ipc_footer_blocks(blob_bytes[footer_start:-10])
+    assert not has_dictionaries
+    assert len(record_batch_blocks) == 4
+
+    metadata_ranges = {footer_start: blob_bytes[footer_start:]}
+    for offset, metadata_length, _body_length in record_batch_blocks:
+        metadata_ranges[offset] = blob_bytes[offset : offset + metadata_length]
+    layout = create_arrow_ipc_layout(len(blob_bytes), metadata_ranges, record_batch_blocks)
+    assert layout is not None
+
+    column_names = ["WOPR:W7", "DATE"]
+    byte_ranges = find_arrow_ipc_column_byte_ranges(layout, column_names)
+    fetched_bytes = sum(end - start for start, end in byte_ranges)
+    assert fetched_bytes < len(blob_bytes) / 50
+
+    sparse_file = _SparseRangeFile(len(blob_bytes), metadata_ranges)
+    sparse_file.add_ranges({start: blob_bytes[start:end] for start, end in byte_ranges})
+    result = read_arrow_ipc_columns(sparse_file, column_names)
+    assert result.equals(table.select(column_names))
+    assert result.schema.field("WOPR:W7").metadata == {b"is_rate": b"True"}
+
+    with pytest.raises(_RangeNotFetchedError):
+        read_arrow_ipc_columns(sparse_file, ["WOPR:W8"])
+
+
+def test_read_columns_from_full_feather_and_parquet_blobs() -> None:
+    table = _make_single_real_table(num_vectors=5, num_dates=20)
+    column_names = ["DATE", "WOPR:W3"]
+
+    feather_buf = io.BytesIO()
+    pf.write_feather(table, feather_buf)
+    feather_result = _read_columns_from_full_blob(
+        io.BytesIO(feather_buf.getvalue()), column_names, is_aggregated_table=False
+    )
+    assert feather_result.equals(table.select(column_names))
+
+    parquet_result = _read_columns_from_full_blob(
+        io.BytesIO(_write_parquet(table)), column_names, is_aggregated_table=False
+    )
+    assert parquet_result.equals(table.select(column_names))
+
+
+class _FakeSumoTable:
+    def __init__(self, uuid: str, blob_bytes: bytes) -> None:
+        self.uuid = uuid
+        self.format = "arrow"
+        self._blob_bytes = blob_bytes
+
+    @property
+    async def blob_async(self) -> io.BytesIO:
+        return io.BytesIO(self._blob_bytes)
+
+
+@pytest.mark.parametrize("parse_error", [pa.ArrowInvalid("bad footer"), struct.error("unpack requires a buffer")])
+def test_unparseable_footer_falls_back_to_full_download(
+    monkeypatch: pytest.MonkeyPatch, parse_error: Exception
+) -> None:
+    table = _make_single_real_table(num_vectors=3, num_dates=10)
+    feather_buf = io.BytesIO()
+    pf.write_feather(table, feather_buf)
+
+    async def fake_get_sas_token_and_blob_store_base_uri_for_case_async(*_args: Any) -> tuple[str, str]:
+        return "sas", "https://blobstore"
+
+    async def fake_probe_blob_async(_blob_url: str) -> Any:
+        raise parse_error
+
+    monkeypatch.setattr(
+        _arrow_column_loader,
+        "get_sas_token_and_blob_store_base_uri_for_case_async",
+        fake_get_sas_token_and_blob_store_base_uri_for_case_async,
+    )
+    monkeypatch.setattr(_arrow_column_loader, "_probe_blob_async", fake_probe_blob_async)
+
+    sumo_table = _FakeSumoTable(f"table-{type(parse_error).__name__}", feather_buf.getvalue())
+    result, load_method = asyncio.run(
+        _arrow_column_loader._load_columns_from_blob_async(
+            "token", "case", sumo_table, ["DATE", "WOPR:W1"], is_aggregated_table=False  # type: ignore[arg-type]
+        )
+    )
+
+    assert load_method == "full_download"
+    assert result.equals(table.select(["DATE", "WOPR:W1"]))
@@ -0,0 +1,75 @@
+import numpy as np
+import pyarrow as pa
+
+from primary.services.sumo_access._ensemble_timestamp_index import build_ensemble_timestamp_index
+from primary.services.sumo_access._resampling import resample_segmented_multi_real_table
+from primary.services.sumo_access.summary_types import Frequency
+
+
+def _ms(date_str: str) -> int:
+    return int(np.datetime64(date_str, "ms").astype(np.int64))
+
+
+def _create_table(reals: list, date_strs: list) -> pa.Table:
+    schema = pa.schema([("DATE", pa.timestamp("ms")), ("REAL", pa.int16()), ("V", pa.float32())])
+    dates_ms = [_ms(date_str) for date_str in date_strs]
+    values = list(range(len(reals)))
+    table = pa.Table.from_pydict({"DATE": dates_ms, "REAL": reals, "V": values}, schema=schema)
+    return table
+
+
+# Unsorted on purpose, real 2 runs longer than real 0 and real 5 is missing one date
+_TABLE = _create_table(
+    reals=[2, 0, 0, 2, 2, 5, 0, 2, 5],
+    date_strs=[
+        "2020-01-01",
+        "2020-01-01",
+        "2020-02-01",
+        "2020-02-01",
+        "2020-03-01",
+        "2020-01-01",
+        "2020-03-01",
+        "2021-06-15",
+        "2020-03-01",
+    ],
+)
+
+
+def test_date_ranges() -> None:
+    timestamp_index = build_ensemble_timestamp_index(_TABLE)
+
+    date_ranges = timestamp_index.get_realization_date_ranges()
+    assert date_ranges.realizations.tolist() == [0, 2, 5]
+    assert date_ranges.min_dates_utc_ms.tolist() == [_ms("2020-01-01")] * 3
+    assert date_ranges.max_dates_utc_ms.tolist() == [_ms("2020-03-01"), _ms("2021-06-15"), _ms("2020-03-01")]
+
+    subset_ranges = timestamp_index.get_realization_date_ranges([5, 99])
+    assert subset_ranges.realizations.tolist() == [5]
+
+
+def test_raw_timestamps_intersection_and_union() -> None:
+    timestamp_index = build_ensemble_timestamp_index(_TABLE)
+
+    assert timestamp_index.get_timestamps(None).tolist() == [_ms("2020-01-01"), _ms("2020-03-01")]
+    assert timestamp_index.get_timestamps(None, [0, 2]).tolist() == [
+        _ms("2020-01-01"),
+        _ms("2020-02-01"),
+        _ms("2020-03-01"),
+    ]
+    assert timestamp_index.get_raw_timestamps_union().tolist() == [
+        _ms("2020-01-01"),
+        _ms("2020-02-01"),
+        _ms("2020-03-01"),
+        _ms("2021-06-15"),
+    ]
+    assert timestamp_index.get_timestamps(None, [99]).tolist() == []
+
+
+def test_resampled_timestamps_match_resampled_table() -> None:
+    timestamp_index = build_ensemble_timestamp_index(_TABLE)
+
+    sorted_table = _TABLE.sort_by([("REAL", "ascending"), ("DATE", "ascending")])
+    for freq in [Frequency.MONTHLY, Frequency.QUARTERLY, Frequency.YEARLY]:
+        resampled_table = resample_segmented_multi_real_table(sorted_table, freq)
+        expected = np.unique(resampled_table["DATE"].to_numpy().view(np.int64))
+        assert timestamp_index.get_timestamps(freq).tolist() == expected.tolist()
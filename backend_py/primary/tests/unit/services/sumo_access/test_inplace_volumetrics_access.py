@@ -0,0 +1,31 @@
+from io import BytesIO
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from primary.services.sumo_access.inplace_volumetrics_access import _concat_tables_with_unified_schema
+
+
+def _read_csv(csv_str: str) -> pa.Table:
+    return pa_csv.read_csv(BytesIO(csv_str.encode()))
+
+
+def test_concat_tables_with_identical_schemas_is_zero_copy() -> None:
+    table_a = _read_csv("ZONE,STOIIP_OIL\nUpper,1.5\nLower,2.5\n")
+    table_b = _read_csv("ZONE,STOIIP_OIL\nUpper,3.5\nLower,4.5\n")
+
+    result = _concat_tables_with_unified_schema([table_a, table_b])
+    assert result.schema == table_a.schema
+    assert result.column("STOIIP_OIL").num_chunks == 2
+    assert result.column("STOIIP_OIL").to_pylist() == [1.5, 2.5, 3.5, 4.5]
+
+
+def test_concat_tables_unifies_inferred_column_types() -> None:
+    # The numerical column is inferred as integer in the first table and the second table lacks the FACIES column
+    table_a = _read_csv("ZONE,FACIES,STOIIP_OIL\nUpper,Sand,1\n")
+    table_b = _read_csv("ZONE,STOIIP_OIL\nUpper,2.5\n")
+
+    result = _concat_tables_with_unified_schema([table_a, table_b])
+    assert result.schema.field("STOIIP_OIL").type == pa.float64()
+    assert result.column("STOIIP_OIL").to_pylist() == [1.0, 2.5]
+    assert result.column("FACIES").to_pylist() == ["Sand", None]
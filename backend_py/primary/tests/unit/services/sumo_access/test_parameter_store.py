@@ -0,0 +1,53 @@
+import pyarrow as pa
+
+from primary.services.sumo_access._parameter_store import EnsembleParameterStore
+from primary.services.sumo_access.parameter_types import SensitivityType
+
+
+def _make_parameter_table() -> pa.Table:
+    return pa.table(
+        {
+            "REAL": [0, 1, 2, 3, 4],
+            "SENSNAME": ["rms_seed", "rms_seed", "faults", "faults", "faults"],
+            "SENSCASE": ["p10_p90", "p10_p90", "low", "high", "low"],
+            "GLOBVAR:FWL": [1700.0, 1710.0, 1700.0, 1705.0, 1720.0],
+            "GLOBVAR:CONST": [1, 1, 1, 1, 1],
+            "LOG10_MULTZ": [-1.0, -2.0, -1.5, -1.0, -0.5],
+        }
+    )
+
+
+def test_parameter_column_infos() -> None:
+    store = EnsembleParameterStore(_make_parameter_table())
+
+    infos = {info.name: info for info in store.get_parameter_column_infos()}
+    assert list(infos) == ["SENSNAME", "SENSCASE", "FWL", "CONST", "LOG10_MULTZ"]
+    assert infos["FWL"].group_name == "GLOBVAR" and infos["FWL"].column_name == "GLOBVAR:FWL"
+    assert infos["CONST"].is_constant and not infos["FWL"].is_constant
+    assert not infos["SENSNAME"].is_numerical and infos["CONST"].is_numerical
+    assert infos["LOG10_MULTZ"].is_logarithmic
+
+
+def test_get_parameter_materializes_values() -> None:
+    store = EnsembleParameterStore(_make_parameter_table())
+
+    parameter = store.get_parameter("FWL")
+    assert parameter is not None
+    assert parameter.values == [1700.0, 1710.0, 1700.0, 1705.0, 1720.0]
+    assert parameter.realizations == [0, 1, 2, 3, 4]
+    assert store.get_parameter("NOT_A_PARAMETER") is None
+    assert [p.name for p in store.get_parameters(["CONST", "NOT_A_PARAMETER"])] == ["CONST"]
+
+
+def test_sensitivities() -> None:
+    store = EnsembleParameterStore(_make_parameter_table())
+    assert store.is_sensitivity_run()
+
+    sensitivities = store.get_sensitivities()
+    assert sensitivities is not None
+    assert [sens.name for sens in sensitivities] == ["faults", "rms_seed"]
+    assert sensitivities[0].type == SensitivityType.SCENARIO
+    assert [(case.name, case.realizations) for case in sensitivities[0].cases] == [("high", [3]), ("low", [2, 4])]
+    assert sensitivities[1].type == SensitivityType.MONTECARLO
+
+    assert not EnsembleParameterStore(_make_parameter_table().drop_columns(["SENSCASE"])).is_sensitivity_run()
@@ -4,7 +4,9 @@ import pyarrow.compute as pc
 
 from primary.services.sumo_access._resampling import (
     Frequency,
+    downsample_resampled_segmented_multi_real_table,
     generate_normalized_sample_dates,
+    get_nested_finer_frequencies,
     interpolate_backfill,
     resample_segmented_multi_real_table,
     resample_single_real_table,
@@ -225,3 +227,88 @@ def test_resample_segmented_multi_real_table() -> None:
     assert rate_arr_1[3] == rate_arr_1[3] == 4
     assert rate_arr_1[4] == rate_arr_1[4] == 6
     assert rate_arr_1[5] == rate_arr_1[5] == 6
+
+
+def test_resample_segmented_multi_real_table_matches_single_real_resampling() -> None:
+    # Realizations with different date ranges, not aligned to the sample dates and segments not sorted on REAL
+    # fmt:off
+    input_data = [
+        ["DATE",                                  "REAL",  "T",      "R"],
+        [np.datetime64("2020-01-15T12:00", "ms"),  3,      10.0,     1.0],
+        [np.datetime64("2020-03-04", "ms"),        3,      40.0,     4.0],
+        [np.datetime64("2020-03-04", "ms"),        3,      45.0,     4.5],
+        [np.datetime64("2020-06-06", "ms"),        3,      60.0,     6.0],
+        [np.datetime64("2020-02-01", "ms"),        1,      10.0,     1.0],
+        [np.datetime64("2020-04-01", "ms"),        1,      40.0,     4.0],
+        [np.datetime64("2020-01-10", "ms"),        2,      10.0,     1.0],
+        [np.datetime64("2020-09-30", "ms"),        2,      90.0,     9.0],
+    ]
+    # fmt:on
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("T", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+
+    raw_table = _create_table_from_row_data(per_row_input_data=input_data, schema=schema)
+
+    for freq in Frequency:
+        res_table = resample_segmented_multi_real_table(raw_table, freq)
+
+        # Output should be ordered on REAL
+        assert res_table["REAL"].to_numpy().tolist() == sorted(res_table["REAL"].to_numpy().tolist())
+
+        for real in [1, 2, 3]:
+            raw_real_table = raw_table.filter(pc.equal(raw_table["REAL"], real))
+            expected_table = resample_single_real_table(raw_real_table, freq)
+            res_real_table = res_table.filter(pc.equal(res_table["REAL"], real))
+
+            assert res_real_table["DATE"].to_numpy().tolist() == expected_table["DATE"].to_numpy().tolist()
+            assert res_real_table["T"].to_numpy().tolist() == expected_table["T"].to_numpy().tolist()
+            assert res_real_table["R"].to_numpy().tolist() == expected_table["R"].to_numpy().tolist()
+
+
+def test_downsample_resampled_table_matches_resampling_raw_table() -> None:
+    rng = np.random.default_rng(seed=1)
+
+    # Realizations with different, irregular date ranges that are not aligned to any of the sample frequencies
+    date_arr_list = []
+    real_arr_list = []
+    for real in range(5):
+        step_count = 200 + 10 * real
+        steps_ms = rng.integers(1, 14 * 24 * 3600 * 1000, size=step_count)
+        date_arr_list.append(np.datetime64("2018-01-03T05:00", "ms") + np.cumsum(steps_ms).astype("timedelta64[ms]"))
+        real_arr_list.append(np.full(step_count, real, dtype=np.int16))
+    dates = np.concatenate(date_arr_list)
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("T", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+    raw_table = pa.table(
+        [
+            dates,
+            np.concatenate(real_arr_list),
+            rng.random(len(dates), dtype=np.float32).cumsum(),
+            rng.random(len(dates), dtype=np.float32),
+        ],
+        schema=schema,
+    )
+
+    for coarser_freq in Frequency:
+        expected_table = resample_segmented_multi_real_table(raw_table, coarser_freq)
+        for finer_freq in get_nested_finer_frequencies(coarser_freq):
+            finer_table = resample_segmented_multi_real_table(raw_table, finer_freq)
+            derived_table = downsample_resampled_segmented_multi_real_table(finer_table, coarser_freq)
+            assert derived_table.equals(expected_table), f"{finer_freq=} {coarser_freq=}"
+
+    assert not get_nested_finer_frequencies(Frequency.DAILY)
+    assert get_nested_finer_frequencies(Frequency.YEARLY) == [Frequency.QUARTERLY, Frequency.MONTHLY, Frequency.DAILY]
@@ -0,0 +1,56 @@
+import numpy as np
+import pyarrow as pa
+
+from primary.services.sumo_access.summary_access import _combine_vector_tables_on_real_and_date
+
+
+def _make_vector_table(vector_name: str, reals: list, dates: list, values: list) -> pa.Table:
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field(vector_name, pa.float32(), metadata={b"unit": b"SM3"}),
+        ]
+    )
+    return pa.table(
+        [
+            pa.array(np.array(dates, dtype="datetime64[ms]")),
+            pa.array(reals, pa.int16()),
+            pa.array(values, pa.float32()),
+        ],
+        schema=schema,
+    )
+
+
+def test_combine_tables_with_differing_rows_fills_nan_and_sorts() -> None:
+    fopt_table = _make_vector_table("FOPT", [1, 0, 0], ["2020-01-01", "2020-01-01", "2020-02-01"], [10.0, 1.0, 2.0])
+    fwpt_table = _make_vector_table("FWPT", [0, 2], ["2020-02-01", "2020-03-01"], [20.0, 30.0])
+
+    combined_table, has_shared_rows = _combine_vector_tables_on_real_and_date(
+        [fopt_table, fwpt_table], ["FOPT", "FWPT"]
+    )
+
+    assert not has_shared_rows
+    assert combined_table.column_names == ["DATE", "REAL", "FOPT", "FWPT"]
+    assert combined_table["REAL"].to_pylist() == [0, 0, 1, 2]
+    assert combined_table["DATE"].to_numpy().astype("datetime64[D]").astype(str).tolist() == [
+        "2020-01-01",
+        "2020-02-01",
+        "2020-01-01",
+        "2020-03-01",
+    ]
+    np.testing.assert_array_equal(combined_table["FOPT"].to_numpy(), [1.0, 2.0, 10.0, np.nan])
+    np.testing.assert_array_equal(combined_table["FWPT"].to_numpy(), [np.nan, 20.0, np.nan, 30.0])
+    assert combined_table.schema.field("FOPT").metadata == {b"unit": b"SM3"}
+
+
+def test_combine_tables_with_shared_rows_appends_columns() -> None:
+    fopt_table = _make_vector_table("FOPT", [0, 1], ["2020-01-01", "2020-01-01"], [1.0, 2.0])
+    fwpt_table = _make_vector_table("FWPT", [0, 1], ["2020-01-01", "2020-01-01"], [3.0, 4.0])
+
+    combined_table, has_shared_rows = _combine_vector_tables_on_real_and_date(
+        [fopt_table, fwpt_table], ["FOPT", "FWPT"]
+    )
+
+    assert has_shared_rows
+    assert combined_table["FWPT"].to_pylist() == [3.0, 4.0]
@@ -0,0 +1,70 @@
+import numpy as np
+import pyarrow as pa
+
+from primary.services.sumo_access._summary_date_index import PointInTimeLookup, build_segmented_date_index
+
+
+def _create_table(reals: list, dates_ms: list, values: list) -> pa.Table:
+    schema = pa.schema([("DATE", pa.timestamp("ms")), ("REAL", pa.int16()), ("V", pa.float32())])
+    return pa.Table.from_pydict({"DATE": dates_ms, "REAL": reals, "V": values}, schema=schema)
+
+
+# Real 0 has dates 10, 20, 30 and real 3 has dates 20, 40
+_TABLE = _create_table(
+    reals=[0, 0, 0, 3, 3],
+    dates_ms=[10, 20, 30, 20, 40],
+    values=[1.0, 2.0, 3.0, 10.0, 30.0],
+)
+
+
+def test_lookup_exact() -> None:
+    date_index = build_segmented_date_index(_TABLE)
+    assert date_index.unique_reals.tolist() == [0, 3]
+
+    timestamps = np.array([5, 10, 20, 25, 40, 50])
+    values = date_index.lookup_values_at_timestamps(
+        _TABLE["V"].to_numpy(), timestamps, PointInTimeLookup.EXACT, is_rate=False
+    )
+
+    expected = [
+        [np.nan, np.nan],
+        [1.0, np.nan],
+        [2.0, 10.0],
+        [np.nan, np.nan],
+        [np.nan, 30.0],
+        [np.nan, np.nan],
+    ]
+    assert np.array_equal(values, np.array(expected), equal_nan=True)
+
+
+def test_lookup_interpolate_non_rate() -> None:
+    date_index = build_segmented_date_index(_TABLE)
+
+    timestamps = np.array([5, 15, 30, 35])
+    values = date_index.lookup_values_at_timestamps(
+        _TABLE["V"].to_numpy(), timestamps, PointInTimeLookup.INTERPOLATE, is_rate=False
+    )
+
+    expected = [
+        [np.nan, np.nan],
+        [1.5, np.nan],
+        [3.0, 20.0],
+        [np.nan, 25.0],
+    ]
+    assert np.array_equal(values, np.array(expected), equal_nan=True)
+
+
+def test_lookup_interpolate_rate_is_backfilled() -> None:
+    date_index = build_segmented_date_index(_TABLE)
+
+    timestamps = np.array([15, 25, 45])
+    values = date_index.lookup_values_at_timestamps(
+        _TABLE["V"].to_numpy(), timestamps, PointInTimeLookup.INTERPOLATE, is_rate=True
+    )
+
+    expected = [
+        [2.0, np.nan],
+        [3.0, 30.0],
+        [np.nan, np.nan],
+    ]
+    assert np.array_equal(values, np.array(expected), equal_nan=True)
@@ -0,0 +1,28 @@
+import datetime
+
+from primary.services.sumo_access.sumo_blob_access import _SasTokenEntry, _cache_ttl_for_entry
+from primary.services.sumo_access.sumo_blob_access import _get_sas_token_expiry_utc, _SAS_TOKEN_REFRESH_MARGIN_S
+
+
+def test_get_sas_token_expiry_utc() -> None:
+    sas_token = "sv=2021-08-06&se=2024-03-01T12%3A30%3A00Z&sr=c&sp=rl&sig=abc%2Bdef"
+    assert _get_sas_token_expiry_utc(sas_token) == datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc)
+
+    assert _get_sas_token_expiry_utc("sv=2021-08-06&sr=c&sp=rl&sig=abc") is None
+    assert _get_sas_token_expiry_utc("se=not-a-date&sig=abc") is None
+
+
+def test_cache_ttl_refreshes_ahead_of_expiry() -> None:
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    entry = _SasTokenEntry("token", "uri", expires_at_utc=now + datetime.timedelta(hours=1))
+    ttl_s = _cache_ttl_for_entry(entry)
+    assert ttl_s is not None
+    assert 3600 - _SAS_TOKEN_REFRESH_MARGIN_S - 5 < ttl_s <= 3600 - _SAS_TOKEN_REFRESH_MARGIN_S
+
+    # Tokens that are about to expire should not be cached at all
+    almost_expired_entry = _SasTokenEntry("token", "uri", expires_at_utc=now + datetime.timedelta(minutes=1))
+    almost_expired_ttl_s = _cache_ttl_for_entry(almost_expired_entry)
+    assert almost_expired_ttl_s is not None and almost_expired_ttl_s <= 0
+
+    assert _cache_ttl_for_entry(_SasTokenEntry("token", "uri", expires_at_utc=None)) is None
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+from primary.services.service_exceptions import InvalidDataError
+from primary.services.sumo_access import surface_access
+from primary.services.sumo_access._surface_cache import DecodedSurface, SurfaceGeometry
+from primary.services.surface_statistics import StreamingSurfaceStatistics
+from primary.services.utils.statistic_function import StatisticFunction
+
+
+def _make_decoded_surface(ncol: int) -> DecodedSurface:
+    geometry = SurfaceGeometry(ncol=ncol, nrow=2, xori=0.0, yori=0.0, xinc=1.0, yinc=1.0, yflip=1, rotation=0.0)
+    return DecodedSurface(geometry=geometry, values=np.zeros((ncol, 2), dtype=np.float32))
+
+
+def test_remaining_loads_are_cancelled_on_geometry_mismatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    cancelled_loads: List[int] = []
+
+    async def fake_load_decoded_surface_async(sumo_surf: Any) -> DecodedSurface:
+        # The first two surfaces load immediately with different geometries, the rest are slow
+        if sumo_surf >= 2:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled_loads.append(sumo_surf)
+                raise
+        return _make_decoded_surface(ncol=3 + sumo_surf)
+
+    monkeypatch.setattr(surface_access, "_load_decoded_surface_async", fake_load_decoded_surface_async)
+
+    async def run() -> None:
+        surface_statistics = StreamingSurfaceStatistics([StatisticFunction.MEAN], realization_count=5)
+        with pytest.raises(InvalidDataError):
+            await surface_access._load_and_accumulate_surfaces_async(
+                list(range(5)), surface_statistics  # type: ignore[arg-type]
+            )
+
+        # The slow loads must be cancelled when the error is raised, not left running in the background
+        assert sorted(cancelled_loads) == [2, 3, 4]
+
+    asyncio.run(run())
+
+
+def test_remaining_loads_are_cancelled_when_percentiles_are_left_to_aggregation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cancelled_loads: List[int] = []
+
+    async def fake_load_decoded_surface_async(sumo_surf: Any) -> DecodedSurface:
+        if sumo_surf >= 1:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled_loads.append(sumo_surf)
+                raise
+        return _make_decoded_surface(ncol=3)
+
+    monkeypatch.setattr(surface_access, "_load_decoded_surface_async", fake_load_decoded_surface_async)
+
+    async def run() -> None:
+        surface_statistics = StreamingSurfaceStatistics(
+            [StatisticFunction.P10], realization_count=5, percentile_stack_max_bytes=0
+        )
+        geometry = await surface_access._load_and_accumulate_surfaces_async(
+            list(range(5)), surface_statistics  # type: ignore[arg-type]
+        )
+
+        # The first surface gives the geometry, and the loads that are not needed are cancelled
+        assert geometry.ncol == 3
+        assert surface_statistics.get_skipped_statistic_functions() == [StatisticFunction.P10]
+        assert sorted(cancelled_loads) == [1, 2, 3, 4]
+
+    asyncio.run(run())
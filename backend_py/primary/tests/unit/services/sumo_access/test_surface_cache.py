@@ -0,0 +1,103 @@
+import asyncio
+import os
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import xtgeo
+
+from primary.services.sumo_access._surface_cache import DecodedSurfaceCache
+
+SURFACE_UUID = "1f6b6d8e-0c4a-4a53-9a49-7c2e6f0e1d2a"
+
+
+def _make_surface_blob() -> BytesIO:
+    values = np.ma.masked_invalid(np.array([[1.0, 2.0, 3.0], [4.0, np.nan, 6.0]]))
+    surf = xtgeo.RegularSurface(
+        ncol=2, nrow=3, xinc=25.0, yinc=50.0, xori=1000.0, yori=2000.0, rotation=30.0, values=values
+    )
+    byte_stream = BytesIO()
+    surf.to_file(byte_stream, fformat="irap_binary")
+    byte_stream.seek(0)
+    return byte_stream
+
+
+class _CountingDownloader:
+    def __init__(self) -> None:
+        self.download_count = 0
+
+    async def download_async(self) -> BytesIO:
+        self.download_count += 1
+        await asyncio.sleep(0)
+        return _make_surface_blob()
+
+
+def _assert_is_test_surface(xtgeo_surf: xtgeo.RegularSurface) -> None:
+    assert (xtgeo_surf.ncol, xtgeo_surf.nrow) == (2, 3)
+    assert (xtgeo_surf.xori, xtgeo_surf.yori, xtgeo_surf.rotation) == (1000.0, 2000.0, 30.0)
+    np.testing.assert_array_equal(np.ma.getmaskarray(xtgeo_surf.values), [[False] * 3, [False, True, False]])
+    np.testing.assert_allclose(xtgeo_surf.values.compressed(), [1.0, 2.0, 3.0, 4.0, 6.0])
+
+
+def test_concurrent_requests_share_one_download() -> None:
+    async def run() -> None:
+        cache = DecodedSurfaceCache(max_bytes=1024, spill_dir=None, spill_max_bytes=0)
+        downloader = _CountingDownloader()
+
+        decoded_surfs = await asyncio.gather(
+            *[cache.get_or_load_async(SURFACE_UUID, downloader.download_async) for _ in range(3)]
+        )
+        await cache.get_or_load_async(SURFACE_UUID, downloader.download_async)
+
+        assert downloader.download_count == 1
+        assert decoded_surfs[0].values.dtype == np.float32
+        _assert_is_test_surface(decoded_surfs[0].to_xtgeo_surface())
+
+    asyncio.run(run())
+
+
+def test_spilled_surface_is_read_back_without_download(tmp_path: Path) -> None:
+    async def run() -> None:
+        downloader = _CountingDownloader()
+        await DecodedSurfaceCache(
+            max_bytes=1024, spill_dir=str(tmp_path), spill_max_bytes=1024 * 1024
+        ).get_or_load_async(SURFACE_UUID, downloader.download_async)
+
+        # A new cache, e.g. after a restart, has an empty memory tier but finds the surface on disk
+        decoded_surf = await DecodedSurfaceCache(
+            max_bytes=1024, spill_dir=str(tmp_path), spill_max_bytes=1024 * 1024
+        ).get_or_load_async(SURFACE_UUID, downloader.download_async)
+
+        assert downloader.download_count == 1
+        assert sorted(path.name for path in tmp_path.iterdir()) == [f"{SURFACE_UUID}.json", f"{SURFACE_UUID}.npy"]
+        _assert_is_test_surface(decoded_surf.to_xtgeo_surface())
+
+    asyncio.run(run())
+
+
+def test_least_recently_used_spilled_surfaces_are_pruned(tmp_path: Path) -> None:
+    uuids = ["aaaa", "bbbb", "cccc"]
+
+    async def run() -> None:
+        downloader = _CountingDownloader()
+        await DecodedSurfaceCache(
+            max_bytes=1024, spill_dir=str(tmp_path), spill_max_bytes=1024 * 1024
+        ).get_or_load_async(uuids[0], downloader.download_async)
+        entry_size = sum(path.stat().st_size for path in tmp_path.iterdir())
+
+        # A memory budget smaller than a surface makes every load go through the spill directory
+        cache = DecodedSurfaceCache(max_bytes=1, spill_dir=str(tmp_path), spill_max_bytes=2 * entry_size)
+        await cache.get_or_load_async(uuids[1], downloader.download_async)
+        os.utime(tmp_path / f"{uuids[0]}.json", (1000, 1000))
+        os.utime(tmp_path / f"{uuids[1]}.json", (2000, 2000))
+
+        # Reading the oldest surface back makes it the most recently used one
+        await cache.get_or_load_async(uuids[0], downloader.download_async)
+        await cache.get_or_load_async(uuids[2], downloader.download_async)
+
+        assert downloader.download_count == 3
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+            [f"{uuids[0]}.json", f"{uuids[0]}.npy", f"{uuids[2]}.json", f"{uuids[2]}.npy"]
+        )
+
+    asyncio.run(run())
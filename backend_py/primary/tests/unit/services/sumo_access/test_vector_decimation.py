@@ -0,0 +1,39 @@
+import numpy as np
+import pyarrow as pa
+
+from primary.services.sumo_access._vector_decimation import decimate_vector_table_min_max
+
+
+def _make_vector_table(reals: list[int], values: list[float]) -> pa.Table:
+    return pa.table(
+        {
+            "DATE": pa.array(np.arange(len(reals)), type=pa.timestamp("ms")),
+            "REAL": pa.array(reals, type=pa.int16()),
+            "FOPR": pa.array(values, type=pa.float32()),
+        }
+    )
+
+
+def test_decimation_keeps_endpoints_and_extremes() -> None:
+    rng = np.random.default_rng(0)
+    values = rng.random(1000)
+    values[123] = 5.0
+    values[456] = -5.0
+    table = _make_vector_table([0] * 1000 + [1] * 3, list(values) + [1.0, 2.0, 3.0])
+
+    decimated_table = decimate_vector_table_min_max(table, "FOPR", max_points_per_realization=50)
+
+    real_0_table = decimated_table.filter(pa.compute.equal(decimated_table["REAL"], 0))
+    dates = real_0_table["DATE"].to_numpy().view(np.int64)
+    assert real_0_table.num_rows <= 50
+    assert np.all(np.diff(dates) > 0)
+    assert dates[0] == 0 and dates[-1] == 999
+    assert 123 in dates and 456 in dates
+
+    # Realizations below the limit are returned unchanged
+    assert decimated_table.filter(pa.compute.equal(decimated_table["REAL"], 1))["FOPR"].to_pylist() == [1.0, 2.0, 3.0]
+
+
+def test_decimation_is_noop_below_limit() -> None:
+    table = _make_vector_table([0, 0, 0, 1, 1], [1.0, np.nan, 3.0, 4.0, 5.0])
+    assert decimate_vector_table_min_max(table, "FOPR", max_points_per_realization=4) is table
@@ -0,0 +1,72 @@
+from primary.services.sumo_access._vector_directory import VectorDirectory
+
+_COLUMN_NAMES = [
+    "DATE",
+    "REAL",
+    "WOPR:OP_2",
+    "FOPT",
+    "WOPR:OP_1",
+    "WOPRH:OP_1",
+    "FOPTH",
+    "FGPT",
+    "FWPR",
+    "GOPR:G1",
+    "WGPR:OP_1",
+    "RPR:5",
+    "RPR:15",
+]
+
+
+def _names(directory: VectorDirectory, pattern: str | None) -> list[str]:
+    return [vi.name for vi in directory.search(pattern).vectors]
+
+
+def test_all_vectors_are_sorted_and_paired_with_historical() -> None:
+    directory = VectorDirectory(_COLUMN_NAMES)
+
+    all_vectors = directory.get_all_vectors()
+    assert [vi.name for vi in all_vectors] == [
+        "FGPT",
+        "FOPT",
+        "FWPR",
+        "GOPR:G1",
+        "RPR:15",
+        "RPR:5",
+        "WGPR:OP_1",
+        "WOPR:OP_1",
+        "WOPR:OP_2",
+    ]
+    assert [vi.name for vi in all_vectors if vi.has_historical] == ["FOPT", "WOPR:OP_1"]
+
+
+def test_search_with_patterns() -> None:
+    directory = VectorDirectory(_COLUMN_NAMES)
+
+    assert _names(directory, "WOPR:*") == ["WOPR:OP_1", "WOPR:OP_2"]
+    assert _names(directory, "F*PT") == ["FGPT", "FOPT"]
+    assert _names(directory, "*:OP_1") == ["WGPR:OP_1", "WOPR:OP_1"]
+    assert _names(directory, "W?PR:OP_1") == ["WGPR:OP_1", "WOPR:OP_1"]
+    assert _names(directory, "RPR:5") == ["RPR:5"]
+    assert _names(directory, "*:NOT_A_WELL") == []
+    assert _names(directory, "FOPTH") == []
+
+
+def test_search_with_qualifier_in_names_with_several_colons() -> None:
+    directory = VectorDirectory(["WOPR:OP_1", "LWOPR:LGR1:OP_1", "LWOPR:LGR1:OP_2"])
+
+    assert _names(directory, "*:OP_1") == ["LWOPR:LGR1:OP_1", "WOPR:OP_1"]
+    assert _names(directory, "*:LGR1:OP_1") == ["LWOPR:LGR1:OP_1"]
+    assert _names(directory, "*:LGR1:*") == ["LWOPR:LGR1:OP_1", "LWOPR:LGR1:OP_2"]
+    assert _names(directory, "*[:]OP_1") == ["LWOPR:LGR1:OP_1", "WOPR:OP_1"]
+
+
+def test_search_paging() -> None:
+    directory = VectorDirectory(_COLUMN_NAMES)
+
+    first_page = directory.search("*", offset=0, limit=4)
+    assert [vi.name for vi in first_page.vectors] == ["FGPT", "FOPT", "FWPR", "GOPR:G1"]
+    assert first_page.total_count == 9
+
+    last_page = directory.search("*", offset=8, limit=4)
+    assert [vi.name for vi in last_page.vectors] == ["WOPR:OP_2"]
+    assert last_page.total_count == 9
@@ -0,0 +1,56 @@
+import numpy as np
+
+from primary.services.observation_misfit import (
+    compute_summary_observation_misfits,
+    get_summary_observation_timestamps_utc_ms,
+)
+from primary.services.sumo_access.observation_types import (
+    SummaryVectorDateObservation,
+    SummaryVectorObservations,
+)
+from primary.services.sumo_access.summary_access import VectorValuesAtTimestamps
+
+
+def _make_summary_observations(vector_name: str, values: list, errors: list) -> SummaryVectorObservations:
+    return SummaryVectorObservations(
+        vector_name=vector_name,
+        observations=[
+            SummaryVectorDateObservation(date=f"2020-0{i + 1}-01", value=value, error=error, label=f"{vector_name}_{i}")
+            for i, (value, error) in enumerate(zip(values, errors))
+        ],
+    )
+
+
+def test_summary_observation_timestamps() -> None:
+    observations = _make_summary_observations("FOPT", [1.0, 2.0], [1.0, 1.0])
+    timestamps = get_summary_observation_timestamps_utc_ms(observations)
+    assert timestamps.tolist() == [1577836800000, 1580515200000]
+
+
+def test_summary_observation_misfits_align_realizations() -> None:
+    fopt_obs = _make_summary_observations("FOPT", [10.0, 20.0], [2.0, 5.0])
+    fgpt_obs = _make_summary_observations("FGPT", [100.0], [0.0])
+    values_per_vector = {
+        "FOPT": VectorValuesAtTimestamps(
+            realizations=np.array([0, 1]),
+            timestamps_utc_ms=get_summary_observation_timestamps_utc_ms(fopt_obs),
+            values=np.array([[12.0, 8.0], [20.0, np.nan]]),
+        ),
+        "FGPT": VectorValuesAtTimestamps(
+            realizations=np.array([1, 2]),
+            timestamps_utc_ms=get_summary_observation_timestamps_utc_ms(fgpt_obs),
+            values=np.array([[90.0, 100.0]]),
+        ),
+    }
+
+    misfits = compute_summary_observation_misfits([fopt_obs, fgpt_obs], values_per_vector)
+
+    assert misfits.realizations.tolist() == [0, 1, 2]
+    assert misfits.observation_labels == ["FOPT_0", "FOPT_1", "FGPT_0"]
+    # Zero error gives undefined residuals, which are treated as missing
+    np.testing.assert_allclose(
+        misfits.normalized_residuals, [[1.0, -1.0, np.nan], [0.0, np.nan, np.nan], [np.nan, np.nan, np.nan]]
+    )
+    np.testing.assert_allclose(misfits.get_realization_misfits(), [1.0, 1.0, 0.0])
+    assert misfits.get_realization_observation_counts().tolist() == [2, 1, 0]
+    np.testing.assert_allclose(misfits.get_observation_misfits(), [1.0, 0.0, np.nan])
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from primary.services.parameter_correlations import (
+    CorrelationMethod,
+    correlate_parameters_with_responses,
+    pivot_vector_table_to_realization_matrix,
+    rank_columns,
+)
+from primary.services.sumo_access._parameter_store import EnsembleParameterStore
+
+
+def _make_parameter_store(num_reals: int) -> EnsembleParameterStore:
+    rng = np.random.default_rng(42)
+    return EnsembleParameterStore(
+        pa.table(
+            {
+                "REAL": np.arange(num_reals),
+                "GLOBVAR:A": rng.random(num_reals),
+                "GLOBVAR:B": rng.integers(0, 3, num_reals),
+                "GLOBVAR:CONST": np.ones(num_reals),
+                "NAME": ["x"] * num_reals,
+            }
+        )
+    )
+
+
+def test_rank_columns_averages_ties() -> None:
+    values = np.array([[3.0, 1.0], [1.0, 1.0], [3.0, 2.0], [2.0, 1.0]])
+    assert rank_columns(values).tolist() == [[3.5, 2.0], [1.0, 2.0], [3.5, 4.0], [2.0, 2.0]]
+
+
+@pytest.mark.parametrize("method", [CorrelationMethod.PEARSON, CorrelationMethod.SPEARMAN])
+def test_correlations_match_pandas(method: CorrelationMethod) -> None:
+    store = _make_parameter_store(20)
+    rng = np.random.default_rng(0)
+
+    # Responses for realizations 5-24 in reverse order, where the second response lacks some realizations
+    response_reals = np.arange(24, 4, -1)
+    response_values = rng.random((20, 3))
+    response_values[:4, 1] = np.nan
+    response_values[:, 2] = 7.0
+
+    correlation_matrix = correlate_parameters_with_responses(store, response_reals, response_values, method)
+    assert correlation_matrix.parameter_names == ["A", "B"]
+    assert correlation_matrix.correlations.shape == (2, 3)
+
+    param_df = pd.DataFrame(store.get_numerical_parameter_matrix()[1], columns=["A", "B"], index=np.arange(20))
+    response_df = pd.DataFrame(response_values, index=response_reals)
+    for param_idx, param_name in enumerate(["A", "B"]):
+        for resp_idx in range(2):
+            joined_df = pd.concat([param_df[param_name], response_df[resp_idx]], axis=1, join="inner").dropna()
+            expected = joined_df.iloc[:, 0].corr(joined_df.iloc[:, 1], method=method.value.lower())
+            assert correlation_matrix.correlations[param_idx, resp_idx] == pytest.approx(expected)
+
+    # A constant response has undefined correlation
+    assert np.all(np.isnan(correlation_matrix.correlations[:, 2]))
+
+
+def test_pivot_vector_table() -> None:
+    vector_table = pa.table(
+        {
+            "DATE": pa.array([10, 20, 10, 20, 30], type=pa.timestamp("ms")),
+            "REAL": pa.array([1, 1, 3, 3, 3], type=pa.int16()),
+            "FOPT": pa.array([1.0, 2.0, 3.0, 4.0, 5.0], type=pa.float32()),
+        }
+    )
+    reals, timestamps, values = pivot_vector_table_to_realization_matrix(vector_table, "FOPT")
+    assert reals.tolist() == [1, 3]
+    assert timestamps.tolist() == [10, 20, 30]
+    assert np.array_equal(values, [[1.0, 2.0, np.nan], [3.0, 4.0, 5.0]], equal_nan=True)
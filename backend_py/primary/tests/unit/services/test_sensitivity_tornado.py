@@ -0,0 +1,67 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from primary.services.sensitivity_tornado import compute_sensitivity_tornado
+from primary.services.service_exceptions import InvalidParameterError
+from primary.services.sumo_access._parameter_store import EnsembleParameterStore
+from primary.services.sumo_access.parameter_types import SensitivityType
+
+
+def _make_parameter_store() -> EnsembleParameterStore:
+    return EnsembleParameterStore(
+        pa.table(
+            {
+                "REAL": [0, 1, 2, 3, 4, 5, 6, 7],
+                "SENSNAME": ["rms_seed"] * 4 + ["faults", "faults", "multz", "multz"],
+                "SENSCASE": ["p10_p90"] * 4 + ["low", "high", "high", "high"],
+            }
+        )
+    )
+
+
+def test_tornado_for_multiple_responses() -> None:
+    response_reals = np.array([7, 6, 5, 4, 3, 2, 1, 0])
+    response_values = np.array(
+        [
+            [14.0, 1.0],
+            [12.0, 1.0],
+            [20.0, 1.0],
+            [5.0, np.nan],
+            [13.0, 1.0],
+            [12.0, 1.0],
+            [11.0, 1.0],
+            [10.0, 1.0],
+        ]
+    )
+
+    tornado = compute_sensitivity_tornado(_make_parameter_store(), response_reals, response_values, None)
+
+    assert tornado.reference_sensitivity_name == "rms_seed"
+    assert tornado.reference_values.tolist() == [11.5, 1.0]
+    faults, multz, rms_seed = tornado.sensitivities
+
+    assert faults.sensitivity_name == "faults"
+    assert faults.low_values.tolist() == [5.0, 1.0]
+    assert faults.high_values.tolist() == [20.0, 1.0]
+    assert faults.low_case_names == ["low", "high"]
+    assert faults.high_case_names == ["high", "high"]
+    assert faults.low_deltas.tolist() == [5.0 - 11.5, 0.0]
+    assert faults.high_deltas.tolist() == [20.0 - 11.5, 0.0]
+
+    # With a single case the reference is used on the other side
+    assert multz.low_values.tolist() == [11.5, 1.0]
+    assert multz.high_values.tolist() == [13.0, 1.0]
+    assert multz.low_case_names == [None, "high"]
+    assert multz.mean_values.tolist() == [13.0, 1.0]
+    assert multz.low_deltas.tolist() == [0.0, 0.0]
+    assert multz.mean_deltas.tolist() == [1.5, 0.0]
+
+    assert rms_seed.sensitivity_type == SensitivityType.MONTECARLO
+    assert rms_seed.low_values[0] == pytest.approx(np.percentile([10.0, 11.0, 12.0, 13.0], 10))
+    assert rms_seed.high_values[0] == pytest.approx(np.percentile([10.0, 11.0, 12.0, 13.0], 90))
+
+
+def test_invalid_reference_sensitivity() -> None:
+    with pytest.raises(InvalidParameterError):
+        compute_sensitivity_tornado(_make_parameter_store(), np.arange(8), np.ones((8, 1)), "not_a_sensitivity")
@@ -0,0 +1,73 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from primary.services.service_exceptions import InvalidParameterError
+from primary.services.summary_delta_vectors import (
+    compute_delta_statistics_table,
+    compute_delta_vector_table,
+    compute_vector_table_relative_to_timestamp,
+)
+
+
+def _make_vector_table(reals: list[int], dates: list[int], values: list[float]) -> pa.Table:
+    return pa.table(
+        {
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "REAL": pa.array(reals, type=pa.int16()),
+            "FOPT": pa.array(values, type=pa.float32()),
+        }
+    )
+
+
+def test_relative_to_timestamp_drops_realizations_without_value() -> None:
+    table = _make_vector_table(
+        reals=[0, 0, 0, 1, 1, 2, 2],
+        dates=[10, 20, 30, 10, 30, 20, 30],
+        values=[1.0, 3.0, 6.0, 2.0, 5.0, 10.0, 20.0],
+    )
+
+    relative_table = compute_vector_table_relative_to_timestamp(table, "FOPT", 20)
+
+    assert relative_table["REAL"].to_pylist() == [0, 0, 0, 2, 2]
+    assert relative_table["FOPT"].to_pylist() == [-2.0, 0.0, 3.0, 0.0, 10.0]
+    assert relative_table.schema == table.schema
+
+
+def test_delta_vector_table_with_same_and_different_rows() -> None:
+    comparison_table = _make_vector_table(reals=[0, 0, 1, 1], dates=[10, 20, 10, 20], values=[5.0, 6.0, 7.0, 8.0])
+    reference_table = _make_vector_table(reals=[0, 0, 1, 1], dates=[10, 20, 10, 20], values=[1.0, 1.0, 2.0, 2.0])
+
+    delta_table = compute_delta_vector_table(comparison_table, reference_table, "FOPT")
+    assert delta_table["FOPT"].to_pylist() == [4.0, 5.0, 5.0, 6.0]
+
+    # Only realizations and dates found in both tables are included
+    reference_table = _make_vector_table(reals=[1, 1, 2], dates=[10, 20, 10], values=[2.0, 2.0, 9.0])
+    delta_table = compute_delta_vector_table(comparison_table, reference_table, "FOPT")
+    assert delta_table["REAL"].to_pylist() == [1, 1]
+    assert delta_table["FOPT"].to_pylist() == [5.0, 6.0]
+
+
+def test_delta_statistics_table() -> None:
+    comparison_stats_table = pa.table(
+        {
+            "DATE": pa.array([10, 20, 30], type=pa.timestamp("ms")),
+            "MEAN": pa.array([1.0, 2.0, 3.0], type=pa.float32()),
+            "P10": pa.array([4.0, 5.0, 6.0], type=pa.float32()),
+        }
+    )
+    reference_stats_table = pa.table(
+        {
+            "DATE": pa.array([20, 30, 40], type=pa.timestamp("ms")),
+            "P10": pa.array([1.0, 1.0, 1.0], type=pa.float32()),
+            "MEAN": pa.array([0.5, 0.5, 0.5], type=pa.float32()),
+        }
+    )
+
+    delta_table = compute_delta_statistics_table(comparison_stats_table, reference_stats_table)
+    assert delta_table.column_names == ["DATE", "MEAN", "P10"]
+    assert np.array_equal(delta_table["MEAN"].to_numpy(), [1.5, 2.5])
+    assert np.array_equal(delta_table["P10"].to_numpy(), [4.0, 5.0])
+
+    with pytest.raises(InvalidParameterError):
+        compute_delta_statistics_table(comparison_stats_table, reference_stats_table.drop_columns(["P10"]))
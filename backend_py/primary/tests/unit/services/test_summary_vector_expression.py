@@ -0,0 +1,54 @@
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from primary.services.service_exceptions import InvalidParameterError
+from primary.services.summary_vector_expression import evaluate_vector_expression, parse_vector_expression
+
+
+def test_evaluate_expression() -> None:
+    vector_expression = parse_vector_expression("x / (y + 1) - 2 * abs(x)", ["x", "y"], ["FGPR", "FOPR"])
+    assert vector_expression.vector_names == ("FGPR", "FOPR")
+
+    vector_values = {
+        "FGPR": np.array([1.0, -2.0, 3.0], dtype=np.float32),
+        "FOPR": np.array([0.0, 1.0, -1.0], dtype=np.float32),
+    }
+    values = evaluate_vector_expression(vector_expression, vector_values, {})
+
+    # Division by zero gives inf and is not an error
+    assert np.array_equal(values, np.array([1.0 - 2.0, -1.0 - 4.0, np.inf]))
+
+
+def test_subexpressions_are_shared_across_variable_names() -> None:
+    expr_a = parse_vector_expression("(a + b) / (a + b + c)", ["a", "b", "c"], ["WOPR:A1", "WOPR:A2", "WOPR:A3"])
+    expr_b = parse_vector_expression("q + r", ["q", "r"], ["WOPR:A1", "WOPR:A2"])
+
+    subexpressions_a = dict(expr_a.get_cacheable_subexpressions())
+    assert expr_b.canonical() in subexpressions_a
+    assert subexpressions_a[expr_b.canonical()] == ("WOPR:A1", "WOPR:A2")
+    assert len(subexpressions_a) == 3
+
+    vector_values = {"WOPR:A1": np.array([1.0]), "WOPR:A2": np.array([3.0]), "WOPR:A3": np.array([4.0])}
+    subexpression_values: Dict[str, np.ndarray] = {}
+    assert evaluate_vector_expression(expr_b, vector_values, subexpression_values).tolist() == [4.0]
+
+    # The computed subexpression is used instead of the vector values
+    subexpression_values[expr_b.canonical()] = np.array([100.0])
+    assert evaluate_vector_expression(expr_a, vector_values, subexpression_values).tolist() == [100.0 / 104.0]
+
+
+def test_constant_expression_is_broadcast() -> None:
+    vector_expression = parse_vector_expression("x * 0 + 2 ** 3", ["x"], ["FOPT"])
+    values = evaluate_vector_expression(vector_expression, {"FOPT": np.array([5.0, 6.0])}, {})
+    assert values.tolist() == [8.0, 8.0]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["x +", "z + 1", "__import__('os')", "x.real", "x if x else 1", "sqrt(x, x)", "[x]", "'a'", "1 + 2"],
+)
+def test_invalid_expressions(expression: str) -> None:
+    with pytest.raises(InvalidParameterError):
+        parse_vector_expression(expression, ["x"], ["FOPT"])
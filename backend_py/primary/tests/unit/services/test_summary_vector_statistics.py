@@ -0,0 +1,115 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from primary.services.service_exceptions import InvalidParameterError
+from primary.services.summary_vector_statistics import (
+    compute_vector_statistics,
+    compute_vector_statistics_for_realization_groups,
+    compute_vector_statistics_table,
+)
+from primary.services.utils.statistic_function import StatisticFunction
+
+
+def _create_table(dates: list[str], reals: list[int], values: list[float]) -> pa.Table:
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int16()),
+            pa.field("V", pa.float32()),
+        ]
+    )
+    return pa.table(
+        {"DATE": np.array(dates, dtype="datetime64[ms]"), "REAL": reals, "V": values},
+        schema=schema,
+    )
+
+
+def test_statistics_for_shared_dates_match_numpy_reference() -> None:
+    rng = np.random.default_rng(seed=1)
+    num_reals = 7
+    dates = ["2020-01-01", "2020-02-01", "2020-03-01"]
+    values = rng.normal(size=num_reals * len(dates)).astype(np.float32)
+    values[4] = np.nan
+
+    table = _create_table(dates * num_reals, np.repeat(np.arange(num_reals), len(dates)).tolist(), values.tolist())
+    stat_funcs = [StatisticFunction.P10, StatisticFunction.MEAN, StatisticFunction.STD, StatisticFunction.MIN]
+    stat_table = compute_vector_statistics_table(table, "V", stat_funcs)
+
+    assert stat_table is not None
+    assert stat_table.schema == pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("P10", pa.float32()),
+            pa.field("MEAN", pa.float32()),
+            pa.field("STD", pa.float32()),
+            pa.field("MIN", pa.float32()),
+        ]
+    )
+    assert stat_table["DATE"].to_numpy().tolist() == np.array(dates, dtype="datetime64[ms]").tolist()
+
+    per_date_values = values.reshape(num_reals, len(dates)).T
+    # P10 is the 90th percentile due to oil industry convention
+    assert np.allclose(stat_table["P10"].to_numpy(), np.nanpercentile(per_date_values, q=90, axis=1))
+    assert np.allclose(stat_table["MEAN"].to_numpy(), np.nanmean(per_date_values, axis=1))
+    assert np.allclose(stat_table["STD"].to_numpy(), np.nanstd(per_date_values, axis=1))
+    assert np.allclose(stat_table["MIN"].to_numpy(), np.nanmin(per_date_values, axis=1))
+
+
+def test_statistics_for_unsorted_rows_with_differing_dates() -> None:
+    # fmt:off
+    table = _create_table(
+        dates= ["2020-02-01", "2020-01-01", "2020-02-01", "2020-03-01", "2020-01-01", "2020-03-01"],
+        reals= [1,            0,            0,            1,            1,            0],
+        values=[4.0,          1.0,          2.0,          np.nan,       3.0,          np.nan],
+    )
+    # fmt:on
+
+    stat_table = compute_vector_statistics_table(table, "V", None)
+
+    assert stat_table is not None
+    assert stat_table.column_names == ["DATE", "MIN", "MAX", "MEAN", "P10", "P90", "P50"]
+    assert (
+        stat_table["DATE"].to_numpy().tolist()
+        == np.array(["2020-01-01", "2020-02-01", "2020-03-01"], dtype="datetime64[ms]").tolist()
+    )
+    assert np.array_equal(stat_table["MIN"].to_numpy(), [1.0, 2.0, np.nan], equal_nan=True)
+    assert np.array_equal(stat_table["MAX"].to_numpy(), [3.0, 4.0, np.nan], equal_nan=True)
+    assert np.array_equal(stat_table["MEAN"].to_numpy(), [2.0, 3.0, np.nan], equal_nan=True)
+    assert np.array_equal(stat_table["P50"].to_numpy(), [2.0, 3.0, np.nan], equal_nan=True)
+
+
+def test_statistics_for_empty_table_and_no_statistics() -> None:
+    empty_table = _create_table([], [], [])
+    assert compute_vector_statistics_table(empty_table, "V", [StatisticFunction.MEAN]) is None
+
+    with pytest.raises(InvalidParameterError):
+        compute_vector_statistics_table(empty_table, "V", [])
+
+
+def test_statistics_for_realization_groups_match_statistics_of_filtered_tables() -> None:
+    # Realization 2 has data for one date less than the others, realization 9 is not present in the table
+    # fmt:off
+    table = _create_table(
+        dates= ["2020-01-01", "2020-02-01", "2020-01-01", "2020-02-01", "2020-01-01", "2020-01-01", "2020-02-01"],
+        reals= [0,            0,            1,            1,            2,            3,            3],
+        values=[1.0,          2.0,          3.0,          np.nan,       5.0,          7.0,          8.0],
+    )
+    # fmt:on
+    realization_groups = [[0, 1], [2, 9], [3, 1, 0], [9]]
+
+    stats_per_group = compute_vector_statistics_for_realization_groups(table, "V", None, realization_groups)
+
+    assert len(stats_per_group) == len(realization_groups)
+    assert stats_per_group[3] is None
+
+    for group_reals, group_stats in zip(realization_groups[:3], stats_per_group[:3]):
+        filtered_table = table.filter(pc.is_in(table["REAL"], value_set=pa.array(group_reals, type=pa.int16())))
+        expected_stats = compute_vector_statistics(filtered_table, "V", None)
+
+        assert group_stats is not None and expected_stats is not None
+        assert group_stats.realizations == sorted(expected_stats.realizations)
+        assert group_stats.timestamps_utc_ms == expected_stats.timestamps_utc_ms
+        for stat_func, expected_values in expected_stats.values_dict.items():
+            assert np.array_equal(group_stats.values_dict[stat_func], expected_values, equal_nan=True)
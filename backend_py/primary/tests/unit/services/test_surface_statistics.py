@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from primary.services.service_exceptions import InvalidDataError
+from primary.services.surface_statistics import StreamingSurfaceStatistics
+from primary.services.utils.statistic_function import StatisticFunction
+
+
+def test_all_statistics_match_numpy_in_one_pass() -> None:
+    rng = np.random.default_rng(0)
+    realization_values = rng.normal(1000.0, 50.0, size=(7, 4, 5)).astype(np.float32)
+    realization_values[2, 1, 1] = np.nan
+    realization_values[:, 3, 4] = np.nan
+
+    # A tiny chunk budget makes the percentiles be computed over several chunks of nodes
+    surface_statistics = StreamingSurfaceStatistics(
+        list(StatisticFunction), realization_count=7, percentile_chunk_max_bytes=3 * 7 * 8
+    )
+    for values in realization_values:
+        surface_statistics.add_realization_values(values)
+    stats = surface_statistics.compute_statistics()
+
+    assert surface_statistics.get_realization_count() == 7
+    assert list(stats) == list(StatisticFunction)
+    with np.errstate(invalid="ignore"), pytest.warns(RuntimeWarning):
+        expected = {
+            StatisticFunction.MIN: np.nanmin(realization_values, axis=0),
+            StatisticFunction.MAX: np.nanmax(realization_values, axis=0),
+            StatisticFunction.MEAN: np.nanmean(realization_values.astype(np.float64), axis=0),
+            StatisticFunction.STD: np.nanstd(realization_values.astype(np.float64), axis=0),
+            StatisticFunction.P10: np.nanpercentile(realization_values, 90, axis=0),
+            StatisticFunction.P90: np.nanpercentile(realization_values, 10, axis=0),
+            StatisticFunction.P50: np.nanpercentile(realization_values, 50, axis=0),
+        }
+    for stat_func, expected_values in expected.items():
+        assert stats[stat_func].shape == (4, 5)
+        assert stats[stat_func].dtype == np.float32
+        np.testing.assert_allclose(stats[stat_func], expected_values, rtol=1e-5, err_msg=stat_func.value)
+
+
+def test_surfaces_with_different_shapes_are_rejected() -> None:
+    surface_statistics = StreamingSurfaceStatistics([StatisticFunction.MEAN], realization_count=2)
+    surface_statistics.add_realization_values(np.zeros((3, 4), dtype=np.float32))
+    with pytest.raises(InvalidDataError):
+        surface_statistics.add_realization_values(np.zeros((4, 3), dtype=np.float32))
+
+
+def test_percentiles_from_fewer_realizations_than_expected() -> None:
+    surface_statistics = StreamingSurfaceStatistics([StatisticFunction.P50], realization_count=5)
+    for real_value in [1.0, 2.0, 4.0]:
+        surface_statistics.add_realization_values(np.full((2, 2), real_value, dtype=np.float32))
+
+    np.testing.assert_array_equal(surface_statistics.compute_statistics()[StatisticFunction.P50], np.full((2, 2), 2.0))
+
+
+def test_percentiles_above_stack_byte_limit_are_skipped() -> None:
+    surface_statistics = StreamingSurfaceStatistics(
+        [StatisticFunction.MEAN, StatisticFunction.P10],
+        realization_count=10,
+        percentile_stack_max_bytes=10 * 12 * 4 - 1,
+    )
+    surface_statistics.add_realization_values(np.ones((3, 4), dtype=np.float32))
+
+    # The percentiles are left to the caller, while the streaming statistics are still computed
+    assert surface_statistics.get_skipped_statistic_functions() == [StatisticFunction.P10]
+    assert surface_statistics.has_statistics_to_compute()
+    assert list(surface_statistics.compute_statistics()) == [StatisticFunction.MEAN]
+
+    # With only percentiles requested, no more values are needed
+    surface_statistics = StreamingSurfaceStatistics(
+        [StatisticFunction.P10, StatisticFunction.P90], realization_count=10, percentile_stack_max_bytes=10 * 12 * 4 - 1
+    )
+    surface_statistics.add_realization_values(np.ones((3, 4), dtype=np.float32))
+    assert not surface_statistics.has_statistics_to_compute()
+    assert surface_statistics.compute_statistics() == {}
+
+    # Within the limit, nothing is skipped
+    surface_statistics = StreamingSurfaceStatistics(
+        [StatisticFunction.P10], realization_count=10, percentile_stack_max_bytes=10 * 12 * 4
+    )
+    surface_statistics.add_realization_values(np.ones((3, 4), dtype=np.float32))
+    assert not surface_statistics.get_skipped_statistic_functions()
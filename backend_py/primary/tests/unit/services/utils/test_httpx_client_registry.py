@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+
+from primary.services.utils.httpx_client_registry import HttpClientId, HttpClientRegistry, _MeteredTransport
+
+
+def test_started_registry_reuses_client_and_fallback_client_is_closed() -> None:
+    async def run() -> None:
+        registry = HttpClientRegistry()
+
+        async with registry.client_context(HttpClientId.SMDA) as fallback_client:
+            assert not fallback_client.is_closed
+        assert fallback_client.is_closed
+
+        registry.start()
+        async with registry.client_context(HttpClientId.SMDA) as client_a:
+            pass
+        async with registry.client_context(HttpClientId.SMDA) as client_b:
+            pass
+        assert client_a is client_b
+        assert not client_a.is_closed
+
+        await registry.aclose_async()
+        assert client_a.is_closed
+        assert not registry.is_started()
+
+    asyncio.run(run())
+
+
+def test_metered_transport_tracks_peak_in_flight() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        if request.url.path == "/fail":
+            raise httpx.ConnectError("failed", request=request)
+        return httpx.Response(200)
+
+    transport = _MeteredTransport(httpx.MockTransport(handler), max_connections=10)
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await asyncio.gather(*[client.get("/ok") for _ in range(4)])
+            try:
+                await client.get("/fail")
+            except httpx.ConnectError:
+                pass
+
+    asyncio.run(run())
+
+    stats = transport.stats()
+    assert stats.request_count == 5
+    assert stats.error_count == 1
+    assert stats.peak_in_flight == 4
+    assert stats.in_flight == 0
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from primary.services.utils.memory_lru_cache import MemoryLruCache
+
+
+def _make_cache(max_bytes: int) -> MemoryLruCache[str, bytes]:
+    return MemoryLruCache(max_bytes=max_bytes, size_of_value=len)
+
+
+def test_lru_eviction_respects_byte_budget() -> None:
+    cache = _make_cache(max_bytes=10)
+
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") == b"1234"
+
+    cache.put("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entry_count == 2
+    assert stats.byte_count == 8
+    assert stats.hits == 3
+    assert stats.misses == 1
+
+
+def test_peek_does_not_affect_stats_or_recency() -> None:
+    cache = _make_cache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+
+    assert cache.peek("a") == b"1234"
+    assert cache.peek("x") is None
+    assert cache.stats().hits == 0
+    assert cache.stats().misses == 0
+
+    # Peeking at "a" did not make it recently used, so it is the one evicted
+    cache.put("c", b"1234")
+    assert cache.peek("a") is None
+    assert cache.peek("b") == b"1234"
+
+
+def test_value_larger_than_budget_is_not_stored() -> None:
+    cache = _make_cache(max_bytes=4)
+    cache.put("a", b"12345")
+    assert cache.get("a") is None
+    assert cache.stats().byte_count == 0
+
+
+def test_get_or_load_is_single_flight() -> None:
+    cache = _make_cache(max_bytes=100)
+    load_count = 0
+
+    async def load() -> bytes:
+        nonlocal load_count
+        load_count += 1
+        await asyncio.sleep(0.01)
+        return b"data"
+
+    async def run() -> list[bytes]:
+        return await asyncio.gather(*[cache.get_or_load_async("key", load) for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert results == [b"data"] * 5
+    assert load_count == 1
+
+    # Subsequent call should be served from the cache
+    assert asyncio.run(cache.get_or_load_async("key", load)) == b"data"
+    assert load_count == 1
+
+
+def test_get_or_load_does_not_cache_failures() -> None:
+    cache = _make_cache(max_bytes=100)
+
+    async def failing_load() -> bytes:
+        raise ValueError("load failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(cache.get_or_load_async("key", failing_load))
+
+    assert cache.get("key") is None
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from primary.services.utils import ttl_cache
+from primary.services.utils.ttl_cache import TtlCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="fake_clock")
+def fixture_fake_clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def test_entries_expire_after_default_and_per_entry_ttl(fake_clock: _FakeClock) -> None:
+    cache: TtlCache[str, str] = TtlCache(max_entries=10, ttl_s=60)
+    cache.put("a", "default_ttl")
+    cache.put("b", "short_ttl", ttl_s=10)
+
+    fake_clock.now += 30
+    assert cache.get("a") == "default_ttl"
+    assert cache.get("b") is None
+
+    fake_clock.now += 30
+    assert cache.get("a") is None
+    assert cache.entry_count() == 0
+
+
+def test_least_recently_used_entry_is_evicted_when_full(fake_clock: _FakeClock) -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, ttl_s=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_get_or_load_is_single_flight_and_reloads_after_expiry(fake_clock: _FakeClock) -> None:
+    cache: TtlCache[str, str] = TtlCache(max_entries=10, ttl_s=60)
+    load_count = 0
+
+    async def load() -> str:
+        nonlocal load_count
+        load_count += 1
+        # Note that the event loop also uses time.monotonic(), so only yield control here instead of sleeping
+        await asyncio.sleep(0)
+        return "data"
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*[cache.get_or_load_async("key", load) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["data"] * 5
+    assert load_count == 1
+
+    fake_clock.now += 61
+    assert asyncio.run(cache.get_or_load_async("key", load)) == "data"
+    assert load_count == 2
+
+
+def test_get_or_load_uses_ttl_of_value(fake_clock: _FakeClock) -> None:
+    cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_s=60)
+
+    async def load() -> int:
+        return 10
+
+    async def run() -> None:
+        await cache.get_or_load_async("a", load, ttl_of_value=lambda value: float(value))
+        # Let the done callback of the load task run before we move the clock
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+
+    fake_clock.now += 5
+    assert cache.get("a") == 10
+    fake_clock.now += 10
+    assert cache.get("a") is None
@@ -5,6 +5,7 @@
 import type { BaseHttpRequest } from './core/BaseHttpRequest';
 import type { OpenAPIConfig } from './core/OpenAPI';
 import { AxiosHttpRequest } from './core/AxiosHttpRequest';
+import { CorrelationsService } from './services/CorrelationsService';
 import { DefaultService } from './services/DefaultService';
 import { ExploreService } from './services/ExploreService';
 import { GraphService } from './services/GraphService';
@@ -22,6 +23,7 @@ import { WellService } from './services/WellService';
 import { WellCompletionsService } from './services/WellCompletionsService';
 type HttpRequestConstructor = new (config: OpenAPIConfig) => BaseHttpRequest;
 export class ApiService {
+    public readonly correlations: CorrelationsService;
     public readonly default: DefaultService;
     public readonly explore: ExploreService;
     public readonly graph: GraphService;
@@ -50,6 +52,7 @@ export class ApiService {
             HEADERS: config?.HEADERS,
             ENCODE_PATH: config?.ENCODE_PATH,
         });
+        this.correlations = new CorrelationsService(this.request);
         this.default = new DefaultService(this.request);
         this.explore = new ExploreService(this.request);
         this.graph = new GraphService(this.request);
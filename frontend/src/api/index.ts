@@ -11,6 +11,7 @@ export { OpenAPI } from './core/OpenAPI';
 export type { OpenAPIConfig } from './core/OpenAPI';
 
 export { B64FloatArray as B64FloatArray_api } from './models/B64FloatArray';
+export { B64IntArray as B64IntArray_api } from './models/B64IntArray';
 export { B64UintArray as B64UintArray_api } from './models/B64UintArray';
 export type { Body_get_realizations_response as Body_get_realizations_response_api } from './models/Body_get_realizations_response';
 export type { Body_post_get_polyline_intersection as Body_post_get_polyline_intersection_api } from './models/Body_post_get_polyline_intersection';
@@ -20,6 +21,8 @@ export type { Body_post_sample_surface_in_points as Body_post_sample_surface_in_
 export type { BoundingBox3d as BoundingBox3d_api } from './models/BoundingBox3d';
 export type { CaseInfo as CaseInfo_api } from './models/CaseInfo';
 export type { Completions as Completions_api } from './models/Completions';
+export { CorrelationMethod as CorrelationMethod_api } from './models/CorrelationMethod';
+export { DeltaEnsembleMethod as DeltaEnsembleMethod_api } from './models/DeltaEnsembleMethod';
 export type { EnsembleDetails as EnsembleDetails_api } from './models/EnsembleDetails';
 export type { EnsembleInfo as EnsembleInfo_api } from './models/EnsembleInfo';
 export type { EnsembleParameter as EnsembleParameter_api } from './models/EnsembleParameter';
@@ -43,13 +46,17 @@ export type { GridSurfaceVtk as GridSurfaceVtk_api } from './models/GridSurfaceV
 export type { HTTPValidationError as HTTPValidationError_api } from './models/HTTPValidationError';
 export type { InplaceVolumetricsCategoricalMetaData as InplaceVolumetricsCategoricalMetaData_api } from './models/InplaceVolumetricsCategoricalMetaData';
 export type { InplaceVolumetricsTableMetaData as InplaceVolumetricsTableMetaData_api } from './models/InplaceVolumetricsTableMetaData';
+export type { ObservationMisfitData as ObservationMisfitData_api } from './models/ObservationMisfitData';
 export type { Observations as Observations_api } from './models/Observations';
+export type { ParameterCorrelations as ParameterCorrelations_api } from './models/ParameterCorrelations';
+export type { ParameterCorrelationsWithVectorB64 as ParameterCorrelationsWithVectorB64_api } from './models/ParameterCorrelationsWithVectorB64';
 export type { PointSetXY as PointSetXY_api } from './models/PointSetXY';
 export type { PolygonData as PolygonData_api } from './models/PolygonData';
 export { PolygonsAttributeType as PolygonsAttributeType_api } from './models/PolygonsAttributeType';
 export type { PolygonsMeta as PolygonsMeta_api } from './models/PolygonsMeta';
 export type { PolylineIntersection as PolylineIntersection_api } from './models/PolylineIntersection';
 export type { PvtData as PvtData_api } from './models/PvtData';
+export type { RealizationsVectorsData as RealizationsVectorsData_api } from './models/RealizationsVectorsData';
 export type { RftInfo as RftInfo_api } from './models/RftInfo';
 export type { RftObservation as RftObservation_api } from './models/RftObservation';
 export type { RftObservations as RftObservations_api } from './models/RftObservations';
@@ -57,9 +64,14 @@ export type { RftRealizationData as RftRealizationData_api } from './models/RftR
 export type { SeismicCubeMeta as SeismicCubeMeta_api } from './models/SeismicCubeMeta';
 export type { SeismicFenceData as SeismicFenceData_api } from './models/SeismicFenceData';
 export type { SeismicFencePolyline as SeismicFencePolyline_api } from './models/SeismicFencePolyline';
+export type { SensitivityTornadoData as SensitivityTornadoData_api } from './models/SensitivityTornadoData';
+export type { SensitivityTornadoValues as SensitivityTornadoValues_api } from './models/SensitivityTornadoValues';
 export { SensitivityType as SensitivityType_api } from './models/SensitivityType';
 export { StatisticFunction as StatisticFunction_api } from './models/StatisticFunction';
 export type { StatisticValueObject as StatisticValueObject_api } from './models/StatisticValueObject';
+export type { StatisticValueObjectB64 as StatisticValueObjectB64_api } from './models/StatisticValueObjectB64';
+export type { StatisticalSurfaceData as StatisticalSurfaceData_api } from './models/StatisticalSurfaceData';
+export type { StatisticalVectorsData as StatisticalVectorsData_api } from './models/StatisticalVectorsData';
 export { StratigraphicFeature as StratigraphicFeature_api } from './models/StratigraphicFeature';
 export type { StratigraphicUnit as StratigraphicUnit_api } from './models/StratigraphicUnit';
 export type { SummaryVectorDateObservation as SummaryVectorDateObservation_api } from './models/SummaryVectorDateObservation';
@@ -73,10 +85,16 @@ export type { SurfaceRealizationSampleValues as SurfaceRealizationSampleValues_a
 export { SurfaceStatisticFunction as SurfaceStatisticFunction_api } from './models/SurfaceStatisticFunction';
 export type { UserInfo as UserInfo_api } from './models/UserInfo';
 export type { ValidationError as ValidationError_api } from './models/ValidationError';
+export type { VectorColumnData as VectorColumnData_api } from './models/VectorColumnData';
 export type { VectorDescription as VectorDescription_api } from './models/VectorDescription';
 export type { VectorHistoricalData as VectorHistoricalData_api } from './models/VectorHistoricalData';
 export type { VectorRealizationData as VectorRealizationData_api } from './models/VectorRealizationData';
+export type { VectorRealizationsAtTimestampsData as VectorRealizationsAtTimestampsData_api } from './models/VectorRealizationsAtTimestampsData';
+export type { VectorRealizationsDataB64 as VectorRealizationsDataB64_api } from './models/VectorRealizationsDataB64';
+export type { VectorSearchResult as VectorSearchResult_api } from './models/VectorSearchResult';
+export type { VectorStatisticColumnData as VectorStatisticColumnData_api } from './models/VectorStatisticColumnData';
 export type { VectorStatisticData as VectorStatisticData_api } from './models/VectorStatisticData';
+export type { VectorStatisticDataB64 as VectorStatisticDataB64_api } from './models/VectorStatisticDataB64';
 export type { VectorStatisticSensitivityData as VectorStatisticSensitivityData_api } from './models/VectorStatisticSensitivityData';
 export type { WellBoreHeader as WellBoreHeader_api } from './models/WellBoreHeader';
 export type { WellBorePick as WellBorePick_api } from './models/WellBorePick';
@@ -88,6 +106,7 @@ export type { WellCompletionsUnits as WellCompletionsUnits_api } from './models/
 export type { WellCompletionsWell as WellCompletionsWell_api } from './models/WellCompletionsWell';
 export type { WellCompletionsZone as WellCompletionsZone_api } from './models/WellCompletionsZone';
 
+export { CorrelationsService } from './services/CorrelationsService';
 export { DefaultService } from './services/DefaultService';
 export { ExploreService } from './services/ExploreService';
 export { GraphService } from './services/GraphService';
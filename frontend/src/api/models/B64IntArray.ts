@@ -0,0 +1,16 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type B64IntArray = {
+    element_type: B64IntArray.element_type;
+    data_b64str: string;
+};
+export namespace B64IntArray {
+    export enum element_type {
+        INT8 = 'int8',
+        INT16 = 'int16',
+        INT32 = 'int32',
+    }
+}
+
@@ -0,0 +1,8 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export enum CorrelationMethod {
+    PEARSON = 'PEARSON',
+    SPEARMAN = 'SPEARMAN',
+}
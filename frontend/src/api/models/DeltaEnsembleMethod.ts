@@ -0,0 +1,8 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export enum DeltaEnsembleMethod {
+    REALIZATION_MATCHED = 'REALIZATION_MATCHED',
+    STATISTICS_MATCHED = 'STATISTICS_MATCHED',
+}
@@ -0,0 +1,18 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * Misfits between observations and the simulated values of an ensemble.
+ * The realization misfits are the sum of squared normalized residuals, (simulated - observed) / error, over the
+ * observations the realization has values for, and the observation misfits are the mean of the squared normalized
+ * residuals over the realizations. Observation misfits without any simulated values are null.
+ */
+export type ObservationMisfitData = {
+    realizations: Array<number>;
+    realization_misfits: Array<(number | null)>;
+    realization_observation_counts: Array<number>;
+    observation_labels: Array<string>;
+    observation_misfits: Array<(number | null)>;
+};
+
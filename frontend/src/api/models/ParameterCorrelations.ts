@@ -0,0 +1,13 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * Correlations between parameters and a single response, sorted on ascending absolute correlation.
+ * Parameters where the correlation is undefined are left out.
+ */
+export type ParameterCorrelations = {
+    names: Array<string>;
+    values: Array<number>;
+};
+
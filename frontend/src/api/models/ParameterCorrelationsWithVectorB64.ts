@@ -0,0 +1,16 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { B64FloatArray } from './B64FloatArray';
+/**
+ * Correlations between parameters and a vector at each of its timestamps.
+ * The correlations are a row-major float32 matrix with one row per parameter and one column per timestamp,
+ * where NaN means that the correlation is undefined.
+ */
+export type ParameterCorrelationsWithVectorB64 = {
+    parameter_names: Array<string>;
+    timestamps_utc_ms: Array<number>;
+    correlations_b64arr: B64FloatArray;
+};
+
@@ -0,0 +1,16 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { VectorColumnData } from './VectorColumnData';
+/**
+ * Columnar data for multiple vectors. The realizations and timestamps lists, along with the values list of each
+ * vector, all have one entry per row. The rows are sorted on realization and then on timestamp. A value is null
+ * where the vector has no value for the row, which happens when the vectors have different dates.
+ */
+export type RealizationsVectorsData = {
+    realizations: Array<number>;
+    timestamps_utc_ms: Array<number>;
+    vectors: Array<VectorColumnData>;
+};
+
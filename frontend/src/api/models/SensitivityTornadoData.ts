@@ -0,0 +1,16 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { SensitivityTornadoValues } from './SensitivityTornadoValues';
+/**
+ * Tornado data with one entry per response in all the value lists, in the same order as the requested responses.
+ * The reference values are the mean of the reference sensitivity, and the deltas are the values minus the
+ * reference values. Null means that there is no value.
+ */
+export type SensitivityTornadoData = {
+    reference_sensitivity_name: string;
+    reference_values: Array<(number | null)>;
+    sensitivities: Array<SensitivityTornadoValues>;
+};
+
@@ -0,0 +1,18 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { SensitivityType } from './SensitivityType';
+export type SensitivityTornadoValues = {
+    sensitivity_name: string;
+    sensitivity_type: SensitivityType;
+    low_values: Array<(number | null)>;
+    high_values: Array<(number | null)>;
+    mean_values: Array<(number | null)>;
+    low_deltas: Array<(number | null)>;
+    high_deltas: Array<(number | null)>;
+    mean_deltas: Array<(number | null)>;
+    low_case_names: Array<(string | null)>;
+    high_case_names: Array<(string | null)>;
+};
+
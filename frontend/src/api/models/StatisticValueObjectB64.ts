@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { B64FloatArray } from './B64FloatArray';
+import type { StatisticFunction } from './StatisticFunction';
+export type StatisticValueObjectB64 = {
+    statistic_function: StatisticFunction;
+    values_b64arr: B64FloatArray;
+};
+
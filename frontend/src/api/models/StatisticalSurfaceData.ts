@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { SurfaceData } from './SurfaceData';
+import type { SurfaceStatisticFunction } from './SurfaceStatisticFunction';
+export type StatisticalSurfaceData = {
+    statistic_function: SurfaceStatisticFunction;
+    surface_data: SurfaceData;
+};
+
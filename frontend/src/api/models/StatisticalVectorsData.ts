@@ -0,0 +1,14 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { VectorStatisticColumnData } from './VectorStatisticColumnData';
+/**
+ * Statistics for multiple vectors, computed over the same realizations and sampled at the same timestamps.
+ */
+export type StatisticalVectorsData = {
+    realizations: Array<number>;
+    timestamps_utc_ms: Array<number>;
+    vectors: Array<VectorStatisticColumnData>;
+};
+
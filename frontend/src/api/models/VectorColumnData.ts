@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type VectorColumnData = {
+    vector_name: string;
+    values: Array<(number | null)>;
+    unit: string;
+    is_rate: boolean;
+};
+
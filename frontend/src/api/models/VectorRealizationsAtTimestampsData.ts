@@ -0,0 +1,17 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * Values of a vector for multiple realizations at a set of timestamps.
+ * The values list has one entry per timestamp, each holding one value per realization, where null means that
+ * the realization has no value at the timestamp.
+ */
+export type VectorRealizationsAtTimestampsData = {
+    realizations: Array<number>;
+    timestamps_utc_ms: Array<number>;
+    values_per_timestamp: Array<Array<(number | null)>>;
+    unit: string;
+    is_rate: boolean;
+};
+
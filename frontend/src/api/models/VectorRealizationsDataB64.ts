@@ -0,0 +1,21 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { B64FloatArray } from './B64FloatArray';
+import type { B64IntArray } from './B64IntArray';
+/**
+ * Data for all realizations of a single vector as base64 encoded typed arrays.
+ * The rows of all the realizations are concatenated, and the rows of realizations[i] are found in the index
+ * range [real_row_offsets[i], real_row_offsets[i+1]) of the timestamps and values arrays.
+ * Timestamps are encoded as float64, which is exact for timestamps in ms.
+ */
+export type VectorRealizationsDataB64 = {
+    realizations: Array<number>;
+    real_row_offsets_b64arr: B64IntArray;
+    timestamps_utc_ms_b64arr: B64FloatArray;
+    values_b64arr: B64FloatArray;
+    unit: string;
+    is_rate: boolean;
+};
+
@@ -0,0 +1,13 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { VectorDescription } from './VectorDescription';
+/**
+ * One page of the vectors matching a search, total_count is the number of matches across all pages
+ */
+export type VectorSearchResult = {
+    vectors: Array<VectorDescription>;
+    total_count: number;
+};
+
@@ -0,0 +1,12 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { StatisticValueObject } from './StatisticValueObject';
+export type VectorStatisticColumnData = {
+    vector_name: string;
+    value_objects: Array<StatisticValueObject>;
+    unit: string;
+    is_rate: boolean;
+};
+
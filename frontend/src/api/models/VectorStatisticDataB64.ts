@@ -0,0 +1,18 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { B64FloatArray } from './B64FloatArray';
+import type { StatisticValueObjectB64 } from './StatisticValueObjectB64';
+/**
+ * Statistical vector data with the timestamps and values as base64 encoded typed arrays.
+ * Timestamps are encoded as float64, which is exact for timestamps in ms.
+ */
+export type VectorStatisticDataB64 = {
+    realizations: Array<number>;
+    timestamps_utc_ms_b64arr: B64FloatArray;
+    value_objects: Array<StatisticValueObjectB64>;
+    unit: string;
+    is_rate: boolean;
+};
+
@@ -0,0 +1,90 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { CorrelationMethod } from '../models/CorrelationMethod';
+import type { Frequency } from '../models/Frequency';
+import type { InplaceVolumetricsCategoricalMetaData } from '../models/InplaceVolumetricsCategoricalMetaData';
+import type { ParameterCorrelations } from '../models/ParameterCorrelations';
+import type { ParameterCorrelationsWithVectorB64 } from '../models/ParameterCorrelationsWithVectorB64';
+import type { CancelablePromise } from '../core/CancelablePromise';
+import type { BaseHttpRequest } from '../core/BaseHttpRequest';
+export class CorrelationsService {
+    constructor(public readonly httpRequest: BaseHttpRequest) {}
+    /**
+     * Get Parameter Correlations With Vector B64
+     * Get the correlations between all numerical, non-constant parameters and a vector at each of its timestamps
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorName Name of the vector
+     * @param resamplingFrequency Resampling frequency
+     * @param method Correlation method
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @returns ParameterCorrelationsWithVectorB64 Successful Response
+     * @throws ApiError
+     */
+    public getParameterCorrelationsWithVectorB64(
+        caseUuid: string,
+        ensembleName: string,
+        vectorName: string,
+        resamplingFrequency: Frequency,
+        method: CorrelationMethod,
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<ParameterCorrelationsWithVectorB64> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/correlations/parameter_correlations_with_vector_b64/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_name': vectorName,
+                'resampling_frequency': resamplingFrequency,
+                'method': method,
+                'realizations': realizations,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Post Parameter Correlations With Inplace Volumes
+     * Get the correlations between all numerical, non-constant parameters and an inplace volumetrics response
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param tableName Table name
+     * @param responseName Response name
+     * @param method Correlation method
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @param requestBody
+     * @returns ParameterCorrelations Successful Response
+     * @throws ApiError
+     */
+    public postParameterCorrelationsWithInplaceVolumes(
+        caseUuid: string,
+        ensembleName: string,
+        tableName: string,
+        responseName: string,
+        method: CorrelationMethod,
+        realizations?: (Array<number> | null),
+        requestBody?: (Array<InplaceVolumetricsCategoricalMetaData> | null),
+    ): CancelablePromise<ParameterCorrelations> {
+        return this.httpRequest.request({
+            method: 'POST',
+            url: '/correlations/parameter_correlations_with_inplace_volumes/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'table_name': tableName,
+                'response_name': responseName,
+                'method': method,
+                'realizations': realizations,
+            },
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+}
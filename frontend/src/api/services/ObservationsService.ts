@@ -2,6 +2,7 @@
 /* istanbul ignore file */
 /* tslint:disable */
 /* eslint-disable */
+import type { ObservationMisfitData } from '../models/ObservationMisfitData';
 import type { Observations } from '../models/Observations';
 import type { CancelablePromise } from '../core/CancelablePromise';
 import type { BaseHttpRequest } from '../core/BaseHttpRequest';
@@ -31,4 +32,34 @@ export class ObservationsService {
             },
         });
     }
+    /**
+     * Get Summary Observation Misfits
+     * Get misfits between the summary vector observations and the simulated values of all realizations
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorNames Optional list of observed vectors to include. If not specified, all observed vectors are included
+     * @param realizations Optional list of realizations to include. If not specified, all realizations are included
+     * @returns ObservationMisfitData Successful Response
+     * @throws ApiError
+     */
+    public getSummaryObservationMisfits(
+        caseUuid: string,
+        ensembleName: string,
+        vectorNames?: (Array<string> | null),
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<ObservationMisfitData> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/observations/summary_observation_misfits/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_names': vectorNames,
+                'realizations': realizations,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
 }
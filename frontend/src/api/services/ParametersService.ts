@@ -5,6 +5,8 @@
 import type { EnsembleParameter } from '../models/EnsembleParameter';
 import type { EnsembleParameterDescription } from '../models/EnsembleParameterDescription';
 import type { EnsembleSensitivity } from '../models/EnsembleSensitivity';
+import type { InplaceVolumetricsCategoricalMetaData } from '../models/InplaceVolumetricsCategoricalMetaData';
+import type { SensitivityTornadoData } from '../models/SensitivityTornadoData';
 import type { CancelablePromise } from '../core/CancelablePromise';
 import type { BaseHttpRequest } from '../core/BaseHttpRequest';
 export class ParametersService {
@@ -137,4 +139,74 @@ export class ParametersService {
             },
         });
     }
+    /**
+     * Get Sensitivity Tornado For Vector
+     * Get tornado data for a vector at each of the timestamps, where the vector values are interpolated
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorName Name of the vector
+     * @param timestampsUtcMs Timestamps in ms UTC, each timestamp is one response
+     * @param referenceSensitivityName Reference sensitivity. If not specified, rms_seed or the first sensitivity is used
+     * @returns SensitivityTornadoData Successful Response
+     * @throws ApiError
+     */
+    public getSensitivityTornadoForVector(
+        caseUuid: string,
+        ensembleName: string,
+        vectorName: string,
+        timestampsUtcMs: Array<number>,
+        referenceSensitivityName?: (string | null),
+    ): CancelablePromise<SensitivityTornadoData> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/parameters/sensitivity_tornado_for_vector/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_name': vectorName,
+                'timestamps_utc_ms': timestampsUtcMs,
+                'reference_sensitivity_name': referenceSensitivityName,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Post Sensitivity Tornado For Inplace Volumes
+     * Get tornado data for each of the inplace volumetrics responses
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param tableName Table name
+     * @param responseNames Names of the responses
+     * @param referenceSensitivityName Reference sensitivity. If not specified, rms_seed or the first sensitivity is used
+     * @param requestBody
+     * @returns SensitivityTornadoData Successful Response
+     * @throws ApiError
+     */
+    public postSensitivityTornadoForInplaceVolumes(
+        caseUuid: string,
+        ensembleName: string,
+        tableName: string,
+        responseNames: Array<string>,
+        referenceSensitivityName?: (string | null),
+        requestBody?: (Array<InplaceVolumetricsCategoricalMetaData> | null),
+    ): CancelablePromise<SensitivityTornadoData> {
+        return this.httpRequest.request({
+            method: 'POST',
+            url: '/parameters/sensitivity_tornado_for_inplace_volumes/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'table_name': tableName,
+                'response_names': responseNames,
+                'reference_sensitivity_name': referenceSensitivityName,
+            },
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
 }
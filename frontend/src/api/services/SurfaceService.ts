@@ -4,6 +4,7 @@
 /* eslint-disable */
 import type { Body_post_get_surface_intersection } from '../models/Body_post_get_surface_intersection';
 import type { Body_post_sample_surface_in_points } from '../models/Body_post_sample_surface_in_points';
+import type { StatisticalSurfaceData } from '../models/StatisticalSurfaceData';
 import type { SurfaceData } from '../models/SurfaceData';
 import type { SurfaceIntersectionData } from '../models/SurfaceIntersectionData';
 import type { SurfaceMeta } from '../models/SurfaceMeta';
@@ -107,6 +108,42 @@ export class SurfaceService {
             },
         });
     }
+    /**
+     * Get Statistical Surfaces Data
+     * Calculate multiple statistical surfaces in one pass over the realization surfaces
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param statisticFunctions Statistics to calculate
+     * @param name Surface name
+     * @param attribute Surface attribute
+     * @param timeOrInterval Time point or time interval string
+     * @returns StatisticalSurfaceData Successful Response
+     * @throws ApiError
+     */
+    public getStatisticalSurfacesData(
+        caseUuid: string,
+        ensembleName: string,
+        statisticFunctions: Array<SurfaceStatisticFunction>,
+        name: string,
+        attribute: string,
+        timeOrInterval?: (string | null),
+    ): CancelablePromise<Array<StatisticalSurfaceData>> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/surface/statistical_surfaces_data/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'statistic_functions': statisticFunctions,
+                'name': name,
+                'attribute': attribute,
+                'time_or_interval': timeOrInterval,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Get Property Surface Resampled To Static Surface
      * @param caseUuid Sumo case uuid
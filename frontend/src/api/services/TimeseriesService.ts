@@ -2,13 +2,20 @@
 /* istanbul ignore file */
 /* tslint:disable */
 /* eslint-disable */
+import type { DeltaEnsembleMethod } from '../models/DeltaEnsembleMethod';
 import type { EnsembleScalarResponse } from '../models/EnsembleScalarResponse';
 import type { Frequency } from '../models/Frequency';
+import type { RealizationsVectorsData } from '../models/RealizationsVectorsData';
 import type { StatisticFunction } from '../models/StatisticFunction';
+import type { StatisticalVectorsData } from '../models/StatisticalVectorsData';
 import type { VectorDescription } from '../models/VectorDescription';
 import type { VectorHistoricalData } from '../models/VectorHistoricalData';
 import type { VectorRealizationData } from '../models/VectorRealizationData';
+import type { VectorRealizationsAtTimestampsData } from '../models/VectorRealizationsAtTimestampsData';
+import type { VectorRealizationsDataB64 } from '../models/VectorRealizationsDataB64';
+import type { VectorSearchResult } from '../models/VectorSearchResult';
 import type { VectorStatisticData } from '../models/VectorStatisticData';
+import type { VectorStatisticDataB64 } from '../models/VectorStatisticDataB64';
 import type { VectorStatisticSensitivityData } from '../models/VectorStatisticSensitivityData';
 import type { CancelablePromise } from '../core/CancelablePromise';
 import type { BaseHttpRequest } from '../core/BaseHttpRequest';
@@ -38,6 +45,39 @@ export class TimeseriesService {
             },
         });
     }
+    /**
+     * Get Vector Search
+     * Get one page of the vectors in a given Sumo ensemble matching the pattern, excluding any historical vectors
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param pattern Case sensitive wildcard pattern for the vector names, e.g. 'WOPR:*', 'F*PT' or '*:OP_1'. If not specified, all vectors match.
+     * @param offset Number of matching vectors to skip
+     * @param limit Max number of matching vectors to return
+     * @returns VectorSearchResult Successful Response
+     * @throws ApiError
+     */
+    public getVectorSearch(
+        caseUuid: string,
+        ensembleName: string,
+        pattern?: (string | null),
+        offset: number = 0,
+        limit?: (number | null),
+    ): CancelablePromise<VectorSearchResult> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/vector_search/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'pattern': pattern,
+                'offset': offset,
+                'limit': limit,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Get Realizations Vector Data
      * Get vector data per realization
@@ -46,6 +86,8 @@ export class TimeseriesService {
      * @param vectorName Name of the vector
      * @param resamplingFrequency Resampling frequency. If not specified, raw data without resampling wil be returned.
      * @param realizations Optional list of realizations to include. If not specified, all realizations will be returned.
+     * @param relativeToTimestampUtcMs Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.
+     * @param maxPointsPerRealization Optional max number of points per realization. Realizations with more points are decimated using a min/max envelope that preserves the extremes, typically set to about twice the plot width in pixels.
      * @returns VectorRealizationData Successful Response
      * @throws ApiError
      */
@@ -55,6 +97,8 @@ export class TimeseriesService {
         vectorName: string,
         resamplingFrequency?: (Frequency | null),
         realizations?: (Array<number> | null),
+        relativeToTimestampUtcMs?: (number | null),
+        maxPointsPerRealization?: (number | null),
     ): CancelablePromise<Array<VectorRealizationData>> {
         return this.httpRequest.request({
             method: 'GET',
@@ -65,6 +109,80 @@ export class TimeseriesService {
                 'vector_name': vectorName,
                 'resampling_frequency': resamplingFrequency,
                 'realizations': realizations,
+                'relative_to_timestamp_utc_ms': relativeToTimestampUtcMs,
+                'max_points_per_realization': maxPointsPerRealization,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Realizations Vector Data B64
+     * Get vector data per realization, same as realizations_vector_data, but returned as base64 encoded typed arrays
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorName Name of the vector
+     * @param resamplingFrequency Resampling frequency. If not specified, raw data without resampling wil be returned.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be returned.
+     * @param relativeToTimestampUtcMs Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.
+     * @param maxPointsPerRealization Optional max number of points per realization. Realizations with more points are decimated using a min/max envelope that preserves the extremes, typically set to about twice the plot width in pixels.
+     * @returns VectorRealizationsDataB64 Successful Response
+     * @throws ApiError
+     */
+    public getRealizationsVectorDataB64(
+        caseUuid: string,
+        ensembleName: string,
+        vectorName: string,
+        resamplingFrequency?: (Frequency | null),
+        realizations?: (Array<number> | null),
+        relativeToTimestampUtcMs?: (number | null),
+        maxPointsPerRealization?: (number | null),
+    ): CancelablePromise<VectorRealizationsDataB64> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/realizations_vector_data_b64/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_name': vectorName,
+                'resampling_frequency': resamplingFrequency,
+                'realizations': realizations,
+                'relative_to_timestamp_utc_ms': relativeToTimestampUtcMs,
+                'max_points_per_realization': maxPointsPerRealization,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Realizations Vectors Data
+     * Get vector data per realization for multiple vectors in one columnar response
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorNames Names of the vectors
+     * @param resamplingFrequency Resampling frequency. If not specified, raw data without resampling wil be returned.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be returned.
+     * @returns RealizationsVectorsData Successful Response
+     * @throws ApiError
+     */
+    public getRealizationsVectorsData(
+        caseUuid: string,
+        ensembleName: string,
+        vectorNames: Array<string>,
+        resamplingFrequency?: (Frequency | null),
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<RealizationsVectorsData> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/realizations_vectors_data/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_names': vectorNames,
+                'resampling_frequency': resamplingFrequency,
+                'realizations': realizations,
             },
             errors: {
                 422: `Validation Error`,
@@ -82,6 +200,7 @@ export class TimeseriesService {
      * @param caseUuid Sumo case uuid
      * @param ensembleName Ensemble name
      * @param resamplingFrequency Resampling frequency
+     * @param realizations Optional list of realizations to include
      * @returns number Successful Response
      * @throws ApiError
      */
@@ -89,6 +208,7 @@ export class TimeseriesService {
         caseUuid: string,
         ensembleName: string,
         resamplingFrequency?: (Frequency | null),
+        realizations?: (Array<number> | null),
     ): CancelablePromise<Array<number>> {
         return this.httpRequest.request({
             method: 'GET',
@@ -97,6 +217,7 @@ export class TimeseriesService {
                 'case_uuid': caseUuid,
                 'ensemble_name': ensembleName,
                 'resampling_frequency': resamplingFrequency,
+                'realizations': realizations,
             },
             errors: {
                 422: `Validation Error`,
@@ -141,6 +262,7 @@ export class TimeseriesService {
      * @param resamplingFrequency Resampling frequency
      * @param statisticFunctions Optional list of statistics to calculate. If not specified, all statistics will be calculated.
      * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @param relativeToTimestampUtcMs Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.
      * @returns VectorStatisticData Successful Response
      * @throws ApiError
      */
@@ -151,6 +273,7 @@ export class TimeseriesService {
         resamplingFrequency: Frequency,
         statisticFunctions?: (Array<StatisticFunction> | null),
         realizations?: (Array<number> | null),
+        relativeToTimestampUtcMs?: (number | null),
     ): CancelablePromise<VectorStatisticData> {
         return this.httpRequest.request({
             method: 'GET',
@@ -162,6 +285,83 @@ export class TimeseriesService {
                 'resampling_frequency': resamplingFrequency,
                 'statistic_functions': statisticFunctions,
                 'realizations': realizations,
+                'relative_to_timestamp_utc_ms': relativeToTimestampUtcMs,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Statistical Vector Data B64
+     * Get statistical vector data for an ensemble, same as statistical_vector_data, but with the timestamps and
+     * values returned as base64 encoded typed arrays
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorName Name of the vector
+     * @param resamplingFrequency Resampling frequency
+     * @param statisticFunctions Optional list of statistics to calculate. If not specified, all statistics will be calculated.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @param relativeToTimestampUtcMs Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.
+     * @returns VectorStatisticDataB64 Successful Response
+     * @throws ApiError
+     */
+    public getStatisticalVectorDataB64(
+        caseUuid: string,
+        ensembleName: string,
+        vectorName: string,
+        resamplingFrequency: Frequency,
+        statisticFunctions?: (Array<StatisticFunction> | null),
+        realizations?: (Array<number> | null),
+        relativeToTimestampUtcMs?: (number | null),
+    ): CancelablePromise<VectorStatisticDataB64> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/statistical_vector_data_b64/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_name': vectorName,
+                'resampling_frequency': resamplingFrequency,
+                'statistic_functions': statisticFunctions,
+                'realizations': realizations,
+                'relative_to_timestamp_utc_ms': relativeToTimestampUtcMs,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Statistical Vectors Data
+     * Get statistical vector data for an ensemble for multiple vectors in one response
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorNames Names of the vectors
+     * @param resamplingFrequency Resampling frequency
+     * @param statisticFunctions Optional list of statistics to calculate. If not specified, all statistics will be calculated.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @returns StatisticalVectorsData Successful Response
+     * @throws ApiError
+     */
+    public getStatisticalVectorsData(
+        caseUuid: string,
+        ensembleName: string,
+        vectorNames: Array<string>,
+        resamplingFrequency: Frequency,
+        statisticFunctions?: (Array<StatisticFunction> | null),
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<StatisticalVectorsData> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/statistical_vectors_data/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_names': vectorNames,
+                'resampling_frequency': resamplingFrequency,
+                'statistic_functions': statisticFunctions,
+                'realizations': realizations,
             },
             errors: {
                 422: `Validation Error`,
@@ -176,6 +376,7 @@ export class TimeseriesService {
      * @param vectorName Name of the vector
      * @param resamplingFrequency Resampling frequency
      * @param statisticFunctions Optional list of statistics to calculate. If not specified, all statistics will be calculated.
+     * @param relativeToTimestampUtcMs Optional timestamp in ms UTC. If specified, each realization's value at this timestamp is subtracted from all its values, and realizations without a value at the timestamp are excluded.
      * @returns VectorStatisticSensitivityData Successful Response
      * @throws ApiError
      */
@@ -185,6 +386,7 @@ export class TimeseriesService {
         vectorName: string,
         resamplingFrequency: Frequency,
         statisticFunctions?: (Array<StatisticFunction> | null),
+        relativeToTimestampUtcMs?: (number | null),
     ): CancelablePromise<Array<VectorStatisticSensitivityData>> {
         return this.httpRequest.request({
             method: 'GET',
@@ -195,6 +397,94 @@ export class TimeseriesService {
                 'vector_name': vectorName,
                 'resampling_frequency': resamplingFrequency,
                 'statistic_functions': statisticFunctions,
+                'relative_to_timestamp_utc_ms': relativeToTimestampUtcMs,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Delta Ensemble Realizations Vector Data B64
+     * Get the realization matched delta of a vector between two ensembles, comparison minus reference, for the
+     * realizations and resampled dates found in both ensembles
+     * @param comparisonCaseUuid Sumo case uuid for comparison ensemble
+     * @param comparisonEnsembleName Comparison ensemble name
+     * @param referenceCaseUuid Sumo case uuid for reference ensemble
+     * @param referenceEnsembleName Reference ensemble name
+     * @param vectorName Name of the vector
+     * @param resamplingFrequency Resampling frequency
+     * @param realizations Optional list of realizations to include. If not specified, all realizations found in both ensembles will be returned.
+     * @returns VectorRealizationsDataB64 Successful Response
+     * @throws ApiError
+     */
+    public getDeltaEnsembleRealizationsVectorDataB64(
+        comparisonCaseUuid: string,
+        comparisonEnsembleName: string,
+        referenceCaseUuid: string,
+        referenceEnsembleName: string,
+        vectorName: string,
+        resamplingFrequency: Frequency,
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<VectorRealizationsDataB64> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/delta_ensemble_realizations_vector_data_b64/',
+            query: {
+                'comparison_case_uuid': comparisonCaseUuid,
+                'comparison_ensemble_name': comparisonEnsembleName,
+                'reference_case_uuid': referenceCaseUuid,
+                'reference_ensemble_name': referenceEnsembleName,
+                'vector_name': vectorName,
+                'resampling_frequency': resamplingFrequency,
+                'realizations': realizations,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Delta Ensemble Statistical Vector Data B64
+     * Get statistics of the delta of a vector between two ensembles, comparison minus reference.
+     * REALIZATION_MATCHED computes the statistics of the realization matched delta, while STATISTICS_MATCHED
+     * computes the statistics of each ensemble and subtracts them, e.g. P10 minus P10.
+     * @param comparisonCaseUuid Sumo case uuid for comparison ensemble
+     * @param comparisonEnsembleName Comparison ensemble name
+     * @param referenceCaseUuid Sumo case uuid for reference ensemble
+     * @param referenceEnsembleName Reference ensemble name
+     * @param vectorName Name of the vector
+     * @param resamplingFrequency Resampling frequency
+     * @param deltaMethod How the ensembles are matched when computing the delta
+     * @param statisticFunctions Optional list of statistics to calculate. If not specified, all statistics will be calculated.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be included.
+     * @returns VectorStatisticDataB64 Successful Response
+     * @throws ApiError
+     */
+    public getDeltaEnsembleStatisticalVectorDataB64(
+        comparisonCaseUuid: string,
+        comparisonEnsembleName: string,
+        referenceCaseUuid: string,
+        referenceEnsembleName: string,
+        vectorName: string,
+        resamplingFrequency: Frequency,
+        deltaMethod: DeltaEnsembleMethod,
+        statisticFunctions?: (Array<StatisticFunction> | null),
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<VectorStatisticDataB64> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/delta_ensemble_statistical_vector_data_b64/',
+            query: {
+                'comparison_case_uuid': comparisonCaseUuid,
+                'comparison_ensemble_name': comparisonEnsembleName,
+                'reference_case_uuid': referenceCaseUuid,
+                'reference_ensemble_name': referenceEnsembleName,
+                'vector_name': vectorName,
+                'resampling_frequency': resamplingFrequency,
+                'delta_method': deltaMethod,
+                'statistic_functions': statisticFunctions,
+                'realizations': realizations,
             },
             errors: {
                 422: `Validation Error`,
@@ -230,4 +520,79 @@ export class TimeseriesService {
             },
         });
     }
+    /**
+     * Get Realization Vector At Timestamps
+     * Get the values of a vector at multiple timestamps for all realizations, using the raw (non-resampled) data
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param vectorName Name of the vector
+     * @param timestampsUtcMs Timestamps in ms UTC to query the vector at
+     * @param interpolate Interpolate between the realization's dates instead of only returning values at exact dates. Rate vectors are back-filled.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be returned.
+     * @returns VectorRealizationsAtTimestampsData Successful Response
+     * @throws ApiError
+     */
+    public getRealizationVectorAtTimestamps(
+        caseUuid: string,
+        ensembleName: string,
+        vectorName: string,
+        timestampsUtcMs: Array<number>,
+        interpolate: boolean = false,
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<VectorRealizationsAtTimestampsData> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/realization_vector_at_timestamps/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'vector_name': vectorName,
+                'timestamps_utc_ms': timestampsUtcMs,
+                'interpolate': interpolate,
+                'realizations': realizations,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Get Realizations Calculated Vector Data
+     * Get calculated vector data per realization
+     * @param caseUuid Sumo case uuid
+     * @param ensembleName Ensemble name
+     * @param expression Mathematical expression, e.g. 'x + y' or 'x / (y + 1)'
+     * @param variableNames Variable names used in the expression
+     * @param vectorNames Vector name for each of the variable names
+     * @param resamplingFrequency Resampling frequency. If not specified, raw data without resampling wil be returned.
+     * @param realizations Optional list of realizations to include. If not specified, all realizations will be returned.
+     * @returns VectorRealizationData Successful Response
+     * @throws ApiError
+     */
+    public getRealizationsCalculatedVectorData(
+        caseUuid: string,
+        ensembleName: string,
+        expression: string,
+        variableNames: Array<string>,
+        vectorNames: Array<string>,
+        resamplingFrequency?: (Frequency | null),
+        realizations?: (Array<number> | null),
+    ): CancelablePromise<Array<VectorRealizationData>> {
+        return this.httpRequest.request({
+            method: 'GET',
+            url: '/timeseries/realizations_calculated_vector_data/',
+            query: {
+                'case_uuid': caseUuid,
+                'ensemble_name': ensembleName,
+                'expression': expression,
+                'variable_names': variableNames,
+                'vector_names': vectorNames,
+                'resampling_frequency': resamplingFrequency,
+                'realizations': realizations,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
 }